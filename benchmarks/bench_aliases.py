@@ -0,0 +1,145 @@
+"""Compare list_entities with and without the shared alias cache.
+
+Lists 10k entities (every page, at the maximum page size) through the
+`list_entities` tool handler, once computing aliases per entity as before
+and once reading them from a warm `AliasCache`.
+
+On HA releases without `er.async_get_entity_aliases` (before 2026.4) a
+stand-in that resolves computed names through the device, as HA does, is
+installed so the comparison reflects the per-call cost on newer releases.
+
+Run from the repository root:
+
+    python benchmarks/bench_aliases.py [--entities 10000] [--rounds 10]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import State  # noqa: E402
+from homeassistant.helpers import entity_registry as er  # noqa: E402
+
+from custom_components.mcp_server_http_transport import aliases as aliases_mod  # noqa: E402
+from custom_components.mcp_server_http_transport.aliases import AliasCache  # noqa: E402
+from custom_components.mcp_server_http_transport.const import DOMAIN  # noqa: E402
+from custom_components.mcp_server_http_transport.entity_index import EntityIndex  # noqa: E402
+from custom_components.mcp_server_http_transport.pagination import MAX_PAGE_SIZE  # noqa: E402
+from custom_components.mcp_server_http_transport.tools.entities import (  # noqa: E402
+    list_entities,
+)
+
+DOMAINS = ["light", "sensor", "switch", "binary_sensor", "climate", "media_player"]
+
+# Stands in for a ComputedNameType alias ("use the entity's name")
+COMPUTED = object()
+
+
+def build(count: int) -> tuple[list[State], dict[str, SimpleNamespace], dict[str, str]]:
+    """Build states, registry entries with aliases, and device names."""
+    states, entries, devices = [], {}, {}
+    for i in range(count):
+        entity_id = f"{DOMAINS[i % len(DOMAINS)]}.entity_{i}"
+        device_id = f"device_{i // 4}"
+        devices[device_id] = f"Device {i // 4}"
+        states.append(State(entity_id, "on", {"friendly_name": f"Entity {i}"}))
+        entries[entity_id] = SimpleNamespace(
+            entity_id=entity_id,
+            device_id=device_id,
+            name=None,
+            original_name=f"Entity {i}",
+            aliases=[COMPUTED, f"alias {i}"] if i % 2 else [f"alias {i}"],
+        )
+    return states, entries, devices
+
+
+def stand_in_get_entity_aliases(devices: dict[str, str]):
+    """Return a stand-in for er.async_get_entity_aliases resolving computed names."""
+
+    def get_entity_aliases(hass, entry) -> list[str]:
+        resolved = []
+        for alias in entry.aliases:
+            if alias is COMPUTED:
+                name = entry.name or entry.original_name
+                device_name = devices.get(entry.device_id)
+                alias = f"{device_name} {name}" if device_name else name
+            resolved.append(str(alias))
+        return sorted(resolved)
+
+    return get_entity_aliases
+
+
+async def list_all(hass) -> int:
+    """List every entity page by page, returning the number of pages."""
+    arguments = {"page_size": MAX_PAGE_SIZE}
+    pages = 0
+    while True:
+        result = await list_entities(hass, arguments)
+        pages += 1
+        if len(result["content"]) == 1:
+            return pages
+        cursor = json.loads(result["content"][1]["text"])["nextCursor"]
+        arguments = {"page_size": MAX_PAGE_SIZE, "cursor": cursor}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    states, entries, devices = build(args.entities)
+    by_id = {state.entity_id: state for state in states}
+    hass = SimpleNamespace(
+        data={},
+        states=SimpleNamespace(async_all=lambda: states, get=by_id.get),
+    )
+    registry = SimpleNamespace(async_get=entries.get)
+    hass.data[DOMAIN] = {"entity_index": EntityIndex(hass)}
+
+    native = hasattr(er, "async_get_entity_aliases")
+    patches = [patch.object(er, "async_get", return_value=registry)]
+    if not native:
+        patches.append(
+            patch.object(
+                er,
+                "async_get_entity_aliases",
+                stand_in_get_entity_aliases(devices),
+                create=True,
+            )
+        )
+    patches.append(patch.object(aliases_mod, "_HAS_GET_ENTITY_ALIASES", True))
+
+    for p in patches:
+        p.start()
+    try:
+        source = "er.async_get_entity_aliases" if native else "stand-in for 2026.4+"
+        print(f"{args.entities} entities, best of {args.rounds} rounds, aliases via {source}")
+        baseline = None
+        for label, cache in (("per-entity (previous)", None), ("AliasCache", AliasCache(hass))):
+            if cache is None:
+                hass.data[DOMAIN].pop("aliases", None)
+            else:
+                hass.data[DOMAIN]["aliases"] = cache
+            pages = await list_all(hass)  # warm up, and fill the cache
+            best = float("inf")
+            for _ in range(args.rounds):
+                start = time.perf_counter()
+                await list_all(hass)
+                best = min(best, time.perf_counter() - start)
+            baseline = baseline or best
+            print(f"  {label:<24} {best * 1000:8.1f} ms  {baseline / best:5.1f}x  {pages} pages")
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
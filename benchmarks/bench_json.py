@@ -0,0 +1,86 @@
+"""Compare tool payload serialization: indented stdlib vs json_dumps.
+
+Builds a detailed `list_entities`-shaped payload for 10k entities and times
+the previous `json.dumps(..., indent=2, cls=_HAJSONEncoder)` path against
+`json_utils.json_dumps` (orjson when installed, compact by default).
+
+Run from the repository root:
+
+    python benchmarks/bench_json.py [--entities 10000] [--rounds 20]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.mcp_server_http_transport import json_utils  # noqa: E402
+from custom_components.mcp_server_http_transport.json_utils import (  # noqa: E402
+    _HAJSONEncoder,
+    json_dumps,
+)
+
+DOMAINS = ["light", "sensor", "switch", "binary_sensor", "climate", "media_player"]
+
+
+def build_payload(count: int) -> list[dict]:
+    """Build entities the way list_entities(detailed=True) returns them."""
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    entities = []
+    for i in range(count):
+        domain = DOMAINS[i % len(DOMAINS)]
+        changed = now - timedelta(seconds=i)
+        entities.append(
+            {
+                "entity_id": f"{domain}.entity_{i}",
+                "state": "on" if i % 2 else "21.5",
+                "friendly_name": f"Entity {i}",
+                "aliases": [f"alias {i}"] if i % 10 == 0 else [],
+                "attributes": {
+                    "friendly_name": f"Entity {i}",
+                    "unit_of_measurement": "°C",
+                    "device_class": "temperature",
+                    "supported_color_modes": {"hs", "color_temp"},
+                    "brightness": i % 256,
+                    "last_triggered": changed,
+                },
+                "last_changed": changed.isoformat(),
+                "last_updated": changed.isoformat(),
+            }
+        )
+    return entities
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    payload = build_payload(args.entities)
+    cases = {
+        "stdlib indent=2 (previous)": lambda: json.dumps(payload, indent=2, cls=_HAJSONEncoder),
+        "stdlib compact": lambda: json.dumps(payload, cls=_HAJSONEncoder),
+        "json_dumps compact": lambda: json_dumps(payload),
+        "json_dumps indent=2": lambda: json_dumps(payload, indent=2),
+    }
+
+    engine = "orjson" if json_utils.orjson is not None else "stdlib (orjson not installed)"
+    print(f"{args.entities} entities, best of {args.rounds} rounds, json_dumps engine: {engine}")
+    baseline = None
+    for label, fn in cases.items():
+        size = len(fn().encode())
+        best = min(timeit.repeat(fn, number=1, repeat=args.rounds))
+        baseline = baseline or best
+        print(
+            f"  {label:<28} {best * 1000:8.1f} ms  {baseline / best:5.1f}x  "
+            f"{size / 1024:8.0f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
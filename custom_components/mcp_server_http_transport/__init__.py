@@ -7,18 +7,36 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import config_validation as cv
 from mcp.server import Server
 
+from .aliases import AliasCache
+from .change_feed import ChangeFeed
 from .const import (
+    CONF_BATCH_CONCURRENCY,
     CONF_CAMERA_IMAGE_ACCESS,
     CONF_CONFIG_FILE_ACCESS,
     CONF_IMAGE_FILE_ACCESS,
     CONF_NATIVE_AUTH,
+    CONF_RELOAD_DELAY,
+    CONF_RELOAD_MAX_DELAY,
+    CONF_TOKEN_CACHE_TTL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_RELOAD_DELAY,
+    DEFAULT_RELOAD_MAX_DELAY,
+    DEFAULT_TOKEN_CACHE_TTL,
     DOMAIN,
 )
+from .entity_index import EntityIndex
 from .http import (
     MCPEndpointView,
     MCPProtectedResourceMetadataView,
     MCPSubpathProtectedResourceMetadataView,
 )
+from .recorder_cache import RecorderCache
+from .reload_scheduler import ReloadScheduler
+from .resource_updates import ResourceUpdateNotifier
+from .service_descriptions import ServiceDescriptionCache
+from .state_cache import StateFragmentCache
+from .streaming import NotificationHub
+from .token_cache import TokenCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,11 +61,73 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN]["config_file_access"] = config_file_access_enabled
     hass.data[DOMAIN]["camera_image_access"] = camera_image_access_enabled
     hass.data[DOMAIN]["image_file_access"] = image_file_access_enabled
+    hass.data[DOMAIN]["batch_concurrency"] = entry.data.get(
+        CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY
+    )
 
     # Create MCP server
     server = Server("home-assistant-mcp-server")
     hass.data[DOMAIN]["server"] = server
 
+    # Successful OIDC token validations; dropped with hass.data[DOMAIN] on
+    # unload so a reload never serves a validation made under old settings.
+    hass.data[DOMAIN]["token_cache"] = TokenCache(
+        max_ttl=entry.data.get(CONF_TOKEN_CACHE_TTL, DEFAULT_TOKEN_CACHE_TTL)
+    )
+
+    # Server-initiated notifications fanned out to open GET /api/mcp streams
+    notifications = NotificationHub()
+    hass.data[DOMAIN]["notifications"] = notifications
+
+    # notifications/resources/updated for resources changed by HA events
+    resource_updates = ResourceUpdateNotifier(hass, notifications)
+    resource_updates.async_start()
+    entry.async_on_unload(resource_updates.async_stop)
+
+    # Entity aliases, computed once per registry entry. Started before the
+    # entity index so its registry listeners see fresh aliases when they
+    # re-index the search documents of changed entities.
+    aliases = AliasCache(hass)
+    aliases.async_start()
+    hass.data[DOMAIN]["aliases"] = aliases
+    entry.async_on_unload(aliases.async_stop)
+
+    # Entity lookups by domain/area/label/etc. without scanning every state
+    entity_index = EntityIndex(hass)
+    entity_index.async_start()
+    hass.data[DOMAIN]["entity_index"] = entity_index
+    entry.async_on_unload(entity_index.async_stop)
+
+    # Recent state changes for clients polling with a watermark
+    change_feed = ChangeFeed(hass)
+    change_feed.async_start()
+    hass.data[DOMAIN]["change_feed"] = change_feed
+    entry.async_on_unload(change_feed.async_stop)
+
+    # Service descriptions served by describe_service, per domain
+    service_descriptions = ServiceDescriptionCache(hass)
+    service_descriptions.async_start()
+    hass.data[DOMAIN]["service_descriptions"] = service_descriptions
+    entry.async_on_unload(service_descriptions.async_stop)
+
+    # Encoded state attributes, reused until an entity's state changes
+    hass.data[DOMAIN]["state_fragments"] = StateFragmentCache(hass)
+
+    # History, statistics and logbook results of windows that have closed
+    recorder_cache = RecorderCache(hass)
+    recorder_cache.async_start()
+    hass.data[DOMAIN]["recorder_cache"] = recorder_cache
+    entry.async_on_unload(recorder_cache.async_stop)
+
+    # Reloads after automation, scene and script edits, coalesced per domain
+    reload_scheduler = ReloadScheduler(
+        hass,
+        entry.data.get(CONF_RELOAD_DELAY, DEFAULT_RELOAD_DELAY),
+        entry.data.get(CONF_RELOAD_MAX_DELAY, DEFAULT_RELOAD_MAX_DELAY),
+    )
+    hass.data[DOMAIN]["reload_scheduler"] = reload_scheduler
+    entry.async_on_unload(reload_scheduler.async_stop)
+
     # Register HTTP endpoints. The views are gated on hass.data[DOMAIN] so
     # requests stop being served the moment async_unload_entry clears it
     # (HA has no public register_view reverse — see #37).
@@ -68,5 +148,11 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    token_cache = hass.data[DOMAIN].get("token_cache")
+    if token_cache is not None:
+        token_cache.clear()
+    notifications = hass.data[DOMAIN].get("notifications")
+    if notifications is not None:
+        notifications.close()
     hass.data[DOMAIN].clear()
     return True
@@ -0,0 +1,71 @@
+"""Aggregates of recorder series, computed with arrays.
+
+Like downsample.py, the functions here are synchronous and meant for the
+executor. Times are POSIX timestamps in seconds; each point holds its value
+until the next point, and the last one until the end of the window.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+DEFAULT_PERCENTILES = (5, 50, 95)
+
+
+def _durations(x: np.ndarray, end: float) -> np.ndarray:
+    """Return how long each point's value was held."""
+    return np.diff(np.append(x, max(end, x[-1])))
+
+
+def numeric_summary(
+    x: np.ndarray, y: np.ndarray, end: float, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> dict[str, Any]:
+    """Return min, max, mean, time-weighted mean and percentiles of y.
+
+    Points where y is NaN (unavailable or unknown) are left out; the time
+    they were held does not count towards the time-weighted mean.
+    """
+    held = _durations(x, end)
+    finite = np.isfinite(y)
+    y, held = y[finite], held[finite]
+    total = float(held.sum())
+    summary: dict[str, Any] = {
+        "count": int(len(y)),
+        "min": float(y.min()),
+        "max": float(y.max()),
+        "mean": float(y.mean()),
+        "time_weighted_mean": float((y * held).sum() / total) if total > 0 else None,
+        "last": float(y[-1]),
+    }
+    if percentiles:
+        values = np.percentile(y, percentiles).tolist()
+        summary["percentiles"] = {f"p{p:g}": value for p, value in zip(percentiles, values)}
+    return summary
+
+
+def state_summary(x: np.ndarray, states: Sequence[str], end: float) -> dict[str, Any]:
+    """Return transitions and per-state time of a series of states.
+
+    Consecutive points with the same state form one span. Each state
+    reports how many spans it had, and their total and longest duration in
+    seconds.
+    """
+    values = np.asarray(states, dtype=object)
+    starts = np.concatenate(([0], np.flatnonzero(values[1:] != values[:-1]) + 1))
+    held = _durations(x[starts], end)
+    names, index = np.unique(values[starts].astype(str), return_inverse=True)
+    counts = np.bincount(index, minlength=len(names))
+    totals = np.bincount(index, weights=held, minlength=len(names))
+    longest = np.zeros(len(names))
+    np.maximum.at(longest, index, held)
+    return {
+        "transitions": int(len(starts) - 1),
+        "states": {
+            name: {"count": count, "total_seconds": total, "longest_seconds": maximum}
+            for name, count, total, maximum in zip(
+                names.tolist(), counts.tolist(), totals.tolist(), longest.tolist()
+            )
+        },
+        "last": str(values[-1]),
+    }
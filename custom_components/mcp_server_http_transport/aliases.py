@@ -0,0 +1,93 @@
+"""Entity alias lookups shared by the entity tools and the search index."""
+
+from collections.abc import Callable
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+_HAS_GET_ENTITY_ALIASES = hasattr(er, "async_get_entity_aliases")
+
+# Device registry changes that can change the computed aliases of its entities
+_DEVICE_NAME_FIELDS = {"name", "name_by_user"}
+
+
+def _compute_aliases(hass: HomeAssistant, entry: er.RegistryEntry) -> list[str]:
+    """Get entity aliases, handling ComputedNameType on HA 2026.4+."""
+    if _HAS_GET_ENTITY_ALIASES:
+        return er.async_get_entity_aliases(hass, entry)
+    return sorted(str(a) for a in entry.aliases) if entry.aliases else []
+
+
+class AliasCache:
+    """Aliases by entity ID, dropped when the entity's registry entry changes.
+
+    On HA 2026.4+ aliases may be computed from the entity and device names,
+    so a device rename drops the aliases of that device's entities too.
+    Returned lists are shared between callers and must not be modified.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self._aliases: dict[str, list[str]] = {}
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking entity and device registry changes."""
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated),
+            bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def get(self, entry: er.RegistryEntry) -> list[str]:
+        """Return the aliases of a registry entry."""
+        aliases = self._aliases.get(entry.entity_id)
+        if aliases is None:
+            aliases = self._aliases[entry.entity_id] = _compute_aliases(self.hass, entry)
+        return aliases
+
+    @callback
+    def _async_entity_updated(self, event: Event) -> None:
+        """Drop an entity's aliases after its registry entry changed."""
+        self._aliases.pop(event.data["entity_id"], None)
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._aliases.pop(old_entity_id, None)
+
+    @callback
+    def _async_device_updated(self, event: Event) -> None:
+        """Drop the aliases of a device's entities after the device was renamed."""
+        if event.data["action"] != "update" or not self._aliases:
+            return
+        changes = event.data.get("changes")
+        if changes is not None and not changes.keys() & _DEVICE_NAME_FIELDS:
+            return
+        registry = er.async_get(self.hass)
+        for entry in er.async_entries_for_device(
+            registry, event.data["device_id"], include_disabled_entities=True
+        ):
+            self._aliases.pop(entry.entity_id, None)
+
+
+def get_aliases(hass: HomeAssistant, entry: er.RegistryEntry) -> list[str]:
+    """Return the aliases of a registry entry.
+
+    Uses the integration's cache, or computes them directly when the
+    integration is not set up.
+    """
+    data = hass.data.get(DOMAIN)
+    cache = data.get("aliases") if isinstance(data, dict) else None
+    if isinstance(cache, AliasCache):
+        return cache.get(entry)
+    return _compute_aliases(hass, entry)
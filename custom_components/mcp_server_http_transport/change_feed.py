@@ -0,0 +1,137 @@
+"""In-memory change feed of entity state changes, read by watermark."""
+
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from itertools import islice
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+
+from .const import DEFAULT_CHANGE_FEED_SIZE, DOMAIN
+
+
+def _changed(old: State | None, new: State | None, attributes: Iterable[str]) -> bool:
+    """Return True when an event added, removed or changed an entity's state or attributes."""
+    if old is None or new is None:
+        return True
+    if old.state != new.state:
+        return True
+    return any(old.attributes.get(key) != new.attributes.get(key) for key in attributes)
+
+
+class ChangeFeed:
+    """Ring buffer of state_changed events numbered by a watermark.
+
+    Every event gets the next watermark. The first watermark is the start
+    time in microseconds, so watermarks handed out before a restart or
+    reload are below the oldest one still available and ask for a resync,
+    as do watermarks whose events were pushed out of the buffer.
+    """
+
+    def __init__(self, hass: HomeAssistant, maxlen: int = DEFAULT_CHANGE_FEED_SIZE) -> None:
+        """Initialize an empty feed."""
+        self.hass = hass
+        # (watermark, entity_id, old_state, new_state)
+        self._events: deque[tuple[int, str, State | None, State | None]] = deque(maxlen=maxlen)
+        self._watermark = time.time_ns() // 1000
+        # Watermarks below this have had events dropped after them
+        self._oldest = self._watermark
+        self._unsub: Callable[[], None] | None = None
+
+    @property
+    def watermark(self) -> int:
+        """Return the watermark of the latest event."""
+        return self._watermark
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording state changes."""
+        self._unsub = self.hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop recording state changes."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Record a state_changed event."""
+        if len(self._events) == self._events.maxlen:
+            self._oldest = self._events[0][0]
+        self._watermark += 1
+        self._events.append(
+            (
+                self._watermark,
+                event.data["entity_id"],
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
+        )
+
+    def changes_since(
+        self, watermark: int, attributes: Iterable[str] = ()
+    ) -> dict[str, State | None] | None:
+        """Return the entities changed after watermark, or None when a resync is needed.
+
+        An entity counts as changed when it was added or removed, or its
+        state or one of the given attributes changed. Each maps to its
+        latest state (None once removed), in order of its latest change.
+        """
+        if not self._oldest <= watermark <= self._watermark:
+            return None
+        attributes = tuple(attributes)
+        changed: dict[str, State | None] = {}
+        start = len(self._events) - (self._watermark - watermark)
+        for _, entity_id, old_state, new_state in islice(self._events, start, None):
+            if entity_id in changed:
+                # Keep the latest state and move the entity to its latest position
+                del changed[entity_id]
+                changed[entity_id] = new_state
+            elif _changed(old_state, new_state, attributes):
+                changed[entity_id] = new_state
+        return changed
+
+
+def changes_payload(
+    feed: ChangeFeed, watermark: int | None, attributes: Iterable[str] = ()
+) -> dict[str, Any]:
+    """Return the response for a change request.
+
+    Without a watermark, only the current watermark is returned, to be
+    passed back on the next request.
+    """
+    attributes = tuple(attributes)
+    current = feed.watermark
+    payload: dict[str, Any] = {"watermark": current, "resync_required": False, "changes": []}
+    if watermark is None:
+        return payload
+    changed = feed.changes_since(watermark, attributes)
+    if changed is None:
+        payload["resync_required"] = True
+        return payload
+    for entity_id, state in changed.items():
+        if state is None:
+            payload["changes"].append({"entity_id": entity_id, "removed": True})
+            continue
+        change: dict[str, Any] = {
+            "entity_id": entity_id,
+            "state": state.state,
+            "last_changed": state.last_changed.isoformat(),
+        }
+        if attributes:
+            change["attributes"] = {
+                key: state.attributes[key] for key in attributes if key in state.attributes
+            }
+        payload["changes"].append(change)
+    return payload
+
+
+def get_change_feed(hass: HomeAssistant) -> ChangeFeed | None:
+    """Return the integration's change feed, or None when it is not set up."""
+    data = hass.data.get(DOMAIN)
+    feed = data.get("change_feed") if isinstance(data, dict) else None
+    return feed if isinstance(feed, ChangeFeed) else None
@@ -4,6 +4,9 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import floor_registry as fr
+
+from .entity_index import get_entity_index
 
 MAX_COMPLETIONS = 100
 
@@ -32,6 +35,9 @@ async def complete(
     if arg_name == "area_id":
         return _complete_area_id(hass, arg_value)
 
+    if arg_name == "floor_id":
+        return _complete_floor_id(hass, arg_value)
+
     if arg_name == "url_path":
         return _complete_url_path(hass, arg_value)
 
@@ -77,8 +83,10 @@ async def complete(
 
 def _complete_entity_id(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
     """Complete entity IDs."""
-    all_entities = [s.entity_id for s in hass.states.async_all()]
-    matches = sorted(e for e in all_entities if e.startswith(prefix))
+    index = get_entity_index(hass)
+    # Entity IDs start with their domain, so narrow to it once the dot is typed
+    domain = prefix.split(".", 1)[0] if "." in prefix else None
+    matches = [e for e in index.entity_ids(domain=domain) if e.startswith(prefix)]
     return {
         "values": matches[:MAX_COMPLETIONS],
         "hasMore": len(matches) > MAX_COMPLETIONS,
@@ -87,8 +95,7 @@ def _complete_entity_id(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
 
 def _complete_domain(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
     """Complete domain names."""
-    domains = sorted(set(s.entity_id.split(".")[0] for s in hass.states.async_all()))
-    matches = [d for d in domains if d.startswith(prefix)]
+    matches = [d for d in get_entity_index(hass).domains() if d.startswith(prefix)]
     return {"values": matches, "hasMore": False}
 
 
@@ -114,6 +121,14 @@ def _complete_area_id(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
     return {"values": matches, "hasMore": False}
 
 
+def _complete_floor_id(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
+    """Complete floor IDs."""
+    registry = fr.async_get(hass)
+    floors = [floor.floor_id for floor in registry.async_list_floors()]
+    matches = sorted(f for f in floors if f.startswith(prefix))
+    return {"values": matches, "hasMore": False}
+
+
 def _complete_url_path(hass: HomeAssistant, prefix: str) -> dict[str, Any]:
     """Complete dashboard URL paths."""
     from homeassistant.components.lovelace.const import LOVELACE_DATA
@@ -8,11 +8,22 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 
 from .const import (
+    CONF_BATCH_CONCURRENCY,
     CONF_CAMERA_IMAGE_ACCESS,
     CONF_CONFIG_FILE_ACCESS,
     CONF_IMAGE_FILE_ACCESS,
     CONF_NATIVE_AUTH,
+    CONF_RELOAD_DELAY,
+    CONF_RELOAD_MAX_DELAY,
+    CONF_TOKEN_CACHE_TTL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_RELOAD_DELAY,
+    DEFAULT_RELOAD_MAX_DELAY,
+    DEFAULT_TOKEN_CACHE_TTL,
     DOMAIN,
+    MAX_BATCH_CONCURRENCY,
+    MAX_RELOAD_DELAY,
+    MAX_TOKEN_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -26,6 +37,9 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Seconds a reload after config edits may wait, as validated in options
+_RELOAD_DELAY_SCHEMA = vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_RELOAD_DELAY))
+
 
 class MCPServerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for MCP Server."""
@@ -77,8 +91,13 @@ class MCPServerOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             native_auth = user_input.get(CONF_NATIVE_AUTH, False)
 
+            reload_delay = user_input.get(CONF_RELOAD_DELAY, DEFAULT_RELOAD_DELAY)
+            reload_max_delay = user_input.get(CONF_RELOAD_MAX_DELAY, DEFAULT_RELOAD_MAX_DELAY)
+
             if not native_auth and "oidc_provider" not in self.hass.config_entries.async_domains():
                 errors["base"] = "oidc_provider_required"
+            elif reload_max_delay < reload_delay:
+                errors[CONF_RELOAD_MAX_DELAY] = "reload_max_delay_too_short"
             else:
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
@@ -90,6 +109,16 @@ class MCPServerOptionsFlowHandler(config_entries.OptionsFlow):
         current_config_file_access = self.config_entry.data.get(CONF_CONFIG_FILE_ACCESS, False)
         current_camera_image_access = self.config_entry.data.get(CONF_CAMERA_IMAGE_ACCESS, False)
         current_image_file_access = self.config_entry.data.get(CONF_IMAGE_FILE_ACCESS, False)
+        current_reload_delay = self.config_entry.data.get(CONF_RELOAD_DELAY, DEFAULT_RELOAD_DELAY)
+        current_reload_max_delay = self.config_entry.data.get(
+            CONF_RELOAD_MAX_DELAY, DEFAULT_RELOAD_MAX_DELAY
+        )
+        current_token_cache_ttl = self.config_entry.data.get(
+            CONF_TOKEN_CACHE_TTL, DEFAULT_TOKEN_CACHE_TTL
+        )
+        current_batch_concurrency = self.config_entry.data.get(
+            CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -101,6 +130,18 @@ class MCPServerOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_CAMERA_IMAGE_ACCESS, default=current_camera_image_access
                     ): bool,
                     vol.Optional(CONF_IMAGE_FILE_ACCESS, default=current_image_file_access): bool,
+                    vol.Optional(
+                        CONF_RELOAD_DELAY, default=current_reload_delay
+                    ): _RELOAD_DELAY_SCHEMA,
+                    vol.Optional(
+                        CONF_RELOAD_MAX_DELAY, default=current_reload_max_delay
+                    ): _RELOAD_DELAY_SCHEMA,
+                    vol.Optional(CONF_TOKEN_CACHE_TTL, default=current_token_cache_ttl): vol.All(
+                        vol.Coerce(int), vol.Range(min=0, max=MAX_TOKEN_CACHE_TTL)
+                    ),
+                    vol.Optional(
+                        CONF_BATCH_CONCURRENCY, default=current_batch_concurrency
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_BATCH_CONCURRENCY)),
                 }
             ),
             errors=errors,
@@ -3,12 +3,16 @@
 import logging
 import os
 import uuid
-from typing import Any
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any, NamedTuple
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.yaml import dumper as yaml_dumper
 from homeassistant.util.yaml import loader as yaml_loader
 
+from .reload_scheduler import async_request_reload
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -36,6 +40,90 @@ def _load_yaml_dict(path: str) -> dict[str, Any]:
     return {}
 
 
+def _readonly(*args: Any, **kwargs: Any) -> Any:
+    """Raise an exception when a read only list is modified."""
+    raise RuntimeError("Cannot modify ReadOnlyList")
+
+
+class _ReadOnlyList(list):
+    """Read only version of list, like ReadOnlyDict."""
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    clear = _readonly
+    sort = _readonly
+    reverse = _readonly
+
+
+class _ParsedFile(NamedTuple):
+    """A parsed config file, as a read only view, with the position of each list entry ID."""
+
+    data: Sequence[dict[str, Any]] | dict[str, Any]
+    index: dict[Hashable, int]
+
+
+# Parsed config files by path, with the (mtime_ns, size) they were parsed at
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], _ParsedFile]] = {}
+
+
+def _parse_list(path: str) -> _ParsedFile:
+    """Load a list-based config file into a read only view and ID index."""
+    entries = _load_yaml_list(path)
+    index: dict[Hashable, int] = {}
+    for i, entry in enumerate(entries):
+        if isinstance(entry, dict) and isinstance(entry.get("id"), Hashable):
+            index.setdefault(entry["id"], i)
+    return _ParsedFile(_ReadOnlyList(entries), index)
+
+
+def _parse_dict(path: str) -> _ParsedFile:
+    """Load a dict-based config file into a read only view."""
+    return _ParsedFile(ReadOnlyDict(_load_yaml_dict(path)), {})
+
+
+def _parsed(path: str, parse: Callable[[str], _ParsedFile]) -> _ParsedFile:
+    """Return the parsed config file, parsing it again only when it changed.
+
+    A file is unchanged while its modification time and size are; writes
+    through this module drop the cached parse, as they may keep both.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Missing: nothing worth caching
+        _PARSE_CACHE.pop(path, None)
+        return parse(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    parsed = parse(path)
+    _PARSE_CACHE[path] = (signature, parsed)
+    return parsed
+
+
+def _save_yaml(path: str, data: list[dict[str, Any]] | dict[str, Any]) -> None:
+    """Write a config file and drop its cached parse."""
+    try:
+        yaml_dumper.save_yaml(path, data)
+    finally:
+        _PARSE_CACHE.pop(path, None)
+
+
+# Write helpers schedule a reload of the domain and return once the file is
+# written; the reload scheduler waits briefly to combine the reloads of
+# back-to-back edits. reload_now starts the reload at once and waits for it.
+# They return whether the reload was merged with another edit's.
+# List-based helpers name the IDs they changed, so automations reload just
+# those where Home Assistant supports it.
+
 # --- List-based CRUD (automations, scenes) ---
 
 
@@ -44,8 +132,10 @@ async def create_list_entry(
     config_file: str,
     entry: dict[str, Any],
     reload_domain: str,
-) -> str:
-    """Create a new entry in a list-based YAML config."""
+    *,
+    reload_now: bool = False,
+) -> tuple[str, bool]:
+    """Create a new entry in a list-based YAML config, returning its ID."""
     path = hass.config.path(config_file)
     entry_id = str(uuid.uuid4())
     entry["id"] = entry_id
@@ -53,11 +143,11 @@ async def create_list_entry(
     def _write():
         current = _load_yaml_list(path)
         current.append(entry)
-        yaml_dumper.save_yaml(path, current)
+        _save_yaml(path, current)
 
     await hass.async_add_executor_job(_write)
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
-    return entry_id
+    merged = await async_request_reload(hass, reload_domain, flush=reload_now, targets=[entry_id])
+    return entry_id, merged
 
 
 async def update_list_entry(
@@ -66,7 +156,9 @@ async def update_list_entry(
     entry_id: str,
     entry: dict[str, Any],
     reload_domain: str,
-) -> None:
+    *,
+    reload_now: bool = False,
+) -> bool:
     """Update an existing entry in a list-based YAML config."""
     path = hass.config.path(config_file)
     entry["id"] = entry_id
@@ -76,14 +168,14 @@ async def update_list_entry(
         for i, item in enumerate(current):
             if item.get("id") == entry_id:
                 current[i] = entry
-                yaml_dumper.save_yaml(path, current)
+                _save_yaml(path, current)
                 return True
         return False
 
     found = await hass.async_add_executor_job(_write)
     if not found:
         raise ValueError(f"Entry with id '{entry_id}' not found in {config_file}")
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
+    return await async_request_reload(hass, reload_domain, flush=reload_now, targets=[entry_id])
 
 
 async def delete_list_entry(
@@ -91,7 +183,9 @@ async def delete_list_entry(
     config_file: str,
     entry_id: str,
     reload_domain: str,
-) -> None:
+    *,
+    reload_now: bool = False,
+) -> bool:
     """Delete an entry from a list-based YAML config."""
     path = hass.config.path(config_file)
 
@@ -101,13 +195,13 @@ async def delete_list_entry(
         current = [item for item in current if item.get("id") != entry_id]
         if len(current) == original_len:
             return False
-        yaml_dumper.save_yaml(path, current)
+        _save_yaml(path, current)
         return True
 
     found = await hass.async_add_executor_job(_write)
     if not found:
         raise ValueError(f"Entry with id '{entry_id}' not found in {config_file}")
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
+    return await async_request_reload(hass, reload_domain, flush=reload_now, targets=[entry_id])
 
 
 # --- Dict-based CRUD (scripts) ---
@@ -119,8 +213,10 @@ async def create_dict_entry(
     key: str,
     config: dict[str, Any],
     reload_domain: str,
-) -> str:
-    """Create a new entry in a dict-based YAML config."""
+    *,
+    reload_now: bool = False,
+) -> tuple[str, bool]:
+    """Create a new entry in a dict-based YAML config, returning its key."""
     path = hass.config.path(config_file)
 
     def _write():
@@ -128,11 +224,11 @@ async def create_dict_entry(
         if key in current:
             raise ValueError(f"Entry '{key}' already exists in {config_file}")
         current[key] = config
-        yaml_dumper.save_yaml(path, current)
+        _save_yaml(path, current)
 
     await hass.async_add_executor_job(_write)
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
-    return key
+    merged = await async_request_reload(hass, reload_domain, flush=reload_now)
+    return key, merged
 
 
 async def update_dict_entry(
@@ -141,7 +237,9 @@ async def update_dict_entry(
     key: str,
     config: dict[str, Any],
     reload_domain: str,
-) -> None:
+    *,
+    reload_now: bool = False,
+) -> bool:
     """Update an existing entry in a dict-based YAML config."""
     path = hass.config.path(config_file)
 
@@ -150,10 +248,10 @@ async def update_dict_entry(
         if key not in current:
             raise ValueError(f"Entry '{key}' not found in {config_file}")
         current[key] = config
-        yaml_dumper.save_yaml(path, current)
+        _save_yaml(path, current)
 
     await hass.async_add_executor_job(_write)
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
+    return await async_request_reload(hass, reload_domain, flush=reload_now)
 
 
 async def delete_dict_entry(
@@ -161,7 +259,9 @@ async def delete_dict_entry(
     config_file: str,
     key: str,
     reload_domain: str,
-) -> None:
+    *,
+    reload_now: bool = False,
+) -> bool:
     """Delete an entry from a dict-based YAML config."""
     path = hass.config.path(config_file)
 
@@ -170,10 +270,150 @@ async def delete_dict_entry(
         if key not in current:
             raise ValueError(f"Entry '{key}' not found in {config_file}")
         del current[key]
-        yaml_dumper.save_yaml(path, current)
+        _save_yaml(path, current)
 
     await hass.async_add_executor_job(_write)
-    await hass.services.async_call(reload_domain, "reload", blocking=True)
+    return await async_request_reload(hass, reload_domain, flush=reload_now)
+
+
+# --- Batch edits ---
+
+BATCH_OPERATIONS = ("create", "update", "delete")
+
+
+def _check_operation(operation: dict[str, Any], key_field: str) -> str:
+    """Return the operation's kind, or raise ValueError when it is malformed."""
+    kind = operation.get("op")
+    if kind not in BATCH_OPERATIONS:
+        raise ValueError(f"Unknown op '{kind}', expected one of {', '.join(BATCH_OPERATIONS)}")
+    if kind != "create" and not operation.get(key_field):
+        raise ValueError(f"{key_field} is required for {kind}")
+    if kind != "delete" and not isinstance(operation.get("config"), dict):
+        raise ValueError(f"config is required for {kind}")
+    return kind
+
+
+async def _async_apply_operations(
+    hass: HomeAssistant,
+    reload_domain: str,
+    apply: Callable[[], tuple[list[dict[str, Any]], bool]],
+    reload_now: bool,
+    key_field: str | None = None,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Run apply in the executor, then reload once when it wrote the file.
+
+    With key_field, only the entries the operations changed are reloaded.
+    """
+    results, written = await hass.async_add_executor_job(apply)
+    merged = False
+    if written:
+        targets = None
+        if key_field is not None:
+            targets = [str(result[key_field]) for result in results if result["success"]]
+        merged = await async_request_reload(hass, reload_domain, flush=reload_now, targets=targets)
+    return results, merged
+
+
+async def apply_list_operations(
+    hass: HomeAssistant,
+    config_file: str,
+    operations: list[dict[str, Any]],
+    reload_domain: str,
+    *,
+    reload_now: bool = False,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Apply create/update/delete operations to a list-based YAML config.
+
+    Operations are applied in order to one parse of the file, which is
+    written once and reloaded once if any succeeded. An operation that
+    fails (malformed, or its ID not found) is reported and skipped. Returns
+    one result per operation with its index, op, id and success or error,
+    and whether the reload was merged.
+    """
+    path = hass.config.path(config_file)
+
+    def _apply() -> tuple[list[dict[str, Any]], bool]:
+        current: list[dict[str, Any] | None] = list(_load_yaml_list(path))
+        index = {
+            entry["id"]: i
+            for i, entry in reversed(list(enumerate(current)))
+            if isinstance(entry, dict) and isinstance(entry.get("id"), Hashable)
+        }
+        results = []
+        for i, operation in enumerate(operations):
+            entry_id = operation.get("id")
+            result: dict[str, Any] = {"index": i, "op": operation.get("op"), "id": entry_id}
+            try:
+                kind = _check_operation(operation, "id")
+                if kind == "create":
+                    entry_id = result["id"] = str(uuid.uuid4())
+                    index[entry_id] = len(current)
+                    current.append({**operation["config"], "id": entry_id})
+                elif entry_id not in index:
+                    raise ValueError(f"Entry with id '{entry_id}' not found in {config_file}")
+                elif kind == "update":
+                    current[index[entry_id]] = {**operation["config"], "id": entry_id}
+                else:
+                    current[index.pop(entry_id)] = None
+                result["success"] = True
+            except ValueError as err:
+                result.update(success=False, error=str(err))
+            results.append(result)
+
+        written = any(result["success"] for result in results)
+        if written:
+            _save_yaml(path, [entry for entry in current if entry is not None])
+        return results, written
+
+    return await _async_apply_operations(hass, reload_domain, _apply, reload_now, "id")
+
+
+async def apply_dict_operations(
+    hass: HomeAssistant,
+    config_file: str,
+    operations: list[dict[str, Any]],
+    reload_domain: str,
+    *,
+    reload_now: bool = False,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Apply create/update/delete operations to a dict-based YAML config.
+
+    Like apply_list_operations, with entries addressed by key; create fails
+    when the key exists.
+    """
+    path = hass.config.path(config_file)
+
+    def _apply() -> tuple[list[dict[str, Any]], bool]:
+        current = dict(_load_yaml_dict(path))
+        results = []
+        for i, operation in enumerate(operations):
+            key = operation.get("key")
+            result: dict[str, Any] = {"index": i, "op": operation.get("op"), "key": key}
+            try:
+                kind = _check_operation(operation, "key")
+                if kind == "create":
+                    if not key:
+                        raise ValueError("key is required for create")
+                    if key in current:
+                        raise ValueError(f"Entry '{key}' already exists in {config_file}")
+                    current[key] = operation["config"]
+                elif key not in current:
+                    raise ValueError(f"Entry '{key}' not found in {config_file}")
+                elif kind == "update":
+                    current[key] = operation["config"]
+                else:
+                    del current[key]
+                result["success"] = True
+            except ValueError as err:
+                result.update(success=False, error=str(err))
+            results.append(result)
+
+        written = any(result["success"] for result in results)
+        if written:
+            _save_yaml(path, current)
+        return results, written
+
+    return await _async_apply_operations(hass, reload_domain, _apply, reload_now)
 
 
 # --- Read helpers ---
@@ -182,10 +422,15 @@ async def delete_dict_entry(
 async def read_list_entries(
     hass: HomeAssistant,
     config_file: str,
-) -> list[dict[str, Any]]:
-    """Read all entries from a list-based YAML config."""
+) -> Sequence[dict[str, Any]]:
+    """Read all entries from a list-based YAML config.
+
+    The file is parsed again only when it changed. The result is a read
+    only view shared between callers; its entries must not be modified.
+    """
     path = hass.config.path(config_file)
-    return await hass.async_add_executor_job(_load_yaml_list, path)
+    parsed = await hass.async_add_executor_job(_parsed, path, _parse_list)
+    return parsed.data
 
 
 async def read_list_entry(
@@ -195,10 +440,9 @@ async def read_list_entry(
 ) -> dict[str, Any]:
     """Read a single entry from a list-based YAML config by ID."""
     path = hass.config.path(config_file)
-    entries = await hass.async_add_executor_job(_load_yaml_list, path)
-    for entry in entries:
-        if entry.get("id") == entry_id:
-            return entry
+    parsed = await hass.async_add_executor_job(_parsed, path, _parse_list)
+    if (position := parsed.index.get(entry_id)) is not None:
+        return parsed.data[position]
     raise ValueError(f"Entry with id '{entry_id}' not found in {config_file}")
 
 
@@ -206,9 +450,13 @@ async def read_dict_entries(
     hass: HomeAssistant,
     config_file: str,
 ) -> dict[str, Any]:
-    """Read all entries from a dict-based YAML config."""
+    """Read all entries from a dict-based YAML config.
+
+    Cached like read_list_entries, and likewise read only.
+    """
     path = hass.config.path(config_file)
-    return await hass.async_add_executor_job(_load_yaml_dict, path)
+    parsed = await hass.async_add_executor_job(_parsed, path, _parse_dict)
+    return parsed.data
 
 
 async def read_dict_entry(
@@ -218,7 +466,7 @@ async def read_dict_entry(
 ) -> dict[str, Any]:
     """Read a single entry from a dict-based YAML config by key."""
     path = hass.config.path(config_file)
-    entries = await hass.async_add_executor_job(_load_yaml_dict, path)
+    entries = (await hass.async_add_executor_job(_parsed, path, _parse_dict)).data
     if key not in entries:
         raise ValueError(f"Entry '{key}' not found in {config_file}")
     return entries[key]
@@ -13,3 +13,44 @@ CONF_NATIVE_AUTH = "native_auth_enabled"
 CONF_CONFIG_FILE_ACCESS = "config_file_access_enabled"
 CONF_CAMERA_IMAGE_ACCESS = "camera_image_access_enabled"
 CONF_IMAGE_FILE_ACCESS = "image_file_access_enabled"
+
+# JSON-RPC batch handling: maximum number of batch elements dispatched at once
+CONF_BATCH_CONCURRENCY = "batch_concurrency"
+DEFAULT_BATCH_CONCURRENCY = 8
+MAX_BATCH_CONCURRENCY = 32
+
+# batch_call_service: calls in flight at once (caller may lower or raise up to
+# the max), and seconds each call may take
+DEFAULT_SERVICE_CALL_CONCURRENCY = 8
+MAX_SERVICE_CALL_CONCURRENCY = 32
+DEFAULT_SERVICE_CALL_TIMEOUT = 30
+
+# Validated OIDC token cache; the TTL (seconds) bounds entries even when the
+# token's exp is later, and 0 turns the cache off
+CONF_TOKEN_CACHE_TTL = "token_cache_ttl"
+DEFAULT_TOKEN_CACHE_SIZE = 256
+DEFAULT_TOKEN_CACHE_TTL = 300
+MAX_TOKEN_CACHE_TTL = 3600
+
+# Streamable HTTP (SSE): seconds between keepalive comments on idle streams
+SSE_KEEPALIVE_INTERVAL = 25
+
+# Seconds resource updates are collected before being sent to open streams
+RESOURCE_UPDATE_DELAY = 1
+
+# Recorder query results kept for windows that have closed (JSON bytes)
+DEFAULT_RECORDER_CACHE_BYTES = 16 * 1024 * 1024
+
+# Seconds prompts wait for the recorder before answering without its data
+PROMPT_RECORDER_TIMEOUT = 10
+
+# Reloads after config edits: seconds of quiet awaited before reloading a
+# domain, and most seconds a reload waits after its first request
+CONF_RELOAD_DELAY = "reload_delay"
+CONF_RELOAD_MAX_DELAY = "reload_max_delay"
+DEFAULT_RELOAD_DELAY = 0.5
+DEFAULT_RELOAD_MAX_DELAY = 3
+MAX_RELOAD_DELAY = 60
+
+# Change feed: state_changed events kept for get_changes_since
+DEFAULT_CHANGE_FEED_SIZE = 10000
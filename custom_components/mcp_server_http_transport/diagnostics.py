@@ -0,0 +1,27 @@
+"""Diagnostics support for MCP Server."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .recorder_cache import get_recorder_cache
+from .state_cache import get_state_fragments
+from .token_cache import get_token_cache
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the settings of the config entry and the counters of its caches."""
+    caches = {
+        "tokens": get_token_cache(hass),
+        "state_fragments": get_state_fragments(hass),
+        "recorder": get_recorder_cache(hass),
+    }
+    return {
+        "entry": dict(entry.data),
+        "caches": {
+            name: cache.stats() if cache is not None else None for name, cache in caches.items()
+        },
+    }
@@ -0,0 +1,225 @@
+"""Reduction of long recorder series to a bounded number of points.
+
+The functions here are array-based and synchronous; tools run them in the
+executor. Times are POSIX timestamps in seconds.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+DOWNSAMPLE_METHODS = ("lttb", "bucket")
+
+MIN_POINTS = 3
+MAX_POINTS = 10_000
+
+# Input schema properties for tools that downsample
+DOWNSAMPLE_PROPERTIES = {
+    "max_points": {
+        "type": "integer",
+        "description": (
+            f"Reduce each series to at most this many points (optional, "
+            f"{MIN_POINTS}-{MAX_POINTS}). The response then reports the original row count"
+        ),
+    },
+    "downsample": {
+        "type": "string",
+        "enum": list(DOWNSAMPLE_METHODS),
+        "description": (
+            "How numeric series are reduced with max_points: 'lttb' (default) keeps the "
+            "rows that best preserve the curve's shape; 'bucket' aggregates equal time "
+            "buckets into min/max/mean/last"
+        ),
+    },
+}
+
+# Non-numeric states allowed in a numeric series; they are left out of it
+_MISSING_STATES = ("unavailable", "unknown")
+
+
+def max_points(arguments: dict[str, Any]) -> int | None:
+    """Return the requested number of points, validated and capped, or None."""
+    points = arguments.get("max_points")
+    if points is None:
+        return None
+    if not isinstance(points, int) or isinstance(points, bool) or points < MIN_POINTS:
+        raise ValueError(f"max_points must be an integer of at least {MIN_POINTS}, got {points!r}")
+    return min(points, MAX_POINTS)
+
+
+def downsample_method(arguments: dict[str, Any]) -> str:
+    """Return the requested reduction method, validated."""
+    method = arguments.get("downsample", "lttb")
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(
+            f"Unknown downsample '{method}', expected one of {', '.join(DOWNSAMPLE_METHODS)}"
+        )
+    return method
+
+
+def numeric_values(states: Sequence[str]) -> np.ndarray | None:
+    """Return states as floats, NaN where unavailable or unknown.
+
+    Returns None when any other state is not a number.
+    """
+    values = np.asarray(states, dtype=object)
+    missing = np.isin(values, _MISSING_STATES)
+    numbers = np.full(len(values), np.nan)
+    try:
+        numbers[~missing] = values[~missing].astype(float)
+    except (TypeError, ValueError):
+        return None
+    return numbers
+
+
+def _bucket_starts(x: np.ndarray, n: int) -> np.ndarray:
+    """Return the index of the first point of each non-empty equal-time bucket.
+
+    x must be sorted; the span from its first to last time is split into n
+    buckets.
+    """
+    width = (x[-1] - x[0]) / n
+    if width <= 0:
+        return np.zeros(1, dtype=np.intp)
+    buckets = np.minimum(((x - x[0]) / width).astype(np.intp), n - 1)
+    return np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n: int) -> np.ndarray:
+    """Return the indices of at most n points chosen by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; from each bucket in between,
+    the point forming the largest triangle with the point kept from the
+    previous bucket and the mean of the next bucket. Points where y is NaN
+    are skipped.
+    """
+    finite = np.flatnonzero(np.isfinite(y))
+    if len(finite) <= n:
+        return finite
+    # Relative times keep the areas precise
+    x, y = x[finite] - x[finite[0]], y[finite]
+    size = len(x)
+
+    # n - 2 buckets over the points between the first and the last
+    edges = np.linspace(1, size - 1, n - 1).astype(np.intp)
+    starts, ends = edges[:-1], edges[1:]
+    # Mean of the bucket after each bucket; the last bucket's is the last point
+    next_starts, next_ends = ends, np.append(ends[1:], size)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+    counts = next_ends - next_starts
+    mean_x = (cum_x[next_ends] - cum_x[next_starts]) / counts
+    mean_y = (cum_y[next_ends] - cum_y[next_starts]) / counts
+
+    kept = np.empty(n, dtype=np.intp)
+    kept[0], kept[-1] = 0, size - 1
+    previous = 0
+    for bucket, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+        px, py = x[previous], y[previous]
+        areas = np.abs(
+            (px - mean_x[bucket]) * (y[start:end] - py)
+            - (px - x[start:end]) * (mean_y[bucket] - py)
+        )
+        previous = kept[bucket + 1] = start + int(np.argmax(areas))
+    return finite[kept]
+
+
+def time_buckets(x: np.ndarray, y: np.ndarray, n: int) -> list[dict[str, Any]]:
+    """Return min/max/mean/last of y over at most n equal time buckets.
+
+    Each bucket reports the times of its first and last point as start and
+    end, and its point count. Points where y is NaN are skipped.
+    """
+    finite = np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if not len(x):
+        return []
+    starts = _bucket_starts(x, n)
+    ends = np.append(starts[1:], len(x))
+    counts = ends - starts
+    columns = zip(
+        x[starts].tolist(),
+        x[ends - 1].tolist(),
+        np.minimum.reduceat(y, starts).tolist(),
+        np.maximum.reduceat(y, starts).tolist(),
+        (np.add.reduceat(y, starts) / counts).tolist(),
+        y[ends - 1].tolist(),
+        counts.tolist(),
+    )
+    keys = ("start", "end", "min", "max", "mean", "last", "count")
+    return [dict(zip(keys, values)) for values in columns]
+
+
+def state_spans(x: np.ndarray, states: Sequence[str], end: float, n: int) -> list[dict[str, Any]]:
+    """Return run-length encoded spans of states, at most n.
+
+    Each span holds one state from the time of its first point until the
+    next span starts, or until end for the last. When there are more than n
+    spans, spans in the same equal time bucket are merged and report the
+    state held longest; count is the number of points a span covers.
+    """
+    values = np.asarray(states, dtype=object)
+    starts = np.concatenate(([0], np.flatnonzero(values[1:] != values[:-1]) + 1))
+    counts = np.diff(np.append(starts, len(values)))
+    span_starts = x[starts]
+    span_ends = np.append(span_starts[1:], max(end, x[-1]))
+    span_states = values[starts]
+
+    if len(starts) > n:
+        groups = _bucket_starts(span_starts, n)
+        group_of = np.repeat(np.arange(len(groups)), np.diff(np.append(groups, len(starts))))
+        # Longest span first within each group
+        order = np.lexsort((-(span_ends - span_starts), group_of))
+        longest = order[np.concatenate(([0], np.flatnonzero(np.diff(group_of[order])) + 1))]
+        group_ends = np.append(groups[1:], len(starts)) - 1
+        span_states = span_states[longest]
+        span_starts, span_ends = span_starts[groups], span_ends[group_ends]
+        counts = np.add.reduceat(counts, groups)
+
+    keys = ("state", "start", "end", "count")
+    columns = zip(span_states.tolist(), span_starts.tolist(), span_ends.tolist(), counts.tolist())
+    return [dict(zip(keys, values)) for values in columns]
+
+
+def merge_statistics(rows: Sequence[dict[str, Any]], x: np.ndarray, n: int) -> list[dict[str, Any]]:
+    """Merge long-term statistics rows starting at times x into at most n time buckets.
+
+    A merged row runs from the start of its first row to the end of its
+    last; min and max are the bucket's extremes, mean the mean of its
+    means, and sum and state those of its last row. count is the number of
+    rows merged. Values a row lacks are skipped.
+    """
+    if not rows:
+        return []
+    starts = _bucket_starts(x, n)
+    ends = np.append(starts[1:], len(rows))
+    merged = [
+        {"start": rows[start]["start"], "end": rows[end - 1]["end"]}
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+    columns = {}
+    for key in ("min", "max", "mean"):
+        values = np.array([np.nan if row.get(key) is None else row[key] for row in rows])
+        present = ~np.isnan(values)
+        if not present.any():
+            continue
+        if key == "mean":
+            with np.errstate(invalid="ignore"):
+                columns[key] = np.add.reduceat(np.where(present, values, 0.0), starts) / (
+                    np.add.reduceat(present, starts)
+                )
+        else:
+            reduce = np.fmin if key == "min" else np.fmax
+            columns[key] = reduce.reduceat(values, starts)
+    for key, values in columns.items():
+        for row, value in zip(merged, values.tolist()):
+            if value == value:  # not NaN
+                row[key] = value
+
+    for row, end, count in zip(merged, ends.tolist(), (ends - starts).tolist()):
+        last = rows[end - 1]
+        row.update({key: last[key] for key in ("sum", "state") if last.get(key) is not None})
+        row["count"] = count
+    return merged
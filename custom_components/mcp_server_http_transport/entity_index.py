@@ -0,0 +1,397 @@
+"""In-memory entity index shared by the entity-scanning tools, resources and prompts."""
+
+from collections import defaultdict
+from collections.abc import Callable
+from typing import NamedTuple
+from weakref import WeakKeyDictionary
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .aliases import get_aliases
+from .const import DOMAIN
+from .search_index import TrigramIndex
+
+# Indexes used while the integration is not set up, one per hass instance
+_FALLBACK_INDEXES: WeakKeyDictionary[HomeAssistant, "EntityIndex"] = WeakKeyDictionary()
+
+
+def _domain(entity_id: str) -> str:
+    """Return the domain part of an entity ID."""
+    return entity_id.split(".", 1)[0]
+
+
+class _Location(NamedTuple):
+    """Where an entity is: its device, area and the area's floor."""
+
+    device_id: str | None
+    area_id: str | None
+    floor_id: str | None
+
+
+_NO_LOCATION = _Location(None, None, None)
+
+# Device registry changes that affect an entity's location or search context
+_DEVICE_FIELDS = {"area_id", "name", "name_by_user"}
+
+
+def _add(buckets: dict[str, set[str]], key: str | None, entity_id: str) -> None:
+    """Add entity_id to the bucket for key, ignoring empty keys."""
+    if key:
+        buckets[key].add(entity_id)
+
+
+def _discard(buckets: dict[str, set[str]], key: str | None, entity_id: str) -> None:
+    """Remove entity_id from the bucket for key, dropping the bucket once empty."""
+    if key and (bucket := buckets.get(key)) is not None:
+        bucket.discard(entity_id)
+        if not bucket:
+            del buckets[key]
+
+
+class EntityIndex:
+    """Entity ID sets keyed by domain, state, device_class, area, floor and label.
+
+    Built from the state machine at setup and kept current from
+    `state_changed`, so tools query buckets instead of scanning every state
+    and looking each one up in the registries. The location map (each
+    entity's device, its area with the device area fallback, and that area's
+    floor), label buckets, and the trigram search index over names, aliases,
+    device and area names, need registry lookups, so they are built on first
+    use. After that, registry updates re-index only the entities they touch:
+    an entity registry update its entity, a device registry update the
+    device's entities, and an area registry update the area's entities
+    (floor removals arrive as area updates). Query results are sorted by
+    entity_id.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index from the current states."""
+        self.hass = hass
+        self._states: dict[str, State] = {}
+        self._by_domain: dict[str, set[str]] = defaultdict(set)
+        self._by_state: dict[str, set[str]] = defaultdict(set)
+        self._by_device_class: dict[str, set[str]] = defaultdict(set)
+        # Registry-derived maps; None until first needed
+        self._locations: dict[str, _Location] | None = None
+        self._by_device: dict[str, set[str]] = defaultdict(set)
+        self._by_area: dict[str, set[str]] = defaultdict(set)
+        self._by_floor: dict[str, set[str]] = defaultdict(set)
+        self._labels: dict[str, set[str]] | None = None
+        self._by_label: dict[str, set[str]] = defaultdict(set)
+        self._search: TrigramIndex | None = None
+        self._unsubs: list[Callable[[], None]] = []
+        for state in hass.states.async_all():
+            self._add_state(state)
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking state and registry changes."""
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed),
+            bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_updated),
+            bus.async_listen(dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_updated),
+            bus.async_listen(ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_updated),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    def __len__(self) -> int:
+        """Return the number of indexed entities."""
+        return len(self._states)
+
+    def get(self, entity_id: str) -> State | None:
+        """Return the indexed state for entity_id."""
+        return self._states.get(entity_id)
+
+    def domains(self) -> list[str]:
+        """Return all domains that have at least one entity."""
+        return sorted(self._by_domain)
+
+    def domain_counts(self) -> dict[str, int]:
+        """Return the number of entities per domain."""
+        return {domain: len(ids) for domain, ids in sorted(self._by_domain.items())}
+
+    def area_of(self, entity_id: str) -> str | None:
+        """Return the entity's area, falling back to its device's area."""
+        return self._location(entity_id).area_id
+
+    def floor_of(self, entity_id: str) -> str | None:
+        """Return the floor of the entity's area."""
+        return self._location(entity_id).floor_id
+
+    def _location(self, entity_id: str) -> "_Location":
+        """Return the entity's location, empty for unknown entities."""
+        self._ensure_locations()
+        return self._locations.get(entity_id, _NO_LOCATION)
+
+    def entity_ids(
+        self,
+        *,
+        domain: str | None = None,
+        state: str | None = None,
+        device_class: str | None = None,
+        area_id: str | None = None,
+        floor_id: str | None = None,
+        label_id: str | None = None,
+    ) -> list[str]:
+        """Return entity IDs matching every given filter, sorted."""
+        buckets = []
+        if domain:
+            buckets.append(self._by_domain.get(domain, set()))
+        if state is not None:
+            buckets.append(self._by_state.get(state, set()))
+        if device_class:
+            buckets.append(self._by_device_class.get(device_class, set()))
+        if area_id:
+            self._ensure_locations()
+            buckets.append(self._by_area.get(area_id, set()))
+        if floor_id:
+            self._ensure_locations()
+            buckets.append(self._by_floor.get(floor_id, set()))
+        if label_id:
+            self._ensure_labels()
+            buckets.append(self._by_label.get(label_id, set()))
+
+        if not buckets:
+            return sorted(self._states)
+        buckets.sort(key=len)
+        return sorted(buckets[0].intersection(*buckets[1:]))
+
+    def states(self, **filters: str | None) -> list[State]:
+        """Return states matching the filters accepted by entity_ids, sorted by entity_id."""
+        return [self._states[entity_id] for entity_id in self.entity_ids(**filters)]
+
+    def search(
+        self, query: str, limit: int | None = None, **filters: str | None
+    ) -> list[tuple[State, float]]:
+        """Return (state, score) pairs fuzzily matching query, best first.
+
+        Accepts the filters of entity_ids to restrict the candidates.
+        """
+        self._ensure_search()
+        candidates = set(self.entity_ids(**filters)) if any(filters.values()) else None
+        return [
+            (self._states[entity_id], score)
+            for entity_id, score in self._search.search(query, candidates, limit)
+        ]
+
+    def _add_state(self, state: State) -> None:
+        """Index a state that is not indexed yet."""
+        entity_id = state.entity_id
+        self._states[entity_id] = state
+        _add(self._by_domain, _domain(entity_id), entity_id)
+        _add(self._by_state, state.state, entity_id)
+        _add(self._by_device_class, state.attributes.get("device_class"), entity_id)
+        self._index_registry_entry(entity_id)
+
+    def _remove_state(self, entity_id: str) -> None:
+        """Drop an entity from every bucket."""
+        state = self._states.pop(entity_id, None)
+        if state is None:
+            return
+        _discard(self._by_domain, _domain(entity_id), entity_id)
+        _discard(self._by_state, state.state, entity_id)
+        _discard(self._by_device_class, state.attributes.get("device_class"), entity_id)
+        self._unindex_registry_entry(entity_id)
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Apply a state_changed event."""
+        entity_id = event.data["entity_id"]
+        new_state: State | None = event.data.get("new_state")
+        old_state = self._states.get(entity_id)
+        if new_state is None:
+            self._remove_state(entity_id)
+            return
+        if old_state is None:
+            self._add_state(new_state)
+            return
+
+        self._states[entity_id] = new_state
+        if self._search is not None and old_state.attributes.get(
+            "friendly_name"
+        ) != new_state.attributes.get("friendly_name"):
+            self._index_search_doc(entity_id)
+        if old_state.state != new_state.state:
+            _discard(self._by_state, old_state.state, entity_id)
+            _add(self._by_state, new_state.state, entity_id)
+        old_class = old_state.attributes.get("device_class")
+        new_class = new_state.attributes.get("device_class")
+        if old_class != new_class:
+            _discard(self._by_device_class, old_class, entity_id)
+            _add(self._by_device_class, new_class, entity_id)
+
+    @callback
+    def _async_entity_updated(self, event: Event) -> None:
+        """Re-index one entity after an entity registry change."""
+        entity_id = event.data["entity_id"]
+        if old_entity_id := event.data.get("old_entity_id"):
+            self._unindex_registry_entry(old_entity_id)
+        self._unindex_registry_entry(entity_id)
+        if event.data["action"] != "remove" and entity_id in self._states:
+            self._index_registry_entry(entity_id)
+
+    @callback
+    def _async_device_updated(self, event: Event) -> None:
+        """Re-index a device's entities after its area or name changed.
+
+        Entities of a removed device get their own entity registry updates.
+        """
+        if event.data["action"] != "update" or self._locations is None:
+            return
+        changes = event.data.get("changes")
+        if changes is not None and not changes.keys() & _DEVICE_FIELDS:
+            return
+        for entity_id in list(self._by_device.get(event.data["device_id"], ())):
+            self._reindex_registry_entry(entity_id)
+
+    @callback
+    def _async_area_updated(self, event: Event) -> None:
+        """Re-index an area's entities after its floor or name changed, or it was removed."""
+        if event.data["action"] not in ("update", "remove") or self._locations is None:
+            return
+        for entity_id in list(self._by_area.get(event.data["area_id"], ())):
+            self._reindex_registry_entry(entity_id)
+
+    def _ensure_locations(self) -> None:
+        """Build the location map if it was never built."""
+        if self._locations is not None:
+            return
+        self._locations = {}
+        self._by_device.clear()
+        self._by_area.clear()
+        self._by_floor.clear()
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
+        area_registry = ar.async_get(self.hass)
+        for entity_id in self._states:
+            self._index_location(entity_id, entity_registry, device_registry, area_registry)
+
+    def _ensure_labels(self) -> None:
+        """Build the label map if it was never built."""
+        if self._labels is not None:
+            return
+        self._labels = {}
+        self._by_label.clear()
+        entity_registry = er.async_get(self.hass)
+        for entity_id in self._states:
+            self._index_labels(entity_id, entity_registry)
+
+    def _ensure_search(self) -> None:
+        """Build the search index if it was never built or was invalidated."""
+        if self._search is not None:
+            return
+        self._search = TrigramIndex()
+        for entity_id in self._states:
+            self._index_search_doc(entity_id)
+
+    def _index_registry_entry(self, entity_id: str) -> None:
+        """Record the location, labels and names of one entity in whichever maps are built."""
+        if self._locations is not None:
+            self._index_location(
+                entity_id, er.async_get(self.hass), dr.async_get(self.hass), ar.async_get(self.hass)
+            )
+        if self._labels is not None:
+            self._index_labels(entity_id, er.async_get(self.hass))
+        if self._search is not None:
+            self._index_search_doc(entity_id)
+
+    def _unindex_registry_entry(self, entity_id: str) -> None:
+        """Forget the location, labels and names of one entity."""
+        if (
+            self._locations is not None
+            and (location := self._locations.pop(entity_id, None)) is not None
+        ):
+            _discard(self._by_device, location.device_id, entity_id)
+            _discard(self._by_area, location.area_id, entity_id)
+            _discard(self._by_floor, location.floor_id, entity_id)
+        if self._labels is not None:
+            for label_id in self._labels.pop(entity_id, ()):
+                _discard(self._by_label, label_id, entity_id)
+        if self._search is not None:
+            self._search.remove(entity_id)
+
+    def _reindex_registry_entry(self, entity_id: str) -> None:
+        """Re-read one entity's location, labels and names from the registries."""
+        self._unindex_registry_entry(entity_id)
+        self._index_registry_entry(entity_id)
+
+    def _index_location(
+        self,
+        entity_id: str,
+        entity_registry: er.EntityRegistry,
+        device_registry: dr.DeviceRegistry,
+        area_registry: ar.AreaRegistry,
+    ) -> None:
+        """Record the entity's device, area (falling back to the device's) and floor."""
+        entry = entity_registry.async_get(entity_id)
+        device_id = entry.device_id if entry else None
+        area_id = entry.area_id if entry else None
+        if not area_id and device_id:
+            device = device_registry.async_get(device_id)
+            area_id = device.area_id if device else None
+        area = area_registry.async_get_area(area_id) if area_id else None
+        floor_id = area.floor_id if area else None
+        self._locations[entity_id] = _Location(device_id, area_id, floor_id)
+        _add(self._by_device, device_id, entity_id)
+        _add(self._by_area, area_id, entity_id)
+        _add(self._by_floor, floor_id, entity_id)
+
+    def _index_labels(self, entity_id: str, entity_registry: er.EntityRegistry) -> None:
+        """Record the entity's labels."""
+        entry = entity_registry.async_get(entity_id)
+        if entry is None or not entry.labels:
+            return
+        self._labels[entity_id] = set(entry.labels)
+        for label_id in entry.labels:
+            _add(self._by_label, label_id, entity_id)
+
+    def _index_search_doc(self, entity_id: str) -> None:
+        """Index the names of one entity, with its device and area names as context."""
+        state = self._states[entity_id]
+        entry = er.async_get(self.hass).async_get(entity_id)
+        names = [entity_id, state.attributes.get("friendly_name")]
+        context = []
+        if entry:
+            names.extend(get_aliases(self.hass, entry))
+            if entry.device_id and (device := dr.async_get(self.hass).async_get(entry.device_id)):
+                context.append(device.name_by_user or device.name)
+        if (area_id := self.area_of(entity_id)) and (
+            area := ar.async_get(self.hass).async_get_area(area_id)
+        ):
+            context.append(area.name)
+        # Registry names and friendly_name are optional
+        self._search.add(
+            entity_id,
+            [name for name in names if isinstance(name, str)],
+            [name for name in context if isinstance(name, str)],
+        )
+
+
+def get_entity_index(hass: HomeAssistant) -> EntityIndex:
+    """Return the integration's entity index.
+
+    Falls back to an index of its own when the integration is not set up, so
+    handlers behave the same when called directly. That index is built once
+    per hass instance and kept current like the integration's; it is kept
+    out of hass.data[DOMAIN] so it does not make the integration look loaded.
+    """
+    data = hass.data.get(DOMAIN)
+    index = data.get("entity_index") if isinstance(data, dict) else None
+    if isinstance(index, EntityIndex):
+        return index
+    index = _FALLBACK_INDEXES.get(hass)
+    if index is None:
+        index = _FALLBACK_INDEXES[hass] = EntityIndex(hass)
+        index.async_start()
+    return index
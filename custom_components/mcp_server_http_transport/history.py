@@ -0,0 +1,180 @@
+"""State history from the recorder, shared by the history tools and prompts."""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from homeassistant.core import HomeAssistant
+
+from .recorder_cache import async_cached_query
+
+_LOGGER = logging.getLogger(__name__)
+
+# The state change count running for each Home Assistant instance, if any
+_RUNNING_COUNTS: WeakKeyDictionary[HomeAssistant, asyncio.Task[dict[str, int]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _history_row(state: Any, attributes: list[str] | None, no_attributes: bool) -> dict[str, Any]:
+    """Return one history row, with the attributes limited to the whitelist.
+
+    The recorder has already loaded every attribute of the state; the
+    whitelist only trims what is returned.
+    """
+    if isinstance(state, dict):
+        # minimal_response rows between the first and last carry no attributes
+        return {"state": state["state"], "last_changed": state["last_changed"]}
+    row = {"state": state.state, "last_changed": state.last_changed.isoformat()}
+    if no_attributes:
+        return row
+    if attributes is None:
+        row["attributes"] = dict(state.attributes)
+    else:
+        row["attributes"] = {
+            key: state.attributes[key] for key in attributes if key in state.attributes
+        }
+    return row
+
+
+async def async_get_history_rows(
+    hass: HomeAssistant,
+    entity_ids: list[str] | None,
+    start_time: datetime,
+    end_time: datetime,
+    *,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    attributes: list[str] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the history rows of each entity with any, from one recorder query.
+
+    entity_ids None means every recorded entity. Rows hold state,
+    last_changed and, unless no_attributes, the attributes in the
+    attributes whitelist. The whitelist is applied after the recorder
+    loaded all attributes, so it shrinks the rows but not the query; an
+    empty whitelist is the same as no_attributes, which skips loading
+    them. Results of windows that have closed are cached, so the rows must
+    not be modified.
+    """
+    if attributes == []:
+        no_attributes, attributes = True, None
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.history import get_significant_states
+
+    async def _fetch() -> dict[str, list[dict[str, Any]]]:
+        states = await get_instance(hass).async_add_executor_job(
+            get_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            True,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return {
+            entity_id: [_history_row(state, attributes, no_attributes) for state in rows]
+            for entity_id, rows in states.items()
+        }
+
+    key = (
+        "history",
+        None if entity_ids is None else tuple(entity_ids),
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        None if attributes is None else tuple(attributes),
+    )
+    return await async_cached_query(hass, key, start_time, end_time, _fetch)
+
+
+def _state_changes_query(start_time: datetime, end_time: datetime) -> Any:
+    """Return the query counting each entity's state changes in the window.
+
+    Built on the recorder's database schema, which is not a public API: an
+    ImportError or AttributeError means the schema changed.
+    """
+    from homeassistant.components.recorder.db_schema import States, StatesMeta
+    from sqlalchemy import func, select
+
+    # The recorder leaves last_changed_ts empty when it equals last_updated_ts,
+    # that is when the state itself changed
+    return (
+        select(StatesMeta.entity_id, func.count())
+        .select_from(States)
+        .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        .where(
+            States.last_updated_ts > start_time.timestamp(),
+            States.last_updated_ts < end_time.timestamp(),
+            States.last_changed_ts.is_(None),
+        )
+        .group_by(StatesMeta.entity_id)
+    )
+
+
+def _count_state_changes(hass: HomeAssistant, query: Any) -> dict[str, int]:
+    """Run a query from _state_changes_query in a recorder session."""
+    from homeassistant.helpers.recorder import session_scope
+
+    with session_scope(hass=hass, read_only=True) as session:
+        return dict(session.execute(query).tuples().all())
+
+
+async def _async_count_state_changes(
+    hass: HomeAssistant, start_time: datetime, end_time: datetime
+) -> dict[str, int]:
+    """Count state changes in the database, or from the history if its schema changed."""
+    from homeassistant.components.recorder import get_instance
+
+    try:
+        query = _state_changes_query(start_time, end_time)
+    except (ImportError, AttributeError) as err:
+        _LOGGER.debug("Counting state changes from the history, as the query failed: %s", err)
+    else:
+        return await get_instance(hass).async_add_executor_job(_count_state_changes, hass, query)
+
+    # The first row of each entity is its state at the start of the window
+    history = await async_get_history_rows(
+        hass, None, start_time, end_time, minimal_response=True, no_attributes=True
+    )
+    return {entity_id: len(rows) - 1 for entity_id, rows in history.items() if len(rows) > 1}
+
+
+async def async_count_state_changes(
+    hass: HomeAssistant, start_time: datetime, end_time: datetime
+) -> dict[str, int]:
+    """Return how many times each entity changed state, for entities that did.
+
+    The counting is done by the database, so no rows are loaded, unless
+    the recorder's schema no longer fits the query; then the history rows
+    are loaded and counted. A query in the recorder's executor cannot be
+    cancelled, so one a caller stopped waiting for keeps running: until it
+    finishes, later calls wait for it and return its counts, whose window
+    may end a little earlier, instead of starting another.
+    """
+    task = _RUNNING_COUNTS.get(hass)
+    if task is None:
+
+        async def _fetch() -> dict[str, int]:
+            return await _async_count_state_changes(hass, start_time, end_time)
+
+        task = asyncio.create_task(
+            async_cached_query(hass, ("state_changes",), start_time, end_time, _fetch)
+        )
+        _RUNNING_COUNTS[hass] = task
+        task.add_done_callback(lambda done: _async_count_done(hass, done))
+    return await asyncio.shield(task)
+
+
+def _async_count_done(hass: HomeAssistant, task: asyncio.Task[dict[str, int]]) -> None:
+    """Forget the finished count, retrieving its error in case no caller waited."""
+    if _RUNNING_COUNTS.get(hass) is task:
+        del _RUNNING_COUNTS[hass]
+    if not task.cancelled() and (err := task.exception()) is not None:
+        _LOGGER.debug("Counting state changes failed: %s", err)
@@ -1,6 +1,8 @@
 """HTTP transport for MCP server."""
 
+import asyncio
 import logging
+import secrets
 from typing import Any
 
 from aiohttp import web
@@ -9,9 +11,20 @@ from homeassistant.core import HomeAssistant
 from mcp.server import Server
 
 from .completions import complete
-from .const import DOMAIN
+from .const import DEFAULT_BATCH_CONCURRENCY, DOMAIN, SSE_KEEPALIVE_INTERVAL
+from .json_utils import reset_indent, set_indent
+from .pagination import InvalidCursorError
 from .prompts import get_prompt, get_prompts
 from .resources import get_resources, read_resource
+from .streaming import (
+    MCP_SESSION_HEADER,
+    SSE_HEADERS,
+    NotificationHub,
+    reset_progress_callback,
+    set_progress_callback,
+    sse_event,
+)
+from .token_cache import TokenCache, get_token_cache
 from .tools import call_tool, get_tool_schemas
 
 _LOGGER = logging.getLogger(__name__)
@@ -52,6 +65,53 @@ def _get_issuer(request: web.Request) -> str | None:
         return None
 
 
+def _unauthorized(request: web.Request) -> web.Response:
+    """Build a 401 response pointing clients at the protected resource metadata."""
+    base_url = _get_issuer(request)
+    if base_url is not None:
+        resource_metadata_url = f"{base_url}/.well-known/oauth-protected-resource/api/mcp"
+        www_authenticate = (
+            f'Bearer realm="MCP Server",' f' resource_metadata="{resource_metadata_url}"'
+        )
+    else:
+        www_authenticate = 'Bearer realm="Home Assistant MCP Server"'
+
+    return web.json_response(
+        {
+            "error": "invalid_token",
+            "error_description": "Invalid or missing token",
+        },
+        status=401,
+        headers={"WWW-Authenticate": www_authenticate},
+    )
+
+
+def _accepts_event_stream(request: web.Request) -> bool:
+    """Return True when the client accepts an SSE response."""
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+def _has_request(body: Any) -> bool:
+    """Return True when a message or batch contains at least one request (has an id)."""
+    messages = body if isinstance(body, list) else [body]
+    return any(isinstance(m, dict) and m.get("id") is not None for m in messages)
+
+
+def _requested_indent(params: dict[str, Any]) -> int | None:
+    """Return the JSON indentation a request asked for via `_meta.pretty`."""
+    meta = params.get("_meta")
+    return 2 if isinstance(meta, dict) and meta.get("pretty") else None
+
+
+def _invalid_params(msg_id: Any, error: Exception) -> dict[str, Any]:
+    """Return a JSON-RPC invalid params error, as MCP specifies for bad cursors."""
+    return {
+        "jsonrpc": "2.0",
+        "error": {"code": -32602, "message": f"Invalid params: {str(error)}"},
+        "id": msg_id,
+    }
+
+
 def _get_protected_resource_metadata(base_url: str) -> dict[str, Any]:
     """Generate OAuth 2.0 Protected Resource Metadata (RFC 9728)."""
     return {
@@ -115,54 +175,147 @@ class MCPEndpointView(HomeAssistantView):
     requires_auth = False
 
     def __init__(
-        self, hass: HomeAssistant, server: Server, native_auth_enabled: bool = False
+        self,
+        hass: HomeAssistant,
+        server: Server,
+        native_auth_enabled: bool = False,
     ) -> None:
         """Initialize the MCP endpoint."""
         self.hass = hass
         self.server = server
         self.native_auth_enabled = native_auth_enabled
 
+    def _token_cache(self) -> TokenCache | None:
+        """Return the token cache of the active config entry, if any.
+
+        The cache lives in hass.data[DOMAIN] rather than on the view so a
+        config entry reload (which clears hass.data[DOMAIN]) invalidates it,
+        even though the originally registered view keeps serving requests.
+        """
+        return get_token_cache(self.hass)
+
+    def _batch_concurrency(self) -> int:
+        """Return how many batch elements the active config entry dispatches at once.
+
+        Read from hass.data[DOMAIN] like the token cache, so a changed option
+        applies once the entry has reloaded.
+        """
+        data = self.hass.data.get(DOMAIN)
+        value = data.get("batch_concurrency") if isinstance(data, dict) else None
+        return value if isinstance(value, int) else DEFAULT_BATCH_CONCURRENCY
+
     async def _validate_token(self, request: web.Request) -> dict[str, Any] | None:
-        """Validate the bearer token via OIDC (if available) then native HA auth."""
+        """Validate the bearer token, serving repeat OIDC validations from the cache.
+
+        Native tokens are checked on every request: Home Assistant's check is
+        a signature and dict lookup, and skipping it would keep accepting a
+        Long-Lived Access Token after it is deleted.
+        """
         auth_header = request.headers.get("Authorization", "")
         if not auth_header.startswith("Bearer "):
             return None
 
         token = auth_header[7:]  # Remove "Bearer " prefix
 
-        # 1. Try OIDC first
+        cache = self._token_cache()
+        cache_key = None
+        if cache is not None:
+            issuer = _get_issuer(request)
+            audience = f"{issuer}/api/mcp" if issuer is not None else None
+            cache_key = cache.make_key(token, issuer, audience)
+            result = cache.get(cache_key)
+            if result is not None:
+                return result
+
+        result = self._validate_oidc_token(request, token)
+        if result is not None:
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, result)
+            return result
+
+        return self._validate_native_token(token)
+
+    def _validate_oidc_token(self, request: web.Request, token: str) -> dict[str, Any] | None:
+        """Validate the bearer token via the OIDC provider, if it is installed."""
         try:
             from custom_components.oidc_provider.token_validator import (
                 get_issuer_from_request,
                 validate_access_token,
             )
-
-            expected_issuer = get_issuer_from_request(request)
-            # This MCP server is the protected resource (RFC 8707); its canonical
-            # URI is the resource a compliant client (e.g. Claude) binds the token
-            # to. Require the token's aud to match it.
-            expected_audience = f"{expected_issuer}/api/mcp"
-            try:
-                result = validate_access_token(
-                    self.hass, token, expected_issuer, expected_audience=expected_audience
-                )
-            except TypeError:
-                # OIDC provider predates resource-aware validation; fall back to
-                # the legacy signature so an un-upgraded provider still works.
-                result = validate_access_token(self.hass, token, expected_issuer)
-            if result is not None:
-                return result
         except ImportError as e:
             _LOGGER.debug("OIDC provider not available: %s", e)
+            return None
+
+        expected_issuer = get_issuer_from_request(request)
+        # This MCP server is the protected resource (RFC 8707); its canonical
+        # URI is the resource a compliant client (e.g. Claude) binds the token
+        # to. Require the token's aud to match it.
+        expected_audience = f"{expected_issuer}/api/mcp"
+        try:
+            return validate_access_token(
+                self.hass, token, expected_issuer, expected_audience=expected_audience
+            )
+        except TypeError:
+            # OIDC provider predates resource-aware validation; fall back to
+            # the legacy signature so an un-upgraded provider still works.
+            return validate_access_token(self.hass, token, expected_issuer)
 
-        # 2. Fall back to native HA auth (Long-Lived Access Tokens)
+    def _validate_native_token(self, token: str) -> dict[str, Any] | None:
+        """Validate the bearer token as a native HA token (Long-Lived Access Token)."""
         if self.native_auth_enabled:
             refresh_token = self.hass.auth.async_validate_access_token(token)
             if refresh_token is not None:
                 return {"sub": refresh_token.user.id}
-
         return None
 
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Open a long-lived SSE stream for server-initiated notifications."""
+        if not _integration_loaded(self.hass):
+            return _service_unavailable()
+
+        if not await self._validate_token(request):
+            return _unauthorized(request)
+
+        hub = self.hass.data[DOMAIN].get("notifications")
+        if not _accepts_event_stream(request) or not isinstance(hub, NotificationHub):
+            return web.Response(status=405, headers={"Allow": "POST"})
+
+        response = web.StreamResponse(headers=SSE_HEADERS)
+        await response.prepare(request)
+
+        queue = hub.subscribe(request.headers.get(MCP_SESSION_HEADER))
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_INTERVAL)
+                except TimeoutError:
+                    await response.write(b": keepalive\n\n")
+                    continue
+                if message is None:
+                    # Hub closed: the config entry is unloading
+                    break
+                await response.write(sse_event(message))
+        except ConnectionResetError:
+            _LOGGER.debug("MCP notification stream closed by client")
+        finally:
+            hub.unsubscribe(queue)
+
+        return response
+
+    async def delete(self, request: web.Request) -> web.Response:
+        """End a session, dropping its resource subscriptions."""
+        if not _integration_loaded(self.hass):
+            return _service_unavailable()
+
+        if not await self._validate_token(request):
+            return _unauthorized(request)
+
+        session_id = request.headers.get(MCP_SESSION_HEADER)
+        hub = self.hass.data[DOMAIN].get("notifications")
+        if session_id and isinstance(hub, NotificationHub):
+            hub.end_session(session_id)
+        return web.Response(status=200)
+
     async def post(self, request: web.Request) -> web.Response:
         """Handle POST requests for MCP messages."""
         if not _integration_loaded(self.hass):
@@ -171,24 +324,7 @@ class MCPEndpointView(HomeAssistantView):
         # Validate token
         token_payload = await self._validate_token(request)
         if not token_payload:
-            # Build WWW-Authenticate header
-            base_url = _get_issuer(request)
-            if base_url is not None:
-                resource_metadata_url = f"{base_url}/.well-known/oauth-protected-resource/api/mcp"
-                www_authenticate = (
-                    f'Bearer realm="MCP Server",' f' resource_metadata="{resource_metadata_url}"'
-                )
-            else:
-                www_authenticate = 'Bearer realm="Home Assistant MCP Server"'
-
-            return web.json_response(
-                {
-                    "error": "invalid_token",
-                    "error_description": "Invalid or missing token",
-                },
-                status=401,
-                headers={"WWW-Authenticate": www_authenticate},
-            )
+            return _unauthorized(request)
 
         body = None
         try:
@@ -196,16 +332,35 @@ class MCPEndpointView(HomeAssistantView):
             body = await request.json()
             _LOGGER.debug("Received MCP request: %s", body)
 
+            # initialize starts a new session, whose ID the client sends back
+            # with later requests and the GET stream
+            session_id = request.headers.get(MCP_SESSION_HEADER)
+            headers: dict[str, str] = {}
+            if isinstance(body, dict) and body.get("method") == "initialize":
+                session_id = secrets.token_hex(16)
+                headers[MCP_SESSION_HEADER] = session_id
+
+            # Streamable HTTP: answer over SSE so progress can be sent while
+            # the handler runs. Notification-only bodies still get a bare 202.
+            if _accepts_event_stream(request) and _has_request(body):
+                return await self._stream_messages(request, body, session_id, headers)
+
+            # JSON-RPC 2.0 batch: an array of messages answered with one array
+            if isinstance(body, list):
+                return await self._handle_batch(body, session_id)
+
             # Process the message directly
-            response_data = await self._handle_message(body)
+            response_data = await self._handle_message(body, session_id)
 
             if response_data is None:
                 # Notification - return 202 Accepted
                 return web.Response(status=202)
 
             # Return JSON response
-            return web.json_response(response_data)
+            return web.json_response(response_data, headers=headers)
 
+        except InvalidCursorError as e:
+            return web.json_response(_invalid_params(body.get("id"), e))
         except Exception as e:
             _LOGGER.error("Error handling MCP request: %s", e, exc_info=True)
             return web.json_response(
@@ -220,8 +375,139 @@ class MCPEndpointView(HomeAssistantView):
                 status=500,
             )
 
-    async def _handle_message(self, message: dict[str, Any]) -> dict[str, Any] | None:
-        """Handle a JSON-RPC message."""
+    async def _handle_batch(
+        self, messages: list[Any], session_id: str | None = None
+    ) -> web.Response:
+        """Handle a JSON-RPC 2.0 batch.
+
+        Elements are dispatched concurrently, _batch_concurrency() at most, and
+        their responses returned in request order. Notifications produce no
+        entry; a batch made up only of notifications is answered with 202.
+        """
+        if not messages:
+            return web.json_response(
+                {
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32600, "message": "Invalid Request: empty batch"},
+                    "id": None,
+                }
+            )
+
+        semaphore = asyncio.Semaphore(self._batch_concurrency())
+
+        async def _dispatch(message: Any) -> dict[str, Any] | None:
+            async with semaphore:
+                return await self._handle_element(message, session_id)
+
+        results = await asyncio.gather(*(_dispatch(m) for m in messages))
+        responses = [r for r in results if r is not None]
+
+        if not responses:
+            return web.Response(status=202)
+
+        return web.json_response(responses)
+
+    async def _handle_element(
+        self, message: Any, session_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Handle one message of a batch or stream, turning failures into error responses."""
+        if not isinstance(message, dict):
+            return {
+                "jsonrpc": "2.0",
+                "error": {"code": -32600, "message": "Invalid Request"},
+                "id": None,
+            }
+        try:
+            return await self._handle_message(message, session_id)
+        except InvalidCursorError as e:
+            if message.get("id") is None:
+                return None
+            return _invalid_params(message.get("id"), e)
+        except Exception as e:
+            _LOGGER.error("Error handling MCP message: %s", e, exc_info=True)
+            if message.get("id") is None:
+                return None
+            return {
+                "jsonrpc": "2.0",
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}",
+                },
+                "id": message.get("id"),
+            }
+
+    async def _stream_messages(
+        self,
+        request: web.Request,
+        body: Any,
+        session_id: str | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> web.StreamResponse:
+        """Answer a single message or batch over an SSE stream.
+
+        Each response is written as its own event as soon as it is ready, and
+        requests carrying `params._meta.progressToken` get
+        `notifications/progress` events from handlers that call
+        report_progress while they run.
+        """
+        messages = body if isinstance(body, list) else [body]
+
+        response = web.StreamResponse(headers={**SSE_HEADERS, **(headers or {})})
+        await response.prepare(request)
+
+        write_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(self._batch_concurrency())
+
+        async def _send(message: dict[str, Any]) -> None:
+            async with write_lock:
+                await response.write(sse_event(message))
+
+        async def _dispatch(message: Any) -> None:
+            progress_token = None
+            if isinstance(message, dict):
+                params = message.get("params")
+                meta = params.get("_meta") if isinstance(params, dict) else None
+                if isinstance(meta, dict):
+                    progress_token = meta.get("progressToken")
+
+            async def _progress(progress: float, total: float | None, text: str | None) -> None:
+                notification: dict[str, Any] = {
+                    "progressToken": progress_token,
+                    "progress": progress,
+                }
+                if total is not None:
+                    notification["total"] = total
+                if text is not None:
+                    notification["message"] = text
+                await _send(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": "notifications/progress",
+                        "params": notification,
+                    }
+                )
+
+            async with semaphore:
+                token = set_progress_callback(_progress if progress_token is not None else None)
+                try:
+                    result = await self._handle_element(message, session_id)
+                finally:
+                    reset_progress_callback(token)
+            if result is not None:
+                await _send(result)
+
+        try:
+            await asyncio.gather(*(_dispatch(m) for m in messages))
+            await response.write_eof()
+        except ConnectionResetError:
+            _LOGGER.debug("MCP response stream closed by client")
+
+        return response
+
+    async def _handle_message(
+        self, message: dict[str, Any], session_id: str | None = None
+    ) -> dict[str, Any] | None:
+        """Handle a JSON-RPC message of the session with session_id, if any."""
         method = message.get("method")
         params = message.get("params", {})
         msg_id = message.get("id")
@@ -234,7 +520,7 @@ class MCPEndpointView(HomeAssistantView):
                     "protocolVersion": "2024-11-05",
                     "capabilities": {
                         "tools": {},
-                        "resources": {},
+                        "resources": {"subscribe": True},
                         "prompts": {},
                     },
                     "serverInfo": {
@@ -259,7 +545,11 @@ class MCPEndpointView(HomeAssistantView):
             name = params.get("name")
             arguments = params.get("arguments", {})
 
-            result = await self._call_tool(name, arguments)
+            token = set_indent(_requested_indent(params))
+            try:
+                result = await self._call_tool(name, arguments)
+            finally:
+                reset_indent(token)
             return {
                 "jsonrpc": "2.0",
                 "result": result,
@@ -278,10 +568,38 @@ class MCPEndpointView(HomeAssistantView):
         # Handle resources/read
         if method == "resources/read":
             uri = params.get("uri", "")
-            contents = await read_resource(self.hass, uri)
+            token = set_indent(_requested_indent(params))
+            try:
+                contents, next_cursor = await read_resource(self.hass, uri, params)
+            finally:
+                reset_indent(token)
+            result = {"contents": contents}
+            if next_cursor:
+                result["nextCursor"] = next_cursor
+            return {
+                "jsonrpc": "2.0",
+                "result": result,
+                "id": msg_id,
+            }
+
+        # Handle resources/subscribe and resources/unsubscribe; updates are
+        # sent on the session's GET stream
+        if method in ("resources/subscribe", "resources/unsubscribe"):
+            uri = params.get("uri")
+            hub = self.hass.data[DOMAIN].get("notifications")
+            if not isinstance(uri, str) or not uri:
+                return _invalid_params(msg_id, ValueError("uri is required"))
+            if session_id is None or not isinstance(hub, NotificationHub):
+                return _invalid_params(
+                    msg_id, ValueError(f"{method} requires the {MCP_SESSION_HEADER} header")
+                )
+            if method == "resources/subscribe":
+                hub.subscribe_resource(session_id, uri)
+            else:
+                hub.unsubscribe_resource(session_id, uri)
             return {
                 "jsonrpc": "2.0",
-                "result": {"contents": contents},
+                "result": {},
                 "id": msg_id,
             }
 
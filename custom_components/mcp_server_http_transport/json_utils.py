@@ -1,18 +1,97 @@
 """Shared JSON helpers for Home Assistant MCP serialization."""
 
 import json
+from contextvars import ContextVar, Token
 from datetime import date, datetime
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant core
+    orjson = None
+
+# Indentation for tool/resource payloads. Compact by default; the HTTP layer
+# binds a value for requests that ask for pretty output via params._meta.
+_indent: ContextVar[int | None] = ContextVar("mcp_json_indent", default=None)
+
+
+class JSONFragment:
+    """Compact JSON encoded once and copied verbatim into json_dumps output."""
+
+    __slots__ = ("contents",)
+
+    def __init__(self, contents: bytes) -> None:
+        """Wrap already encoded JSON."""
+        self.contents = contents
+
+
+def _encode_extra(o: Any) -> Any:
+    """Convert HA attribute types that JSON does not support natively."""
+    if isinstance(o, JSONFragment):
+        return orjson.Fragment(o.contents)
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, (set, frozenset)):
+        return sorted(o) if all(isinstance(x, str) for x in o) else list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
 
 class _HAJSONEncoder(json.JSONEncoder):
     """JSON encoder that handles datetime/date objects in HA state attributes."""
 
     def default(self, o: Any) -> Any:
-        if isinstance(o, datetime):
-            return o.isoformat()
-        if isinstance(o, date):
-            return o.isoformat()
-        if isinstance(o, (set, frozenset)):
-            return sorted(o) if all(isinstance(x, str) for x in o) else list(o)
-        return super().default(o)
+        if isinstance(o, JSONFragment):
+            return json.loads(o.contents)
+        try:
+            return _encode_extra(o)
+        except TypeError:
+            return super().default(o)
+
+
+def set_indent(indent: int | None) -> Token:
+    """Bind the output indentation for the current request context."""
+    return _indent.set(indent)
+
+
+def reset_indent(token: Token) -> None:
+    """Restore the indentation that was bound before set_indent."""
+    _indent.reset(token)
+
+
+def compact_output() -> bool:
+    """Return True when the current request is serialized without indentation."""
+    return _indent.get() is None
+
+
+def json_fragment(obj: Any) -> JSONFragment | None:
+    """Return obj encoded as compact JSON, to be embedded in json_dumps output.
+
+    Returns None when orjson is not available or cannot encode obj.
+    """
+    if orjson is None:
+        return None
+    try:
+        return JSONFragment(
+            orjson.dumps(obj, default=_encode_extra, option=orjson.OPT_NON_STR_KEYS)
+        )
+    except orjson.JSONEncodeError:
+        return None
+
+
+def json_dumps(obj: Any, indent: int | None = None) -> str:
+    """Serialize obj to JSON, using orjson when available.
+
+    Falls back to the request-bound indentation when indent is not given.
+    """
+    if indent is None:
+        indent = _indent.get()
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_encode_extra, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; let the stdlib decide
+            pass
+    return json.dumps(obj, indent=indent, cls=_HAJSONEncoder)
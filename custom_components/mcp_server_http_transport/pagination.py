@@ -0,0 +1,111 @@
+"""Cursor pagination shared by the list tools and resources."""
+
+import base64
+import binascii
+import json
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from homeassistant.core import State
+from homeassistant.helpers.device_registry import DeviceEntry
+
+from .json_utils import json_dumps
+
+_T = TypeVar("_T")
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+# Input schema properties for tools that paginate
+PAGINATION_PROPERTIES = {
+    "cursor": {
+        "type": "string",
+        "description": "Opaque cursor from a previous response's nextCursor (optional)",
+    },
+    "page_size": {
+        "type": "integer",
+        "description": (
+            f"Maximum number of items per page "
+            f"(default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})"
+        ),
+    },
+}
+
+
+class InvalidCursorError(ValueError):
+    """Raised for a cursor or page size that cannot be used."""
+
+
+def encode_cursor(key: Any) -> str:
+    """Return an opaque cursor for the sort key of the last item returned."""
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Any:
+    """Return the sort key encoded in cursor."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError) as err:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from err
+    # JSON has no tuples; composite keys are compared as tuples
+    return tuple(key) if isinstance(key, list) else key
+
+
+def page_size(arguments: dict[str, Any]) -> int:
+    """Return the requested page size, validated and capped."""
+    size = arguments.get("page_size")
+    if size is None:
+        return DEFAULT_PAGE_SIZE
+    if not isinstance(size, int) or isinstance(size, bool) or size < 1:
+        raise InvalidCursorError(f"page_size must be a positive integer, got {size!r}")
+    return min(size, MAX_PAGE_SIZE)
+
+
+def entity_sort_key(state: State) -> str:
+    """Return the key that entity listings are sorted and paged by."""
+    return state.entity_id
+
+
+def device_sort_key(device: DeviceEntry) -> str:
+    """Return the key that device listings are sorted and paged by."""
+    return device.id
+
+
+def entry_sort_key(entry: dict[str, Any]) -> str:
+    """Return the key that YAML list entries (automations, scenes) are paged by."""
+    return str(entry.get("id", ""))
+
+
+def paginate(
+    items: Sequence[_T], key: Callable[[_T], Any], arguments: dict[str, Any]
+) -> tuple[list[_T], str | None]:
+    """Return one page of items and the cursor of the next page.
+
+    items must be sorted by key, and keys must be unique. The cursor records
+    the key of the last item returned rather than an offset, so a page
+    continues after that item even when items were added or removed since.
+    """
+    size = page_size(arguments)
+    start = 0
+    if cursor := arguments.get("cursor"):
+        after = decode_cursor(cursor)
+        try:
+            start = bisect_right(items, after, key=key)
+        except TypeError as err:
+            raise InvalidCursorError(f"Cursor does not belong to this listing: {cursor}") from err
+    page = list(items[start : start + size])
+    next_cursor = encode_cursor(key(page[-1])) if start + size < len(items) else None
+    return page, next_cursor
+
+
+def page_content(data: Any, next_cursor: str | None) -> dict[str, Any]:
+    """Return a tool result for one page of data.
+
+    The page is the first content block, as for unpaginated tools, and a
+    second block carries nextCursor when more pages follow.
+    """
+    content = [{"type": "text", "text": json_dumps(data)}]
+    if next_cursor:
+        content.append({"type": "text", "text": json_dumps({"nextCursor": next_cursor})})
+    return {"content": content}
@@ -6,6 +6,7 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..entity_index import get_entity_index
 from ..json_utils import _HAJSONEncoder
 from . import register_prompt
 
@@ -30,7 +31,7 @@ async def automation_builder(hass: HomeAssistant, arguments: dict[str, Any]) ->
     """Generate a guided automation builder prompt."""
     trigger_type = arguments.get("trigger_type", "")
 
-    domains = sorted(set(s.entity_id.split(".")[0] for s in hass.states.async_all()))
+    domains = get_entity_index(hass).domains()
     domains_text = ", ".join(domains)
 
     services = hass.services.async_services()
@@ -106,8 +107,8 @@ async def automation_debugger(hass: HomeAssistant, arguments: dict[str, Any]) ->
     state = hass.states.get(entity_id)
     if state is None:
         # Try finding by matching automation entities
-        for s in hass.states.async_all():
-            if s.entity_id.startswith("automation.") and s.attributes.get("id") == automation_id:
+        for s in get_entity_index(hass).states(domain="automation"):
+            if s.attributes.get("id") == automation_id:
                 state = s
                 entity_id = s.entity_id
                 break
@@ -207,16 +208,14 @@ async def automation_audit(hass: HomeAssistant, arguments: dict[str, Any]) -> di
         automations_text = "Unable to read automations.yaml"
 
     # Gather automation entity states
-    auto_states = []
-    for state in hass.states.async_all():
-        if state.entity_id.startswith("automation."):
-            auto_states.append(
-                {
-                    "entity_id": state.entity_id,
-                    "state": state.state,
-                    "last_triggered": str(state.attributes.get("last_triggered", "never")),
-                }
-            )
+    auto_states = [
+        {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "last_triggered": str(state.attributes.get("last_triggered", "never")),
+        }
+        for state in get_entity_index(hass).states(domain="automation")
+    ]
     states_text = json.dumps(auto_states, indent=2, cls=_HAJSONEncoder)
 
     return {
@@ -6,6 +6,7 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..entity_index import get_entity_index
 from ..json_utils import _HAJSONEncoder
 from . import register_prompt
 
@@ -92,7 +93,7 @@ async def schedule_optimizer(hass: HomeAssistant, arguments: dict[str, Any]) ->
 async def naming_conventions(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate a naming conventions analysis prompt."""
     by_domain: dict[str, list[dict[str, str]]] = {}
-    for state in hass.states.async_all():
+    for state in get_entity_index(hass).states():
         domain = state.entity_id.split(".")[0]
         by_domain.setdefault(domain, []).append(
             {
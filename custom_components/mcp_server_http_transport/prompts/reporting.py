@@ -1,5 +1,6 @@
 """Reporting and summary prompts."""
 
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Any
@@ -7,10 +8,43 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
+from ..const import PROMPT_RECORDER_TIMEOUT
+from ..entity_index import get_entity_index
+from ..history import async_count_state_changes
 from . import register_prompt
 
 _LOGGER = logging.getLogger(__name__)
 
+# daily_summary: entities listed, those with the most changes first
+_SUMMARY_ENTITIES = 100
+
+# energy_report: ranges up to this long are reported by the hour, longer ones by the day
+_HOURLY_REPORT_RANGE = timedelta(days=2)
+
+
+def _period_start(value: Any) -> str:
+    """Return the start of a statistics row in ISO format."""
+    if isinstance(value, int | float):
+        value = dt_util.utc_from_timestamp(value)
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _energy_line(rows: list[dict[str, Any]], unit: str, period: str) -> str:
+    """Describe an entity's statistics rows: consumption for sums, levels for means."""
+    changes = [row for row in rows if row.get("change") is not None]
+    if changes:
+        total = sum(row["change"] for row in changes)
+        peak = max(changes, key=lambda row: row["change"])
+        return (
+            f"total {total:g} {unit}, peak {peak['change']:g} {unit} "
+            f"in the {period} from {_period_start(peak['start'])}"
+        )
+    means = [row["mean"] for row in rows if row.get("mean") is not None]
+    if means:
+        peak = max(row["max"] for row in rows if row.get("max") is not None)
+        return f"average {sum(means) / len(means):g} {unit}, max {peak:g} {unit}"
+    return "no long-term statistics in this period"
+
 
 @register_prompt(
     name="daily_summary",
@@ -18,28 +52,31 @@ _LOGGER = logging.getLogger(__name__)
 )
 async def daily_summary(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate a daily summary prompt with recent state changes."""
-    from homeassistant.components.recorder import get_instance
-    from homeassistant.components.recorder.history import get_significant_states
-
     end_time = dt_util.utcnow()
     start_time = end_time - timedelta(days=1)
 
     try:
-        states = await get_instance(hass).async_add_executor_job(
-            get_significant_states, hass, start_time, end_time, None
-        )
+        async with asyncio.timeout(PROMPT_RECORDER_TIMEOUT):
+            counts = await async_count_state_changes(hass, start_time, end_time)
 
         summary_parts = []
-        for entity_id, entity_states in states.items():
-            if len(entity_states) > 1:
-                changes = len(entity_states) - 1
-                current = entity_states[-1].state
-                summary_parts.append(f"- {entity_id}: {changes} change(s), currently '{current}'")
+        ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        for entity_id, changes in ranked[:_SUMMARY_ENTITIES]:
+            line = f"- {entity_id}: {changes} change(s)"
+            if (state := hass.states.get(entity_id)) is not None:
+                line += f", currently '{state.state}'"
+            summary_parts.append(line)
+        if len(ranked) > _SUMMARY_ENTITIES:
+            summary_parts.append(
+                f"- ... and {len(ranked) - _SUMMARY_ENTITIES} more entities with fewer changes"
+            )
 
         summary_text = (
-            "\n".join(sorted(summary_parts)[:100])
-            if summary_parts
-            else "No significant state changes in the last 24 hours."
+            "\n".join(summary_parts) if summary_parts else "No state changes in the last 24 hours."
+        )
+    except TimeoutError:
+        summary_text = (
+            f"The recorder did not count state changes within {PROMPT_RECORDER_TIMEOUT} seconds."
         )
     except Exception:
         _LOGGER.exception("Error retrieving history for daily summary")
@@ -67,6 +104,33 @@ async def daily_summary(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     }
 
 
+async def _async_energy_statistics(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start_time: datetime,
+    end_time: datetime,
+    period: str,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the statistics rows of the energy entities, from one recorder query.
+
+    Not cached, as get_statistics: past statistics can be rewritten through
+    the recorder's websocket API without an event to invalidate on.
+    """
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.statistics import statistics_during_period
+
+    return await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start_time,
+        end_time,
+        set(entity_ids),
+        period,
+        None,
+        {"change", "mean", "max"},
+    )
+
+
 @register_prompt(
     name="energy_report",
     description="Summarize energy consumption data over a time range",
@@ -85,50 +149,56 @@ async def daily_summary(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
 )
 async def energy_report(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate an energy consumption report prompt."""
-    from homeassistant.components.recorder import get_instance
-    from homeassistant.components.recorder.history import get_significant_states
-
     start_time = datetime.fromisoformat(arguments.get("start_time", ""))
     end_time_str = arguments.get("end_time")
     end_time = datetime.fromisoformat(end_time_str) if end_time_str else dt_util.utcnow()
+    # Naive times are local, as elsewhere in Home Assistant
+    start_time, end_time = dt_util.as_utc(start_time), dt_util.as_utc(end_time)
 
     energy_device_classes = {"energy", "power", "gas"}
     energy_units = {"kWh", "Wh", "W", "m\u00b3"}
 
-    energy_entities = []
-    for state in hass.states.async_all():
-        attrs = state.attributes
-        device_class = attrs.get("device_class", "")
-        unit = attrs.get("unit_of_measurement", "")
-        if device_class in energy_device_classes or unit in energy_units:
-            energy_entities.append(state.entity_id)
+    # Entities of an energy device class, and sensors in an energy unit
+    index = get_entity_index(hass)
+    energy_entities = {
+        state.entity_id: state
+        for device_class in energy_device_classes
+        for state in index.states(device_class=device_class)
+    }
+    for state in index.states(domain="sensor"):
+        if state.attributes.get("unit_of_measurement", "") in energy_units:
+            energy_entities[state.entity_id] = state
 
     if not energy_entities:
         summary_text = "No energy-related entities found in Home Assistant."
     else:
         try:
-            states = await get_instance(hass).async_add_executor_job(
-                get_significant_states,
-                hass,
-                start_time,
-                end_time,
-                energy_entities,
-            )
+            # Hourly or daily long-term statistics: consumption (change) of
+            # meters, mean and max of power sensors
+            period = "hour" if end_time - start_time <= _HOURLY_REPORT_RANGE else "day"
+            async with asyncio.timeout(PROMPT_RECORDER_TIMEOUT):
+                stats = await _async_energy_statistics(
+                    hass, sorted(energy_entities), start_time, end_time, period
+                )
 
             parts = []
-            for eid, entity_states in states.items():
-                if entity_states:
-                    current = entity_states[-1]
-                    parts.append(
-                        f"- {eid} ({current.attributes.get('friendly_name', eid)}): "
-                        f"{len(entity_states)} readings, "
-                        f"current: {current.state} "
-                        f"{current.attributes.get('unit_of_measurement', '')}"
-                    )
-            summary_text = "\n".join(sorted(parts)) if parts else "No energy data recorded."
+            for eid, state in sorted(energy_entities.items()):
+                attributes = state.attributes
+                unit = attributes.get("unit_of_measurement", "")
+                parts.append(
+                    f"- {eid} ({attributes.get('friendly_name', eid)}): "
+                    f"{_energy_line(stats.get(eid, []), unit, period)}, "
+                    f"current: {state.state} {unit}"
+                )
+            summary_text = "\n".join(parts)
+        except TimeoutError:
+            summary_text = (
+                f"The recorder did not return energy statistics within "
+                f"{PROMPT_RECORDER_TIMEOUT} seconds."
+            )
         except Exception:
-            _LOGGER.exception("Error retrieving energy history data")
-            summary_text = "Unable to retrieve energy history data."
+            _LOGGER.exception("Error retrieving energy statistics")
+            summary_text = "Unable to retrieve energy statistics."
 
     return {
         "description": (f"Energy report from {start_time.isoformat()} to {end_time.isoformat()}"),
@@ -6,9 +6,9 @@ from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import area_registry as ar
-from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
 
+from ..entity_index import get_entity_index
 from . import register_prompt
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ _LOGGER = logging.getLogger(__name__)
 @register_prompt(
     name="dashboard_builder",
     description=(
-        "Given a set of entities or an area, suggest a Lovelace dashboard layout "
+        "Given a set of entities, an area or a floor, suggest a Lovelace dashboard layout "
         "with appropriate card types"
     ),
     arguments=[
@@ -26,6 +26,11 @@ _LOGGER = logging.getLogger(__name__)
             "description": "Area ID to build a dashboard for (optional)",
             "required": False,
         },
+        {
+            "name": "floor_id",
+            "description": "Floor ID to build a dashboard for, grouped by area (optional)",
+            "required": False,
+        },
         {
             "name": "entity_ids",
             "description": "Comma-separated list of entity IDs (optional)",
@@ -36,6 +41,7 @@ _LOGGER = logging.getLogger(__name__)
 async def dashboard_builder(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Generate a dashboard builder prompt."""
     area_id = arguments.get("area_id")
+    floor_id = arguments.get("floor_id")
     entity_ids_str = arguments.get("entity_ids", "")
     entity_ids = (
         [e.strip() for e in entity_ids_str.split(",") if e.strip()] if entity_ids_str else []
@@ -50,23 +56,32 @@ async def dashboard_builder(hass: HomeAssistant, arguments: dict[str, Any]) -> d
         if area:
             area_info = f"**Area:** {area.name} (id: {area.id})\n"
 
-        entity_registry = er.async_get(hass)
-        device_registry = dr.async_get(hass)
-        for state in hass.states.async_all():
-            entry = entity_registry.async_get(state.entity_id)
-            entity_area = entry.area_id if entry else None
-            if not entity_area and entry and entry.device_id:
-                device = device_registry.async_get(entry.device_id)
-                entity_area = device.area_id if device else None
-            if entity_area == area_id:
-                entities_info.append(
-                    {
-                        "entity_id": state.entity_id,
-                        "state": state.state,
-                        "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                        "device_class": state.attributes.get("device_class"),
-                    }
-                )
+        for state in get_entity_index(hass).states(area_id=area_id):
+            entities_info.append(
+                {
+                    "entity_id": state.entity_id,
+                    "state": state.state,
+                    "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+                    "device_class": state.attributes.get("device_class"),
+                }
+            )
+
+    if floor_id:
+        floor = fr.async_get(hass).async_get_floor(floor_id)
+        if floor:
+            area_info += f"**Floor:** {floor.name} (id: {floor.floor_id})\n"
+
+        index = get_entity_index(hass)
+        for state in index.states(floor_id=floor_id):
+            entities_info.append(
+                {
+                    "entity_id": state.entity_id,
+                    "state": state.state,
+                    "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+                    "device_class": state.attributes.get("device_class"),
+                    "area_id": index.area_of(state.entity_id),
+                }
+            )
 
     if entity_ids:
         for eid in entity_ids:
@@ -240,17 +255,16 @@ async def security_review(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
 
     # Sensitive entity domains
     sensitive_domains = {"camera", "lock", "alarm_control_panel", "cover"}
-    sensitive_entities = []
-    for state in hass.states.async_all():
-        domain = state.entity_id.split(".")[0]
-        if domain in sensitive_domains:
-            sensitive_entities.append(
-                {
-                    "entity_id": state.entity_id,
-                    "state": state.state,
-                    "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                }
-            )
+    index = get_entity_index(hass)
+    sensitive_entities = [
+        {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+        }
+        for domain in sorted(sensitive_domains)
+        for state in index.states(domain=domain)
+    ]
     sensitive_text = json.dumps(sensitive_entities, indent=2)
 
     return {
@@ -0,0 +1,175 @@
+"""Results of recorder queries over time windows that have closed."""
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DEFAULT_RECORDER_CACHE_BYTES, DOMAIN
+
+# Time after a window ends before everything in it is in the database: states
+# and events wait for the recorder's next commit. Statistics are not cached,
+# since the recorder's websocket API can import, adjust and clear those of
+# past windows without firing an event.
+HISTORY_SETTLE_TIME = timedelta(seconds=30)
+
+# Recorder services that delete rows of past windows
+_PURGE_SERVICES = {"purge", "purge_entities"}
+
+# Bytes counted for a number, boolean or None in a result
+_SCALAR_BYTES = 8
+
+
+def _result_size(value: Any) -> int:
+    """Return the approximate JSON size of a query result, in bytes.
+
+    Rows of a list are alike, so a list counts as its middle row times its
+    length; the first and last rows of a history series carry attributes
+    that the rest do not. The cost grows with the number of series, not
+    with the number of rows.
+    """
+    if isinstance(value, dict):
+        return 2 + sum(len(str(key)) + 4 + _result_size(item) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return 2 + len(value) * (_result_size(value[len(value) // 2]) + 1) if value else 2
+    if isinstance(value, str):
+        return len(value) + 2
+    if isinstance(value, datetime):
+        return 34
+    return _SCALAR_BYTES
+
+
+class RecorderCache:
+    """LRU cache of recorder query results, bounded by their estimated JSON size.
+
+    Rows of a window that has ended never change, except when the recorder
+    purges them: the purge services drop every entry, and results reaching
+    back past the recorder's keep_days are not served, since the nightly
+    purge may have removed their oldest rows. Cached values are shared
+    between callers and must not be modified.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int = DEFAULT_RECORDER_CACHE_BYTES) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[datetime | None, int, Any]] = OrderedDict()
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching for recorder purges."""
+        self._unsub = self.hass.bus.async_listen(EVENT_CALL_SERVICE, self._async_service_called)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching for recorder purges."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    def get(self, key: Hashable, purged_before: datetime | None = None) -> Any | None:
+        """Return the cached result for key, or None.
+
+        With purged_before, a result whose window starts before it counts
+        as a miss and is dropped.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and purged_before is not None and entry[0] is not None:
+            if entry[0] < purged_before:
+                self._remove(key)
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def set(self, key: Hashable, start: datetime | None, value: Any, size: int) -> None:
+        """Cache the result of a query over a window starting at start.
+
+        size is the result's size in bytes. Evicts the least recently used
+        results to stay within max_bytes; a result larger than that is not
+        cached.
+        """
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (start, size, value)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop one entry."""
+        self._bytes -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters, the current size and its bytes, and the byte limit."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    @callback
+    def _async_service_called(self, event: Event) -> None:
+        """Drop every result when the recorder is asked to purge."""
+        if event.data.get("domain") == "recorder" and event.data.get("service") in _PURGE_SERVICES:
+            self.clear()
+
+
+def get_recorder_cache(hass: HomeAssistant) -> RecorderCache | None:
+    """Return the integration's recorder cache, or None when it is not set up."""
+    data = hass.data.get(DOMAIN)
+    cache = data.get("recorder_cache") if isinstance(data, dict) else None
+    return cache if isinstance(cache, RecorderCache) else None
+
+
+async def async_cached_query[T](
+    hass: HomeAssistant,
+    key: tuple[Hashable, ...],
+    start_time: datetime,
+    end_time: datetime,
+    fetch: Callable[[], Awaitable[T]],
+) -> T:
+    """Return the result of fetch, a query of states or events from start_time to end_time.
+
+    The result is cached under key and the window when the window ended at
+    least HISTORY_SETTLE_TIME ago.
+    """
+    cache = get_recorder_cache(hass)
+    start, end = dt_util.as_utc(start_time), dt_util.as_utc(end_time)
+    now = dt_util.utcnow()
+    if cache is None or end > now - HISTORY_SETTLE_TIME:
+        return await fetch()
+
+    from homeassistant.components.recorder import get_instance
+
+    purged_before = now - timedelta(days=get_instance(hass).keep_days)
+    if start < purged_before:
+        return await fetch()
+
+    full_key = (*key, start.isoformat(), end.isoformat())
+    value = cache.get(full_key, purged_before)
+    if value is None:
+        value = await fetch()
+        size = await hass.async_add_executor_job(_result_size, value)
+        cache.set(full_key, start, value, size)
+    return value
@@ -0,0 +1,197 @@
+"""Reloads of automations, scenes and scripts after config edits, coalesced per domain."""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import voluptuous as vol
+from homeassistant.const import CONF_ID, SERVICE_RELOAD
+from homeassistant.core import HomeAssistant, Service, callback
+
+from .const import DEFAULT_RELOAD_DELAY, DEFAULT_RELOAD_MAX_DELAY, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Most items reloaded one by one; reloading more at once is cheaper in one go,
+# since each item's reload reads the whole configuration again
+_MAX_TARGETED_RELOADS = 5
+
+
+def _supports_targeted_reload(hass: HomeAssistant, domain: str) -> bool:
+    """Return whether the domain's reload service accepts the ID of one item.
+
+    automation.reload does on recent Home Assistant releases.
+    """
+    service = hass.services.async_services_for_domain(domain).get(SERVICE_RELOAD)
+    if not isinstance(service, Service) or service.schema is None:
+        return False
+    try:
+        service.schema({CONF_ID: "probe"})
+    except vol.Invalid:
+        return False
+    return True
+
+
+async def _async_call_reload(hass: HomeAssistant, domain: str, targets: set[str] | None) -> None:
+    """Reload the targets of domain, or all of it when targets is None.
+
+    Targets are reloaded one by one where the reload service accepts an
+    ID and there are few enough of them.
+    """
+    if (
+        targets
+        and len(targets) <= _MAX_TARGETED_RELOADS
+        and _supports_targeted_reload(hass, domain)
+    ):
+        for target in sorted(targets):
+            await hass.services.async_call(domain, SERVICE_RELOAD, {CONF_ID: target}, blocking=True)
+        return
+    await hass.services.async_call(domain, SERVICE_RELOAD, blocking=True)
+
+
+@dataclass
+class _PendingReload:
+    """A reload of one domain that has been requested but not started."""
+
+    future: asyncio.Future[None]
+    first_requested: float
+    requests: int = 0
+    # IDs of the items to reload, or None for the whole domain
+    targets: set[str] | None = field(default_factory=set)
+    timer: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+
+class ReloadScheduler:
+    """Reload service calls, coalesced per domain.
+
+    A requested reload waits for delay seconds of quiet, but no longer than
+    max_delay after the first request, so back-to-back edits lead to one
+    reload. Every request made meanwhile shares it. A request made while a
+    reload runs schedules another, since the running one may have read the
+    files before the edit. When every request names the items it changed,
+    only those are reloaded, if the domain supports it.
+
+    Edits usually come one tool call at a time, so requests are scheduled
+    without waiting for the reload (async_schedule); only a request that
+    needs the outcome waits for it (async_reload).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        delay: float = DEFAULT_RELOAD_DELAY,
+        max_delay: float = DEFAULT_RELOAD_MAX_DELAY,
+    ) -> None:
+        """Initialize with no pending reloads."""
+        self.hass = hass
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending: dict[str, _PendingReload] = {}
+
+    @callback
+    def async_schedule(self, domain: str, *, targets: Iterable[str] | None = None) -> bool:
+        """Request a reload of domain, or of its targets, without waiting for it.
+
+        Returns whether the request joined a reload that was already
+        pending. Errors of the reload are logged.
+        """
+        return self._async_request(domain, False, targets).requests > 1
+
+    async def async_reload(
+        self, domain: str, *, flush: bool = False, targets: Iterable[str] | None = None
+    ) -> bool:
+        """Request a reload of domain, or of its targets, and wait until it has run.
+
+        With flush, the reload starts at once, along with the requests
+        pending for it. Returns whether the reload was shared with another
+        request; raises what the reload service raised.
+        """
+        pending = self._async_request(domain, flush, targets)
+        await asyncio.shield(pending.future)
+        return pending.requests > 1
+
+    @callback
+    def _async_request(
+        self, domain: str, flush: bool, targets: Iterable[str] | None
+    ) -> _PendingReload:
+        """Add a request to the pending reload of domain and (re)arm its timer."""
+        now = self.hass.loop.time()
+        pending = self._pending.get(domain)
+        if pending is None:
+            pending = self._pending[domain] = _PendingReload(self.hass.loop.create_future(), now)
+        pending.requests += 1
+        if targets is None:
+            pending.targets = None
+        elif pending.targets is not None:
+            pending.targets.update(targets)
+        if pending.timer is not None:
+            pending.timer.cancel()
+        if flush:
+            self._async_start(domain)
+        else:
+            delay = min(self.delay, pending.first_requested + self.max_delay - now)
+            pending.timer = self.hass.loop.call_later(delay, self._async_start, domain)
+        return pending
+
+    @callback
+    def async_stop(self) -> None:
+        """Start every pending reload, so no edit is left unloaded."""
+        for domain in list(self._pending):
+            self._async_start(domain)
+
+    @callback
+    def _async_start(self, domain: str) -> None:
+        """Start the pending reload of domain."""
+        pending = self._pending.pop(domain, None)
+        if pending is None:
+            return
+        if pending.timer is not None:
+            pending.timer.cancel()
+        self.hass.async_create_task(
+            self._async_run(domain, pending.targets, pending.future), f"{DOMAIN} reload {domain}"
+        )
+
+    async def _async_run(
+        self, domain: str, targets: set[str] | None, future: asyncio.Future[None]
+    ) -> None:
+        """Call the reload service and report its outcome to the waiting requests."""
+        try:
+            await _async_call_reload(self.hass, domain, targets)
+        except Exception as err:
+            _LOGGER.error("Error reloading %s after a config edit: %s", domain, err)
+            future.set_exception(err)
+            # Retrieved here too, in case every request was cancelled
+            future.exception()
+        else:
+            future.set_result(None)
+
+
+def get_reload_scheduler(hass: HomeAssistant) -> ReloadScheduler | None:
+    """Return the integration's reload scheduler, or None when it is not set up."""
+    data = hass.data.get(DOMAIN)
+    scheduler = data.get("reload_scheduler") if isinstance(data, dict) else None
+    return scheduler if isinstance(scheduler, ReloadScheduler) else None
+
+
+async def async_request_reload(
+    hass: HomeAssistant,
+    domain: str,
+    *,
+    flush: bool = False,
+    targets: Iterable[str] | None = None,
+) -> bool:
+    """Schedule a reload of domain through the scheduler, or reload at once.
+
+    targets are the IDs of the items that changed; without them the whole
+    domain is reloaded. With flush the reload starts at once and is waited
+    for, as it is when the scheduler is not set up. Returns whether the
+    reload was shared with another request.
+    """
+    scheduler = get_reload_scheduler(hass)
+    if scheduler is None:
+        await _async_call_reload(hass, domain, None if targets is None else set(targets))
+        return False
+    if flush:
+        return await scheduler.async_reload(domain, flush=True, targets=targets)
+    return scheduler.async_schedule(domain, targets=targets)
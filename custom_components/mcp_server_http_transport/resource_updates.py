@@ -0,0 +1,110 @@
+"""notifications/resources/updated for resources changed by Home Assistant events."""
+
+import asyncio
+from collections.abc import Callable, Iterable
+
+from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
+    EVENT_CORE_CONFIG_UPDATE,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers import floor_registry as fr
+from homeassistant.helpers import label_registry as lr
+
+from .const import RESOURCE_UPDATE_DELAY
+from .streaming import NotificationHub
+
+# Resources whose content changes with each event; state changes are
+# handled apart, since they also change the entity's own resource
+_EVENT_RESOURCES = {
+    EVENT_CORE_CONFIG_UPDATE: ("hass://config",),
+    ar.EVENT_AREA_REGISTRY_UPDATED: ("hass://areas",),
+    dr.EVENT_DEVICE_REGISTRY_UPDATED: ("hass://devices",),
+    EVENT_SERVICE_REGISTERED: ("hass://services",),
+    EVENT_SERVICE_REMOVED: ("hass://services",),
+    fr.EVENT_FLOOR_REGISTRY_UPDATED: ("hass://floors",),
+    er.EVENT_ENTITY_REGISTRY_UPDATED: ("hass://entities",),
+    lr.EVENT_LABEL_REGISTRY_UPDATED: ("hass://labels",),
+    EVENT_COMPONENT_LOADED: ("hass://integrations",),
+}
+
+
+def resource_updated(uri: str) -> dict[str, object]:
+    """Return the notification that the resource at uri changed."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "notifications/resources/updated",
+        "params": {"uri": uri},
+    }
+
+
+class ResourceUpdateNotifier:
+    """Publish resource updates to the streams of sessions subscribed to them.
+
+    Changed URIs are collected for delay seconds and each is sent once, so
+    a burst of state changes leads to one notification per resource.
+    Changes to resources no open stream subscribed to are ignored.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, hub: NotificationHub, delay: float = RESOURCE_UPDATE_DELAY
+    ) -> None:
+        """Initialize with nothing pending."""
+        self.hass = hass
+        self.hub = hub
+        self.delay = delay
+        self._pending: dict[str, None] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the events that change resources."""
+        bus = self.hass.bus
+        self._unsubs = [bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)]
+        self._unsubs.extend(
+            bus.async_listen(event_type, self._async_event) for event_type in _EVENT_RESOURCES
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following events and drop pending updates."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Mark the entity's resources as changed."""
+        entity_id = event.data["entity_id"]
+        self._async_mark(("hass://entities", "hass://changes", f"hass://entity/{entity_id}"))
+
+    @callback
+    def _async_event(self, event: Event) -> None:
+        """Mark the resources that follow the event as changed."""
+        self._async_mark(_EVENT_RESOURCES[event.event_type])
+
+    @callback
+    def _async_mark(self, uris: Iterable[str]) -> None:
+        """Add the subscribed uris to the pending updates, publishing them after the delay."""
+        self._pending.update(dict.fromkeys(uri for uri in uris if self.hub.is_subscribed(uri)))
+        if self._pending and self._timer is None:
+            self._timer = self.hass.loop.call_later(self.delay, self._async_publish)
+
+    @callback
+    def _async_publish(self) -> None:
+        """Publish the pending updates, in the order their resources first changed."""
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for uri in pending:
+            self.hub.publish(resource_updated(uri), resource=uri)
@@ -1,6 +1,6 @@
 """MCP resource definitions and handlers for Home Assistant."""
 
-import json
+from collections.abc import Callable, Sequence
 from typing import Any
 
 from homeassistant.const import __version__ as HA_VERSION
@@ -10,7 +10,11 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import floor_registry as fr
 from homeassistant.helpers import label_registry as lr
 
-from .json_utils import _HAJSONEncoder
+from .change_feed import changes_payload, get_change_feed
+from .entity_index import get_entity_index
+from .json_utils import json_dumps
+from .pagination import device_sort_key, entity_sort_key, paginate
+from .state_cache import state_attributes, state_timestamps
 
 RESOURCES = [
     {
@@ -61,6 +65,12 @@ RESOURCES = [
         "description": "Installed integrations with their status",
         "mimeType": "application/json",
     },
+    {
+        "uri": "hass://changes",
+        "name": "Entity Change Watermark",
+        "description": "Current change feed watermark, to read hass://changes/{watermark} with",
+        "mimeType": "application/json",
+    },
 ]
 
 RESOURCE_TEMPLATES = [
@@ -82,6 +92,29 @@ RESOURCE_TEMPLATES = [
         "description": "All entities filtered by a specific domain",
         "mimeType": "application/json",
     },
+    {
+        "uriTemplate": "hass://areas/{area_id}/entities",
+        "name": "Entities by Area",
+        "description": (
+            "All entities in a specific area, including those in it through their device"
+        ),
+        "mimeType": "application/json",
+    },
+    {
+        "uriTemplate": "hass://floors/{floor_id}/entities",
+        "name": "Entities by Floor",
+        "description": "All entities in the areas of a specific floor, with each one's area_id",
+        "mimeType": "application/json",
+    },
+    {
+        "uriTemplate": "hass://changes/{watermark}",
+        "name": "Entity Changes",
+        "description": (
+            "Entities whose state changed since a watermark, with the new watermark "
+            "(resync_required when the watermark is too old)"
+        ),
+        "mimeType": "application/json",
+    },
 ]
 
 
@@ -93,35 +126,80 @@ def get_resources() -> dict[str, Any]:
     }
 
 
-async def read_resource(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
-    """Read a resource by URI."""
+async def read_resource(
+    hass: HomeAssistant, uri: str, params: dict[str, Any] | None = None
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read a resource by URI, returning its contents and the next page's cursor.
+
+    hass://devices, hass://entities, hass://entities/domain/{domain},
+    hass://areas/{area_id}/entities and hass://floors/{floor_id}/entities are
+    paginated when the `cursor` or `page_size` param is given, and read whole
+    otherwise; the returned cursor is None when there are no further pages,
+    and always for other resources.
+    """
+    params = params or {}
+    if uri == "hass://devices":
+        return _read_devices(hass, uri, params)
+
+    if uri == "hass://entities":
+        return _read_entities(hass, uri, params)
+
+    if uri.startswith("hass://entities/domain/"):
+        domain = uri[len("hass://entities/domain/") :]
+        return _read_entities_domain(hass, uri, domain, params)
+
+    if uri.startswith("hass://areas/") and uri.endswith("/entities"):
+        area_id = uri[len("hass://areas/") : -len("/entities")]
+        return _read_entities_location(hass, uri, params, area_id=area_id)
+
+    if uri.startswith("hass://floors/") and uri.endswith("/entities"):
+        floor_id = uri[len("hass://floors/") : -len("/entities")]
+        return _read_entities_location(hass, uri, params, floor_id=floor_id)
+
+    return await _read_unpaginated(hass, uri), None
+
+
+def _page(
+    items: Sequence[Any], key: Callable[[Any], Any], params: dict[str, Any]
+) -> tuple[list[Any], str | None]:
+    """Return the page of items that params ask for, or all of them.
+
+    Clients that do not page read resources whole, so a page is only
+    returned for a read with a cursor or page_size.
+    """
+    if "cursor" not in params and "page_size" not in params:
+        return list(items), None
+    return paginate(items, key, params)
+
+
+async def _read_unpaginated(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
+    """Read an unpaginated resource by URI."""
     if uri == "hass://config":
         return _read_config(hass, uri)
 
     if uri == "hass://areas":
         return _read_areas(hass, uri)
 
-    if uri == "hass://devices":
-        return _read_devices(hass, uri)
-
     if uri == "hass://services":
         return _read_services(hass, uri)
 
     if uri == "hass://floors":
         return _read_floors(hass, uri)
 
-    if uri == "hass://entities":
-        return _read_entities(hass, uri)
-
     if uri == "hass://labels":
         return _read_labels(hass, uri)
 
     if uri == "hass://integrations":
         return _read_integrations(hass, uri)
 
-    if uri.startswith("hass://entities/domain/"):
-        domain = uri[len("hass://entities/domain/") :]
-        return _read_entities_domain(hass, uri, domain)
+    if uri == "hass://changes":
+        return _read_changes(hass, uri, None)
+
+    if uri.startswith("hass://changes/"):
+        watermark = uri[len("hass://changes/") :]
+        if not watermark.isdigit():
+            raise ValueError(f"Invalid watermark: {watermark}")
+        return _read_changes(hass, uri, int(watermark))
 
     if uri.startswith("hass://entity/"):
         entity_id = uri[len("hass://entity/") :]
@@ -153,7 +231,7 @@ def _read_config(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(data, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(data),
         }
     ]
 
@@ -173,7 +251,7 @@ def _read_areas(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(areas, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(areas),
         }
     ]
 
@@ -187,14 +265,19 @@ async def _read_dashboard(hass: HomeAssistant, uri: str, url_path: str) -> list[
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(config, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(config),
         }
     ]
 
 
-def _read_devices(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
-    """Read all devices as a resource."""
+def _read_devices(
+    hass: HomeAssistant, uri: str, params: dict[str, Any]
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read the devices, or a page of them, ordered by ID, as a resource."""
     registry = dr.async_get(hass)
+    page, next_cursor = _page(
+        sorted(registry.devices.values(), key=device_sort_key), device_sort_key, params
+    )
     devices = [
         {
             "id": device.id,
@@ -204,26 +287,26 @@ def _read_devices(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
             "area_id": device.area_id,
             "name_by_user": device.name_by_user,
         }
-        for device in registry.devices.values()
+        for device in page
     ]
     return [
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(devices, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(devices),
         }
-    ]
+    ], next_cursor
 
 
 def _read_services(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
     """Read all services as a resource."""
     services = hass.services.async_services()
-    result = {domain: list(svcs.keys()) for domain, svcs in services.items()}
+    result = {domain: sorted(svcs) for domain, svcs in sorted(services.items())}
     return [
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(result, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(result),
         }
     ]
 
@@ -245,7 +328,7 @@ def _read_floors(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(floors, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(floors),
         }
     ]
 
@@ -257,28 +340,31 @@ def _read_entity(hass: HomeAssistant, uri: str, entity_id: str) -> list[dict[str
     if state is None:
         raise ValueError(f"Entity {entity_id} not found")
 
+    last_changed, last_updated = state_timestamps(hass, state)
     data = {
         "entity_id": state.entity_id,
         "state": state.state,
-        "attributes": dict(state.attributes),
-        "last_changed": state.last_changed.isoformat(),
-        "last_updated": state.last_updated.isoformat(),
+        "attributes": state_attributes(hass, state),
+        "last_changed": last_changed,
+        "last_updated": last_updated,
     }
     return [
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(data, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(data),
         }
     ]
 
 
-def _read_entities(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
-    """Read all entities organized by domain."""
+def _read_entities(
+    hass: HomeAssistant, uri: str, params: dict[str, Any]
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read the entities, or a page of them, ordered by entity ID, organized by domain."""
+    page, next_cursor = _page(get_entity_index(hass).states(), entity_sort_key, params)
     by_domain: dict[str, list[dict[str, Any]]] = {}
-    for state in hass.states.async_all():
-        domain = state.entity_id.split(".")[0]
-        by_domain.setdefault(domain, []).append(
+    for state in page:
+        by_domain.setdefault(state.entity_id.split(".", 1)[0], []).append(
             {
                 "entity_id": state.entity_id,
                 "state": state.state,
@@ -289,31 +375,64 @@ def _read_entities(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(by_domain, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(by_domain),
         }
-    ]
+    ], next_cursor
 
 
-def _read_entities_domain(hass: HomeAssistant, uri: str, domain: str) -> list[dict[str, Any]]:
-    """Read entities filtered by domain."""
+def _read_entities_domain(
+    hass: HomeAssistant, uri: str, domain: str, params: dict[str, Any]
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read the entities of a domain, or a page of them."""
+    page, next_cursor = _page(get_entity_index(hass).states(domain=domain), entity_sort_key, params)
+    entities = [
+        {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+        }
+        for state in page
+    ]
+    return [
+        {
+            "uri": uri,
+            "mimeType": "application/json",
+            "text": json_dumps(entities),
+        }
+    ], next_cursor
+
+
+def _read_entities_location(
+    hass: HomeAssistant,
+    uri: str,
+    params: dict[str, Any],
+    *,
+    area_id: str | None = None,
+    floor_id: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Read the entities in an area or on a floor, or a page of them."""
+    if not (area_id or floor_id):
+        raise ValueError(f"Unknown resource: {uri}")
+    index = get_entity_index(hass)
+    states = index.states(area_id=area_id, floor_id=floor_id)
+    page, next_cursor = _page(states, entity_sort_key, params)
     entities = []
-    for state in hass.states.async_all():
-        if not state.entity_id.startswith(f"{domain}."):
-            continue
-        entities.append(
-            {
-                "entity_id": state.entity_id,
-                "state": state.state,
-                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-            }
-        )
+    for state in page:
+        entity = {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+        }
+        if floor_id:
+            entity["area_id"] = index.area_of(state.entity_id)
+        entities.append(entity)
     return [
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(entities, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(entities),
         }
-    ]
+    ], next_cursor
 
 
 def _read_labels(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
@@ -333,7 +452,7 @@ def _read_labels(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(labels, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(labels),
         }
     ]
 
@@ -354,6 +473,20 @@ def _read_integrations(hass: HomeAssistant, uri: str) -> list[dict[str, Any]]:
         {
             "uri": uri,
             "mimeType": "application/json",
-            "text": json.dumps(integrations, indent=2, cls=_HAJSONEncoder),
+            "text": json_dumps(integrations),
+        }
+    ]
+
+
+def _read_changes(hass: HomeAssistant, uri: str, watermark: int | None) -> list[dict[str, Any]]:
+    """Read entity changes since a watermark as a resource."""
+    feed = get_change_feed(hass)
+    if feed is None:
+        raise ValueError("Change feed is not available")
+    return [
+        {
+            "uri": uri,
+            "mimeType": "application/json",
+            "text": json_dumps(changes_payload(feed, watermark)),
         }
     ]
@@ -0,0 +1,129 @@
+"""Trigram index for ranked, typo-tolerant name search."""
+
+import heapq
+import re
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from itertools import chain
+from operator import itemgetter
+
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+# A document must share at least this fraction of the query's trigrams to match
+MIN_COVERAGE = 0.5
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Return the trigrams of text's lowercased alphanumeric tokens.
+
+    Tokens are padded with a leading space so word starts weigh in and short
+    tokens still produce at least one trigram; `light.living_room` and
+    "Living Room" therefore share " li", "liv", ... regardless of separators.
+    """
+    grams = set()
+    for token in _NON_ALNUM.sub(" ", text.lower()).split():
+        padded = f" {token}" if len(token) > 1 else f" {token} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def _best_score(shared: int, size: int) -> float:
+    """Return the highest score a document sharing `shared` query trigrams can reach."""
+    return 0.6 * shared / size + 0.4 * 2 * shared / (size + shared)
+
+
+class TrigramIndex:
+    """Inverted trigram index over documents with name and context texts.
+
+    A match is ranked by how much of the query its names and context cover
+    together (so "kitchen lamp" can match area "Kitchen" plus name "Lamp")
+    and by the Dice similarity of the query and its names alone (so "Lamp"
+    outranks "Lamp Power Monitor", and a name match outranks a context
+    match). Both parts tolerate typos because a misspelled word still shares
+    most of its trigrams with the correct one.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, set[str]] = defaultdict(set)
+        # doc_id -> (all trigrams, name trigrams)
+        self._docs: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed documents."""
+        return len(self._docs)
+
+    def __contains__(self, doc_id: str) -> bool:
+        """Return True when doc_id is indexed."""
+        return doc_id in self._docs
+
+    def add(self, doc_id: str, names: Iterable[str], context: Iterable[str] = ()) -> None:
+        """Index doc_id, replacing any previous version."""
+        self.remove(doc_id)
+        name_grams = frozenset(chain.from_iterable(trigrams(text) for text in names))
+        all_grams = name_grams.union(*(trigrams(text) for text in context))
+        self._docs[doc_id] = (all_grams, name_grams)
+        for gram in all_grams:
+            self._postings[gram].add(doc_id)
+
+    def remove(self, doc_id: str) -> None:
+        """Remove doc_id from the index if present."""
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for gram in doc[0]:
+            posting = self._postings[gram]
+            posting.discard(doc_id)
+            if not posting:
+                del self._postings[gram]
+
+    def search(
+        self, query: str, candidates: set[str] | None = None, limit: int | None = None
+    ) -> list[tuple[str, float]]:
+        """Return (doc_id, score) pairs for query, best first.
+
+        Scores are in 0..1. When candidates is given, only those documents are
+        considered.
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        size = len(query_grams)
+        required = MIN_COVERAGE * size
+        postings = self._postings
+        shared = Counter(chain.from_iterable(postings[g] for g in query_grams if g in postings))
+        matches = sorted(
+            (
+                (doc_id, count)
+                for doc_id, count in shared.items()
+                if count >= required and (candidates is None or doc_id in candidates)
+            ),
+            key=itemgetter(1),
+            reverse=True,
+        )
+
+        # Documents are visited by descending shared-trigram count, so with a
+        # limit the scan stops once no remaining document can beat the
+        # current limit-th best score.
+        docs = self._docs
+        top: list[float] = []
+        scored = []
+        last_count = None
+        for doc_id, count in matches:
+            if limit and count != last_count:
+                last_count = count
+                if len(top) >= limit and _best_score(count, size) < top[0]:
+                    break
+            name_grams = docs[doc_id][1]
+            similarity = 2 * len(query_grams & name_grams) / (size + len(name_grams))
+            score = 0.6 * count / size + 0.4 * similarity
+            scored.append((-score, doc_id))
+            if limit:
+                if len(top) < limit:
+                    heapq.heappush(top, score)
+                elif score > top[0]:
+                    heapq.heapreplace(top, score)
+
+        best = heapq.nsmallest(limit, scored) if limit else sorted(scored)
+        return [(doc_id, round(-score, 3)) for score, doc_id in best]
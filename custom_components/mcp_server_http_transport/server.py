@@ -10,16 +10,10 @@ from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-_LOGGER = logging.getLogger(__name__)
-
-_HAS_GET_ENTITY_ALIASES = hasattr(er, "async_get_entity_aliases")
+from .aliases import get_aliases
+from .entity_index import get_entity_index
 
-
-def _get_aliases(hass: "HomeAssistant", entry: er.RegistryEntry) -> list[str]:
-    """Get entity aliases, handling ComputedNameType on HA 2026.4+."""
-    if _HAS_GET_ENTITY_ALIASES:
-        return er.async_get_entity_aliases(hass, entry)
-    return sorted(str(a) for a in entry.aliases) if entry.aliases else []
+_LOGGER = logging.getLogger(__name__)
 
 
 class HomeAssistantMCPServer:
@@ -117,7 +111,7 @@ class HomeAssistantMCPServer:
 
         registry = er.async_get(self.hass)
         entry = registry.async_get(entity_id)
-        aliases = _get_aliases(self.hass, entry) if entry else []
+        aliases = get_aliases(self.hass, entry) if entry else []
 
         result = {
             "entity_id": state.entity_id,
@@ -154,11 +148,9 @@ class HomeAssistantMCPServer:
         registry = er.async_get(self.hass)
 
         entities = []
-        for state in self.hass.states.async_all():
-            if domain_filter and not state.entity_id.startswith(f"{domain_filter}."):
-                continue
+        for state in get_entity_index(self.hass).states(domain=domain_filter):
             entry = registry.async_get(state.entity_id)
-            aliases = _get_aliases(self.hass, entry) if entry else []
+            aliases = get_aliases(self.hass, entry) if entry else []
             entities.append(
                 {
                     "entity_id": state.entity_id,
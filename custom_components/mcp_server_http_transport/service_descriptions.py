@@ -0,0 +1,113 @@
+"""Per-domain cache of service descriptions for describe_service."""
+
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import (
+    EVENT_COMPONENT_LOADED,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.service import (
+    async_get_all_descriptions,
+    async_get_cached_service_description,
+)
+
+from .const import DOMAIN
+
+
+async def _async_describe_domain(hass: HomeAssistant, domain: str) -> dict[str, Any]:
+    """Return the descriptions of one domain's services.
+
+    Services HA has described before are read from its per-service cache.
+    Only when one of them was never described do we fall back to
+    async_get_all_descriptions, which loads services.yaml and translations
+    for every domain with undescribed services.
+    """
+    services = hass.services.async_services_for_domain(domain)
+    if not services:
+        return {}
+    descriptions = {}
+    for service in services:
+        description = async_get_cached_service_description(hass, domain, service)
+        if description is None:
+            return dict((await async_get_all_descriptions(hass)).get(domain, {}))
+        descriptions[service] = description
+    return descriptions
+
+
+class ServiceDescriptionCache:
+    """Service descriptions by domain, dropped when the domain's services change.
+
+    A domain's entry is invalidated when one of its services is registered
+    or removed, or when the integration (or one of its platforms) loads,
+    which covers reloads.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self._domains: dict[str, dict[str, Any]] = {}
+        # Bumped per domain on invalidation, so a lookup that was in flight
+        # meanwhile does not store what it read before the change
+        self._generations: dict[str, int] = {}
+        self._unsubs: list[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking service and integration changes."""
+        bus = self.hass.bus
+        self._unsubs = [
+            bus.async_listen(EVENT_SERVICE_REGISTERED, self._async_service_changed),
+            bus.async_listen(EVENT_SERVICE_REMOVED, self._async_service_changed),
+            bus.async_listen(EVENT_COMPONENT_LOADED, self._async_component_loaded),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    async def async_get(self, domain: str) -> dict[str, Any]:
+        """Return the descriptions of domain's services, keyed by service name."""
+        if (descriptions := self._domains.get(domain)) is not None:
+            return descriptions
+        generation = self._generations.get(domain, 0)
+        descriptions = await _async_describe_domain(self.hass, domain)
+        if descriptions and self._generations.get(domain, 0) == generation:
+            self._domains[domain] = descriptions
+        return descriptions
+
+    @callback
+    def _invalidate(self, domain: str) -> None:
+        """Drop one domain's descriptions."""
+        self._domains.pop(domain, None)
+        self._generations[domain] = self._generations.get(domain, 0) + 1
+
+    @callback
+    def _async_service_changed(self, event: Event) -> None:
+        """Drop a domain after one of its services was registered or removed."""
+        self._invalidate(event.data["domain"])
+
+    @callback
+    def _async_component_loaded(self, event: Event) -> None:
+        """Drop a domain after its integration or one of its platforms loaded."""
+        # Platforms load as "<domain>.<integration>"
+        for domain in event.data["component"].split("."):
+            self._invalidate(domain)
+
+
+async def async_get_service_descriptions(hass: HomeAssistant, domain: str) -> dict[str, Any]:
+    """Return the descriptions of domain's services.
+
+    Uses the integration's cache, or describes the domain directly when the
+    integration is not set up.
+    """
+    data = hass.data.get(DOMAIN)
+    cache = data.get("service_descriptions") if isinstance(data, dict) else None
+    if isinstance(cache, ServiceDescriptionCache):
+        return await cache.async_get(domain)
+    return await _async_describe_domain(hass, domain)
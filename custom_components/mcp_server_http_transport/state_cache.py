@@ -0,0 +1,131 @@
+"""Encoded entity state parts, reused until the entity's State is replaced."""
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, State
+
+from .const import DOMAIN
+from .json_utils import compact_output, json_fragment
+
+# Parts kept per state: full attributes, timestamps and a few projections
+# (distinct `fields` lists); further projections are built per request
+_MAX_PARTS = 6
+
+# Entries kept before states of removed entities are swept out
+_MIN_SWEEP_SIZE = 1024
+
+_TIMESTAMPS = "timestamps"
+
+
+def _attributes(state: State, fields: Iterable[str] | None) -> dict[str, Any]:
+    """Return a copy of state's attributes, limited to fields when given."""
+    if fields is None:
+        return dict(state.attributes)
+    return {k: v for k, v in state.attributes.items() if k in fields}
+
+
+def _timestamps(state: State) -> tuple[str, str]:
+    """Return state's last_changed and last_updated in ISO format."""
+    return state.last_changed.isoformat(), state.last_updated.isoformat()
+
+
+class StateFragmentCache:
+    """Encoded attributes and timestamps of each entity's current State.
+
+    HA never mutates a State; it replaces the object on every change. An
+    entry holds the State it was built from and is used only while that
+    same object is being serialized, so it needs no invalidation. Entries
+    are keyed by entity ID rather than weakly by State, because State
+    defines __slots__ without __weakref__.
+
+    Attributes are stored as JSON fragments that json_dumps copies verbatim
+    into the response, so an unchanged entity's attributes are encoded once
+    however many requests read them.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[State, dict[Hashable, Any]]] = {}
+        self._sweep_at = _MIN_SWEEP_SIZE
+
+    def _parts(self, state: State) -> dict[Hashable, Any]:
+        """Return the cached parts of state, starting over when it was replaced."""
+        entry = self._entries.get(state.entity_id)
+        if entry is not None and entry[0] is state:
+            return entry[1]
+        if entry is None and len(self._entries) >= self._sweep_at:
+            self._sweep()
+        parts: dict[Hashable, Any] = {}
+        self._entries[state.entity_id] = (state, parts)
+        return parts
+
+    def _sweep(self) -> None:
+        """Drop entries whose State is no longer current, e.g. of removed entities."""
+        get = self.hass.states.get
+        self._entries = {
+            entity_id: entry
+            for entity_id, entry in self._entries.items()
+            if get(entity_id) is entry[0]
+        }
+        self._sweep_at = max(_MIN_SWEEP_SIZE, 2 * len(self._entries))
+
+    def attributes(self, state: State, fields: Iterable[str] | None = None) -> Any:
+        """Return state's attributes, limited to fields, encoded for json_dumps.
+
+        Falls back to a plain dict when the attributes cannot be encoded as a
+        fragment.
+        """
+        key = None if fields is None else frozenset(fields)
+        parts = self._parts(state)
+        if key in parts:
+            self.hits += 1
+            return parts[key]
+        self.misses += 1
+        attributes = _attributes(state, key)
+        if key is not None and len(parts) >= _MAX_PARTS:
+            return attributes
+        fragment = json_fragment(attributes)
+        parts[key] = attributes if fragment is None else fragment
+        return parts[key]
+
+    def timestamps(self, state: State) -> tuple[str, str]:
+        """Return state's last_changed and last_updated in ISO format."""
+        parts = self._parts(state)
+        if _TIMESTAMPS not in parts:
+            parts[_TIMESTAMPS] = _timestamps(state)
+        return parts[_TIMESTAMPS]
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters for attributes and the current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+def get_state_fragments(hass: HomeAssistant) -> StateFragmentCache | None:
+    """Return the integration's state cache, or None when it is not set up."""
+    data = hass.data.get(DOMAIN)
+    cache = data.get("state_fragments") if isinstance(data, dict) else None
+    return cache if isinstance(cache, StateFragmentCache) else None
+
+
+def state_attributes(hass: HomeAssistant, state: State, fields: Iterable[str] | None = None) -> Any:
+    """Return state's attributes, limited to fields, for json_dumps output.
+
+    Uses the cache for compact output; indented output gets a plain dict,
+    since cached fragments are compact.
+    """
+    cache = get_state_fragments(hass)
+    if cache is None or not compact_output():
+        return _attributes(state, fields)
+    return cache.attributes(state, fields)
+
+
+def state_timestamps(hass: HomeAssistant, state: State) -> tuple[str, str]:
+    """Return state's last_changed and last_updated in ISO format."""
+    cache = get_state_fragments(hass)
+    if cache is None:
+        return _timestamps(state)
+    return cache.timestamps(state)
@@ -0,0 +1,135 @@
+"""Server-Sent Events support for the MCP Streamable HTTP transport."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar, Token
+from typing import Any
+
+from .json_utils import json_dumps, reset_indent, set_indent
+
+_LOGGER = logging.getLogger(__name__)
+
+SSE_HEADERS = {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+# Streamable HTTP session, issued with the initialize response and sent back
+# by the client on later requests
+MCP_SESSION_HEADER = "Mcp-Session-Id"
+
+ProgressCallback = Callable[[float, float | None, str | None], Awaitable[None]]
+
+# Bound by the HTTP layer while a streamed request with a progressToken runs,
+# so handlers can report progress without threading a callback through every
+# tool signature. Unset (no-op) for plain JSON requests.
+_progress_callback: ContextVar[ProgressCallback | None] = ContextVar(
+    "mcp_progress_callback", default=None
+)
+
+
+def sse_event(message: dict[str, Any]) -> bytes:
+    """Encode a JSON-RPC message as one SSE `message` event."""
+    # Compact even for pretty requests, since a data field is one line
+    token = set_indent(None)
+    try:
+        data = json_dumps(message)
+    finally:
+        reset_indent(token)
+    return f"event: message\ndata: {data}\n\n".encode()
+
+
+def set_progress_callback(callback: ProgressCallback | None) -> Token:
+    """Bind a progress callback for the current request context."""
+    return _progress_callback.set(callback)
+
+
+def reset_progress_callback(token: Token) -> None:
+    """Restore the progress callback that was bound before set_progress_callback."""
+    _progress_callback.reset(token)
+
+
+async def report_progress(
+    progress: float, total: float | None = None, message: str | None = None
+) -> None:
+    """Report progress for the request being handled, if the client asked for it."""
+    callback = _progress_callback.get()
+    if callback is not None:
+        await callback(progress, total, message)
+
+
+class NotificationHub:
+    """Fan-out of server-initiated notifications to open GET streams.
+
+    Each stream belongs to the session whose ID it was opened with, if any.
+    Resource updates only go to the streams of sessions that subscribed to
+    the resource with resources/subscribe.
+    """
+
+    def __init__(self, max_queue: int = 100) -> None:
+        """Initialize the hub."""
+        self._max_queue = max_queue
+        self._subscribers: dict[asyncio.Queue, str | None] = {}
+        # Resource URIs each session subscribed to
+        self._resources: dict[str, set[str]] = {}
+
+    def subscribe(self, session_id: str | None = None) -> asyncio.Queue:
+        """Register a new stream of session_id and return the queue it should drain."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._max_queue)
+        self._subscribers[queue] = session_id
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Remove a stream's queue."""
+        self._subscribers.pop(queue, None)
+
+    def subscribe_resource(self, session_id: str, uri: str) -> None:
+        """Send the session updates of the resource at uri."""
+        self._resources.setdefault(session_id, set()).add(uri)
+
+    def unsubscribe_resource(self, session_id: str, uri: str) -> None:
+        """Stop sending the session updates of the resource at uri."""
+        uris = self._resources.get(session_id)
+        if uris is not None:
+            uris.discard(uri)
+            if not uris:
+                del self._resources[session_id]
+
+    def end_session(self, session_id: str) -> None:
+        """Drop the session's resource subscriptions."""
+        self._resources.pop(session_id, None)
+
+    def is_subscribed(self, uri: str) -> bool:
+        """Return True if an open stream's session subscribed to uri."""
+        return any(
+            uri in self._resources.get(session_id, ())
+            for session_id in self._subscribers.values()
+            if session_id is not None
+        )
+
+    def publish(self, message: dict[str, Any], resource: str | None = None) -> None:
+        """Queue a JSON-RPC notification for every open stream.
+
+        A notification about a resource is only queued for the streams of
+        sessions subscribed to it.
+        """
+        for queue, session_id in self._subscribers.items():
+            if resource is not None and resource not in self._resources.get(session_id, ()):
+                continue
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                _LOGGER.debug("Dropping MCP notification for a slow stream consumer")
+
+    def close(self) -> None:
+        """Tell every open stream to finish (a None item ends the stream)."""
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(None)
+        self._subscribers.clear()
+        self._resources.clear()
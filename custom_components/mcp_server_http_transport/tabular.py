@@ -0,0 +1,69 @@
+"""Columnar output for tools that list records."""
+
+from typing import Any
+
+FORMATS = ("objects", "table", "dictionary")
+
+# Input schema properties for tools that support the table format
+FORMAT_PROPERTIES = {
+    "format": {
+        "type": "string",
+        "enum": list(FORMATS),
+        "description": (
+            "Output shape (optional). 'objects' (default) is a list of objects; "
+            "'table' is {columns, rows} with one value list per record; "
+            "'dictionary' is a table whose repetitive string columns hold indexes "
+            "into {dictionaries: {column: [values]}}"
+        ),
+    },
+}
+
+
+def to_table(records: list[dict[str, Any]], dictionary: bool = False) -> dict[str, Any]:
+    """Return records as {"columns": [...], "rows": [[...], ...]}.
+
+    Columns are the keys of all records in first-seen order; a record missing
+    a key gets None. With dictionary, each string column where a value
+    repeats on average at least twice is replaced by indexes into
+    `dictionaries[column]`; None stays None.
+    """
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    rows = [[record.get(column) for column in columns] for record in records]
+    table: dict[str, Any] = {"columns": columns, "rows": rows}
+    if not dictionary:
+        return table
+
+    dictionaries = {}
+    for i, column in enumerate(columns):
+        values = [row[i] for row in rows if row[i] is not None]
+        if not values or not all(isinstance(value, str) for value in values):
+            continue
+        distinct = list(dict.fromkeys(values))
+        if len(distinct) * 2 > len(values):
+            continue
+        lookup = {value: n for n, value in enumerate(distinct)}
+        for row in rows:
+            if row[i] is not None:
+                row[i] = lookup[row[i]]
+        dictionaries[column] = distinct
+    if dictionaries:
+        table["dictionaries"] = dictionaries
+    return table
+
+
+def output_format(arguments: dict[str, Any]) -> str:
+    """Return the `format` argument, raising ValueError when it is not a known format."""
+    value = arguments.get("format", "objects")
+    if value not in FORMATS:
+        raise ValueError(f"Unknown format '{value}', expected one of {', '.join(FORMATS)}")
+    return value
+
+
+def format_records(
+    records: list[dict[str, Any]], arguments: dict[str, Any]
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Return records in the shape requested by the `format` argument."""
+    value = output_format(arguments)
+    if value == "objects":
+        return records
+    return to_table(records, dictionary=value == "dictionary")
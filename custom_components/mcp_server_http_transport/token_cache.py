@@ -0,0 +1,89 @@
+"""Bounded TTL cache for validated bearer tokens."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DEFAULT_TOKEN_CACHE_SIZE, DEFAULT_TOKEN_CACHE_TTL, DOMAIN
+
+
+class TokenCache:
+    """LRU cache of successful token validations.
+
+    Entries are keyed by a SHA-256 digest of the token (the raw token is never
+    stored) plus the issuer and audience it was validated against, and expire
+    at the token's `exp` claim or after `max_ttl` seconds, whichever is first.
+    Only OIDC validations are cached; native tokens are checked on every
+    request so that deleting one takes effect at once.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_TOKEN_CACHE_SIZE,
+        max_ttl: float = DEFAULT_TOKEN_CACHE_TTL,
+    ) -> None:
+        """Initialize the cache."""
+        self.max_size = max(1, max_size)
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def make_key(token: str, issuer: str | None, audience: str | None) -> str:
+        """Build the cache key for a token validated against issuer and audience."""
+        digest = hashlib.sha256(token.encode()).hexdigest()
+        return f"{digest}|{issuer or ''}|{audience or ''}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached payload for key, or None on a miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return payload
+
+    def set(self, key: str, payload: dict[str, Any]) -> None:
+        """Cache a validated payload until its exp claim or max_ttl."""
+        now = time.time()
+        expires_at = now + self.max_ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        if expires_at <= now:
+            return
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached validation."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters, the current size, and the size and TTL limits."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "max_ttl": self.max_ttl,
+        }
+
+
+def get_token_cache(hass: HomeAssistant) -> TokenCache | None:
+    """Return the token cache of the active config entry, or None when it is not set up."""
+    data = hass.data.get(DOMAIN)
+    cache = data.get("token_cache") if isinstance(data, dict) else None
+    return cache if isinstance(cache, TokenCache) else None
@@ -1,16 +1,111 @@
 """Automation, scene, and script CRUD and read tools."""
 
-import json
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from . import _HAJSONEncoder, register_tool
+from ..pagination import (
+    PAGINATION_PROPERTIES,
+    InvalidCursorError,
+    entry_sort_key,
+    page_content,
+    paginate,
+)
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Input schema properties of tools that edit config files
+_RELOAD_PROPERTIES = {
+    "reload_now": {
+        "type": "boolean",
+        "description": (
+            "Reload at once and wait for it. By default the reload follows shortly after "
+            "the edit returns, so edits made in a row share one reload (default false)"
+        ),
+    },
+}
+
+
+def _edited(message: str, merged: bool) -> dict[str, Any]:
+    """Return an edit tool's result, noting when its reload was shared."""
+    if merged:
+        message += " (reload merged with other edits)"
+    return {"content": [{"type": "text", "text": message}]}
+
+
+# Maximum number of operations in one batch_edit_* request
+_MAX_BATCH_EDITS = 50
+
+
+def _batch_edit_schema(key_field: str, key_description: str, config_description: str) -> dict:
+    """Return the input schema of a batch_edit_* tool."""
+    return {
+        "type": "object",
+        "properties": {
+            "operations": {
+                "type": "array",
+                "description": f"Operations, applied in order (max {_MAX_BATCH_EDITS})",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "op": {"type": "string", "enum": ["create", "update", "delete"]},
+                        key_field: {"type": "string", "description": key_description},
+                        "config": {"type": "object", "description": config_description},
+                    },
+                    "required": ["op"],
+                },
+            },
+            **_RELOAD_PROPERTIES,
+        },
+        "required": ["operations"],
+    }
+
+
+async def _batch_edit(
+    hass: HomeAssistant,
+    arguments: dict[str, Any],
+    apply: Callable[..., Awaitable[list[dict[str, Any]]]],
+    config_file: str,
+    reload_domain: str,
+) -> dict[str, Any]:
+    """Apply a batch_edit_* request and report each operation's outcome."""
+    operations = arguments["operations"]
+    if not operations:
+        return {"content": [{"type": "text", "text": "Error: operations must not be empty"}]}
+    if len(operations) > _MAX_BATCH_EDITS:
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": f"Error: maximum {_MAX_BATCH_EDITS} operations per request",
+                }
+            ]
+        }
+    try:
+        results, merged = await apply(
+            hass,
+            config_file,
+            operations,
+            reload_domain,
+            reload_now=arguments.get("reload_now", False),
+        )
+    except Exception as e:
+        return {"content": [{"type": "text", "text": f"Error editing {config_file}: {str(e)}"}]}
+    succeeded = sum(1 for result in results if result["success"])
+    summary = {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "reloaded": succeeded > 0,
+        "reload_merged": merged,
+        "results": results,
+    }
+    return {"content": [{"type": "text", "text": json_dumps(summary)}]}
+
+
 # --- Automation Tools ---
 
 
@@ -25,7 +120,8 @@ _LOGGER = logging.getLogger(__name__)
                 "description": (
                     "Automation configuration (alias, trigger, action, condition, mode, etc.)"
                 ),
-            }
+            },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["config"],
     },
@@ -35,14 +131,14 @@ async def create_automation(hass: HomeAssistant, arguments: dict[str, Any]) -> d
     from ..config_manager import create_list_entry
 
     try:
-        entry_id = await create_list_entry(
-            hass, "automations.yaml", arguments["config"], "automation"
+        entry_id, merged = await create_list_entry(
+            hass,
+            "automations.yaml",
+            arguments["config"],
+            "automation",
+            reload_now=arguments.get("reload_now", False),
         )
-        return {
-            "content": [
-                {"type": "text", "text": f"Successfully created automation with id: {entry_id}"}
-            ]
-        }
+        return _edited(f"Successfully created automation with id: {entry_id}", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error creating automation: {str(e)}"}]}
 
@@ -62,6 +158,7 @@ async def create_automation(hass: HomeAssistant, arguments: dict[str, Any]) -> d
                 "description": "Updated automation config"
                 " (alias, trigger, action, condition, mode, etc.)",
             },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["automation_id", "config"],
     },
@@ -71,14 +168,15 @@ async def update_automation(hass: HomeAssistant, arguments: dict[str, Any]) -> d
     from ..config_manager import update_list_entry
 
     try:
-        await update_list_entry(
+        merged = await update_list_entry(
             hass,
             "automations.yaml",
             arguments["automation_id"],
             arguments["config"],
             "automation",
+            reload_now=arguments.get("reload_now", False),
         )
-        return {"content": [{"type": "text", "text": "Successfully updated automation"}]}
+        return _edited("Successfully updated automation", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error updating automation: {str(e)}"}]}
 
@@ -92,7 +190,8 @@ async def update_automation(hass: HomeAssistant, arguments: dict[str, Any]) -> d
             "automation_id": {
                 "type": "string",
                 "description": "The automation ID to delete",
-            }
+            },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["automation_id"],
     },
@@ -102,18 +201,49 @@ async def delete_automation(hass: HomeAssistant, arguments: dict[str, Any]) -> d
     from ..config_manager import delete_list_entry
 
     try:
-        await delete_list_entry(hass, "automations.yaml", arguments["automation_id"], "automation")
-        return {"content": [{"type": "text", "text": "Successfully deleted automation"}]}
+        merged = await delete_list_entry(
+            hass,
+            "automations.yaml",
+            arguments["automation_id"],
+            "automation",
+            reload_now=arguments.get("reload_now", False),
+        )
+        return _edited("Successfully deleted automation", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error deleting automation: {str(e)}"}]}
 
 
+@register_tool(
+    name="batch_edit_automations",
+    description=(
+        "Create, update and delete several automations with one write of automations.yaml "
+        "and one reload. Returns success or error per operation, and the IDs of created "
+        "automations"
+    ),
+    input_schema=_batch_edit_schema(
+        "id",
+        "The automation ID, for update and delete",
+        "Automation config (alias, trigger, action, condition, mode, etc.), for create "
+        "and update",
+    ),
+)
+async def batch_edit_automations(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Apply several automation edits at once."""
+    from ..config_manager import apply_list_operations
+
+    return await _batch_edit(
+        hass, arguments, apply_list_operations, "automations.yaml", "automation"
+    )
+
+
 @register_tool(
     name="list_automations",
-    description="List all automations with their full configuration from automations.yaml",
+    description=(
+        "List all automations with their full configuration from automations.yaml, " "ordered by ID"
+    ),
     input_schema={
         "type": "object",
-        "properties": {},
+        "properties": {**PAGINATION_PROPERTIES},
     },
 )
 async def list_automations(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
@@ -121,10 +251,10 @@ async def list_automations(hass: HomeAssistant, arguments: dict[str, Any]) -> di
     from ..config_manager import read_list_entries
 
     try:
-        entries = await read_list_entries(hass, "automations.yaml")
-        return {
-            "content": [{"type": "text", "text": json.dumps(entries, indent=2, cls=_HAJSONEncoder)}]
-        }
+        entries = sorted(await read_list_entries(hass, "automations.yaml"), key=entry_sort_key)
+        return page_content(*paginate(entries, entry_sort_key, arguments))
+    except InvalidCursorError:
+        raise
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing automations: {str(e)}"}]}
 
@@ -149,9 +279,7 @@ async def get_automation_config(hass: HomeAssistant, arguments: dict[str, Any])
 
     try:
         entry = await read_list_entry(hass, "automations.yaml", arguments["automation_id"])
-        return {
-            "content": [{"type": "text", "text": json.dumps(entry, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(entry)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error getting automation config: {str(e)}"}]}
 
@@ -168,7 +296,8 @@ async def get_automation_config(hass: HomeAssistant, arguments: dict[str, Any])
             "config": {
                 "type": "object",
                 "description": "Scene configuration (name, entities, etc.)",
-            }
+            },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["config"],
     },
@@ -178,10 +307,14 @@ async def create_scene(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
     from ..config_manager import create_list_entry
 
     try:
-        entry_id = await create_list_entry(hass, "scenes.yaml", arguments["config"], "scene")
-        return {
-            "content": [{"type": "text", "text": f"Successfully created scene with id: {entry_id}"}]
-        }
+        entry_id, merged = await create_list_entry(
+            hass,
+            "scenes.yaml",
+            arguments["config"],
+            "scene",
+            reload_now=arguments.get("reload_now", False),
+        )
+        return _edited(f"Successfully created scene with id: {entry_id}", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error creating scene: {str(e)}"}]}
 
@@ -200,6 +333,7 @@ async def create_scene(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
                 "type": "object",
                 "description": "Updated scene configuration (name, entities, etc.)",
             },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["scene_id", "config"],
     },
@@ -209,10 +343,15 @@ async def update_scene(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
     from ..config_manager import update_list_entry
 
     try:
-        await update_list_entry(
-            hass, "scenes.yaml", arguments["scene_id"], arguments["config"], "scene"
+        merged = await update_list_entry(
+            hass,
+            "scenes.yaml",
+            arguments["scene_id"],
+            arguments["config"],
+            "scene",
+            reload_now=arguments.get("reload_now", False),
         )
-        return {"content": [{"type": "text", "text": "Successfully updated scene"}]}
+        return _edited("Successfully updated scene", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error updating scene: {str(e)}"}]}
 
@@ -226,7 +365,8 @@ async def update_scene(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
             "scene_id": {
                 "type": "string",
                 "description": "The scene ID to delete",
-            }
+            },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["scene_id"],
     },
@@ -236,12 +376,37 @@ async def delete_scene(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
     from ..config_manager import delete_list_entry
 
     try:
-        await delete_list_entry(hass, "scenes.yaml", arguments["scene_id"], "scene")
-        return {"content": [{"type": "text", "text": "Successfully deleted scene"}]}
+        merged = await delete_list_entry(
+            hass,
+            "scenes.yaml",
+            arguments["scene_id"],
+            "scene",
+            reload_now=arguments.get("reload_now", False),
+        )
+        return _edited("Successfully deleted scene", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error deleting scene: {str(e)}"}]}
 
 
+@register_tool(
+    name="batch_edit_scenes",
+    description=(
+        "Create, update and delete several scenes with one write of scenes.yaml and one "
+        "reload. Returns success or error per operation, and the IDs of created scenes"
+    ),
+    input_schema=_batch_edit_schema(
+        "id",
+        "The scene ID, for update and delete",
+        "Scene config (name, entities, etc.), for create and update",
+    ),
+)
+async def batch_edit_scenes(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Apply several scene edits at once."""
+    from ..config_manager import apply_list_operations
+
+    return await _batch_edit(hass, arguments, apply_list_operations, "scenes.yaml", "scene")
+
+
 @register_tool(
     name="list_scenes",
     description="List all scenes with their full configuration from scenes.yaml",
@@ -256,9 +421,7 @@ async def list_scenes(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[st
 
     try:
         entries = await read_list_entries(hass, "scenes.yaml")
-        return {
-            "content": [{"type": "text", "text": json.dumps(entries, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(entries)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing scenes: {str(e)}"}]}
 
@@ -283,9 +446,7 @@ async def get_scene_config(hass: HomeAssistant, arguments: dict[str, Any]) -> di
 
     try:
         entry = await read_list_entry(hass, "scenes.yaml", arguments["scene_id"])
-        return {
-            "content": [{"type": "text", "text": json.dumps(entry, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(entry)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error getting scene config: {str(e)}"}]}
 
@@ -307,6 +468,7 @@ async def get_scene_config(hass: HomeAssistant, arguments: dict[str, Any]) -> di
                 "type": "object",
                 "description": "Script configuration (alias, sequence, mode, etc.)",
             },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["key", "config"],
     },
@@ -316,12 +478,15 @@ async def create_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     from ..config_manager import create_dict_entry
 
     try:
-        key = await create_dict_entry(
-            hass, "scripts.yaml", arguments["key"], arguments["config"], "script"
+        key, merged = await create_dict_entry(
+            hass,
+            "scripts.yaml",
+            arguments["key"],
+            arguments["config"],
+            "script",
+            reload_now=arguments.get("reload_now", False),
         )
-        return {
-            "content": [{"type": "text", "text": f"Successfully created script with key: {key}"}]
-        }
+        return _edited(f"Successfully created script with key: {key}", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error creating script: {str(e)}"}]}
 
@@ -340,6 +505,7 @@ async def create_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
                 "type": "object",
                 "description": "Updated script configuration (alias, sequence, mode, etc.)",
             },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["key", "config"],
     },
@@ -349,10 +515,15 @@ async def update_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     from ..config_manager import update_dict_entry
 
     try:
-        await update_dict_entry(
-            hass, "scripts.yaml", arguments["key"], arguments["config"], "script"
+        merged = await update_dict_entry(
+            hass,
+            "scripts.yaml",
+            arguments["key"],
+            arguments["config"],
+            "script",
+            reload_now=arguments.get("reload_now", False),
         )
-        return {"content": [{"type": "text", "text": "Successfully updated script"}]}
+        return _edited("Successfully updated script", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error updating script: {str(e)}"}]}
 
@@ -366,7 +537,8 @@ async def update_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
             "key": {
                 "type": "string",
                 "description": "The script key to delete",
-            }
+            },
+            **_RELOAD_PROPERTIES,
         },
         "required": ["key"],
     },
@@ -376,12 +548,37 @@ async def delete_script(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     from ..config_manager import delete_dict_entry
 
     try:
-        await delete_dict_entry(hass, "scripts.yaml", arguments["key"], "script")
-        return {"content": [{"type": "text", "text": "Successfully deleted script"}]}
+        merged = await delete_dict_entry(
+            hass,
+            "scripts.yaml",
+            arguments["key"],
+            "script",
+            reload_now=arguments.get("reload_now", False),
+        )
+        return _edited("Successfully deleted script", merged)
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error deleting script: {str(e)}"}]}
 
 
+@register_tool(
+    name="batch_edit_scripts",
+    description=(
+        "Create, update and delete several scripts with one write of scripts.yaml and one "
+        "reload. Returns success or error per operation"
+    ),
+    input_schema=_batch_edit_schema(
+        "key",
+        "The script key (becomes script.{key} entity)",
+        "Script config (alias, sequence, mode, etc.), for create and update",
+    ),
+)
+async def batch_edit_scripts(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Apply several script edits at once."""
+    from ..config_manager import apply_dict_operations
+
+    return await _batch_edit(hass, arguments, apply_dict_operations, "scripts.yaml", "script")
+
+
 @register_tool(
     name="list_scripts",
     description="List all scripts with their full configuration from scripts.yaml",
@@ -396,9 +593,7 @@ async def list_scripts(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
 
     try:
         entries = await read_dict_entries(hass, "scripts.yaml")
-        return {
-            "content": [{"type": "text", "text": json.dumps(entries, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(entries)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing scripts: {str(e)}"}]}
 
@@ -423,8 +618,6 @@ async def get_script_config(hass: HomeAssistant, arguments: dict[str, Any]) -> d
 
     try:
         entry = await read_dict_entry(hass, "scripts.yaml", arguments["key"])
-        return {
-            "content": [{"type": "text", "text": json.dumps(entry, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(entry)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error getting script config: {str(e)}"}]}
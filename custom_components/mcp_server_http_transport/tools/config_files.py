@@ -1,6 +1,5 @@
 """Config file access tools (list, read, write, delete, backup, restore YAML files)."""
 
-import json
 import logging
 import os
 import re
@@ -12,7 +11,7 @@ from typing import Any
 from homeassistant.core import HomeAssistant
 
 from ..const import DOMAIN
-from . import register_tool
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -166,7 +165,7 @@ async def list_config_files(hass: HomeAssistant, arguments: dict[str, Any]) -> d
     config_dir = _config_dir(hass)
     try:
         files = await hass.async_add_executor_job(_list_yaml_filenames_sync, config_dir)
-        return {"content": [{"type": "text", "text": json.dumps(files, indent=2)}]}
+        return {"content": [{"type": "text", "text": json_dumps(files)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing config files: {e}"}]}
 
@@ -558,7 +557,7 @@ async def list_config_backups(hass: HomeAssistant, arguments: dict[str, Any]) ->
         result = await hass.async_add_executor_job(_list_backups_sync, _config_dir(hass))
         if not result:
             return {"content": [{"type": "text", "text": "No backups found"}]}
-        return {"content": [{"type": "text", "text": json.dumps(result, indent=2)}]}
+        return {"content": [{"type": "text", "text": json_dumps(result)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing backups: {e}"}]}
 
@@ -1,12 +1,11 @@
 """Dashboard tools."""
 
-import json
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
-from . import _HAJSONEncoder, register_tool
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,11 +24,7 @@ async def list_dashboards_tool(hass: HomeAssistant, arguments: dict[str, Any]) -
 
     try:
         dashboards = await list_dashboards(hass)
-        return {
-            "content": [
-                {"type": "text", "text": json.dumps(dashboards, indent=2, cls=_HAJSONEncoder)}
-            ]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(dashboards)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error listing dashboards: {str(e)}"}]}
 
@@ -62,9 +57,7 @@ async def get_dashboard_config_tool(
 
     try:
         config = await get_dashboard_config(hass, arguments["url_path"])
-        return {
-            "content": [{"type": "text", "text": json.dumps(config, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(config)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error getting dashboard config: {str(e)}"}]}
 
@@ -205,7 +198,7 @@ async def create_dashboard_tool(hass: HomeAssistant, arguments: dict[str, Any])
                     "type": "text",
                     "text": (
                         f"Successfully created dashboard '{arguments['url_path']}': "
-                        f"{json.dumps(item, indent=2, cls=_HAJSONEncoder)}"
+                        f"{json_dumps(item)}"
                     ),
                 }
             ]
@@ -261,8 +254,7 @@ async def update_dashboard_tool(hass: HomeAssistant, arguments: dict[str, Any])
                 {
                     "type": "text",
                     "text": (
-                        f"Successfully updated dashboard '{url_path}': "
-                        f"{json.dumps(item, indent=2, cls=_HAJSONEncoder)}"
+                        f"Successfully updated dashboard '{url_path}': " f"{json_dumps(item)}"
                     ),
                 }
             ]
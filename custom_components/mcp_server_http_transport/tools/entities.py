@@ -1,28 +1,46 @@
 """Entity, area, device, and service tools."""
 
-import json
+import asyncio
 import logging
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import label_registry as lr
-from homeassistant.helpers.service import async_get_all_descriptions
-
-from . import _HAJSONEncoder, register_tool
+from homeassistant.helpers.event import async_track_state_change_event
+
+from ..aliases import get_aliases
+from ..change_feed import changes_payload, get_change_feed
+from ..const import (
+    DEFAULT_SERVICE_CALL_CONCURRENCY,
+    DEFAULT_SERVICE_CALL_TIMEOUT,
+    MAX_SERVICE_CALL_CONCURRENCY,
+)
+from ..entity_index import get_entity_index
+from ..pagination import (
+    PAGINATION_PROPERTIES,
+    device_sort_key,
+    entity_sort_key,
+    page_content,
+    paginate,
+)
+from ..service_descriptions import async_get_service_descriptions
+from ..state_cache import state_attributes, state_timestamps
+from ..streaming import report_progress
+from ..tabular import FORMAT_PROPERTIES, format_records, output_format
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
-_HAS_GET_ENTITY_ALIASES = hasattr(er, "async_get_entity_aliases")
+# Entities processed between progress notifications on streamed requests
+_PROGRESS_INTERVAL = 500
 
-
-def _get_aliases(hass: HomeAssistant, entry: er.RegistryEntry) -> list[str]:
-    """Get entity aliases, handling ComputedNameType on HA 2026.4+."""
-    if _HAS_GET_ENTITY_ALIASES:
-        return er.async_get_entity_aliases(hass, entry)
-    return sorted(str(a) for a in entry.aliases) if entry.aliases else []
+# wait_for_state timeouts, in seconds
+_DEFAULT_WAIT_TIMEOUT = 30
+_MAX_WAIT_TIMEOUT = 300
 
 
 @register_tool(
@@ -58,22 +76,19 @@ async def get_state(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str,
 
     registry = er.async_get(hass)
     entry = registry.async_get(entity_id)
-    aliases = _get_aliases(hass, entry) if entry else []
-
-    attributes = dict(state.attributes)
-    if fields is not None:
-        attributes = {k: v for k, v in attributes.items() if k in fields}
+    aliases = get_aliases(hass, entry) if entry else []
 
+    last_changed, last_updated = state_timestamps(hass, state)
     result = {
         "entity_id": state.entity_id,
         "state": state.state,
-        "attributes": attributes,
+        "attributes": state_attributes(hass, state, fields),
         "aliases": aliases,
-        "last_changed": state.last_changed.isoformat(),
-        "last_updated": state.last_updated.isoformat(),
+        "last_changed": last_changed,
+        "last_updated": last_updated,
     }
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
@@ -128,6 +143,312 @@ async def call_service(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
         return {"content": [{"type": "text", "text": f"Error calling service: {str(e)}"}]}
 
 
+# Maximum number of service calls in one batch_call_service request
+_MAX_BATCH_CALLS = 50
+
+
+@register_tool(
+    name="batch_call_service",
+    description=(
+        "Call several Home Assistant services in one request, e.g. to turn off every light "
+        "downstairs and set three thermostats. Calls run concurrently; give dependent steps "
+        "increasing group numbers to run them in order. Returns success, error and duration "
+        "per call"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "description": f"Service calls (max {_MAX_BATCH_CALLS})",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "domain": {"type": "string", "description": "The service domain"},
+                        "service": {"type": "string", "description": "The service name"},
+                        "target": {
+                            "type": "object",
+                            "description": "Service target (entity_id, device_id, area_id)",
+                        },
+                        "data": {"type": "object", "description": "Service data"},
+                        "group": {
+                            "type": "integer",
+                            "minimum": 0,
+                            "description": (
+                                "Calls run group by group in ascending order, concurrently "
+                                "within a group (default 0)"
+                            ),
+                        },
+                    },
+                    "required": ["domain", "service"],
+                },
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "description": (
+                    f"Maximum calls in flight at once (default "
+                    f"{DEFAULT_SERVICE_CALL_CONCURRENCY}, max {MAX_SERVICE_CALL_CONCURRENCY})"
+                ),
+            },
+            "timeout": {
+                "type": "number",
+                "description": (
+                    f"Seconds each call may take (default {DEFAULT_SERVICE_CALL_TIMEOUT})"
+                ),
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "description": "Skip later groups once a call fails (default false)",
+            },
+        },
+        "required": ["calls"],
+    },
+)
+async def batch_call_service(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Call several services concurrently."""
+    calls = arguments["calls"]
+    concurrency = arguments.get("max_concurrency", DEFAULT_SERVICE_CALL_CONCURRENCY)
+    concurrency = max(1, min(concurrency, MAX_SERVICE_CALL_CONCURRENCY))
+    timeout = arguments.get("timeout", DEFAULT_SERVICE_CALL_TIMEOUT)
+    stop_on_error = arguments.get("stop_on_error", False)
+
+    if not calls:
+        return {"content": [{"type": "text", "text": "Error: calls must not be empty"}]}
+    if len(calls) > _MAX_BATCH_CALLS:
+        return {
+            "content": [
+                {"type": "text", "text": f"Error: maximum {_MAX_BATCH_CALLS} calls per request"}
+            ]
+        }
+    for index, call in enumerate(calls):
+        group = call.get("group", 0)
+        if not isinstance(group, int) or isinstance(group, bool) or group < 0:
+            return {
+                "content": [
+                    {
+                        "type": "text",
+                        "text": (
+                            f"Error: group of call {index} must be a non-negative integer, "
+                            f"got {group!r}"
+                        ),
+                    }
+                ]
+            }
+
+    semaphore = asyncio.Semaphore(concurrency)
+    results: list[dict[str, Any]] = [{} for _ in calls]
+
+    async def _call(index: int, call: dict[str, Any]) -> bool:
+        result = results[index]
+        if not call.get("domain") or not call.get("service"):
+            result.update(success=False, error="domain and service are required")
+            return False
+        async with semaphore:
+            started = time.monotonic()
+            try:
+                async with asyncio.timeout(timeout):
+                    await hass.services.async_call(
+                        call["domain"],
+                        call["service"],
+                        call.get("data", {}),
+                        blocking=True,
+                        target=call.get("target"),
+                    )
+                result["success"] = True
+            except TimeoutError:
+                result.update(success=False, error=f"Timed out after {timeout}s")
+            except Exception as e:
+                result.update(success=False, error=str(e))
+            result["duration_seconds"] = round(time.monotonic() - started, 3)
+        return result["success"]
+
+    groups: dict[int, list[int]] = {}
+    for index, call in enumerate(calls):
+        results[index].update(index=index, domain=call.get("domain"), service=call.get("service"))
+        groups.setdefault(call.get("group", 0), []).append(index)
+
+    started = time.monotonic()
+    failed = False
+    for group in sorted(groups):
+        indexes = groups[group]
+        if failed and stop_on_error:
+            for index in indexes:
+                results[index].update(success=False, skipped=True)
+            continue
+        outcomes = await asyncio.gather(*(_call(index, calls[index]) for index in indexes))
+        failed = failed or not all(outcomes)
+
+    succeeded = sum(1 for result in results if result["success"])
+    skipped = sum(1 for result in results if result.get("skipped"))
+    summary = {
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded - skipped,
+        "skipped": skipped,
+        "duration_seconds": round(time.monotonic() - started, 3),
+        "results": results,
+    }
+    return {"content": [{"type": "text", "text": json_dumps(summary)}]}
+
+
+def _state_matches(state: State | None, arguments: dict[str, Any]) -> bool:
+    """Return True when a state meets the state, above/below and attribute criteria."""
+    if state is None:
+        return False
+    attribute = arguments.get("attribute")
+    if attribute is not None:
+        if attribute not in state.attributes:
+            return False
+        value = state.attributes[attribute]
+    else:
+        value = state.state
+
+    if "state" in arguments:
+        target = arguments["state"]
+        if value != target and str(value) != str(target):
+            return False
+    above, below = arguments.get("above"), arguments.get("below")
+    if above is not None or below is not None:
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return False
+        if above is not None and not number > above:
+            return False
+        if below is not None and not number < below:
+            return False
+    return True
+
+
+@register_tool(
+    name="wait_for_state",
+    description=(
+        "Wait until entities reach a condition, e.g. to confirm a cover closed or a vacuum "
+        "docked after call_service, instead of polling get_state. Returns as soon as the "
+        "condition holds or the timeout expires, with how long it waited and the final states. "
+        "Criteria given together must all hold"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "entity_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Entities to watch",
+            },
+            "state": {
+                "type": ["string", "number", "boolean"],
+                "description": "Target state, or target attribute value when attribute is set",
+            },
+            "above": {
+                "type": "number",
+                "description": "Numeric state (or attribute value) must be above this",
+            },
+            "below": {
+                "type": "number",
+                "description": "Numeric state (or attribute value) must be below this",
+            },
+            "attribute": {
+                "type": "string",
+                "description": "Compare this attribute instead of the state (optional)",
+            },
+            "template": {
+                "type": "string",
+                "description": (
+                    "Jinja2 template that must render true, re-evaluated whenever a "
+                    "watched entity changes (optional)"
+                ),
+            },
+            "match": {
+                "type": "string",
+                "enum": ["all", "any"],
+                "description": "Whether all (default) or any of the entities must match",
+            },
+            "timeout": {
+                "type": "number",
+                "description": (
+                    f"Seconds to wait (default {_DEFAULT_WAIT_TIMEOUT}, "
+                    f"max {_MAX_WAIT_TIMEOUT})"
+                ),
+            },
+        },
+        "required": ["entity_ids"],
+    },
+)
+async def wait_for_state(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Wait for entities to meet a condition."""
+    from homeassistant.helpers.template import Template, result_as_boolean
+
+    entity_ids = arguments["entity_ids"]
+    template_str = arguments.get("template")
+    combine = any if arguments.get("match") == "any" else all
+    timeout = min(float(arguments.get("timeout", _DEFAULT_WAIT_TIMEOUT)), _MAX_WAIT_TIMEOUT)
+
+    has_criteria = any(key in arguments for key in ("state", "above", "below"))
+
+    if not entity_ids:
+        return {"content": [{"type": "text", "text": "Error: entity_ids must not be empty"}]}
+    if not template_str and not has_criteria:
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": "Error: provide a state, above/below threshold, or template",
+                }
+            ]
+        }
+
+    template = Template(template_str, hass) if template_str else None
+
+    def _condition_met() -> bool:
+        if template is not None and not result_as_boolean(
+            template.async_render(parse_result=False)
+        ):
+            return False
+        if not has_criteria:
+            return True
+        return combine(_state_matches(hass.states.get(eid), arguments) for eid in entity_ids)
+
+    started = time.monotonic()
+    try:
+        met = _condition_met()
+    except Exception as e:
+        return {"content": [{"type": "text", "text": f"Error evaluating condition: {str(e)}"}]}
+
+    if not met:
+        condition_met = asyncio.Event()
+
+        @callback
+        def _state_changed(event: Event) -> None:
+            try:
+                if _condition_met():
+                    condition_met.set()
+            except Exception as e:
+                # e.g. a template failing on an intermediate state; keep waiting
+                _LOGGER.debug("Error evaluating wait_for_state condition: %s", e)
+
+        # Removed in finally, including when the request is cancelled
+        unsub = async_track_state_change_event(hass, entity_ids, _state_changed)
+        try:
+            async with asyncio.timeout(timeout):
+                await condition_met.wait()
+            met = True
+        except TimeoutError:
+            met = False
+        finally:
+            unsub()
+
+    states = {}
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        states[entity_id] = state.state if state else None
+    result = {
+        "condition_met": met,
+        "waited_seconds": round(time.monotonic() - started, 3),
+        "states": states,
+    }
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
+
+
 @register_tool(
     name="list_entities",
     description="List all entities in Home Assistant",
@@ -138,6 +459,21 @@ async def call_service(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
                 "type": "string",
                 "description": "Filter by domain (optional)",
             },
+            "area_id": {
+                "type": "string",
+                "description": (
+                    "Filter by area ID, including entities in the area through their "
+                    "device (optional)"
+                ),
+            },
+            "floor_id": {
+                "type": "string",
+                "description": "Filter by the floor of the entity's area (optional)",
+            },
+            "include_area": {
+                "type": "boolean",
+                "description": "Include each entity's area_id and floor_id (default false)",
+            },
             "detailed": {
                 "type": "boolean",
                 "description": (
@@ -154,56 +490,58 @@ async def call_service(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
                     "Takes precedence over the detailed flag"
                 ),
             },
+            **FORMAT_PROPERTIES,
+            **PAGINATION_PROPERTIES,
         },
     },
 )
 async def list_entities(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """List entities."""
+    try:
+        output_format(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
     domain_filter = arguments.get("domain")
     detailed = arguments.get("detailed", False)
     fields = arguments.get("fields")
+    include_area = arguments.get("include_area", False) or (
+        fields is not None and ("area_id" in fields or "floor_id" in fields)
+    )
     registry = er.async_get(hass)
 
+    index = get_entity_index(hass)
+    all_states = index.states(
+        domain=domain_filter,
+        area_id=arguments.get("area_id"),
+        floor_id=arguments.get("floor_id"),
+    )
+    page, next_cursor = paginate(all_states, entity_sort_key, arguments)
+    total = len(page)
     entities = []
-    for state in hass.states.async_all():
-        if domain_filter and not state.entity_id.startswith(f"{domain_filter}."):
-            continue
+    for i, state in enumerate(page):
+        if i and i % _PROGRESS_INTERVAL == 0:
+            await report_progress(i, total, "Collecting entities")
         entry = registry.async_get(state.entity_id)
-        aliases = _get_aliases(hass, entry) if entry else []
+        aliases = get_aliases(hass, entry) if entry else []
 
+        entity = {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+            "aliases": aliases,
+        }
+        if include_area:
+            entity["area_id"] = index.area_of(state.entity_id)
+            entity["floor_id"] = index.floor_of(state.entity_id)
+        if fields is not None or detailed:
+            if fields is None or "attributes" in fields:
+                entity["attributes"] = state_attributes(hass, state)
+            entity["last_changed"], entity["last_updated"] = state_timestamps(hass, state)
         if fields is not None:
-            full = {
-                "entity_id": state.entity_id,
-                "state": state.state,
-                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                "aliases": aliases,
-                "attributes": dict(state.attributes),
-                "last_changed": state.last_changed.isoformat(),
-                "last_updated": state.last_updated.isoformat(),
-            }
-            entity = {k: v for k, v in full.items() if k in fields}
-        elif detailed:
-            entity = {
-                "entity_id": state.entity_id,
-                "state": state.state,
-                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                "aliases": aliases,
-                "attributes": dict(state.attributes),
-                "last_changed": state.last_changed.isoformat(),
-                "last_updated": state.last_updated.isoformat(),
-            }
-        else:
-            entity = {
-                "entity_id": state.entity_id,
-                "state": state.state,
-                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                "aliases": aliases,
-            }
+            entity = {k: v for k, v in entity.items() if k in fields}
         entities.append(entity)
 
-    return {
-        "content": [{"type": "text", "text": json.dumps(entities, indent=2, cls=_HAJSONEncoder)}]
-    }
+    return page_content(format_records(entities, arguments), next_cursor)
 
 
 @register_tool(
@@ -226,7 +564,7 @@ async def list_areas(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
         for area in registry.async_list_areas()
     ]
 
-    return {"content": [{"type": "text", "text": json.dumps(areas, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(areas)}]}
 
 
 @register_tool(
@@ -238,33 +576,43 @@ async def list_areas(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
             "area_id": {
                 "type": "string",
                 "description": "Filter by area ID (optional)",
-            }
+            },
+            **FORMAT_PROPERTIES,
+            **PAGINATION_PROPERTIES,
         },
     },
 )
 async def list_devices(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """List devices."""
+    try:
+        output_format(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
     registry = dr.async_get(hass)
     area_filter = arguments.get("area_id")
 
-    devices = []
-    for device in registry.devices.values():
-        if area_filter and device.area_id != area_filter:
-            continue
-        devices.append(
-            {
-                "id": device.id,
-                "name": device.name,
-                "manufacturer": device.manufacturer,
-                "model": device.model,
-                "area_id": device.area_id,
-                "name_by_user": device.name_by_user,
-            }
-        )
+    matching = sorted(
+        (
+            device
+            for device in registry.devices.values()
+            if not area_filter or device.area_id == area_filter
+        ),
+        key=device_sort_key,
+    )
+    page, next_cursor = paginate(matching, device_sort_key, arguments)
+    devices = [
+        {
+            "id": device.id,
+            "name": device.name,
+            "manufacturer": device.manufacturer,
+            "model": device.model,
+            "area_id": device.area_id,
+            "name_by_user": device.name_by_user,
+        }
+        for device in page
+    ]
 
-    return {
-        "content": [{"type": "text", "text": json.dumps(devices, indent=2, cls=_HAJSONEncoder)}]
-    }
+    return page_content(format_records(devices, arguments), next_cursor)
 
 
 @register_tool(
@@ -342,14 +690,14 @@ async def get_device_details(hass: HomeAssistant, arguments: dict[str, Any]) ->
                 state = hass.states.get(entry.entity_id)
                 if state is not None:
                     entity["state"] = state.state
-                    entity["attributes"] = dict(state.attributes)
+                    entity["attributes"] = state_attributes(hass, state)
                     entity["name"] = state.attributes.get("friendly_name", entity["name"])
                 else:
                     entity["state"] = None
             entities.append(entity)
         result["entities"] = entities
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
@@ -361,7 +709,8 @@ async def get_device_details(hass: HomeAssistant, arguments: dict[str, Any]) ->
             "domain": {
                 "type": "string",
                 "description": "Filter by domain (optional)",
-            }
+            },
+            **PAGINATION_PROPERTIES,
         },
     },
 )
@@ -373,12 +722,18 @@ async def list_services(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[
     if domain_filter:
         services = {k: v for k, v in services.items() if k == domain_filter}
 
-    # Convert service objects to serializable format
-    result = {}
-    for domain, domain_services in services.items():
-        result[domain] = list(domain_services.keys())
+    # Services are paged as (domain, service) pairs and regrouped by domain
+    pairs = sorted(
+        (domain, service)
+        for domain, domain_services in services.items()
+        for service in domain_services
+    )
+    page, next_cursor = paginate(pairs, tuple, arguments)
+    result: dict[str, list[str]] = {}
+    for domain, service in page:
+        result.setdefault(domain, []).append(service)
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return page_content(result, next_cursor)
 
 
 @register_tool(
@@ -414,8 +769,7 @@ async def describe_service(hass: HomeAssistant, arguments: dict[str, Any]) -> di
     domain = arguments["domain"]
     service = arguments.get("service")
 
-    descriptions = await async_get_all_descriptions(hass)
-    domain_services = descriptions.get(domain)
+    domain_services = await async_get_service_descriptions(hass, domain)
     if not domain_services:
         return {"content": [{"type": "text", "text": f"No services found for domain {domain}"}]}
 
@@ -427,13 +781,15 @@ async def describe_service(hass: HomeAssistant, arguments: dict[str, Any]) -> di
     else:
         result = dict(domain_services)
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
     name="search_entities",
     description=(
         "Search entities by friendly name, attribute values, or device class. "
+        "The query is matched fuzzily (typos tolerated) against entity IDs, friendly names, "
+        "aliases, and device and area names, and results are ranked best first with a score. "
         "More useful than list_entities when you don't know the exact entity_id"
     ),
     input_schema={
@@ -442,7 +798,8 @@ async def describe_service(hass: HomeAssistant, arguments: dict[str, Any]) -> di
             "query": {
                 "type": "string",
                 "description": (
-                    "Search query to match against entity IDs, " "friendly names, and aliases"
+                    "Search query to match against entity IDs, friendly names, aliases, "
+                    "and device and area names"
                 ),
             },
             "device_class": {
@@ -457,85 +814,76 @@ async def describe_service(hass: HomeAssistant, arguments: dict[str, Any]) -> di
                 "type": "string",
                 "description": "Filter by area ID",
             },
+            "floor_id": {
+                "type": "string",
+                "description": "Filter by the floor of the entity's area",
+            },
             "limit": {
                 "type": "integer",
                 "description": "Maximum number of results to return (default 100)",
             },
+            **FORMAT_PROPERTIES,
         },
     },
 )
 async def search_entities(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Search entities by various criteria."""
-    query = arguments.get("query", "").lower()
+    try:
+        output_format(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
+    query = arguments.get("query", "")
     device_class_filter = arguments.get("device_class")
     domain_filter = arguments.get("domain")
     area_filter = arguments.get("area_id")
+    floor_filter = arguments.get("floor_id")
     limit = arguments.get("limit", 100)
 
-    if not any([query, device_class_filter, domain_filter, area_filter]):
+    if not any([query, device_class_filter, domain_filter, area_filter, floor_filter]):
         return {
             "content": [
                 {
                     "type": "text",
                     "text": (
                         "Error: at least one search parameter "
-                        "(query, device_class, domain, area_id) must be provided"
+                        "(query, device_class, domain, area_id, floor_id) must be provided"
                     ),
                 }
             ]
         }
 
     entity_registry = er.async_get(hass)
-    device_registry = dr.async_get(hass)
-
-    entities = []
-    for state in hass.states.async_all():
-        if domain_filter and not state.entity_id.startswith(f"{domain_filter}."):
-            continue
+    index = get_entity_index(hass)
 
-        if device_class_filter:
-            if state.attributes.get("device_class") != device_class_filter:
-                continue
+    filters = {
+        "domain": domain_filter,
+        "device_class": device_class_filter,
+        "area_id": area_filter,
+        "floor_id": floor_filter,
+    }
+    if query:
+        matches = index.search(query, limit, **filters)
+    else:
+        matches = [(state, None) for state in index.states(**filters)[:limit]]
 
+    entities = []
+    for state, score in matches:
         entry = entity_registry.async_get(state.entity_id)
-        aliases = _get_aliases(hass, entry) if entry else []
-
-        # Resolve area: entity's own area, falling back to its device's area
-        entity_area = entry.area_id if entry else None
-        if not entity_area and entry and entry.device_id:
-            device = device_registry.async_get(entry.device_id)
-            entity_area = device.area_id if device else None
-
-        if area_filter and entity_area != area_filter:
-            continue
-
-        if query:
-            friendly_name = state.attributes.get("friendly_name", "").lower()
-            searchable = [
-                state.entity_id.lower(),
-                friendly_name,
-                *(a.lower() for a in aliases),
-            ]
-            if not any(query in s for s in searchable):
-                continue
-
-        entities.append(
-            {
-                "entity_id": state.entity_id,
-                "state": state.state,
-                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                "device_class": state.attributes.get("device_class"),
-                "area_id": entity_area,
-                "aliases": aliases,
-            }
-        )
-
-        if len(entities) >= limit:
-            break
+        entity = {
+            "entity_id": state.entity_id,
+            "state": state.state,
+            "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+            "device_class": state.attributes.get("device_class"),
+            # Entity's own area, falling back to its device's area
+            "area_id": index.area_of(state.entity_id),
+            "floor_id": index.floor_of(state.entity_id),
+            "aliases": get_aliases(hass, entry) if entry else [],
+        }
+        if score is not None:
+            entity["score"] = score
+        entities.append(entity)
 
-    return {
-        "content": [{"type": "text", "text": json.dumps(entities, indent=2, cls=_HAJSONEncoder)}]
-    }
+    return {"content": [{"type": "text", "text": json_dumps(format_records(entities, arguments))}]}
 
 
 @register_tool(
@@ -563,7 +911,7 @@ async def list_labels(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[st
         for label in registry.async_list_labels()
     ]
 
-    return {"content": [{"type": "text", "text": json.dumps(labels, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(labels)}]}
 
 
 @register_tool(
@@ -588,12 +936,17 @@ async def list_labels(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[st
                     "(e.g., ['brightness', 'color_temp']). Omit for all attributes"
                 ),
             },
+            **FORMAT_PROPERTIES,
         },
         "required": ["entity_ids"],
     },
 )
 async def batch_get_state(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Get state for multiple entities."""
+    try:
+        output_format(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
     entity_ids = arguments["entity_ids"]
     fields = arguments.get("fields")
 
@@ -609,23 +962,55 @@ async def batch_get_state(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
             continue
 
         entry = registry.async_get(entity_id)
-        aliases = _get_aliases(hass, entry) if entry else []
-
-        attributes = dict(state.attributes)
-        if fields is not None:
-            attributes = {k: v for k, v in attributes.items() if k in fields}
+        aliases = get_aliases(hass, entry) if entry else []
 
+        last_changed, last_updated = state_timestamps(hass, state)
         results.append(
             {
                 "entity_id": state.entity_id,
                 "state": state.state,
-                "attributes": attributes,
+                "attributes": state_attributes(hass, state, fields),
                 "aliases": aliases,
-                "last_changed": state.last_changed.isoformat(),
-                "last_updated": state.last_updated.isoformat(),
+                "last_changed": last_changed,
+                "last_updated": last_updated,
             }
         )
 
-    return {
-        "content": [{"type": "text", "text": json.dumps(results, indent=2, cls=_HAJSONEncoder)}]
-    }
+    return {"content": [{"type": "text", "text": json_dumps(format_records(results, arguments))}]}
+
+
+@register_tool(
+    name="get_changes_since",
+    description=(
+        "Get the entities whose state changed since a watermark, instead of re-listing "
+        "every entity to find out what changed. Call without a watermark to get the "
+        "current one, then pass the returned watermark on each following call. When "
+        "resync_required is true the watermark is too old; re-read the entities you track "
+        "and continue with the new watermark"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "watermark": {
+                "type": "integer",
+                "description": "The watermark returned by the previous call (optional)",
+            },
+            "attributes": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Attribute keys whose changes also count, and which are included "
+                    "in each change (e.g., ['brightness']). By default only state "
+                    "changes, additions and removals count"
+                ),
+            },
+        },
+    },
+)
+async def get_changes_since(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Get entities changed since a watermark."""
+    feed = get_change_feed(hass)
+    if feed is None:
+        return {"content": [{"type": "text", "text": "Error: change feed is not available"}]}
+    payload = changes_payload(feed, arguments.get("watermark"), arguments.get("attributes", ()))
+    return {"content": [{"type": "text", "text": json_dumps(payload)}]}
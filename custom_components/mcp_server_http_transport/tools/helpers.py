@@ -1,13 +1,14 @@
 """Helper entity CRUD tools (input_boolean, input_text, counter, timer, etc.)."""
 
-import json
 import logging
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 
-from . import _HAJSONEncoder, register_tool
+from ..entity_index import get_entity_index
+from ..pagination import PAGINATION_PROPERTIES, entity_sort_key, page_content, paginate
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,7 +85,8 @@ async def _entity_id_to_item_id(hass: HomeAssistant, entity_id: str) -> tuple[st
                     "Filter by helper domain, e.g. 'input_boolean' or 'counter'. "
                     "Omit to list all helper types"
                 ),
-            }
+            },
+            **PAGINATION_PROPERTIES,
         },
     },
 )
@@ -107,27 +109,28 @@ async def list_helpers(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
 
     domains = {domain_filter} if domain_filter else HELPER_DOMAINS
     registry = er.async_get(hass)
-    helpers = []
+    index = get_entity_index(hass)
 
-    for domain in sorted(domains):
-        for state in hass.states.async_all():
-            if not state.entity_id.startswith(f"{domain}."):
-                continue
-            entry = registry.async_get(state.entity_id)
-            helpers.append(
-                {
-                    "entity_id": state.entity_id,
-                    "domain": domain,
-                    "state": state.state,
-                    "friendly_name": state.attributes.get("friendly_name", state.entity_id),
-                    "attributes": dict(state.attributes),
-                    "unique_id": entry.unique_id if entry else None,
-                }
-            )
+    states = sorted(
+        (state for domain in domains for state in index.states(domain=domain)),
+        key=entity_sort_key,
+    )
+    page, next_cursor = paginate(states, entity_sort_key, arguments)
+    helpers = []
+    for state in page:
+        entry = registry.async_get(state.entity_id)
+        helpers.append(
+            {
+                "entity_id": state.entity_id,
+                "domain": state.entity_id.split(".", 1)[0],
+                "state": state.state,
+                "friendly_name": state.attributes.get("friendly_name", state.entity_id),
+                "attributes": dict(state.attributes),
+                "unique_id": entry.unique_id if entry else None,
+            }
+        )
 
-    return {
-        "content": [{"type": "text", "text": json.dumps(helpers, indent=2, cls=_HAJSONEncoder)}]
-    }
+    return page_content(helpers, next_cursor)
 
 
 @register_tool(
@@ -158,9 +161,7 @@ async def get_helper_config(hass: HomeAssistant, arguments: dict[str, Any]) -> d
                 f"Helper '{arguments['entity_id']}' not found in storage "
                 "(it may be YAML-configured)"
             )
-        return {
-            "content": [{"type": "text", "text": json.dumps(item, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(item)}]}
     except Exception as e:
         return {"content": [{"type": "text", "text": f"Error getting helper config: {str(e)}"}]}
 
@@ -1,20 +1,57 @@
 """Long-term statistics tools."""
 
-import json
 import logging
 from datetime import datetime as dt
 from typing import Any
 
+import numpy as np
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
-from . import _HAJSONEncoder, register_tool
+from ..downsample import (
+    DOWNSAMPLE_PROPERTIES,
+    downsample_method,
+    lttb_indices,
+    max_points,
+    merge_statistics,
+)
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
 _VALID_PERIODS = {"5minute", "hour", "day", "week", "month"}
 
 
+def _timestamp(value: Any) -> float:
+    """Return a statistics start time as a timestamp."""
+    if isinstance(value, str):
+        value = dt.fromisoformat(value)
+    return value.timestamp() if isinstance(value, dt) else value
+
+
+def _downsample_statistics(
+    rows: list[dict[str, Any]], points: int, method: str
+) -> list[dict[str, Any]]:
+    """Return statistics rows reduced to at most points.
+
+    LTTB selects rows by their mean, or by state or sum for statistics
+    without one, skipping rows that lack it; bucket merges consecutive rows,
+    as does LTTB when no row has a value.
+    """
+    if len(rows) <= points:
+        return rows
+    x = np.fromiter((_timestamp(row["start"]) for row in rows), float, len(rows))
+    if method == "bucket":
+        return merge_statistics(rows, x, points)
+    key = next((key for key in ("mean", "state", "sum") if any(key in row for row in rows)), None)
+    if key is None:
+        return merge_statistics(rows, x, points)
+    y = np.array([row.get(key, np.nan) for row in rows], dtype=float)
+    if not np.isfinite(y).any():
+        return merge_statistics(rows, x, points)
+    return [rows[i] for i in lttb_indices(x, y, points).tolist()]
+
+
 @register_tool(
     name="get_statistics",
     description=(
@@ -44,6 +81,7 @@ _VALID_PERIODS = {"5minute", "hour", "day", "week", "month"}
                     "Aggregation period: 5minute, hour, day, week, or month (default: hour)"
                 ),
             },
+            **DOWNSAMPLE_PROPERTIES,
         },
         "required": ["entity_id", "start_time"],
     },
@@ -71,8 +109,13 @@ async def get_statistics(hass: HomeAssistant, arguments: dict[str, Any]) -> dict
                 }
             ]
         }
-
     try:
+        points = max_points(arguments)
+        method = downsample_method(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
+
+    async def _fetch() -> list[dict[str, Any]]:
         stats = await get_instance(hass).async_add_executor_job(
             statistics_during_period,
             hass,
@@ -83,19 +126,24 @@ async def get_statistics(hass: HomeAssistant, arguments: dict[str, Any]) -> dict
             None,
             {"mean", "min", "max", "sum", "state"},
         )
-
-        entity_stats = stats.get(entity_id, [])
         result = []
-        for stat in entity_stats:
+        for stat in stats.get(entity_id, []):
             entry = {}
             for key in ("start", "end", "mean", "min", "max", "sum", "state"):
                 if key in stat and stat[key] is not None:
                     entry[key] = stat[key]
             result.append(entry)
+        return result
 
-        return {
-            "content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]
-        }
+    try:
+        # Not cached: statistics of past windows can be imported, adjusted or
+        # cleared through the recorder's websocket API, which fires no event
+        result = await _fetch()
+
+        if points is not None:
+            rows = await hass.async_add_executor_job(_downsample_statistics, result, points, method)
+            result = {"original_count": len(result), "count": len(rows), "rows": rows}
+        return {"content": [{"type": "text", "text": json_dumps(result)}]}
     except Exception as e:
         _LOGGER.error("Error getting statistics: %s", e)
         return {"content": [{"type": "text", "text": f"Error getting statistics: {str(e)}"}]}
@@ -1,18 +1,56 @@
 """System, template, and history tools."""
 
-import json
+import fnmatch
 import logging
+from collections.abc import Iterator
 from datetime import datetime as dt
+from datetime import timedelta
 from typing import Any
 
+import numpy as np
 from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
-from . import _HAJSONEncoder, register_tool
+from ..aggregates import DEFAULT_PERCENTILES, numeric_summary, state_summary
+from ..downsample import (
+    DOWNSAMPLE_PROPERTIES,
+    downsample_method,
+    lttb_indices,
+    max_points,
+    numeric_values,
+    state_spans,
+    time_buckets,
+)
+from ..entity_index import get_entity_index
+from ..history import async_get_history_rows
+from ..pagination import (
+    PAGINATION_PROPERTIES,
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    page_content,
+    page_size,
+)
+from ..recorder_cache import async_cached_query
+from ..streaming import report_progress
+from ..tabular import FORMAT_PROPERTIES, format_records, output_format
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
+# get_history: entities per request, after expanding patterns
+_MAX_HISTORY_ENTITIES = 50
+
+_GLOB_CHARS = "*?["
+
+# get_logbook: length of the first time slice read; each next one doubles
+_LOGBOOK_FIRST_SLICE = timedelta(hours=1)
+
+# group_by_context: most time between consecutive entries of one chain
+_CONTEXT_CHAIN_GAP = timedelta(seconds=5)
+
 
 @register_tool(
     name="get_config",
@@ -38,7 +76,7 @@ async def get_config(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
         "language": config.language,
     }
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
@@ -74,9 +112,102 @@ async def render_template(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
         return {"content": [{"type": "text", "text": f"Error rendering template: {str(e)}"}]}
 
 
+def _resolve_entity_ids(hass: HomeAssistant, patterns: list[str]) -> list[str]:
+    """Expand glob patterns against the current entities, keeping plain IDs as given.
+
+    Plain IDs are kept even when the entity no longer exists, since the
+    recorder may still have its history.
+    """
+    entity_ids: dict[str, None] = {}
+    index = None
+    for pattern in patterns:
+        if not any(char in pattern for char in _GLOB_CHARS):
+            entity_ids[pattern] = None
+            continue
+        index = index or get_entity_index(hass)
+        domain = pattern.split(".", 1)[0]
+        if any(char in domain for char in _GLOB_CHARS) or "." not in pattern:
+            candidates = index.entity_ids()
+        else:
+            candidates = index.entity_ids(domain=domain)
+        entity_ids.update(dict.fromkeys(fnmatch.filter(candidates, pattern)))
+    return list(entity_ids)
+
+
+def _history_entity_ids(hass: HomeAssistant, arguments: dict[str, Any]) -> list[str]:
+    """Return the entities named by entity_id and entity_ids, with patterns expanded.
+
+    Raises ValueError when none are given or match, or too many match.
+    """
+    patterns = [arguments["entity_id"]] if "entity_id" in arguments else []
+    patterns.extend(arguments.get("entity_ids", []))
+    if not patterns:
+        raise ValueError("entity_id or entity_ids is required")
+    entity_ids = _resolve_entity_ids(hass, patterns)
+    if not entity_ids:
+        raise ValueError("no entities match entity_ids")
+    if len(entity_ids) > _MAX_HISTORY_ENTITIES:
+        raise ValueError(
+            f"{len(entity_ids)} entities match, maximum {_MAX_HISTORY_ENTITIES} per request"
+        )
+    return entity_ids
+
+
+def _row_times(rows: list[dict[str, Any]]) -> np.ndarray:
+    """Return the last_changed times of history rows as timestamps."""
+    return np.fromiter(
+        (dt.fromisoformat(row["last_changed"]).timestamp() for row in rows), float, len(rows)
+    )
+
+
+def _downsample_history(
+    rows: list[dict[str, Any]], points: int, method: str, end: float
+) -> list[dict[str, Any]]:
+    """Return one entity's history rows reduced to at most points.
+
+    Numeric series keep the rows LTTB selects or become time buckets;
+    other series, and those only ever unavailable or unknown, become state
+    spans.
+    """
+    if len(rows) <= points:
+        return rows
+    x = _row_times(rows)
+    values = [row["state"] for row in rows]
+    y = numeric_values(values)
+    if y is None or not np.isfinite(y).any():
+        reduced = state_spans(x, values, end, points)
+    elif method == "lttb":
+        return [rows[i] for i in lttb_indices(x, y, points).tolist()]
+    else:
+        reduced = time_buckets(x, y, points)
+    for row in reduced:
+        row["start"] = dt_util.utc_from_timestamp(row["start"]).isoformat()
+        row["end"] = dt_util.utc_from_timestamp(row["end"]).isoformat()
+    return reduced
+
+
+def _downsample_histories(
+    rows: dict[str, list[dict[str, Any]]],
+    entity_ids: list[str],
+    single: bool,
+    points: int,
+    method: str,
+    end: float,
+) -> list[dict[str, Any]]:
+    """Return the reduced history rows of each entity, in entity order."""
+    history = []
+    for entity_id in entity_ids:
+        for row in _downsample_history(rows.get(entity_id, []), points, method, end):
+            history.append(row if single else {"entity_id": entity_id, **row})
+    return history
+
+
 @register_tool(
     name="get_history",
-    description="Get state history of an entity over a time range",
+    description=(
+        "Get state history of one or more entities over a time range. "
+        "Several entities are fetched in a single recorder query"
+    ),
     input_schema={
         "type": "object",
         "properties": {
@@ -84,6 +215,15 @@ async def render_template(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
                 "type": "string",
                 "description": "The entity ID",
             },
+            "entity_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Entity IDs or glob patterns (e.g., ['sensor.*_temperature']), instead "
+                    f"of entity_id; at most {_MAX_HISTORY_ENTITIES} entities. Each row then "
+                    "carries its entity_id"
+                ),
+            },
             "start_time": {
                 "type": "string",
                 "description": "Start time in ISO format (e.g., 2024-01-01T00:00:00)",
@@ -92,46 +232,224 @@ async def render_template(hass: HomeAssistant, arguments: dict[str, Any]) -> dic
                 "type": "string",
                 "description": "End time in ISO format (optional, defaults to now)",
             },
+            "attributes": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Limit which attribute keys are included in each row "
+                    "(e.g., ['temperature']). Omit for all attributes; "
+                    "an empty list is the same as no_attributes"
+                ),
+            },
+            "no_attributes": {
+                "type": "boolean",
+                "description": "Leave attributes out of every row (default false)",
+            },
+            "significant_changes_only": {
+                "type": "boolean",
+                "description": (
+                    "Only return significant state changes; attribute-only changes are "
+                    "skipped for most domains (default true)"
+                ),
+            },
+            "minimal_response": {
+                "type": "boolean",
+                "description": (
+                    "Only the first and last row of each entity carry attributes (default false)"
+                ),
+            },
+            **DOWNSAMPLE_PROPERTIES,
+            **FORMAT_PROPERTIES,
         },
-        "required": ["entity_id", "start_time"],
+        "required": ["start_time"],
     },
 )
 async def get_history(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
-    """Get state history for an entity."""
-    from homeassistant.components.recorder import get_instance
-    from homeassistant.components.recorder.history import get_significant_states
-
-    entity_id = arguments["entity_id"]
+    """Get state history for one or more entities."""
+    single = "entity_ids" not in arguments
     start_time = dt.fromisoformat(arguments["start_time"])
     end_time_str = arguments.get("end_time")
     end_time = dt.fromisoformat(end_time_str) if end_time_str else dt_util.utcnow()
+    try:
+        entity_ids = _history_entity_ids(hass, arguments)
+        points = max_points(arguments)
+        method = downsample_method(arguments)
+        output_format(arguments)
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
 
     try:
-        states = await get_instance(hass).async_add_executor_job(
-            get_significant_states,
+        subject = entity_ids[0] if len(entity_ids) == 1 else f"{len(entity_ids)} entities"
+        await report_progress(0, 2, f"Querying recorder history for {subject}")
+        rows = await async_get_history_rows(
             hass,
+            entity_ids,
             start_time,
             end_time,
-            [entity_id],
+            significant_changes_only=arguments.get("significant_changes_only", True),
+            minimal_response=arguments.get("minimal_response", False),
+            no_attributes=arguments.get("no_attributes", False),
+            attributes=arguments.get("attributes"),
         )
+        count = sum(map(len, rows.values()))
+        await report_progress(1, 2, f"Fetched {count} rows")
 
-        history = []
-        for state in states.get(entity_id, []):
-            history.append(
-                {
-                    "state": state.state,
-                    "last_changed": state.last_changed.isoformat(),
-                    "attributes": dict(state.attributes),
-                }
+        if points is not None:
+            history = await hass.async_add_executor_job(
+                _downsample_histories,
+                rows,
+                entity_ids,
+                single,
+                points,
+                method,
+                end_time.timestamp(),
             )
+            result = {
+                "original_count": count,
+                "count": len(history),
+                "rows": format_records(history, arguments),
+            }
+            return {"content": [{"type": "text", "text": json_dumps(result)}]}
+
+        history = []
+        for entity_id in entity_ids:
+            for row in rows.get(entity_id, []):
+                history.append(row if single else {"entity_id": entity_id, **row})
         return {
-            "content": [{"type": "text", "text": json.dumps(history, indent=2, cls=_HAJSONEncoder)}]
+            "content": [{"type": "text", "text": json_dumps(format_records(history, arguments))}]
         }
     except Exception as e:
         _LOGGER.error("Error getting history: %s", e)
         return {"content": [{"type": "text", "text": f"Error getting history: {str(e)}"}]}
 
 
+def _summarize_history(
+    rows: list[dict[str, Any]], start: float, end: float, percentiles: list[float]
+) -> dict[str, Any]:
+    """Return the aggregates of one entity's history rows."""
+    if not rows:
+        return {}
+    # The first row holds the state at the start of the window
+    x = np.maximum(_row_times(rows), start)
+    values = [row["state"] for row in rows]
+    unit = (rows[-1].get("attributes") or rows[0].get("attributes") or {}).get(
+        "unit_of_measurement"
+    )
+    y = numeric_values(values)
+    if y is None or not np.isfinite(y).any():
+        return {"type": "state", **state_summary(x, values, end)}
+    summary = {"type": "numeric", **numeric_summary(x, y, end, percentiles)}
+    if unit is not None:
+        summary["unit_of_measurement"] = unit
+    return summary
+
+
+def _summarize_histories(
+    rows: dict[str, list[dict[str, Any]]],
+    entity_ids: list[str],
+    start: float,
+    end: float,
+    percentiles: list[float],
+) -> list[dict[str, Any]]:
+    """Return the aggregates of each entity's history rows, in entity order."""
+    return [
+        {
+            "entity_id": entity_id,
+            "rows": len(rows.get(entity_id, [])),
+            **_summarize_history(rows.get(entity_id, []), start, end, percentiles),
+        }
+        for entity_id in entity_ids
+    ]
+
+
+@register_tool(
+    name="get_history_summary",
+    description=(
+        "Summarize state history per entity over a time range instead of returning rows. "
+        "Numeric entities get min, max, mean, time-weighted mean and percentiles; other "
+        "entities get the number of transitions and, per state, how often it was entered "
+        "and its total and longest duration in seconds"
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "entity_id": {
+                "type": "string",
+                "description": "The entity ID",
+            },
+            "entity_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": (
+                    "Entity IDs or glob patterns (e.g., ['binary_sensor.*_door']), instead "
+                    f"of entity_id; at most {_MAX_HISTORY_ENTITIES} entities"
+                ),
+            },
+            "start_time": {
+                "type": "string",
+                "description": "Start time in ISO format (e.g., 2024-01-01T00:00:00)",
+            },
+            "end_time": {
+                "type": "string",
+                "description": "End time in ISO format (optional, defaults to now)",
+            },
+            "percentiles": {
+                "type": "array",
+                "items": {"type": "number"},
+                "description": (
+                    "Percentiles (0-100) of numeric states to report "
+                    f"(default {list(DEFAULT_PERCENTILES)}; [] for none)"
+                ),
+            },
+        },
+        "required": ["start_time"],
+    },
+)
+async def get_history_summary(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Get aggregates of the state history of one or more entities."""
+    start_time = dt.fromisoformat(arguments["start_time"])
+    end_time_str = arguments.get("end_time")
+    end_time = dt.fromisoformat(end_time_str) if end_time_str else dt_util.utcnow()
+    percentiles = arguments.get("percentiles", list(DEFAULT_PERCENTILES))
+    try:
+        entity_ids = _history_entity_ids(hass, arguments)
+        if not isinstance(percentiles, list) or not all(
+            isinstance(p, (int, float)) and not isinstance(p, bool) and 0 <= p <= 100
+            for p in percentiles
+        ):
+            raise ValueError(f"percentiles must be numbers from 0 to 100, got {percentiles!r}")
+    except ValueError as err:
+        return {"content": [{"type": "text", "text": f"Error: {err}"}]}
+
+    try:
+        subject = entity_ids[0] if len(entity_ids) == 1 else f"{len(entity_ids)} entities"
+        await report_progress(0, 2, f"Querying recorder history for {subject}")
+        rows = await async_get_history_rows(
+            hass,
+            entity_ids,
+            start_time,
+            end_time,
+            minimal_response=True,
+            attributes=["unit_of_measurement"],
+        )
+        await report_progress(1, 2, f"Fetched {sum(map(len, rows.values()))} rows")
+
+        # Time after now has not been spent in any state yet
+        end = min(dt_util.as_utc(end_time), dt_util.utcnow())
+        summaries = await hass.async_add_executor_job(
+            _summarize_histories,
+            rows,
+            entity_ids,
+            dt_util.as_utc(start_time).timestamp(),
+            end.timestamp(),
+            percentiles,
+        )
+        return {"content": [{"type": "text", "text": json_dumps(summaries)}]}
+    except Exception as e:
+        _LOGGER.error("Error summarizing history: %s", e)
+        return {"content": [{"type": "text", "text": f"Error summarizing history: {str(e)}"}]}
+
+
 _BLOCKED_EVENT_TYPES = frozenset(
     {
         "homeassistant_stop",
@@ -192,6 +510,62 @@ async def fire_event(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
         return {"content": [{"type": "text", "text": f"Error firing event: {str(e)}"}]}
 
 
+def _logbook_slices(start: dt, end: dt, descending: bool) -> Iterator[tuple[dt, dt]]:
+    """Yield consecutive windows covering start to end, from the end when descending.
+
+    The first window is an hour and each next one twice as long, so a page
+    near one end of a long range reads little of it.
+    """
+    length = _LOGBOOK_FIRST_SLICE
+    while start < end:
+        if descending:
+            yield max(start, end - length), end
+            end -= length
+        else:
+            yield start, min(end, start + length)
+            start += length
+        length *= 2
+
+
+def _in_context_chain(chain: dict[str, Any], entry: dict[str, Any]) -> bool:
+    """Return whether entry continues a context chain, given in time order."""
+    return (
+        dt.fromisoformat(entry["when"]) - dt.fromisoformat(chain["entries"][-1]["when"])
+        <= _CONTEXT_CHAIN_GAP
+    )
+
+
+def _context_chains(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse entries, in time order, that share a cause into causal chains.
+
+    Logbook entries carry no context ID; instead the logbook adds context_*
+    fields describing what caused an entry. Consecutive entries with the
+    same context fields, close in time, form one chain, led by the entry
+    that caused them when it is the one just before.
+    """
+    items: list[dict[str, Any]] = []
+    for entry in entries:
+        context = {key: value for key, value in entry.items() if key.startswith("context_")}
+        if not context or "when" not in entry:
+            items.append(entry)
+            continue
+        step = {key: value for key, value in entry.items() if key not in context}
+        last = items[-1] if items else None
+        if last is not None and last.get("context") == context and _in_context_chain(last, step):
+            last["entries"].append(step)
+        elif (
+            last is not None
+            and "entries" not in last
+            and last.get("entity_id") == context.get("context_entity_id")
+            and "when" in last
+            and _in_context_chain({"entries": [last]}, step)
+        ):
+            items[-1] = {"when": last["when"], "context": context, "entries": [last, step]}
+        else:
+            items.append({"when": entry["when"], "context": context, "entries": [step]})
+    return items
+
+
 @register_tool(
     name="get_logbook",
     description=(
@@ -206,6 +580,18 @@ async def fire_event(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
                 "type": "string",
                 "description": "Filter by entity ID (optional)",
             },
+            "domain": {
+                "type": "string",
+                "description": "Filter by domain, e.g. 'light' (optional)",
+            },
+            "device_id": {
+                "type": "string",
+                "description": "Filter by device ID (optional)",
+            },
+            "context_user_id": {
+                "type": "string",
+                "description": "Only entries caused by this user ID (optional)",
+            },
             "start_time": {
                 "type": "string",
                 "description": "Start time in ISO format (e.g., 2024-01-01T00:00:00)",
@@ -214,6 +600,20 @@ async def fire_event(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
                 "type": "string",
                 "description": "End time in ISO format (optional, defaults to now)",
             },
+            "order": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "description": "'asc' (default) for oldest first, 'desc' for newest first",
+            },
+            "group_by_context": {
+                "type": "boolean",
+                "description": (
+                    "Collapse entries with the same cause into one {when, context, entries} "
+                    "chain, e.g. an automation and the changes it made (default false). "
+                    "A chain split by the page size continues on the next page"
+                ),
+            },
+            **PAGINATION_PROPERTIES,
         },
         "required": ["start_time"],
     },
@@ -228,26 +628,124 @@ async def get_logbook(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[st
     from homeassistant.components.recorder import get_instance
 
     entity_id = arguments.get("entity_id")
+    domain = arguments.get("domain")
+    device_id = arguments.get("device_id")
+    context_user_id = arguments.get("context_user_id")
+    descending = arguments.get("order", "asc") == "desc"
     start_time = dt.fromisoformat(arguments["start_time"])
     end_time_str = arguments.get("end_time")
     end_time = dt.fromisoformat(end_time_str) if end_time_str else dt_util.utcnow()
+    # Naive times are local, as elsewhere in Home Assistant
+    start_time, end_time = dt_util.as_utc(start_time), dt_util.as_utc(end_time)
+
+    size = page_size(arguments)
+
+    # Entries are ordered by time, so the cursor holds the time of the last
+    # entry returned and how many entries at that time were returned; the
+    # next page queries from that time on instead of from start_time (or up
+    # to it, newest first).
+    after_when, seen = None, 0
+    if cursor := arguments.get("cursor"):
+        try:
+            after_when, seen = decode_cursor(cursor)
+            if descending:
+                end_time = dt.fromisoformat(after_when) + timedelta(milliseconds=1)
+            else:
+                start_time = dt.fromisoformat(after_when) - timedelta(milliseconds=1)
+        except (TypeError, ValueError) as err:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}") from err
 
+    # Entity, domain and device filters narrow the recorder query
     entity_ids = [entity_id] if entity_id else None
+    if device_id:
+        registry = er.async_get(hass)
+        device_entities = [
+            entry.entity_id
+            for entry in er.async_entries_for_device(
+                registry, device_id, include_disabled_entities=True
+            )
+        ]
+        entity_ids = [e for e in entity_ids or device_entities if e in device_entities]
+    if domain and entity_ids is None:
+        # A domain without entities matches nothing, rather than everything
+        entity_ids = get_entity_index(hass).entity_ids(domain=domain)
+    elif domain:
+        entity_ids = [e for e in entity_ids if e.startswith(f"{domain}.")]
+    if entity_ids == []:
+        return page_content([], None)
+    device_ids = [device_id] if device_id else None
+
+    def _keep(entry: dict[str, Any]) -> bool:
+        when = entry.get("when", "")
+        if after_when is not None and (when > after_when if descending else when < after_when):
+            return False
+        if context_user_id and entry.get("context_user_id") != context_user_id:
+            return False
+        if domain:
+            entry_domain = entry.get("domain") or str(entry.get("entity_id", "")).split(".")[0]
+            return entry_domain == domain
+        return True
 
     try:
+        await report_progress(0, 2, "Querying logbook")
         processor = EventProcessor(
             hass,
             (PSEUDO_EVENT_STATE_CHANGED, EVENT_LOGBOOK_ENTRY),
             entity_ids=entity_ids,
+            device_ids=device_ids,
         )
-
-        events = await get_instance(hass).async_add_executor_job(
-            processor.get_events, start_time, end_time
+        key = (
+            "logbook",
+            None if entity_ids is None else tuple(entity_ids),
+            None if device_ids is None else tuple(device_ids),
         )
 
-        return {
-            "content": [{"type": "text", "text": json.dumps(events, indent=2, cls=_HAJSONEncoder)}]
-        }
+        # Read the range a slice at a time, stopping once the page is full
+        needed = seen + size + 1
+        entries: list[dict[str, Any]] = []
+        for slice_start, slice_end in _logbook_slices(start_time, end_time, descending):
+            # The recorder excludes both ends of a window; each slice but the
+            # first overlaps the previous one slightly and keeps only entries
+            # from its own start on
+            query_start = slice_start
+            low = None
+            if slice_start != start_time:
+                query_start = slice_start - timedelta(milliseconds=1)
+                low = slice_start.isoformat()
+            high = slice_end.isoformat()
+
+            async def _fetch(start: dt = query_start, end: dt = slice_end) -> list[dict[str, Any]]:
+                return await get_instance(hass).async_add_executor_job(
+                    processor.get_events, start, end
+                )
+
+            events = await async_cached_query(hass, key, query_start, slice_end, _fetch)
+            matched = [
+                event
+                for event in events
+                if (low is None or event.get("when", "") >= low)
+                and event.get("when", "") < high
+                and _keep(event)
+            ]
+            entries.extend(reversed(matched) if descending else matched)
+            if len(entries) >= needed:
+                break
+        await report_progress(1, 2, f"Fetched {len(entries)} logbook entries")
+
+        entries = entries[sum(1 for entry in entries[:seen] if entry.get("when") == after_when) :]
+        page = entries[:size]
+        next_cursor = None
+        if len(entries) > size:
+            last_when = page[-1].get("when", "")
+            returned = sum(1 for entry in page if entry.get("when", "") == last_when)
+            if last_when == after_when:
+                returned += seen
+            next_cursor = encode_cursor([last_when, returned])
+
+        if arguments.get("group_by_context"):
+            chains = _context_chains(page[::-1] if descending else page)
+            page = chains[::-1] if descending else chains
+        return page_content(page, next_cursor)
     except Exception as e:
         _LOGGER.error("Error getting logbook: %s", e)
         return {"content": [{"type": "text", "text": f"Error getting logbook: {str(e)}"}]}
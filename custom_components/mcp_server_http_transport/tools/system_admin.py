@@ -1,6 +1,5 @@
 """System administration and diagnostic tools."""
 
-import json
 import logging
 from collections import deque
 from datetime import datetime
@@ -9,7 +8,8 @@ from typing import Any
 from homeassistant.const import __version__ as HA_VERSION
 from homeassistant.core import HomeAssistant
 
-from . import _HAJSONEncoder, register_tool
+from ..entity_index import get_entity_index
+from . import json_dumps, register_tool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -189,27 +189,27 @@ async def restart_ha(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str
 )
 async def get_system_status(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[str, Any]:
     """Get system status overview."""
-    all_states = hass.states.async_all()
-
-    domain_counts: dict[str, int] = {}
-    problem_entities = []
-    for state in all_states:
-        domain = state.entity_id.split(".")[0]
-        domain_counts[domain] = domain_counts.get(domain, 0) + 1
-        if state.state in ("unavailable", "unknown"):
-            problem_entities.append({"entity_id": state.entity_id, "state": state.state})
+    index = get_entity_index(hass)
+
+    problem_entities = [
+        {"entity_id": state.entity_id, "state": state.state}
+        for state in sorted(
+            index.states(state="unavailable") + index.states(state="unknown"),
+            key=lambda s: s.entity_id,
+        )
+    ]
 
     integration_count = len(hass.config_entries.async_entries())
 
     result = {
         "version": HA_VERSION,
-        "total_entities": len(all_states),
-        "domain_counts": dict(sorted(domain_counts.items())),
+        "total_entities": len(index),
+        "domain_counts": index.domain_counts(),
         "problem_entities": problem_entities,
         "integration_count": integration_count,
     }
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
@@ -236,12 +236,10 @@ async def get_domain_stats(hass: HomeAssistant, arguments: dict[str, Any]) -> di
 
     state_counts: dict[str, int] = {}
     examples = []
-    total = 0
+    states = get_entity_index(hass).states(domain=domain)
+    total = len(states)
 
-    for state in hass.states.async_all():
-        if not state.entity_id.startswith(f"{domain}."):
-            continue
-        total += 1
+    for state in states:
         state_counts[state.state] = state_counts.get(state.state, 0) + 1
         if len(examples) < 5:
             examples.append(
@@ -259,7 +257,7 @@ async def get_domain_stats(hass: HomeAssistant, arguments: dict[str, Any]) -> di
         "examples": examples,
     }
 
-    return {"content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]}
+    return {"content": [{"type": "text", "text": json_dumps(result)}]}
 
 
 @register_tool(
@@ -284,9 +282,7 @@ async def check_config(hass: HomeAssistant, arguments: dict[str, Any]) -> dict[s
             "valid": len(errors) == 0,
             "errors": errors,
         }
-        return {
-            "content": [{"type": "text", "text": json.dumps(result, indent=2, cls=_HAJSONEncoder)}]
-        }
+        return {"content": [{"type": "text", "text": json_dumps(result)}]}
     except Exception as e:
         _LOGGER.error("Error checking config: %s", e)
         return {"content": [{"type": "text", "text": f"Error checking config: {str(e)}"}]}
@@ -313,8 +309,4 @@ async def list_integrations(hass: HomeAssistant, arguments: dict[str, Any]) -> d
         for entry in entries
     ]
 
-    return {
-        "content": [
-            {"type": "text", "text": json.dumps(integrations, indent=2, cls=_HAJSONEncoder)}
-        ]
-    }
+    return {"content": [{"type": "text", "text": json_dumps(integrations)}]}
@@ -48,6 +48,7 @@ def mock_hass():
     hass.config.entries.async_domains = Mock(return_value=["oidc_provider"])
     hass.http = Mock()
     hass.http.register_view = Mock()
+    hass.states.async_all = Mock(return_value=[])
     return hass
 
 
@@ -183,6 +183,162 @@ class TestAsyncSetupEntry:
         assert mock_hass.data[DOMAIN]["camera_image_access"] is True
         assert mock_hass.data[DOMAIN]["image_file_access"] is True
 
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_creates_token_cache(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry stores a fresh token cache with the configured TTL."""
+        from custom_components.mcp_server_http_transport.token_cache import TokenCache
+
+        mock_config_entry.data = {"token_cache_ttl": 60}
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        cache = mock_hass.data[DOMAIN]["token_cache"]
+        assert isinstance(cache, TokenCache)
+        assert cache.max_ttl == 60
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_stores_batch_concurrency(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry stores the configured batch concurrency."""
+        mock_config_entry.data = {"batch_concurrency": 3}
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        assert mock_hass.data[DOMAIN]["batch_concurrency"] == 3
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_creates_state_cache(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry stores a fresh state fragment cache in hass.data."""
+        from custom_components.mcp_server_http_transport.state_cache import StateFragmentCache
+
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        assert isinstance(mock_hass.data[DOMAIN]["state_fragments"], StateFragmentCache)
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_starts_entity_index(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry builds the entity index and stops it on unload."""
+        from custom_components.mcp_server_http_transport.entity_index import EntityIndex
+
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        index = mock_hass.data[DOMAIN]["entity_index"]
+        assert isinstance(index, EntityIndex)
+        mock_config_entry.async_on_unload.assert_any_call(index.async_stop)
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_starts_change_feed(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry starts the change feed and stops it on unload."""
+        from custom_components.mcp_server_http_transport.change_feed import ChangeFeed
+
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        feed = mock_hass.data[DOMAIN]["change_feed"]
+        assert isinstance(feed, ChangeFeed)
+        # Aliases: 2 registries; entity index: state + 3 registries; change feed: state;
+        # service descriptions: 3; recorder cache: service calls;
+        # resource updates: state + 9 others
+        assert mock_hass.bus.async_listen.call_count == 21
+        mock_config_entry.async_on_unload.assert_any_call(feed.async_stop)
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_starts_recorder_cache(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry starts the recorder cache and stops it on unload."""
+        from custom_components.mcp_server_http_transport.recorder_cache import RecorderCache
+
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        cache = mock_hass.data[DOMAIN]["recorder_cache"]
+        assert isinstance(cache, RecorderCache)
+        mock_config_entry.async_on_unload.assert_any_call(cache.async_stop)
+
+    @patch("custom_components.mcp_server_http_transport.Server")
+    @patch("custom_components.mcp_server_http_transport.MCPEndpointView")
+    @patch("custom_components.mcp_server_http_transport.MCPProtectedResourceMetadataView")
+    @patch("custom_components.mcp_server_http_transport.MCPSubpathProtectedResourceMetadataView")
+    async def test_async_setup_entry_creates_reload_scheduler(
+        self,
+        mock_subpath_view,
+        mock_metadata_view,
+        mock_endpoint_view,
+        mock_server_class,
+        mock_hass,
+        mock_config_entry,
+    ):
+        """Test async_setup_entry creates the reload scheduler and flushes it on unload."""
+        from custom_components.mcp_server_http_transport.reload_scheduler import (
+            ReloadScheduler,
+        )
+
+        await async_setup_entry(mock_hass, mock_config_entry)
+
+        scheduler = mock_hass.data[DOMAIN]["reload_scheduler"]
+        assert isinstance(scheduler, ReloadScheduler)
+        mock_config_entry.async_on_unload.assert_any_call(scheduler.async_stop)
+
 
 class TestUpdateListener:
     """Test config entry update listener."""
@@ -210,3 +366,15 @@ class TestAsyncUnloadEntry:
 
         assert result is True
         assert len(mock_hass.data[DOMAIN]) == 0
+
+    async def test_async_unload_entry_clears_token_cache(self, mock_hass, mock_config_entry):
+        """Test async_unload_entry invalidates cached token validations."""
+        from custom_components.mcp_server_http_transport.token_cache import TokenCache
+
+        cache = TokenCache()
+        cache.set("key", {"sub": "user"})
+        mock_hass.data[DOMAIN] = {"token_cache": cache}
+
+        await async_unload_entry(mock_hass, mock_config_entry)
+
+        assert cache.get("key") is None
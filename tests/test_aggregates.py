@@ -0,0 +1,58 @@
+"""Tests for history aggregates."""
+
+import numpy as np
+import pytest
+
+from custom_components.mcp_server_http_transport.aggregates import numeric_summary, state_summary
+
+
+class TestNumericSummary:
+    """Test numeric aggregates."""
+
+    def test_time_weighted_mean(self):
+        # 10 for 30s, 20 for 10s
+        summary = numeric_summary(np.array([0.0, 30.0]), np.array([10.0, 20.0]), 40.0)
+        assert summary["mean"] == 15.0
+        assert summary["time_weighted_mean"] == 12.5
+        assert (summary["min"], summary["max"], summary["last"], summary["count"]) == (
+            10.0,
+            20.0,
+            20.0,
+            2,
+        )
+
+    def test_missing_values_left_out(self):
+        x = np.array([0.0, 10.0, 20.0])
+        y = np.array([10.0, np.nan, 30.0])
+        summary = numeric_summary(x, y, 30.0)
+        assert summary["count"] == 2
+        assert summary["time_weighted_mean"] == 20.0
+
+    def test_percentiles(self):
+        y = np.arange(101, dtype=float)
+        summary = numeric_summary(np.arange(101, dtype=float), y, 101.0, [50, 99.5])
+        assert summary["percentiles"] == {"p50": 50.0, "p99.5": 99.5}
+        assert "percentiles" not in numeric_summary(np.zeros(1), np.ones(1), 0.0, [])
+
+    def test_zero_length_window(self):
+        summary = numeric_summary(np.zeros(1), np.array([5.0]), 0.0)
+        assert summary["time_weighted_mean"] is None
+
+
+class TestStateSummary:
+    """Test state transitions and durations."""
+
+    def test_durations_per_state(self):
+        x = np.array([0.0, 10.0, 15.0, 20.0, 50.0])
+        summary = state_summary(x, ["off", "on", "on", "off", "on"], 60.0)
+        assert summary["transitions"] == 3
+        assert summary["last"] == "on"
+        assert summary["states"] == {
+            "off": {"count": 2, "total_seconds": 40.0, "longest_seconds": 30.0},
+            "on": {"count": 2, "total_seconds": 20.0, "longest_seconds": pytest.approx(10.0)},
+        }
+
+    def test_single_state(self):
+        summary = state_summary(np.array([0.0]), ["home"], 100.0)
+        assert summary["transitions"] == 0
+        assert summary["states"]["home"]["total_seconds"] == 100.0
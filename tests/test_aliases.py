@@ -0,0 +1,124 @@
+"""Tests for the shared alias lookups."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from custom_components.mcp_server_http_transport import aliases as aliases_mod
+from custom_components.mcp_server_http_transport.aliases import AliasCache, get_aliases
+from custom_components.mcp_server_http_transport.const import DOMAIN
+
+ENTRIES_FOR_DEVICE = (
+    "custom_components.mcp_server_http_transport.aliases.er.async_entries_for_device"
+)
+
+
+def _hass():
+    hass = Mock()
+    hass.data = {}
+    return hass
+
+
+def _entry(entity_id, aliases):
+    return Mock(entity_id=entity_id, aliases=aliases)
+
+
+def _event(**data):
+    return Mock(data=data)
+
+
+@pytest.fixture
+def compute():
+    """Count alias computations, returning them like HA 2026.4+ would."""
+    with (
+        patch.object(aliases_mod, "_HAS_GET_ENTITY_ALIASES", True),
+        patch(
+            "custom_components.mcp_server_http_transport.aliases.er.async_get_entity_aliases",
+            side_effect=lambda hass, entry: sorted(entry.aliases),
+            create=True,
+        ) as mock_fn,
+    ):
+        yield mock_fn
+
+
+class TestComputeAliases:
+    """Test the HA version compatibility of alias computation."""
+
+    def test_uses_async_get_entity_aliases_when_available(self, compute):
+        hass = _hass()
+        entry = _entry("light.a", {"Lamp"})
+        assert get_aliases(hass, entry) == ["Lamp"]
+        compute.assert_called_once_with(hass, entry)
+
+    def test_falls_back_to_sorted_str_on_older_ha(self):
+        with patch.object(aliases_mod, "_HAS_GET_ENTITY_ALIASES", False):
+            assert get_aliases(_hass(), _entry("light.a", ["Bravo", "Alpha"])) == [
+                "Alpha",
+                "Bravo",
+            ]
+            assert get_aliases(_hass(), _entry("light.a", set())) == []
+
+
+class TestAliasCache:
+    """Test caching and invalidation."""
+
+    def test_computed_once_per_entity(self, compute):
+        cache = AliasCache(_hass())
+        entry = _entry("light.a", {"Lamp"})
+        assert cache.get(entry) == ["Lamp"]
+        assert cache.get(entry) == ["Lamp"]
+        assert compute.call_count == 1
+
+    def test_entity_registry_update_drops_entity(self, compute):
+        cache = AliasCache(_hass())
+        cache.get(_entry("light.a", {"Lamp"}))
+        cache.get(_entry("light.b", {"Desk"}))
+
+        cache._async_entity_updated(_event(action="update", entity_id="light.a"))
+
+        assert cache.get(_entry("light.a", {"Reading Lamp"})) == ["Reading Lamp"]
+        assert cache.get(_entry("light.b", {"Other"})) == ["Desk"]
+
+    def test_renamed_entity_drops_old_id(self, compute):
+        cache = AliasCache(_hass())
+        cache.get(_entry("light.a", {"Lamp"}))
+        cache._async_entity_updated(
+            _event(action="update", entity_id="light.new", old_entity_id="light.a")
+        )
+        assert cache._aliases == {}
+
+    def test_device_rename_drops_device_entities(self, compute):
+        cache = AliasCache(_hass())
+        cache.get(_entry("light.a", {"Lamp"}))
+        cache.get(_entry("light.b", {"Desk"}))
+
+        with (
+            patch("custom_components.mcp_server_http_transport.aliases.er.async_get"),
+            patch(ENTRIES_FOR_DEVICE, return_value=[_entry("light.a", set())]) as entries,
+        ):
+            cache._async_device_updated(
+                _event(action="update", device_id="dev1", changes={"sw_version": "1"})
+            )
+            entries.assert_not_called()
+            cache._async_device_updated(
+                _event(action="update", device_id="dev1", changes={"name_by_user": None})
+            )
+
+        assert list(cache._aliases) == ["light.b"]
+
+    def test_start_and_stop(self):
+        hass = _hass()
+        unsub = Mock()
+        hass.bus.async_listen.return_value = unsub
+        cache = AliasCache(hass)
+        cache.async_start()
+        cache.async_stop()
+        assert unsub.call_count == 2
+
+    def test_get_aliases_uses_installed_cache(self, compute):
+        hass = _hass()
+        hass.data[DOMAIN] = {"aliases": AliasCache(hass)}
+        entry = _entry("light.a", {"Lamp"})
+        get_aliases(hass, entry)
+        get_aliases(hass, entry)
+        assert compute.call_count == 1
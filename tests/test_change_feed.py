@@ -0,0 +1,171 @@
+"""Tests for the change feed."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.mcp_server_http_transport.change_feed import (
+    ChangeFeed,
+    changes_payload,
+    get_change_feed,
+)
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.resources import read_resource
+from custom_components.mcp_server_http_transport.tools.entities import get_changes_since
+
+
+def _hass():
+    hass = Mock()
+    hass.data = {}
+    return hass
+
+
+def _change(feed, entity_id, old, new):
+    feed._async_state_changed(
+        Mock(data={"entity_id": entity_id, "old_state": old, "new_state": new})
+    )
+
+
+@pytest.fixture
+def feed():
+    return ChangeFeed(_hass(), maxlen=5)
+
+
+class TestChangeFeed:
+    """Test recording and reading changes."""
+
+    def test_watermark_increases_per_event(self, feed):
+        start = feed.watermark
+        _change(feed, "light.a", State("light.a", "off"), State("light.a", "on"))
+        assert feed.watermark == start + 1
+
+    def test_changes_since_returns_latest_state_in_change_order(self, feed):
+        start = feed.watermark
+        off, on = State("light.a", "off"), State("light.a", "on")
+        _change(feed, "light.a", off, on)
+        _change(feed, "switch.b", State("switch.b", "off"), State("switch.b", "on"))
+        latest = State("light.a", "off")
+        _change(feed, "light.a", on, latest)
+
+        changed = feed.changes_since(start)
+        assert list(changed) == ["switch.b", "light.a"]
+        assert changed["light.a"] is latest
+        assert list(feed.changes_since(start + 2)) == ["light.a"]
+        assert feed.changes_since(feed.watermark) == {}
+
+    def test_attribute_changes_count_only_when_selected(self, feed):
+        start = feed.watermark
+        old = State("light.a", "on", {"brightness": 10, "color_temp": 300})
+        new = State("light.a", "on", {"brightness": 20, "color_temp": 300})
+        _change(feed, "light.a", old, new)
+
+        assert feed.changes_since(start) == {}
+        assert feed.changes_since(start, ["color_temp"]) == {}
+        assert feed.changes_since(start, ["brightness"]) == {"light.a": new}
+
+    def test_added_and_removed_entities(self, feed):
+        start = feed.watermark
+        new = State("sensor.new", "1")
+        _change(feed, "sensor.new", None, new)
+        _change(feed, "sensor.old", State("sensor.old", "1"), None)
+        assert feed.changes_since(start) == {"sensor.new": new, "sensor.old": None}
+
+    def test_resync_when_watermark_fell_off_the_buffer(self, feed):
+        start = feed.watermark
+        for i in range(6):
+            _change(feed, f"sensor.s{i}", State(f"sensor.s{i}", "0"), State(f"sensor.s{i}", "1"))
+        assert feed.changes_since(start) is None
+        assert list(feed.changes_since(start + 1)) == [f"sensor.s{i}" for i in range(1, 6)]
+
+    def test_resync_for_unknown_watermarks(self, feed):
+        assert feed.changes_since(feed.watermark + 1) is None
+        # e.g. from before a restart
+        assert feed.changes_since(feed.watermark - 1) is None
+
+    def test_start_and_stop(self):
+        hass = _hass()
+        unsub = Mock()
+        hass.bus.async_listen.return_value = unsub
+        feed = ChangeFeed(hass)
+        feed.async_start()
+        feed.async_stop()
+        unsub.assert_called_once()
+
+
+class TestChangesPayload:
+    """Test the response shared by the tool and resource."""
+
+    def test_without_watermark(self, feed):
+        assert changes_payload(feed, None) == {
+            "watermark": feed.watermark,
+            "resync_required": False,
+            "changes": [],
+        }
+
+    def test_changes_with_selected_attributes(self, feed):
+        start = feed.watermark
+        new = State("light.a", "on", {"brightness": 20, "friendly_name": "A"})
+        _change(feed, "light.a", State("light.a", "off"), new)
+        _change(feed, "light.b", State("light.b", "on"), None)
+
+        payload = changes_payload(feed, start, ["brightness"])
+        assert payload["watermark"] == start + 2
+        assert payload["changes"] == [
+            {
+                "entity_id": "light.a",
+                "state": "on",
+                "last_changed": new.last_changed.isoformat(),
+                "attributes": {"brightness": 20},
+            },
+            {"entity_id": "light.b", "removed": True},
+        ]
+
+    def test_resync_required(self, feed):
+        payload = changes_payload(feed, 0)
+        assert payload["resync_required"] is True
+        assert payload["changes"] == []
+
+
+class TestChangesToolAndResource:
+    """Test get_changes_since and hass://changes."""
+
+    async def test_tool_round_trip(self):
+        hass = _hass()
+        feed = ChangeFeed(hass)
+        hass.data[DOMAIN] = {"change_feed": feed}
+        assert get_change_feed(hass) is feed
+
+        result = await get_changes_since(hass, {})
+        watermark = json.loads(result["content"][0]["text"])["watermark"]
+        _change(feed, "light.a", State("light.a", "off"), State("light.a", "on"))
+
+        result = await get_changes_since(hass, {"watermark": watermark})
+        data = json.loads(result["content"][0]["text"])
+        assert [c["entity_id"] for c in data["changes"]] == ["light.a"]
+        assert data["watermark"] == watermark + 1
+
+    async def test_tool_without_feed(self):
+        result = await get_changes_since(_hass(), {})
+        assert "not available" in result["content"][0]["text"]
+
+    async def test_resource(self):
+        hass = _hass()
+        feed = ChangeFeed(hass)
+        hass.data[DOMAIN] = {"change_feed": feed}
+        watermark = feed.watermark
+        _change(feed, "light.a", State("light.a", "off"), State("light.a", "on"))
+
+        contents, _ = await read_resource(hass, f"hass://changes/{watermark}")
+        data = json.loads(contents[0]["text"])
+        assert [c["entity_id"] for c in data["changes"]] == ["light.a"]
+
+        contents, _ = await read_resource(hass, "hass://changes")
+        assert json.loads(contents[0]["text"])["watermark"] == watermark + 1
+
+    async def test_resource_invalid_watermark(self):
+        hass = _hass()
+        hass.data[DOMAIN] = {"change_feed": ChangeFeed(hass)}
+        with pytest.raises(ValueError, match="Invalid watermark"):
+            await read_resource(hass, "hass://changes/abc")
@@ -164,6 +164,41 @@ class TestCompletions:
         assert "living_room" in completion["values"]
         assert "kitchen" not in completion["values"]
 
+    async def test_post_completion_floor_id(self, view, mock_hass):
+        """Test POST with completion/complete for floor_id."""
+        mock_registry = Mock()
+        mock_registry.async_list_floors.return_value = [
+            Mock(floor_id="ground_floor"),
+            Mock(floor_id="first_floor"),
+        ]
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token"}
+        request.json = AsyncMock(
+            return_value={
+                "jsonrpc": "2.0",
+                "method": "completion/complete",
+                "params": {
+                    "ref": {"type": "ref/tool", "name": "list_entities"},
+                    "argument": {"name": "floor_id", "value": "gr"},
+                },
+                "id": 37,
+            }
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "custom_components.mcp_server_http_transport.completions.fr.async_get",
+                return_value=mock_registry,
+            ),
+        ):
+            response = await view.post(request)
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        assert body["result"]["completion"]["values"] == ["ground_floor"]
+
     async def test_post_completion_unknown_argument(self, view, mock_hass):
         """Test POST with completion/complete for unknown argument."""
         request = Mock()
@@ -2,6 +2,8 @@
 
 from unittest.mock import Mock, patch
 
+import pytest
+import voluptuous as vol
 from homeassistant import data_entry_flow
 
 from custom_components.mcp_server_http_transport.config_flow import (
@@ -9,9 +11,19 @@ from custom_components.mcp_server_http_transport.config_flow import (
     MCPServerOptionsFlowHandler,
 )
 from custom_components.mcp_server_http_transport.const import (
+    CONF_BATCH_CONCURRENCY,
     CONF_CAMERA_IMAGE_ACCESS,
     CONF_IMAGE_FILE_ACCESS,
     CONF_NATIVE_AUTH,
+    CONF_RELOAD_DELAY,
+    CONF_RELOAD_MAX_DELAY,
+    CONF_TOKEN_CACHE_TTL,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_RELOAD_MAX_DELAY,
+    DEFAULT_TOKEN_CACHE_TTL,
+    MAX_BATCH_CONCURRENCY,
+    MAX_RELOAD_DELAY,
+    MAX_TOKEN_CACHE_TTL,
 )
 
 
@@ -205,3 +217,54 @@ class TestMCPServerOptionsFlow:
         call_kwargs = flow.hass.config_entries.async_update_entry.call_args
         assert call_kwargs[1]["data"][CONF_CAMERA_IMAGE_ACCESS] is True
         assert call_kwargs[1]["data"][CONF_IMAGE_FILE_ACCESS] is True
+
+    async def test_init_step_shows_reload_delays(self):
+        """Test init step offers the reload delays, defaulting to the constants."""
+        flow = self._create_flow(data={CONF_RELOAD_DELAY: 2})
+        result = await flow.async_step_init(user_input=None)
+
+        schema = result["data_schema"]
+        schema_keys = {str(k): k for k in schema.schema}
+        assert schema_keys[CONF_RELOAD_DELAY].default() == 2
+        assert schema_keys[CONF_RELOAD_MAX_DELAY].default() == DEFAULT_RELOAD_MAX_DELAY
+        with pytest.raises(vol.Invalid):
+            schema({CONF_RELOAD_DELAY: -1})
+        with pytest.raises(vol.Invalid):
+            schema({CONF_RELOAD_MAX_DELAY: MAX_RELOAD_DELAY + 1})
+
+    async def test_init_step_error_when_max_reload_delay_is_shorter(self):
+        """Test the maximum reload delay may not be shorter than the delay."""
+        flow = self._create_flow(data={CONF_NATIVE_AUTH: True})
+
+        result = await flow.async_step_init(
+            user_input={CONF_NATIVE_AUTH: True, CONF_RELOAD_DELAY: 5, CONF_RELOAD_MAX_DELAY: 1}
+        )
+
+        assert result["type"] == data_entry_flow.FlowResultType.FORM
+        assert result["errors"][CONF_RELOAD_MAX_DELAY] == "reload_max_delay_too_short"
+        flow.hass.config_entries.async_update_entry.assert_not_called()
+
+    async def test_init_step_shows_token_cache_ttl(self):
+        """Test init step offers the token cache TTL, bounded to its range."""
+        flow = self._create_flow(data={})
+        result = await flow.async_step_init(user_input=None)
+
+        schema = result["data_schema"]
+        schema_keys = {str(k): k for k in schema.schema}
+        assert schema_keys[CONF_TOKEN_CACHE_TTL].default() == DEFAULT_TOKEN_CACHE_TTL
+        assert schema({CONF_TOKEN_CACHE_TTL: 0})[CONF_TOKEN_CACHE_TTL] == 0
+        with pytest.raises(vol.Invalid):
+            schema({CONF_TOKEN_CACHE_TTL: MAX_TOKEN_CACHE_TTL + 1})
+
+    async def test_init_step_shows_batch_concurrency(self):
+        """Test init step offers the batch concurrency, bounded to its range."""
+        flow = self._create_flow(data={})
+        result = await flow.async_step_init(user_input=None)
+
+        schema = result["data_schema"]
+        schema_keys = {str(k): k for k in schema.schema}
+        assert schema_keys[CONF_BATCH_CONCURRENCY].default() == DEFAULT_BATCH_CONCURRENCY
+        assert schema({CONF_BATCH_CONCURRENCY: "4"})[CONF_BATCH_CONCURRENCY] == 4
+        for invalid in (0, MAX_BATCH_CONCURRENCY + 1):
+            with pytest.raises(vol.Invalid):
+                schema({CONF_BATCH_CONCURRENCY: invalid})
@@ -1,16 +1,23 @@
 """Tests for config_manager YAML helpers."""
 
+import os
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+import voluptuous as vol
+from homeassistant.core import Service
 
+from custom_components.mcp_server_http_transport import config_manager
 from custom_components.mcp_server_http_transport.config_manager import (
     _load_yaml_dict,
     _load_yaml_list,
+    apply_dict_operations,
+    apply_list_operations,
     read_dict_entries,
     read_dict_entry,
     read_list_entries,
     read_list_entry,
+    update_list_entry,
 )
 
 
@@ -254,3 +261,201 @@ class TestReadDictEntry:
             pytest.raises(ValueError, match="not found"),
         ):
             await read_dict_entry(mock_hass, "scripts.yaml", "nonexistent")
+
+
+class TestParseCache:
+    """Tests for the parse cache behind the read helpers."""
+
+    @pytest.fixture
+    def hass(self, tmp_path):
+        hass = Mock()
+        hass.config.path = lambda name: str(tmp_path / name)
+
+        async def run_fn(fn, *args):
+            return fn(*args)
+
+        hass.async_add_executor_job = AsyncMock(side_effect=run_fn)
+        hass.services.async_call = AsyncMock()
+        return hass
+
+    @pytest.fixture
+    def load_yaml(self):
+        from homeassistant.util.yaml import loader
+
+        with patch(
+            "custom_components.mcp_server_http_transport.config_manager.yaml_loader.load_yaml",
+            wraps=loader.load_yaml,
+        ) as load_yaml:
+            yield load_yaml
+
+    async def test_parses_unchanged_file_once(self, hass, tmp_path, load_yaml):
+        """Test repeated reads of an unchanged file share one parse."""
+        (tmp_path / "automations.yaml").write_text("- id: a\n  alias: A\n- id: b\n  alias: B\n")
+        entries = await read_list_entries(hass, "automations.yaml")
+        assert await read_list_entries(hass, "automations.yaml") is entries
+        assert (await read_list_entry(hass, "automations.yaml", "b"))["alias"] == "B"
+        assert load_yaml.call_count == 1
+
+    async def test_parses_again_when_file_changes(self, hass, tmp_path, load_yaml):
+        """Test a file changed by someone else is parsed again."""
+        path = tmp_path / "scripts.yaml"
+        path.write_text("morning:\n  alias: Morning\n")
+        assert list(await read_dict_entries(hass, "scripts.yaml")) == ["morning"]
+
+        path.write_text("morning:\n  alias: Morning\nevening:\n  alias: Evening\n")
+        assert list(await read_dict_entries(hass, "scripts.yaml")) == ["morning", "evening"]
+        assert load_yaml.call_count == 2
+
+    async def test_own_write_drops_cached_parse(self, hass, tmp_path, load_yaml):
+        """Test a write is seen even when it keeps the file's mtime and size."""
+        path = tmp_path / "automations.yaml"
+        path.write_text("- id: a\n  alias: A\n")
+        await read_list_entries(hass, "automations.yaml")
+        stat = os.stat(path)
+
+        await update_list_entry(hass, "automations.yaml", "a", {"alias": "B"}, "automation")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert os.stat(path).st_size == stat.st_size
+
+        assert (await read_list_entry(hass, "automations.yaml", "a"))["alias"] == "B"
+
+    async def test_views_are_read_only(self, hass, tmp_path):
+        """Test the shared results cannot be modified by callers."""
+        (tmp_path / "scenes.yaml").write_text("- id: a\n  name: A\n")
+        (tmp_path / "scripts.yaml").write_text("morning:\n  alias: Morning\n")
+        entries = await read_list_entries(hass, "scenes.yaml")
+        scripts = await read_dict_entries(hass, "scripts.yaml")
+        with pytest.raises(RuntimeError):
+            entries.append({"id": "b"})
+        with pytest.raises(RuntimeError):
+            scripts["evening"] = {}
+        assert entries == [{"id": "a", "name": "A"}]
+
+
+class TestBatchOperations:
+    """Tests for apply_list_operations and apply_dict_operations."""
+
+    @pytest.fixture
+    def hass(self, tmp_path):
+        hass = Mock()
+        hass.config.path = lambda name: str(tmp_path / name)
+
+        async def run_fn(fn, *args):
+            return fn(*args)
+
+        hass.async_add_executor_job = AsyncMock(side_effect=run_fn)
+        hass.services.async_call = AsyncMock()
+        return hass
+
+    async def test_list_operations_write_and_reload_once(self, hass, tmp_path):
+        """Test every operation lands in one write followed by one reload."""
+        (tmp_path / "automations.yaml").write_text(
+            "- id: a\n  alias: A\n- id: b\n  alias: B\n- id: c\n  alias: C\n"
+        )
+        with patch(
+            "custom_components.mcp_server_http_transport.config_manager.yaml_dumper.save_yaml",
+            wraps=config_manager.yaml_dumper.save_yaml,
+        ) as save_yaml:
+            results, merged = await apply_list_operations(
+                hass,
+                "automations.yaml",
+                [
+                    {"op": "create", "config": {"alias": "New"}},
+                    {"op": "update", "id": "b", "config": {"alias": "B2"}},
+                    {"op": "delete", "id": "a"},
+                    {"op": "update", "id": "a", "config": {"alias": "Gone"}},
+                    {"op": "delete", "id": "missing"},
+                    {"op": "rename", "id": "c"},
+                    {"op": "update", "id": "c"},
+                ],
+                "automation",
+            )
+
+        assert merged is False
+        created = results[0]["id"]
+        assert [result["success"] for result in results] == [
+            True,
+            True,
+            True,
+            False,
+            False,
+            False,
+            False,
+        ]
+        assert results[3]["error"] == "Entry with id 'a' not found in automations.yaml"
+        assert results[5]["error"].startswith("Unknown op 'rename'")
+        assert results[6]["error"] == "config is required for update"
+        save_yaml.assert_called_once()
+        hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+        assert await read_list_entries(hass, "automations.yaml") == [
+            {"alias": "B2", "id": "b"},
+            {"id": "c", "alias": "C"},
+            {"alias": "New", "id": created},
+        ]
+
+    async def test_nothing_written_when_every_operation_fails(self, hass, tmp_path):
+        """Test the file is left alone and nothing reloads when no operation applies."""
+        (tmp_path / "scenes.yaml").write_text("- id: a\n  name: A\n")
+        results, merged = await apply_list_operations(
+            hass, "scenes.yaml", [{"op": "delete", "id": "b"}], "scene"
+        )
+        assert results == [
+            {
+                "index": 0,
+                "op": "delete",
+                "id": "b",
+                "success": False,
+                "error": "Entry with id 'b' not found in scenes.yaml",
+            }
+        ]
+        hass.services.async_call.assert_not_awaited()
+        assert (tmp_path / "scenes.yaml").read_text() == "- id: a\n  name: A\n"
+
+    async def test_dict_operations(self, hass, tmp_path):
+        """Test script operations by key, refusing to create an existing key."""
+        (tmp_path / "scripts.yaml").write_text("morning:\n  alias: Morning\n")
+        results, merged = await apply_dict_operations(
+            hass,
+            "scripts.yaml",
+            [
+                {"op": "create", "key": "evening", "config": {"alias": "Evening"}},
+                {"op": "create", "key": "morning", "config": {"alias": "Again"}},
+                {"op": "create", "config": {"alias": "No key"}},
+                {"op": "update", "key": "morning", "config": {"alias": "Early"}},
+            ],
+            "script",
+        )
+        assert [result["success"] for result in results] == [True, False, False, True]
+        assert results[1]["error"] == "Entry 'morning' already exists in scripts.yaml"
+        assert results[2]["error"] == "key is required for create"
+        hass.services.async_call.assert_awaited_once_with("script", "reload", blocking=True)
+        assert await read_dict_entries(hass, "scripts.yaml") == {
+            "morning": {"alias": "Early"},
+            "evening": {"alias": "Evening"},
+        }
+
+    async def test_automations_reload_only_changed_ids(self, hass, tmp_path):
+        """Test automation edits reload just the automations they touched."""
+        (tmp_path / "automations.yaml").write_text("- id: a\n  alias: A\n- id: b\n  alias: B\n")
+        hass.services.async_services_for_domain = Mock(
+            return_value={
+                "reload": Service(
+                    AsyncMock(), vol.Schema({vol.Optional("id"): str}), "automation", "reload"
+                )
+            }
+        )
+        await update_list_entry(hass, "automations.yaml", "b", {"alias": "B2"}, "automation")
+        hass.services.async_call.assert_awaited_once_with(
+            "automation", "reload", {"id": "b"}, blocking=True
+        )
+
+        hass.services.async_call.reset_mock()
+        await apply_list_operations(
+            hass,
+            "automations.yaml",
+            [{"op": "delete", "id": "a"}, {"op": "delete", "id": "missing"}],
+            "automation",
+        )
+        hass.services.async_call.assert_awaited_once_with(
+            "automation", "reload", {"id": "a"}, blocking=True
+        )
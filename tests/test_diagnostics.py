@@ -0,0 +1,53 @@
+"""Tests for config entry diagnostics."""
+
+from unittest.mock import Mock
+
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.mcp_server_http_transport.recorder_cache import RecorderCache
+from custom_components.mcp_server_http_transport.state_cache import StateFragmentCache
+from custom_components.mcp_server_http_transport.token_cache import TokenCache
+
+
+async def test_diagnostics_report_cache_counters():
+    hass = Mock()
+    recorder_cache = RecorderCache(hass, max_bytes=100)
+    recorder_cache.set("a", None, [1], 3)
+    recorder_cache.get("a")
+    token_cache = TokenCache(max_size=5, max_ttl=60)
+    token_cache.get("missing")
+    hass.data = {
+        DOMAIN: {
+            "recorder_cache": recorder_cache,
+            "token_cache": token_cache,
+            "state_fragments": StateFragmentCache(hass),
+        }
+    }
+    entry = Mock(data={"native_auth_enabled": True})
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"] == {"native_auth_enabled": True}
+    assert diagnostics["caches"]["recorder"] == {
+        "hits": 1,
+        "misses": 0,
+        "size": 1,
+        "bytes": 3,
+        "max_bytes": 100,
+    }
+    assert diagnostics["caches"]["tokens"] == {
+        "hits": 0,
+        "misses": 1,
+        "size": 0,
+        "max_size": 5,
+        "max_ttl": 60,
+    }
+    assert diagnostics["caches"]["state_fragments"] == {"hits": 0, "misses": 0, "size": 0}
+
+
+async def test_diagnostics_without_caches():
+    hass = Mock(data={})
+    diagnostics = await async_get_config_entry_diagnostics(hass, Mock(data={}))
+    assert diagnostics["caches"] == {"tokens": None, "state_fragments": None, "recorder": None}
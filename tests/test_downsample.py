@@ -0,0 +1,152 @@
+"""Tests for series downsampling."""
+
+import numpy as np
+import pytest
+
+from custom_components.mcp_server_http_transport.downsample import (
+    MAX_POINTS,
+    downsample_method,
+    lttb_indices,
+    max_points,
+    merge_statistics,
+    numeric_values,
+    state_spans,
+    time_buckets,
+)
+
+
+class TestArguments:
+    """Test validation of max_points and downsample."""
+
+    def test_max_points(self):
+        assert max_points({}) is None
+        assert max_points({"max_points": 100}) == 100
+        assert max_points({"max_points": MAX_POINTS + 1}) == MAX_POINTS
+
+    @pytest.mark.parametrize("value", [2, 0, "10", True, 1.5])
+    def test_invalid_max_points(self, value):
+        with pytest.raises(ValueError, match="max_points"):
+            max_points({"max_points": value})
+
+    def test_method(self):
+        assert downsample_method({}) == "lttb"
+        assert downsample_method({"downsample": "bucket"}) == "bucket"
+        with pytest.raises(ValueError, match="Unknown downsample"):
+            downsample_method({"downsample": "mean"})
+
+
+class TestNumericValues:
+    """Test detection of numeric series."""
+
+    def test_missing_states_become_nan(self):
+        values = numeric_values(["1.5", "unavailable", "2"])
+        assert values[0] == 1.5
+        assert np.isnan(values[1])
+        assert values[2] == 2
+
+    def test_non_numeric(self):
+        assert numeric_values(["on", "off"]) is None
+
+
+class TestLttb:
+    """Test Largest-Triangle-Three-Buckets selection."""
+
+    def test_keeps_ends_and_peaks(self):
+        x = np.arange(1000, dtype=float)
+        y = np.zeros(1000)
+        y[250], y[700] = 50.0, -40.0
+        kept = lttb_indices(x, y, 20)
+        assert len(kept) == 20
+        assert kept[0] == 0 and kept[-1] == 999
+        assert {250, 700} <= set(kept.tolist())
+        assert list(kept) == sorted(kept)
+
+    def test_short_series_unchanged(self):
+        x = np.arange(5, dtype=float)
+        assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_skips_nan(self):
+        x = np.arange(6, dtype=float)
+        y = np.array([1.0, np.nan, 3.0, np.nan, 5.0, 6.0])
+        assert lttb_indices(x, y, 10).tolist() == [0, 2, 4, 5]
+
+    def test_large_timestamps(self):
+        x = 1.7e9 + np.arange(10_000, dtype=float) * 10
+        y = np.sin(np.arange(10_000) / 100)
+        kept = lttb_indices(x, y, 500)
+        assert len(kept) == 500
+        assert np.all(np.diff(kept) > 0)
+
+
+class TestTimeBuckets:
+    """Test min/max/mean/last aggregation."""
+
+    def test_buckets(self):
+        x = np.arange(8, dtype=float)
+        y = np.array([1.0, 3.0, 2.0, np.nan, 5.0, 4.0, 9.0, 0.0])
+        buckets = time_buckets(x, y, 2)
+        assert buckets == [
+            {
+                "start": 0.0,
+                "end": 2.0,
+                "min": 1.0,
+                "max": 3.0,
+                "mean": 2.0,
+                "last": 2.0,
+                "count": 3,
+            },
+            {
+                "start": 4.0,
+                "end": 7.0,
+                "min": 0.0,
+                "max": 9.0,
+                "mean": 4.5,
+                "last": 0.0,
+                "count": 4,
+            },
+        ]
+
+    def test_single_time(self):
+        buckets = time_buckets(np.zeros(3), np.array([1.0, 2.0, 3.0]), 2)
+        assert buckets == [
+            {"start": 0.0, "end": 0.0, "min": 1.0, "max": 3.0, "mean": 2.0, "last": 3.0, "count": 3}
+        ]
+
+
+class TestStateSpans:
+    """Test run-length encoding of non-numeric states."""
+
+    def test_runs(self):
+        x = np.array([0.0, 1.0, 2.0, 5.0])
+        assert state_spans(x, ["off", "off", "on", "off"], 10.0, 10) == [
+            {"state": "off", "start": 0.0, "end": 2.0, "count": 2},
+            {"state": "on", "start": 2.0, "end": 5.0, "count": 1},
+            {"state": "off", "start": 5.0, "end": 10.0, "count": 1},
+        ]
+
+    def test_merged_spans_report_longest_state(self):
+        # on for 1s, off for 8s, on for 1s, then off until 20; spans starting
+        # before and after 5s are merged
+        x = np.array([0.0, 1.0, 9.0, 10.0])
+        spans = state_spans(x, ["on", "off", "on", "off"], 20.0, 2)
+        assert spans == [
+            {"state": "off", "start": 0.0, "end": 9.0, "count": 2},
+            {"state": "off", "start": 9.0, "end": 20.0, "count": 2},
+        ]
+
+
+class TestMergeStatistics:
+    """Test merging long-term statistics rows."""
+
+    def test_merge(self):
+        rows = [
+            {"start": 0, "end": 1, "mean": 1.0, "min": 0.0, "max": 2.0, "sum": 10.0},
+            {"start": 1, "end": 2, "mean": 3.0, "min": 1.0, "max": 5.0, "sum": 12.0},
+            {"start": 2, "end": 3, "min": 2.0, "max": 3.0, "sum": 15.0},
+            {"start": 3, "end": 4, "mean": 4.0, "min": 3.0, "max": 6.0},
+        ]
+        merged = merge_statistics(rows, np.arange(4, dtype=float), 2)
+        assert merged == [
+            {"start": 0, "end": 2, "min": 0.0, "max": 5.0, "mean": 2.0, "sum": 12.0, "count": 2},
+            {"start": 2, "end": 4, "min": 2.0, "max": 6.0, "mean": 4.0, "count": 2},
+        ]
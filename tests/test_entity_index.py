@@ -0,0 +1,363 @@
+"""Tests for the shared entity index."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.entity_index import (
+    EntityIndex,
+    get_entity_index,
+)
+from custom_components.mcp_server_http_transport.resources import read_resource
+from custom_components.mcp_server_http_transport.tools.entities import (
+    list_entities,
+    search_entities,
+)
+
+ER_GET = "custom_components.mcp_server_http_transport.entity_index.er.async_get"
+DR_GET = "custom_components.mcp_server_http_transport.entity_index.dr.async_get"
+AR_GET = "custom_components.mcp_server_http_transport.entity_index.ar.async_get"
+
+
+def _hass(states):
+    hass = Mock()
+    hass.data = {}
+    hass.states.async_all = Mock(return_value=states)
+    return hass
+
+
+def _event(**data):
+    return Mock(data=data)
+
+
+@pytest.fixture
+def states():
+    return [
+        State("sensor.kitchen_temp", "21.5", {"device_class": "temperature"}),
+        State("light.kitchen", "on"),
+        State("sensor.door", "unavailable", {"device_class": "door"}),
+        State("light.bedroom", "off"),
+    ]
+
+
+@pytest.fixture
+def registries():
+    """Entity registry with an own-area entity, a device-area entity, and a labelled one."""
+    entries = {
+        "light.kitchen": Mock(area_id="kitchen", device_id=None, labels=set(), aliases=set()),
+        "sensor.kitchen_temp": Mock(
+            area_id=None, device_id="dev1", labels={"climate"}, aliases=set()
+        ),
+        "light.bedroom": Mock(
+            area_id=None, device_id=None, labels={"night"}, aliases={"Reading Lamp"}
+        ),
+    }
+    entity_registry = Mock()
+    entity_registry.async_get.side_effect = entries.get
+    device = Mock(area_id="kitchen", name_by_user=None)
+    device.name = "Aqara Climate"
+    device_registry = Mock()
+    device_registry.async_get.side_effect = {"dev1": device}.get
+    kitchen = Mock(floor_id="ground")
+    kitchen.name = "Kitchen"
+    area_registry = Mock()
+    area_registry.async_get_area.side_effect = {"kitchen": kitchen}.get
+    with (
+        patch(ER_GET, return_value=entity_registry),
+        patch(DR_GET, return_value=device_registry),
+        patch(AR_GET, return_value=area_registry),
+    ):
+        yield entries, device_registry
+
+
+class TestEntityIndexQueries:
+    """Test bucket queries against the initial states."""
+
+    def test_all_entities_sorted(self, states):
+        index = EntityIndex(_hass(states))
+        assert len(index) == 4
+        assert index.entity_ids() == [
+            "light.bedroom",
+            "light.kitchen",
+            "sensor.door",
+            "sensor.kitchen_temp",
+        ]
+
+    def test_domain_filter(self, states):
+        index = EntityIndex(_hass(states))
+        assert [s.entity_id for s in index.states(domain="light")] == [
+            "light.bedroom",
+            "light.kitchen",
+        ]
+        assert index.entity_ids(domain="switch") == []
+
+    def test_state_and_device_class_filters_intersect(self, states):
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(state="unavailable") == ["sensor.door"]
+        assert index.entity_ids(domain="sensor", device_class="temperature") == [
+            "sensor.kitchen_temp"
+        ]
+        assert index.entity_ids(domain="light", device_class="temperature") == []
+
+    def test_domains_and_counts(self, states):
+        index = EntityIndex(_hass(states))
+        assert index.domains() == ["light", "sensor"]
+        assert index.domain_counts() == {"light": 2, "sensor": 2}
+
+    def test_area_filter_falls_back_to_device_area(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(area_id="kitchen") == ["light.kitchen", "sensor.kitchen_temp"]
+        assert index.area_of("sensor.kitchen_temp") == "kitchen"
+        assert index.area_of("sensor.door") is None
+
+    def test_floor_filter_follows_area_floor(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(floor_id="ground") == ["light.kitchen", "sensor.kitchen_temp"]
+        assert index.entity_ids(floor_id="ground", domain="light") == ["light.kitchen"]
+        assert index.floor_of("sensor.kitchen_temp") == "ground"
+        assert index.floor_of("light.bedroom") is None
+        assert index.floor_of("light.unknown") is None
+
+    def test_label_filter(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(label_id="night") == ["light.bedroom"]
+        assert index.entity_ids(label_id="climate", area_id="kitchen") == ["sensor.kitchen_temp"]
+
+    def test_registry_maps_built_lazily(self, states):
+        with patch(ER_GET) as er_get:
+            index = EntityIndex(_hass(states))
+            index.entity_ids(domain="light")
+        er_get.assert_not_called()
+
+
+class TestEntityIndexUpdates:
+    """Test the index follows state and registry events."""
+
+    def test_state_added(self, states):
+        index = EntityIndex(_hass(states))
+        new = State("switch.fan", "on")
+        index._async_state_changed(_event(entity_id="switch.fan", new_state=new, old_state=None))
+        assert index.entity_ids(domain="switch") == ["switch.fan"]
+        assert index.get("switch.fan") is new
+
+    def test_state_changed_moves_buckets(self, states):
+        index = EntityIndex(_hass(states))
+        new = State("light.kitchen", "off")
+        index._async_state_changed(
+            _event(entity_id="light.kitchen", new_state=new, old_state=states[1])
+        )
+        assert index.entity_ids(state="off") == ["light.bedroom", "light.kitchen"]
+        assert index.entity_ids(state="on") == []
+        assert index.get("light.kitchen") is new
+
+    def test_device_class_change_moves_buckets(self, states):
+        index = EntityIndex(_hass(states))
+        new = State("sensor.door", "off", {"device_class": "window"})
+        index._async_state_changed(_event(entity_id="sensor.door", new_state=new))
+        assert index.entity_ids(device_class="door") == []
+        assert index.entity_ids(device_class="window") == ["sensor.door"]
+
+    def test_state_removed(self, states, registries):
+        index = EntityIndex(_hass(states))
+        index.entity_ids(area_id="kitchen")
+        index._async_state_changed(_event(entity_id="light.kitchen", new_state=None))
+        assert "light.kitchen" not in index.entity_ids()
+        assert index.entity_ids(domain="light") == ["light.bedroom"]
+        assert index.entity_ids(area_id="kitchen") == ["sensor.kitchen_temp"]
+
+    def test_entity_registry_update_reindexes_entity(self, states, registries):
+        entries, _ = registries
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(area_id="bedroom") == []
+
+        entries["light.bedroom"] = Mock(area_id="bedroom", device_id=None, labels=set())
+        index._async_entity_updated(_event(action="update", entity_id="light.bedroom"))
+
+        assert index.entity_ids(area_id="bedroom") == ["light.bedroom"]
+        assert index.entity_ids(label_id="night") == []
+
+    def test_device_registry_update_reindexes_device_entities(self, states, registries):
+        _, device_registry = registries
+        index = EntityIndex(_hass(states))
+        assert index.area_of("sensor.kitchen_temp") == "kitchen"
+
+        device_registry.async_get.side_effect = {"dev1": Mock(area_id="office")}.get
+        index._async_device_updated(
+            _event(action="update", device_id="dev1", changes={"area_id": "kitchen"})
+        )
+
+        assert index.area_of("sensor.kitchen_temp") == "office"
+        assert index.floor_of("sensor.kitchen_temp") is None
+        assert index.entity_ids(area_id="kitchen") == ["light.kitchen"]
+        assert index.entity_ids(floor_id="ground") == ["light.kitchen"]
+
+    def test_unrelated_device_changes_are_ignored(self, states, registries):
+        _, device_registry = registries
+        index = EntityIndex(_hass(states))
+        index.entity_ids(area_id="kitchen")
+
+        device_registry.async_get.side_effect = {"dev1": Mock(area_id="office")}.get
+        index._async_device_updated(
+            _event(action="update", device_id="dev1", changes={"sw_version": "1.0"})
+        )
+
+        assert index.area_of("sensor.kitchen_temp") == "kitchen"
+
+    def test_area_registry_update_moves_area_to_new_floor(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.entity_ids(floor_id="ground") == ["light.kitchen", "sensor.kitchen_temp"]
+
+        kitchen = Mock(floor_id="upstairs")
+        kitchen.name = "Kitchen"
+        with patch(AR_GET) as ar_get:
+            ar_get.return_value.async_get_area.side_effect = {"kitchen": kitchen}.get
+            index._async_area_updated(_event(action="update", area_id="kitchen"))
+
+        assert index.entity_ids(floor_id="ground") == []
+        assert index.entity_ids(floor_id="upstairs") == ["light.kitchen", "sensor.kitchen_temp"]
+        assert index.floor_of("light.kitchen") == "upstairs"
+
+    def test_start_and_stop_listeners(self, states):
+        hass = _hass(states)
+        unsub = Mock()
+        hass.bus.async_listen.return_value = unsub
+        index = EntityIndex(hass)
+
+        index.async_start()
+        assert hass.bus.async_listen.call_count == 4
+
+        index.async_stop()
+        assert unsub.call_count == 4
+
+
+class TestEntityIndexSearch:
+    """Test fuzzy search over names, aliases, device and area names."""
+
+    def test_matches_alias_with_typo(self, states, registries):
+        index = EntityIndex(_hass(states))
+        (state, score), *_ = index.search("readng lamp")
+        assert state.entity_id == "light.bedroom"
+        assert 0 < score <= 1
+
+    def test_matches_device_and_area_names(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.search("aqara")[0][0].entity_id == "sensor.kitchen_temp"
+        matched = {state.entity_id for state, _ in index.search("kitchen")}
+        assert matched == {"light.kitchen", "sensor.kitchen_temp"}
+
+    def test_filters_restrict_results(self, states, registries):
+        index = EntityIndex(_hass(states))
+        results = index.search("kitchen", domain="sensor")
+        assert [state.entity_id for state, _ in results] == ["sensor.kitchen_temp"]
+
+    def test_friendly_name_change_reindexes(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.search("pantry") == []
+
+        new = State("light.kitchen", "on", {"friendly_name": "Pantry Light"})
+        index._async_state_changed(_event(entity_id="light.kitchen", new_state=new))
+
+        assert index.search("pantry")[0][0] is new
+
+    def test_area_rename_reindexes_area_entities(self, states, registries):
+        index = EntityIndex(_hass(states))
+        assert index.search("pantry") == []
+
+        pantry = Mock(floor_id="ground")
+        pantry.name = "Pantry"
+        with patch(AR_GET) as ar_get:
+            ar_get.return_value.async_get_area.side_effect = {"kitchen": pantry}.get
+            index._async_area_updated(_event(action="update", area_id="kitchen"))
+
+            matched = {state.entity_id for state, _ in index.search("pantry")}
+        assert matched == {"light.kitchen", "sensor.kitchen_temp"}
+
+    def test_new_and_removed_entities(self, states, registries):
+        index = EntityIndex(_hass(states))
+        index.search("fan")
+        new = State("fan.ceiling", "on", {"friendly_name": "Ceiling Fan"})
+        index._async_state_changed(_event(entity_id="fan.ceiling", new_state=new))
+        assert index.search("ceiling fan")[0][0] is new
+
+        index._async_state_changed(_event(entity_id="fan.ceiling", new_state=None))
+        assert index.search("ceiling fan") == []
+
+
+class TestLocationConsumers:
+    """Test the tools and resources that read entity locations from the index."""
+
+    async def test_list_entities_by_floor_with_area(self, states, registries):
+        hass = _hass(states)
+        result = await list_entities(hass, {"floor_id": "ground", "include_area": True})
+        entities = json.loads(result["content"][0]["text"])
+        assert [(e["entity_id"], e["area_id"], e["floor_id"]) for e in entities] == [
+            ("light.kitchen", "kitchen", "ground"),
+            ("sensor.kitchen_temp", "kitchen", "ground"),
+        ]
+
+    async def test_list_entities_area_fields(self, states, registries):
+        hass = _hass(states)
+        result = await list_entities(
+            hass, {"area_id": "kitchen", "fields": ["entity_id", "area_id"]}
+        )
+        assert json.loads(result["content"][0]["text"]) == [
+            {"entity_id": "light.kitchen", "area_id": "kitchen"},
+            {"entity_id": "sensor.kitchen_temp", "area_id": "kitchen"},
+        ]
+
+    async def test_search_entities_by_floor(self, states, registries):
+        hass = _hass(states)
+        result = await search_entities(hass, {"floor_id": "ground", "domain": "sensor"})
+        entities = json.loads(result["content"][0]["text"])
+        assert [(e["entity_id"], e["floor_id"]) for e in entities] == [
+            ("sensor.kitchen_temp", "ground")
+        ]
+
+    async def test_area_and_floor_resources(self, states, registries):
+        hass = _hass(states)
+        contents, next_cursor = await read_resource(hass, "hass://areas/kitchen/entities")
+        assert [e["entity_id"] for e in json.loads(contents[0]["text"])] == [
+            "light.kitchen",
+            "sensor.kitchen_temp",
+        ]
+        assert next_cursor is None
+
+        contents, next_cursor = await read_resource(
+            hass, "hass://floors/ground/entities", {"page_size": 1}
+        )
+        assert json.loads(contents[0]["text"]) == [
+            {
+                "entity_id": "light.kitchen",
+                "state": "on",
+                "friendly_name": "light.kitchen",
+                "area_id": "kitchen",
+            }
+        ]
+        assert next_cursor is not None
+
+    async def test_unknown_location_resource(self, states, registries):
+        with pytest.raises(ValueError, match="Unknown resource"):
+            await read_resource(_hass(states), "hass://areas//entities")
+
+
+class TestGetEntityIndex:
+    """Test the accessor used by tools, resources and prompts."""
+
+    def test_returns_installed_index(self, states):
+        hass = _hass(states)
+        index = EntityIndex(hass)
+        hass.data[DOMAIN] = {"entity_index": index}
+        assert get_entity_index(hass) is index
+
+    def test_builds_one_tracking_index_when_not_set_up(self, states):
+        hass = _hass(states)
+        index = get_entity_index(hass)
+        assert isinstance(index, EntityIndex)
+        assert len(index) == 4
+        assert get_entity_index(hass) is index
+        hass.states.async_all.assert_called_once()
+        hass.bus.async_listen.assert_called()
+        assert DOMAIN not in hass.data
@@ -13,6 +13,7 @@ from custom_components.mcp_server_http_transport.http import (
     _get_issuer,
     _get_protected_resource_metadata,
 )
+from custom_components.mcp_server_http_transport.json_utils import json_dumps
 
 
 def test_get_base_url_with_forwarded_headers():
@@ -239,8 +240,9 @@ class TestMCPEndpointView:
         body = json.loads(response.body)
         capabilities = body["result"]["capabilities"]
         assert "tools" in capabilities
-        assert "resources" in capabilities
+        assert capabilities["resources"] == {"subscribe": True}
         assert "prompts" in capabilities
+        assert response.headers["Mcp-Session-Id"]
 
     async def test_post_tools_list_request(self, view):
         """Test POST with tools/list request."""
@@ -255,7 +257,7 @@ class TestMCPEndpointView:
         body = json.loads(response.body)
         assert body["jsonrpc"] == "2.0"
         assert "tools" in body["result"]
-        assert len(body["result"]["tools"]) == 67
+        assert len(body["result"]["tools"]) == 74
         tool_names = [t["name"] for t in body["result"]["tools"]]
         assert "get_state" in tool_names
         assert "call_service" in tool_names
@@ -330,6 +332,464 @@ class TestMCPEndpointView:
         assert "error" in body
         assert "Unknown tool" in body["error"]["message"]
 
+    @pytest.mark.parametrize(("meta", "expected"), [({}, '{"a":1}'), ({"pretty": True}, None)])
+    async def test_tools_call_output_is_compact_unless_pretty_requested(self, view, meta, expected):
+        """Tool payloads are compact by default and indented when _meta.pretty is set."""
+
+        async def _tool(name, arguments):
+            return {"content": [{"type": "text", "text": json_dumps({"a": 1})}]}
+
+        with patch.object(view, "_call_tool", side_effect=_tool):
+            response = await view._handle_message(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "tools/call",
+                    "params": {"name": "x", "arguments": {}, "_meta": meta},
+                    "id": 1,
+                }
+            )
+
+        text = response["result"]["content"][0]["text"]
+        assert text == (expected or '{\n  "a": 1\n}')
+        # The binding does not leak past the request
+        assert json_dumps({"a": 1}) == '{"a":1}'
+
+
+class TestBatchRequests:
+    """Test JSON-RPC 2.0 batch handling in the MCP endpoint."""
+
+    @pytest.fixture
+    def view(self):
+        """Create an MCPEndpointView instance."""
+        hass = Mock()
+        hass.states = Mock()
+        hass.services = Mock()
+        return MCPEndpointView(hass, Mock())
+
+    def _request(self, body):
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token"}
+        request.json = AsyncMock(return_value=body)
+        return request
+
+    async def test_batch_returns_array_in_request_order(self, view):
+        """Each batch element is answered in one array, in request order."""
+        request = self._request(
+            [
+                {"jsonrpc": "2.0", "method": "initialize", "id": 1},
+                {"jsonrpc": "2.0", "method": "prompts/list", "id": 2},
+                {"jsonrpc": "2.0", "method": "unknown_method", "id": 3},
+            ]
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        assert [r["id"] for r in body] == [1, 2, 3]
+        assert body[0]["result"]["protocolVersion"] == "2024-11-05"
+        assert "prompts" in body[1]["result"]
+        assert body[2]["error"]["code"] == -32601
+
+    async def test_batch_omits_notifications(self, view):
+        """Notifications inside a batch produce no response entry."""
+        request = self._request(
+            [
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {"jsonrpc": "2.0", "method": "initialize", "id": 7},
+            ]
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        assert len(body) == 1
+        assert body[0]["id"] == 7
+
+    async def test_batch_of_only_notifications_returns_202(self, view):
+        """A batch containing only notifications is acknowledged with 202."""
+        request = self._request(
+            [
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {"jsonrpc": "2.0", "method": "notifications/cancelled"},
+            ]
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        assert response.status == 202
+
+    async def test_empty_batch_is_invalid_request(self, view):
+        """An empty array is answered with a single Invalid Request error."""
+        request = self._request([])
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        assert body["error"]["code"] == -32600
+        assert body["id"] is None
+
+    async def test_batch_non_object_element_is_invalid_request(self, view):
+        """Non-object batch elements get an Invalid Request error entry."""
+        request = self._request([1, {"jsonrpc": "2.0", "method": "initialize", "id": 4}])
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        assert body[0]["error"]["code"] == -32600
+        assert body[1]["id"] == 4
+
+    async def test_batch_element_error_does_not_fail_batch(self, view):
+        """A failing element yields an error entry while the others still succeed."""
+        request = self._request(
+            [
+                {
+                    "jsonrpc": "2.0",
+                    "method": "tools/call",
+                    "params": {"name": "unknown_tool", "arguments": {}},
+                    "id": 5,
+                },
+                {"jsonrpc": "2.0", "method": "initialize", "id": 6},
+            ]
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        assert body[0]["id"] == 5
+        assert body[0]["error"]["code"] == -32603
+        assert "Unknown tool" in body[0]["error"]["message"]
+        assert body[1]["result"]["serverInfo"]["name"] == "home-assistant-mcp-server"
+
+    async def test_batch_respects_concurrency_limit(self):
+        """No more than the configured number of elements are dispatched at once."""
+        import asyncio
+
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"batch_concurrency": 2}}
+        view = MCPEndpointView(hass, Mock())
+        in_flight = 0
+        peak = 0
+
+        async def fake_handle(message, session_id=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"jsonrpc": "2.0", "result": {}, "id": message["id"]}
+
+        request = self._request(
+            [{"jsonrpc": "2.0", "method": "tools/list", "id": i} for i in range(6)]
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch.object(view, "_handle_message", side_effect=fake_handle),
+        ):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        assert [r["id"] for r in body] == list(range(6))
+        assert peak == 2
+
+
+class _FakeStreamResponse:
+    """Records what a view writes to an SSE stream."""
+
+    def __init__(self, *, status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.chunks = []
+        self.eof = False
+
+    async def prepare(self, request):
+        return None
+
+    async def write(self, data):
+        self.chunks.append(data)
+
+    async def write_eof(self):
+        self.eof = True
+
+    def events(self):
+        """Decode the JSON payload of every `data:` line written."""
+        text = b"".join(self.chunks).decode()
+        return [
+            json.loads(line[len("data: ") :])
+            for line in text.splitlines()
+            if line.startswith("data: ")
+        ]
+
+
+class TestStreamableHttp:
+    """Test SSE responses on POST and the notification stream on GET."""
+
+    @pytest.fixture
+    def view(self):
+        """Create an MCPEndpointView instance."""
+        hass = Mock()
+        hass.states = Mock()
+        hass.services = Mock()
+        return MCPEndpointView(hass, Mock())
+
+    def _request(self, body, accept="application/json, text/event-stream"):
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token", "Accept": accept}
+        request.json = AsyncMock(return_value=body)
+        return request
+
+    async def test_post_with_event_stream_accept_streams_response(self, view):
+        """A client accepting SSE gets the response as an SSE event."""
+        request = self._request({"jsonrpc": "2.0", "method": "initialize", "id": 1})
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "custom_components.mcp_server_http_transport.http.web.StreamResponse",
+                _FakeStreamResponse,
+            ),
+        ):
+            response = await view.post(request)
+
+        assert isinstance(response, _FakeStreamResponse)
+        assert response.headers["Content-Type"] == "text/event-stream"
+        assert response.eof
+        events = response.events()
+        assert len(events) == 1
+        assert events[0]["id"] == 1
+        assert events[0]["result"]["protocolVersion"] == "2024-11-05"
+
+    async def test_post_without_event_stream_accept_returns_json(self, view):
+        """Clients that only accept JSON keep getting a plain JSON response."""
+        request = self._request(
+            {"jsonrpc": "2.0", "method": "initialize", "id": 1}, accept="application/json"
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        assert response.content_type == "application/json"
+
+    async def test_streamed_notification_only_returns_202(self, view):
+        """Notifications are acknowledged with 202 even when SSE is accepted."""
+        request = self._request({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        assert response.status == 202
+
+    async def test_progress_notifications_precede_result(self, view):
+        """report_progress calls become notifications/progress events for the token."""
+        from custom_components.mcp_server_http_transport.streaming import report_progress
+
+        async def fake_call_tool(name, arguments):
+            await report_progress(1, 2, "halfway")
+            return {"content": [{"type": "text", "text": "done"}]}
+
+        request = self._request(
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {
+                    "name": "get_history",
+                    "arguments": {},
+                    "_meta": {"progressToken": "tok-1"},
+                },
+                "id": 2,
+            }
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch.object(view, "_call_tool", side_effect=fake_call_tool),
+            patch(
+                "custom_components.mcp_server_http_transport.http.web.StreamResponse",
+                _FakeStreamResponse,
+            ),
+        ):
+            response = await view.post(request)
+
+        events = response.events()
+        assert events[0] == {
+            "jsonrpc": "2.0",
+            "method": "notifications/progress",
+            "params": {"progressToken": "tok-1", "progress": 1, "total": 2, "message": "halfway"},
+        }
+        assert events[1]["id"] == 2
+        assert events[1]["result"]["content"][0]["text"] == "done"
+
+    async def test_no_progress_without_token(self, view):
+        """Progress is only sent when the request carried a progressToken."""
+        from custom_components.mcp_server_http_transport.streaming import report_progress
+
+        async def fake_call_tool(name, arguments):
+            await report_progress(1, 2, "halfway")
+            return {"content": []}
+
+        request = self._request(
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {"name": "get_history", "arguments": {}},
+                "id": 3,
+            }
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch.object(view, "_call_tool", side_effect=fake_call_tool),
+            patch(
+                "custom_components.mcp_server_http_transport.http.web.StreamResponse",
+                _FakeStreamResponse,
+            ),
+        ):
+            response = await view.post(request)
+
+        events = response.events()
+        assert len(events) == 1
+        assert events[0]["id"] == 3
+
+    async def test_streamed_batch_sends_one_event_per_request(self, view):
+        """Each request in a streamed batch gets its own response event."""
+        request = self._request(
+            [
+                {"jsonrpc": "2.0", "method": "initialize", "id": 1},
+                {"jsonrpc": "2.0", "method": "notifications/initialized"},
+                {"jsonrpc": "2.0", "method": "unknown_method", "id": 2},
+            ]
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "custom_components.mcp_server_http_transport.http.web.StreamResponse",
+                _FakeStreamResponse,
+            ),
+        ):
+            response = await view.post(request)
+
+        assert sorted(e["id"] for e in response.events()) == [1, 2]
+
+    async def test_get_without_token_returns_401(self, view):
+        """The notification stream requires a valid token."""
+        request = Mock()
+        request.headers = {"Accept": "text/event-stream"}
+        request.url.origin.return_value = "https://homeassistant.local"
+
+        response = await view.get(request)
+
+        assert response.status == 401
+
+    async def test_get_without_event_stream_accept_returns_405(self):
+        """GET is only served as an SSE stream."""
+        from custom_components.mcp_server_http_transport.streaming import NotificationHub
+
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"notifications": NotificationHub()}}
+        view = MCPEndpointView(hass, Mock())
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token", "Accept": "application/json"}
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.get(request)
+
+        assert response.status == 405
+
+    async def test_get_streams_published_notifications_until_hub_closes(self):
+        """Published notifications are written as events; closing the hub ends the stream."""
+        from custom_components.mcp_server_http_transport.streaming import NotificationHub
+
+        hub = NotificationHub()
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"notifications": hub}}
+        view = MCPEndpointView(hass, Mock())
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token", "Accept": "text/event-stream"}
+
+        class _PublishingStreamResponse(_FakeStreamResponse):
+            async def prepare(self, request):
+                # The view subscribes right after prepare(); publish on the next tick.
+                import asyncio
+
+                loop = asyncio.get_running_loop()
+                loop.call_soon(hub.publish, {"jsonrpc": "2.0", "method": "notifications/test"})
+                loop.call_soon(loop.call_soon, hub.close)
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "custom_components.mcp_server_http_transport.http.web.StreamResponse",
+                _PublishingStreamResponse,
+            ),
+        ):
+            response = await view.get(request)
+
+        assert response.events() == [{"jsonrpc": "2.0", "method": "notifications/test"}]
+
+    async def test_resource_subscriptions_follow_the_session(self):
+        """resources/subscribe routes updates to the session's stream until unsubscribed."""
+        from custom_components.mcp_server_http_transport.streaming import NotificationHub
+
+        hub = NotificationHub()
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"notifications": hub}}
+        view = MCPEndpointView(hass, Mock())
+        queue = hub.subscribe("s1")
+
+        async def _post(method, headers):
+            request = Mock()
+            request.headers = {"Authorization": "Bearer valid_token", **headers}
+            request.json = AsyncMock(
+                return_value={
+                    "jsonrpc": "2.0",
+                    "method": method,
+                    "params": {"uri": "hass://areas"},
+                    "id": 1,
+                }
+            )
+            with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+                return json.loads((await view.post(request)).body)
+
+        assert (await _post("resources/subscribe", {"Mcp-Session-Id": "s1"}))["result"] == {}
+        hub.publish({"n": 1}, resource="hass://areas")
+        assert (await _post("resources/unsubscribe", {"Mcp-Session-Id": "s1"}))["result"] == {}
+        hub.publish({"n": 2}, resource="hass://areas")
+
+        assert queue.get_nowait() == {"n": 1}
+        assert queue.empty()
+
+        error = (await _post("resources/subscribe", {}))["error"]
+        assert error["code"] == -32602
+        assert not hub.is_subscribed("hass://areas")
+
+    async def test_delete_ends_the_session(self):
+        """DELETE drops the session's resource subscriptions."""
+        from custom_components.mcp_server_http_transport.streaming import NotificationHub
+
+        hub = NotificationHub()
+        hub.subscribe("s1")
+        hub.subscribe_resource("s1", "hass://areas")
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"notifications": hub}}
+        view = MCPEndpointView(hass, Mock())
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token", "Mcp-Session-Id": "s1"}
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.delete(request)
+
+        assert response.status == 200
+        assert not hub.is_subscribed("hass://areas")
+
 
 class TestIntegrationDisabledGate:
     """Regression for #37: views return 503 when the integration is unloaded.
@@ -543,6 +1003,102 @@ class TestNativeAuth:
         assert body["result"]["protocolVersion"] == "2024-11-05"
 
 
+class TestTokenCacheIntegration:
+    """Test that _validate_token uses the per-entry token cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a token cache."""
+        from custom_components.mcp_server_http_transport.token_cache import TokenCache
+
+        return TokenCache()
+
+    @pytest.fixture
+    def mock_hass(self, cache):
+        """Create a mock Home Assistant instance with a loaded token cache."""
+        hass = Mock()
+        hass.data = {"mcp_server_http_transport": {"token_cache": cache}}
+        hass.auth = Mock()
+        hass.auth.async_validate_access_token = Mock(return_value=None)
+        return hass
+
+    @pytest.fixture
+    def oidc_validator(self):
+        """Return the OIDC provider's validate_access_token, reset after the test."""
+        import sys
+
+        validator = sys.modules["custom_components.oidc_provider.token_validator"]
+        validator.validate_access_token.reset_mock()
+        yield validator.validate_access_token
+        validator.validate_access_token.return_value = None
+
+    async def test_repeat_validation_served_from_cache(self, mock_hass, cache, oidc_validator):
+        """A second request with the same OIDC token skips the validator."""
+        oidc_validator.return_value = {"sub": "cached_user"}
+        view = MCPEndpointView(mock_hass, Mock())
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer oidc"}
+        request.url.origin.return_value = "http://localhost:8123"
+
+        first = await view._validate_token(request)
+        second = await view._validate_token(request)
+
+        assert first == second == {"sub": "cached_user"}
+        oidc_validator.assert_called_once()
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    async def test_failed_validation_is_not_cached(self, mock_hass, cache):
+        """Rejected tokens are re-validated on every request."""
+        view = MCPEndpointView(mock_hass, Mock(), native_auth_enabled=True)
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer bad"}
+        request.url.origin.return_value = "http://localhost:8123"
+
+        assert await view._validate_token(request) is None
+        assert await view._validate_token(request) is None
+        assert mock_hass.auth.async_validate_access_token.call_count == 2
+        assert cache.stats()["size"] == 0
+
+    async def test_revoked_native_token_is_rejected_at_once(self, mock_hass, cache):
+        """Native tokens are not cached, so deleting one takes effect on the next request."""
+        mock_refresh_token = Mock()
+        mock_refresh_token.user.id = "user"
+        mock_hass.auth.async_validate_access_token.return_value = mock_refresh_token
+        view = MCPEndpointView(mock_hass, Mock(), native_auth_enabled=True)
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer llat"}
+        request.url.origin.return_value = "http://localhost:8123"
+
+        assert await view._validate_token(request) == {"sub": "user"}
+        mock_hass.auth.async_validate_access_token.return_value = None
+        assert await view._validate_token(request) is None
+        assert cache.stats()["size"] == 0
+
+    async def test_cache_is_keyed_on_issuer(self, mock_hass, oidc_validator):
+        """The same token presented via a different issuer is validated again."""
+        oidc_validator.return_value = {"sub": "user"}
+        view = MCPEndpointView(mock_hass, Mock())
+
+        direct = Mock()
+        direct.headers = {"Authorization": "Bearer oidc"}
+        direct.url.origin.return_value = "http://localhost:8123"
+        proxied = Mock()
+        proxied.headers = {
+            "Authorization": "Bearer oidc",
+            "X-Forwarded-Proto": "https",
+            "X-Forwarded-Host": "ha.example.com",
+        }
+
+        await view._validate_token(direct)
+        await view._validate_token(proxied)
+
+        assert oidc_validator.call_count == 2
+
+
 class TestOidcAudienceBinding:
     """Test that OIDC validation binds the token audience to this resource."""
 
@@ -128,8 +128,10 @@ def mock_area_registry():
     area_kitchen.name = "Kitchen"
     area_kitchen.floor_id = "ground_floor"
 
+    areas = [area_living, area_bedroom, area_kitchen]
     registry = Mock()
-    registry.async_list_areas.return_value = [area_living, area_bedroom, area_kitchen]
+    registry.async_list_areas.return_value = areas
+    registry.async_get_area = Mock(side_effect={a.id: a for a in areas}.get)
     return registry
 
 
@@ -245,7 +247,7 @@ class TestMCPClientSession:
         # Step 2: Discover tools
         result = await self._call(view, "tools/list", msg_id=2)
         tool_names = [t["name"] for t in result["result"]["tools"]]
-        assert len(tool_names) == 67
+        assert len(tool_names) == 74
         # Verify all tools have required schema fields
         for tool in result["result"]["tools"]:
             assert "name" in tool
@@ -255,8 +257,8 @@ class TestMCPClientSession:
 
         # Step 3: Discover resources
         result = await self._call(view, "resources/list", msg_id=3)
-        assert len(result["result"]["resources"]) == 8
-        assert len(result["result"]["resourceTemplates"]) == 3
+        assert len(result["result"]["resources"]) == 9
+        assert len(result["result"]["resourceTemplates"]) == 6
 
         # Step 4: Discover prompts
         result = await self._call(view, "prompts/list", msg_id=4)
@@ -1254,13 +1256,19 @@ class TestMCPClientSession:
         assert "Successfully fired event" in result["result"]["content"][0]["text"]
         populated_hass.bus.async_fire.assert_called_once_with("test_event", {"source": "test"})
 
-    async def test_search_entities_by_query(self, view, populated_hass, mock_entity_registry):
+    async def test_search_entities_by_query(
+        self, view, populated_hass, mock_entity_registry, mock_area_registry
+    ):
         """Test searching entities by friendly name."""
         with (
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_entity_registry,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1277,7 +1285,7 @@ class TestMCPClientSession:
         assert "light.bedroom" in entity_ids
 
     async def test_search_entities_by_device_class(
-        self, view, populated_hass, mock_entity_registry
+        self, view, populated_hass, mock_entity_registry, mock_area_registry
     ):
         """Test searching entities by device class."""
         with (
@@ -1285,6 +1293,10 @@ class TestMCPClientSession:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_entity_registry,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1304,13 +1316,19 @@ class TestMCPClientSession:
         assert data[0]["entity_id"] == "sensor.temperature"
         assert data[0]["device_class"] == "temperature"
 
-    async def test_search_entities_by_alias(self, view, populated_hass, mock_entity_registry):
+    async def test_search_entities_by_alias(
+        self, view, populated_hass, mock_entity_registry, mock_area_registry
+    ):
         """Test searching entities matches aliases."""
         with (
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_entity_registry,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1326,6 +1344,35 @@ class TestMCPClientSession:
         assert len(data) == 1
         assert data[0]["entity_id"] == "light.living_room"
 
+    async def test_search_entities_tolerates_typos_and_ranks(
+        self, view, populated_hass, mock_entity_registry, mock_area_registry
+    ):
+        """Test a misspelled query finds the entity and ranks it first."""
+        with (
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
+                return_value=mock_entity_registry,
+            ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
+                return_value=Mock(),
+            ),
+        ):
+            result = await self._call(
+                view,
+                "tools/call",
+                {"name": "search_entities", "arguments": {"query": "livng room lamp"}},
+                msg_id=204,
+            )
+        data = json.loads(result["result"]["content"][0]["text"])
+        assert data[0]["entity_id"] == "light.living_room"
+        scores = [e["score"] for e in data]
+        assert scores == sorted(scores, reverse=True)
+
     # ── New resources: devices, services, floors ─────────────────────
 
     async def test_devices_consistency_across_tools_and_resources(self, view, mock_device_registry):
@@ -1672,7 +1719,7 @@ class TestMCPClientSession:
             populated_hass.bus.async_fire.assert_not_called()
 
     async def test_search_entities_by_area(
-        self, view, populated_hass, mock_entity_registry, mock_device_registry
+        self, view, populated_hass, mock_entity_registry, mock_device_registry, mock_area_registry
     ):
         """Test searching entities by area_id including device fallback."""
         with (
@@ -1680,6 +1727,10 @@ class TestMCPClientSession:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_entity_registry,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=mock_device_registry,
@@ -1698,13 +1749,19 @@ class TestMCPClientSession:
         for entry in data:
             assert entry["area_id"] == "bedroom"
 
-    async def test_search_entities_limit(self, view, populated_hass, mock_entity_registry):
+    async def test_search_entities_limit(
+        self, view, populated_hass, mock_entity_registry, mock_area_registry
+    ):
         """Test that search_entities respects the limit parameter."""
         with (
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_entity_registry,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.entity_index.ar.async_get",
+                return_value=mock_area_registry,
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1757,18 +1814,180 @@ class TestMCPClientSession:
         data = json.loads(result["result"]["content"][0]["text"])
         assert isinstance(data, list)
 
+    async def test_get_logbook_paginates_by_time(self, view, populated_hass):
+        """Test logbook pages continue after the last entry, including same-time entries."""
+        times = ["00:01", "00:02", "00:02", "00:02", "00:03"]
+        events = [
+            {"when": f"2024-01-01T{t}:00+00:00", "message": f"event {i}"}
+            for i, t in enumerate(times)
+        ]
+
+        async def _get_events(func, start_time, end_time):
+            # The recorder only returns entries strictly after start_time
+            return [e for e in events if datetime.fromisoformat(e["when"]) > start_time]
+
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = AsyncMock(side_effect=_get_events)
+
+        messages, arguments = [], {"start_time": "2024-01-01T00:00:00+00:00", "page_size": 2}
+        with (
+            patch("homeassistant.components.logbook.processor.EventProcessor"),
+            patch(
+                "homeassistant.components.recorder.get_instance",
+                return_value=mock_recorder,
+            ),
+        ):
+            for msg_id in range(410, 420):
+                result = await self._call(
+                    view, "tools/call", {"name": "get_logbook", "arguments": arguments}, msg_id
+                )
+                content = result["result"]["content"]
+                messages.extend(e["message"] for e in json.loads(content[0]["text"]))
+                if len(content) == 1:
+                    break
+                arguments = {**arguments, "cursor": json.loads(content[1]["text"])["nextCursor"]}
+
+        assert messages == [f"event {i}" for i in range(5)]
+
+    # ── Pagination ───────────────────────────────────────────────────
+
+    async def test_list_entities_pages_follow_next_cursor(self, view, mock_entity_registry):
+        """Test list_entities pages cover every entity once, in entity_id order."""
+        entity_ids, arguments = [], {"page_size": 2}
+        with patch(
+            "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
+            return_value=mock_entity_registry,
+        ):
+            for msg_id in range(420, 430):
+                result = await self._call(
+                    view, "tools/call", {"name": "list_entities", "arguments": arguments}, msg_id
+                )
+                content = result["result"]["content"]
+                page = json.loads(content[0]["text"])
+                assert len(page) <= 2
+                entity_ids.extend(e["entity_id"] for e in page)
+                if len(content) == 1:
+                    break
+                arguments = {"page_size": 2, "cursor": json.loads(content[1]["text"])["nextCursor"]}
+
+        assert entity_ids == sorted(entity_ids)
+        assert len(entity_ids) == 5
+
+    async def test_list_entities_cursor_survives_removed_entities(
+        self, view, populated_hass, mock_entity_registry
+    ):
+        """Test a cursor still continues after its entity when earlier entities go away."""
+        with patch(
+            "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
+            return_value=mock_entity_registry,
+        ):
+            result = await self._call(
+                view, "tools/call", {"name": "list_entities", "arguments": {"page_size": 2}}
+            )
+            content = result["result"]["content"]
+            first = [e["entity_id"] for e in json.loads(content[0]["text"])]
+            cursor = json.loads(content[1]["text"])["nextCursor"]
+
+            all_states = populated_hass.states.async_all.return_value
+            populated_hass.states.async_all.return_value = [
+                s for s in all_states if s.entity_id not in first
+            ]
+            result = await self._call(
+                view,
+                "tools/call",
+                {"name": "list_entities", "arguments": {"page_size": 2, "cursor": cursor}},
+                msg_id=2,
+            )
+        second = [e["entity_id"] for e in json.loads(result["result"]["content"][0]["text"])]
+        expected = sorted(s.entity_id for s in all_states)[2:4]
+        assert second == expected
+
+    async def test_entities_resource_returns_next_cursor(self, view):
+        """Test resources/read pages hass://entities with cursor and page_size params."""
+        result = await self._call(
+            view, "resources/read", {"uri": "hass://entities", "page_size": 3}, msg_id=430
+        )
+        first = json.loads(result["result"]["contents"][0]["text"])
+        cursor = result["result"]["nextCursor"]
+        assert sum(len(entities) for entities in first.values()) == 3
+
+        result = await self._call(
+            view,
+            "resources/read",
+            {"uri": "hass://entities", "page_size": 3, "cursor": cursor},
+            msg_id=431,
+        )
+        second = json.loads(result["result"]["contents"][0]["text"])
+        assert "nextCursor" not in result["result"]
+        ids = [e["entity_id"] for page in (first, second) for es in page.values() for e in es]
+        assert len(ids) == 5
+        assert ids == sorted(ids)
+
+    async def test_list_entities_table_format(self, view, mock_entity_registry):
+        """Test list_entities returns columns and rows, paged like the object format."""
+        with patch(
+            "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
+            return_value=mock_entity_registry,
+        ):
+            objects = await self._call(
+                view, "tools/call", {"name": "list_entities", "arguments": {}}, msg_id=433
+            )
+            table = await self._call(
+                view,
+                "tools/call",
+                {"name": "list_entities", "arguments": {"format": "table", "page_size": 3}},
+                msg_id=434,
+            )
+        records = json.loads(objects["result"]["content"][0]["text"])
+        content = table["result"]["content"]
+        data = json.loads(content[0]["text"])
+        assert data["columns"] == ["entity_id", "state", "friendly_name", "aliases"]
+        assert data["rows"] == [list(r.values()) for r in records[:3]]
+        assert "nextCursor" in json.loads(content[1]["text"])
+
+    @pytest.mark.parametrize(
+        ("tool", "arguments"),
+        [
+            ("list_entities", {}),
+            ("list_devices", {}),
+            ("search_entities", {"query": "light"}),
+            ("batch_get_state", {"entity_ids": ["light.living_room"]}),
+            ("get_history", {"entity_id": "light.living_room", "start_time": "2024-01-01"}),
+        ],
+    )
+    async def test_unknown_format_is_a_tool_error(self, view, tool, arguments):
+        """Test an unknown format is reported in the tool result, not as an internal error."""
+        result = await self._call(
+            view,
+            "tools/call",
+            {"name": tool, "arguments": {**arguments, "format": "csv"}},
+            msg_id=435,
+        )
+        assert "error" not in result
+        assert result["result"]["content"][0]["text"] == (
+            "Error: Unknown format 'csv', expected one of objects, table, dictionary"
+        )
+
+    async def test_invalid_cursor_is_invalid_params(self, view, mock_device_registry):
+        """Test a malformed cursor returns a JSON-RPC invalid params error."""
+        with patch(
+            "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
+            return_value=mock_device_registry,
+        ):
+            result = await self._call(
+                view,
+                "tools/call",
+                {"name": "list_devices", "arguments": {"cursor": "garbage!"}},
+                msg_id=432,
+            )
+        assert result["error"]["code"] == -32602
+        assert result["id"] == 432
+
     async def test_energy_report_prompt(self, view, populated_hass):
         """Test energy_report prompt gathers energy entities and history."""
-        mock_history_state = Mock()
-        mock_history_state.state = "100"
-        mock_history_state.attributes = {
-            "friendly_name": "Energy",
-            "unit_of_measurement": "kWh",
-        }
-
         mock_recorder = Mock()
         mock_recorder.async_add_executor_job = AsyncMock(
-            return_value={"sensor.temperature": [mock_history_state]}
+            return_value={"sensor.temperature": [{"start": 1704067200.0, "mean": 21.5, "max": 23}]}
         )
 
         with patch(
@@ -1,11 +1,18 @@
-"""Tests for the shared _HAJSONEncoder."""
+"""Tests for the shared JSON helpers."""
 
 import json
-from datetime import date, datetime
+from datetime import UTC, date, datetime
+from unittest.mock import patch
 
 import pytest
 
-from custom_components.mcp_server_http_transport.json_utils import _HAJSONEncoder
+from custom_components.mcp_server_http_transport import json_utils
+from custom_components.mcp_server_http_transport.json_utils import (
+    _HAJSONEncoder,
+    json_dumps,
+    reset_indent,
+    set_indent,
+)
 
 
 class TestHAJSONEncoder:
@@ -54,3 +61,54 @@ class TestHAJSONEncoder:
 
         with pytest.raises(TypeError):
             json.dumps(CustomType(), cls=_HAJSONEncoder)
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def engine(request):
+    """Run a test against both the orjson path and the stdlib fallback."""
+    if request.param == "stdlib":
+        with patch.object(json_utils, "orjson", None):
+            yield request.param
+    else:
+        yield request.param
+
+
+class TestJsonDumps:
+    """Test json_dumps matches _HAJSONEncoder output on both engines."""
+
+    def test_compact_by_default(self, engine):
+        text = json_dumps({"a": [1, 2], "b": "x"})
+        assert "\n" not in text
+        assert json.loads(text) == {"a": [1, 2], "b": "x"}
+
+    def test_encodes_datetime_like_encoder(self, engine):
+        value = {"naive": datetime(2024, 6, 15, 8, 30, 45, 123456), "day": date(2024, 6, 15)}
+        value["aware"] = datetime(2024, 6, 15, 8, 30, tzinfo=UTC)
+        assert json.loads(json_dumps(value)) == json.loads(json.dumps(value, cls=_HAJSONEncoder))
+
+    def test_encodes_string_set_as_sorted_array(self, engine):
+        assert json.loads(json_dumps({"scenes": {"b", "c", "a"}})) == {"scenes": ["a", "b", "c"]}
+
+    def test_encodes_non_string_keys(self, engine):
+        assert json.loads(json_dumps({1: "one"})) == {"1": "one"}
+
+    def test_explicit_indent(self, engine):
+        assert json_dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+    def test_request_bound_indent(self, engine):
+        token = set_indent(2)
+        try:
+            assert json_dumps({"a": 1}) == '{\n  "a": 1\n}'
+        finally:
+            reset_indent(token)
+        assert "\n" not in json_dumps({"a": 1})
+
+    def test_falls_back_to_stdlib_for_big_integers(self, engine):
+        assert json.loads(json_dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_raises_type_error_for_unhandled_types(self, engine):
+        class CustomType:
+            pass
+
+        with pytest.raises(TypeError):
+            json_dumps(CustomType())
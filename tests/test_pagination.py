@@ -0,0 +1,103 @@
+"""Tests for cursor pagination."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.mcp_server_http_transport.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    device_sort_key,
+    encode_cursor,
+    entity_sort_key,
+    page_content,
+    paginate,
+)
+
+ITEMS = [f"light.lamp_{i:02d}" for i in range(10)]
+
+
+def _key(item):
+    return item
+
+
+class TestPaginate:
+    """Test paging over sorted items."""
+
+    def test_pages_cover_every_item_once(self):
+        seen, arguments = [], {"page_size": 3}
+        while True:
+            page, cursor = paginate(ITEMS, _key, arguments)
+            seen.extend(page)
+            if cursor is None:
+                break
+            arguments = {"page_size": 3, "cursor": cursor}
+        assert seen == ITEMS
+
+    def test_last_full_page_has_no_cursor(self):
+        page, cursor = paginate(ITEMS, _key, {"page_size": 10})
+        assert page == ITEMS
+        assert cursor is None
+
+    def test_cursor_survives_changes_before_it(self):
+        page, cursor = paginate(ITEMS, _key, {"page_size": 4})
+        changed = [item for item in ITEMS if item != page[0]] + ["light.lamp_99"]
+        next_page, _ = paginate(changed, _key, {"page_size": 4, "cursor": cursor})
+        assert next_page == ITEMS[4:8]
+
+    def test_cursor_survives_removal_of_its_item(self):
+        _, cursor = paginate(ITEMS, _key, {"page_size": 4})
+        changed = [item for item in ITEMS if item != ITEMS[3]]
+        next_page, _ = paginate(changed, _key, {"page_size": 2, "cursor": cursor})
+        assert next_page == ITEMS[4:6]
+
+    def test_tuple_keys(self):
+        pairs = [("light", "toggle"), ("light", "turn_on"), ("switch", "turn_on")]
+        page, cursor = paginate(pairs, tuple, {"page_size": 1})
+        assert page == [("light", "toggle")]
+        page, _ = paginate(pairs, tuple, {"page_size": 5, "cursor": cursor})
+        assert page == pairs[1:]
+
+    def test_page_size_defaults_and_cap(self):
+        items = [f"sensor.s{i:05d}" for i in range(MAX_PAGE_SIZE + 5)]
+        assert len(paginate(items, _key, {})[0]) == DEFAULT_PAGE_SIZE
+        assert len(paginate(items, _key, {"page_size": 10**6})[0]) == MAX_PAGE_SIZE
+
+    @pytest.mark.parametrize("size", [0, -1, "10", True])
+    def test_invalid_page_size(self, size):
+        with pytest.raises(InvalidCursorError):
+            paginate(ITEMS, _key, {"page_size": size})
+
+    @pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor(5)])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            paginate(ITEMS, _key, {"cursor": cursor})
+
+
+class TestSortKeys:
+    """Test the keys entity and device listings are paged by."""
+
+    def test_entity_cursor_continues_after_state(self):
+        states = [State(entity_id, "on") for entity_id in ITEMS]
+        page, cursor = paginate(states, entity_sort_key, {"page_size": 4})
+        assert cursor == encode_cursor("light.lamp_03")
+        page, _ = paginate(states, entity_sort_key, {"page_size": 4, "cursor": cursor})
+        assert page[0].entity_id == "light.lamp_04"
+
+    def test_device_key_is_its_id(self):
+        assert device_sort_key(Mock(id="abc")) == "abc"
+
+
+class TestPageContent:
+    """Test the tool result for a page."""
+
+    def test_without_next_page(self):
+        assert page_content([1, 2], None) == {"content": [{"type": "text", "text": "[1,2]"}]}
+
+    def test_with_next_page(self):
+        content = page_content([1, 2], "abc")["content"]
+        assert json.loads(content[0]["text"]) == [1, 2]
+        assert json.loads(content[1]["text"]) == {"nextCursor": "abc"}
@@ -1,7 +1,9 @@
 """Tests for prompt-related MCP endpoints."""
 
+import asyncio
 import json
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -121,14 +123,13 @@ class TestPrompts:
 
     async def test_post_prompts_get_daily_summary(self, view, mock_hass):
         """Test POST with prompts/get for daily_summary."""
-        mock_state1 = Mock()
-        mock_state1.state = "on"
-        mock_state2 = Mock()
-        mock_state2.state = "off"
+        mock_hass.states.get.side_effect = lambda entity_id: (
+            Mock(state="off") if entity_id == "light.living_room" else None
+        )
 
         mock_recorder = Mock()
         mock_recorder.async_add_executor_job = AsyncMock(
-            return_value={"light.living_room": [mock_state1, mock_state2]}
+            return_value={"light.living_room": 1, "light.removed": 3}
         )
 
         request = Mock()
@@ -155,7 +156,175 @@ class TestPrompts:
         body = json.loads(response.body)
         result = body["result"]
         assert "Daily summary" in result["description"]
-        assert "light.living_room" in result["messages"][0]["content"]["text"]
+        text = result["messages"][0]["content"]["text"]
+        # Most changes first; current state only for entities that still exist
+        assert (
+            "- light.removed: 3 change(s)\n- light.living_room: 1 change(s), currently 'off'"
+            in (text)
+        )
+
+    async def test_post_prompts_get_daily_summary_timeout(self, view, mock_hass):
+        """Test daily_summary answers without the counts when the recorder is slow."""
+
+        release = asyncio.Event()
+
+        async def _slow(*args):
+            await release.wait()
+            return {}
+
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = _slow
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token"}
+        request.json = AsyncMock(
+            return_value={
+                "jsonrpc": "2.0",
+                "method": "prompts/get",
+                "params": {"name": "daily_summary", "arguments": {}},
+                "id": 33,
+            }
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "homeassistant.components.recorder.get_instance",
+                return_value=mock_recorder,
+            ),
+            patch(
+                "custom_components.mcp_server_http_transport.prompts.reporting."
+                "PROMPT_RECORDER_TIMEOUT",
+                0.01,
+            ),
+        ):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        text = body["result"]["messages"][0]["content"]["text"]
+        assert "did not count state changes within 0.01 seconds" in text
+
+        # The query keeps running after the timeout, until the recorder answers
+        from custom_components.mcp_server_http_transport.history import _RUNNING_COUNTS
+
+        running = _RUNNING_COUNTS[mock_hass]
+        release.set()
+        assert await running == {}
+
+    def test_count_state_changes_in_database(self):
+        """Test state changes are counted by the database, not attribute-only updates."""
+        from homeassistant.components.recorder.db_schema import Base, States, StatesMeta
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from custom_components.mcp_server_http_transport.history import (
+            _count_state_changes,
+            _state_changes_query,
+        )
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        at = start.timestamp()
+        with Session(engine) as session:
+            session.add_all(
+                [
+                    StatesMeta(metadata_id=1, entity_id="light.a"),
+                    StatesMeta(metadata_id=2, entity_id="sensor.b"),
+                    # Before the window
+                    States(metadata_id=1, state="on", last_updated_ts=at - 60),
+                    States(metadata_id=1, state="off", last_updated_ts=at + 60),
+                    States(metadata_id=1, state="on", last_updated_ts=at + 120),
+                    # Attributes changed, state kept
+                    States(
+                        metadata_id=1,
+                        state="on",
+                        last_updated_ts=at + 180,
+                        last_changed_ts=at + 120,
+                    ),
+                    States(metadata_id=2, state="20", last_updated_ts=at + 60),
+                ]
+            )
+            session.commit()
+
+        @contextmanager
+        def _session_scope(**kwargs):
+            with Session(engine) as session:
+                yield session
+
+        with patch("homeassistant.helpers.recorder.session_scope", _session_scope):
+            counts = _count_state_changes(
+                Mock(), _state_changes_query(start, start + timedelta(days=1))
+            )
+        assert counts == {"light.a": 2, "sensor.b": 1}
+
+    async def test_count_state_changes_without_schema(self):
+        """Test state changes are counted from the history when the schema import fails."""
+        from custom_components.mcp_server_http_transport.history import (
+            async_count_state_changes,
+        )
+
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = AsyncMock(
+            return_value={
+                "light.a": [
+                    {"state": "on", "last_changed": "a"},
+                    {"state": "off", "last_changed": "b"},
+                    {"state": "on", "last_changed": "c"},
+                ],
+                "sensor.b": [{"state": "20", "last_changed": "a"}],
+            }
+        )
+
+        with (
+            patch.dict("sys.modules", {"homeassistant.components.recorder.db_schema": None}),
+            patch(
+                "homeassistant.components.recorder.get_instance",
+                return_value=mock_recorder,
+            ),
+        ):
+            counts = await async_count_state_changes(Mock(), start, start + timedelta(days=1))
+
+        assert counts == {"light.a": 2}
+        args = mock_recorder.async_add_executor_job.call_args.args
+        # minimal_response and no_attributes
+        assert args[-2:] == (True, True)
+
+    async def test_count_state_changes_shares_running_query(self):
+        """Test a count left running after a timeout is shared, not started again."""
+        from custom_components.mcp_server_http_transport.history import (
+            async_count_state_changes,
+        )
+
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        release = asyncio.Event()
+        calls = []
+
+        async def _query(*args):
+            calls.append(args)
+            await release.wait()
+            return {"light.a": 1}
+
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = _query
+        hass = Mock()
+
+        with patch(
+            "homeassistant.components.recorder.get_instance",
+            return_value=mock_recorder,
+        ):
+            with pytest.raises(TimeoutError):
+                async with asyncio.timeout(0.01):
+                    await async_count_state_changes(hass, start, start + timedelta(days=1))
+            waiting = asyncio.create_task(
+                async_count_state_changes(hass, start, start + timedelta(days=2))
+            )
+            await asyncio.sleep(0)
+            release.set()
+            assert await waiting == {"light.a": 1}
+
+        assert len(calls) == 1
 
     async def test_post_prompts_get_daily_summary_recorder_error(self, view, mock_hass):
         """Test POST with prompts/get for daily_summary when recorder fails."""
@@ -324,16 +493,26 @@ class TestPrompts:
         }
         mock_hass.states.async_all.return_value = [mock_state]
 
-        mock_history_state = Mock()
-        mock_history_state.state = "100"
-        mock_history_state.attributes = {
-            "friendly_name": "Energy",
-            "unit_of_measurement": "kWh",
-        }
+        power_state = Mock()
+        power_state.entity_id = "sensor.power"
+        power_state.state = "300"
+        power_state.attributes = {"friendly_name": "Power", "unit_of_measurement": "W"}
+        mock_hass.states.async_all.return_value = [mock_state, power_state]
 
+        start = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
         mock_recorder = Mock()
         mock_recorder.async_add_executor_job = AsyncMock(
-            return_value={"sensor.energy": [mock_history_state]}
+            return_value={
+                "sensor.energy": [
+                    {"start": start, "change": 1.5},
+                    {"start": start + 3600, "change": 2.5},
+                    {"start": start + 7200, "change": None},
+                ],
+                "sensor.power": [
+                    {"start": start, "mean": 200.0, "max": 900.0},
+                    {"start": start + 3600, "mean": 400.0, "max": 1200.0},
+                ],
+            }
         )
 
         request = Mock()
@@ -344,7 +523,10 @@ class TestPrompts:
                 "method": "prompts/get",
                 "params": {
                     "name": "energy_report",
-                    "arguments": {"start_time": "2024-01-01T00:00:00"},
+                    "arguments": {
+                        "start_time": "2024-01-01T00:00:00+00:00",
+                        "end_time": "2024-01-02T00:00:00+00:00",
+                    },
                 },
                 "id": 92,
             }
@@ -362,7 +544,20 @@ class TestPrompts:
         assert response.status == 200
         body = json.loads(response.body)
         text = body["result"]["messages"][0]["content"]["text"]
-        assert "energy" in text.lower()
+        assert (
+            "- sensor.energy (Energy): total 4 kWh, peak 2.5 kWh in the hour from "
+            "2024-01-01T01:00:00+00:00, current: 100 kWh"
+        ) in text
+        assert "- sensor.power (Power): average 300 W, max 1200 W, current: 300 W" in text
+
+        # One hourly statistics query for both entities
+        args = mock_recorder.async_add_executor_job.await_args.args
+        assert args[4:] == (
+            {"sensor.energy", "sensor.power"},
+            "hour",
+            None,
+            {"change", "mean", "max"},
+        )
 
     async def test_post_prompts_get_energy_report_no_entities(self, view, mock_hass):
         """Test energy_report when no energy entities exist."""
@@ -438,6 +633,58 @@ class TestPrompts:
         body = json.loads(response.body)
         text = body["result"]["messages"][0]["content"]["text"]
         assert "Unable to retrieve" in text
+        # The failure came from the recorder, not from the time range
+        mock_recorder.async_add_executor_job.assert_awaited_once()
+
+    async def test_post_prompts_get_energy_report_naive_times(self, view, mock_hass):
+        """Test energy_report with start and end times without a timezone."""
+        mock_state = Mock()
+        mock_state.entity_id = "sensor.energy"
+        mock_state.state = "100"
+        mock_state.attributes = {
+            "friendly_name": "Energy",
+            "device_class": "energy",
+            "unit_of_measurement": "kWh",
+        }
+        mock_hass.states.async_all.return_value = [mock_state]
+
+        start = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+        mock_recorder = Mock()
+        mock_recorder.async_add_executor_job = AsyncMock(
+            return_value={"sensor.energy": [{"start": start, "change": 1.5}]}
+        )
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token"}
+        request.json = AsyncMock(
+            return_value={
+                "jsonrpc": "2.0",
+                "method": "prompts/get",
+                "params": {
+                    "name": "energy_report",
+                    "arguments": {"start_time": "2024-01-01T00:00:00"},
+                },
+                "id": 95,
+            }
+        )
+
+        with (
+            patch.object(view, "_validate_token", return_value={"sub": "user123"}),
+            patch(
+                "homeassistant.components.recorder.get_instance",
+                return_value=mock_recorder,
+            ),
+        ):
+            response = await view.post(request)
+
+        assert response.status == 200
+        body = json.loads(response.body)
+        text = body["result"]["messages"][0]["content"]["text"]
+        assert "- sensor.energy (Energy): total 1.5 kWh" in text
+        # Both times reach the recorder in UTC
+        args = mock_recorder.async_add_executor_job.await_args.args
+        assert args[2] == datetime(2024, 1, 1, tzinfo=UTC)
+        assert args[3].tzinfo is not None
 
     async def test_post_prompts_get_setup_guide_entity_not_found(self, view, mock_hass):
         """Test setup_guide when entity does not exist."""
@@ -807,11 +1054,11 @@ class TestPrompts:
                 return_value=mock_area_registry,
             ),
             patch(
-                "custom_components.mcp_server_http_transport.prompts.workflows.dr.async_get",
+                "custom_components.mcp_server_http_transport.entity_index.dr.async_get",
                 return_value=Mock(),
             ),
             patch(
-                "custom_components.mcp_server_http_transport.prompts.workflows.er.async_get",
+                "custom_components.mcp_server_http_transport.entity_index.er.async_get",
                 return_value=mock_entity_registry,
             ),
         ):
@@ -1141,11 +1388,11 @@ class TestPrompts:
                 return_value=mock_area_registry,
             ),
             patch(
-                "custom_components.mcp_server_http_transport.prompts.workflows.dr.async_get",
+                "custom_components.mcp_server_http_transport.entity_index.dr.async_get",
                 return_value=mock_device_registry,
             ),
             patch(
-                "custom_components.mcp_server_http_transport.prompts.workflows.er.async_get",
+                "custom_components.mcp_server_http_transport.entity_index.er.async_get",
                 return_value=mock_entity_registry,
             ),
         ):
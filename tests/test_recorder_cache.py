@@ -0,0 +1,189 @@
+"""Tests for the recorder query cache."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.mcp_server_http_transport.const import (
+    DEFAULT_RECORDER_CACHE_BYTES,
+    DOMAIN,
+)
+from custom_components.mcp_server_http_transport.json_utils import (
+    json_dumps,
+    reset_indent,
+    set_indent,
+)
+from custom_components.mcp_server_http_transport.recorder_cache import (
+    RecorderCache,
+    _result_size,
+    async_cached_query,
+)
+from custom_components.mcp_server_http_transport.tools.statistics import get_statistics
+
+GET_INSTANCE = "homeassistant.components.recorder.get_instance"
+
+
+@pytest.fixture
+def hass():
+    hass = Mock()
+    hass.data = {}
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+@pytest.fixture
+def cache(hass):
+    cache = RecorderCache(hass)
+    hass.data[DOMAIN] = {"recorder_cache": cache}
+    return cache
+
+
+@pytest.fixture
+def recorder():
+    with patch(GET_INSTANCE, return_value=Mock(keep_days=10)) as get_instance:
+        yield get_instance.return_value
+
+
+def _days_ago(days):
+    return dt_util.utcnow() - timedelta(days=days)
+
+
+def _event(**data):
+    return Mock(data=data)
+
+
+class TestRecorderCache:
+    """Test the LRU and its invalidation."""
+
+    def test_hit_and_miss(self, hass):
+        cache = RecorderCache(hass)
+        assert cache.get("a") is None
+        cache.set("a", None, [1, 2], 5)
+        assert cache.get("a") == [1, 2]
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "bytes": 5,
+            "max_bytes": DEFAULT_RECORDER_CACHE_BYTES,
+        }
+
+    def test_evicts_least_recently_used_within_byte_budget(self, hass):
+        cache = RecorderCache(hass, max_bytes=10)
+        cache.set("a", None, "aaa", 5)
+        cache.set("b", None, "bbb", 5)
+        cache.get("a")
+        cache.set("c", None, "ccc", 5)
+        assert cache.get("b") is None
+        assert cache.get("a") == "aaa"
+        assert cache.stats()["bytes"] == 10
+
+    def test_oversized_result_not_cached(self, hass):
+        cache = RecorderCache(hass, max_bytes=4)
+        cache.set("a", None, "aaaa", 6)
+        assert cache.stats()["size"] == 0
+
+    def test_purged_window_dropped(self, hass):
+        cache = RecorderCache(hass)
+        cache.set("a", _days_ago(5), [1], 3)
+        assert cache.get("a", purged_before=_days_ago(6)) == [1]
+        assert cache.get("a", purged_before=_days_ago(4)) is None
+        assert cache.stats()["size"] == 0
+
+    def test_purge_service_clears(self, hass):
+        cache = RecorderCache(hass)
+        cache.set("a", None, [1], 3)
+        cache._async_service_called(_event(domain="light", service="turn_on"))
+        assert cache.stats()["size"] == 1
+        cache._async_service_called(_event(domain="recorder", service="purge_entities"))
+        assert cache.stats()["size"] == cache.stats()["bytes"] == 0
+
+    def test_start_and_stop(self, hass):
+        unsub = Mock()
+        hass.bus.async_listen.return_value = unsub
+        cache = RecorderCache(hass)
+        cache.async_start()
+        cache.async_stop()
+        unsub.assert_called_once()
+
+
+class TestResultSize:
+    """Test the size estimate of query results."""
+
+    def test_close_to_compact_json_of_alike_rows(self):
+        rows = [
+            {"state": str(i % 10), "last_changed": "2024-01-01T00:00:00+00:00"} for i in range(100)
+        ]
+        result = {"sensor.a": rows, "sensor.b": rows[:10]}
+        actual = len(json_dumps(result, indent=None))
+        assert abs(_result_size(result) - actual) < actual * 0.05
+
+    def test_does_not_depend_on_request_indent(self):
+        result = {"sensor.a": [{"state": "1"}, {"state": "2"}]}
+        token = set_indent(2)
+        try:
+            pretty = _result_size(result)
+        finally:
+            reset_indent(token)
+        assert pretty == _result_size(result)
+
+    def test_history_series_counted_by_middle_row(self):
+        # Only the first and last rows carry attributes
+        plain = {"state": "1", "last_changed": "2024-01-01T00:00:00+00:00"}
+        full = {**plain, "attributes": {"friendly_name": "x" * 1000}}
+        rows = [full, *([plain] * 98), full]
+        assert _result_size(rows) < 10000
+
+
+class TestCachedQuery:
+    """Test which windows are cached."""
+
+    async def test_closed_window_fetched_once(self, hass, cache, recorder):
+        fetch = AsyncMock(return_value={"sensor.a": []})
+        start, end = _days_ago(3), _days_ago(2)
+        for _ in range(2):
+            result = await async_cached_query(hass, ("k",), start, end, fetch)
+        assert result == {"sensor.a": []}
+        fetch.assert_awaited_once()
+        assert cache.stats()["hits"] == 1
+        # Sized in the executor, off the event loop
+        hass.async_add_executor_job.assert_awaited_once_with(_result_size, {"sensor.a": []})
+
+    async def test_open_window_not_cached(self, hass, cache, recorder):
+        fetch = AsyncMock(return_value=[])
+        end = dt_util.utcnow() - timedelta(seconds=5)
+        for _ in range(2):
+            await async_cached_query(hass, ("k",), _days_ago(1), end, fetch)
+        assert fetch.await_count == 2
+        assert cache.stats()["size"] == 0
+
+    async def test_window_past_keep_days_not_cached(self, hass, cache, recorder):
+        fetch = AsyncMock(return_value=[])
+        await async_cached_query(hass, ("k",), _days_ago(11), _days_ago(9), fetch)
+        assert cache.stats()["size"] == 0
+
+    async def test_without_cache(self, hass, recorder):
+        fetch = AsyncMock(return_value=[])
+        await async_cached_query(hass, ("k",), _days_ago(3), _days_ago(2), fetch)
+        await async_cached_query(hass, ("k",), _days_ago(3), _days_ago(2), fetch)
+        assert fetch.await_count == 2
+
+    async def test_get_statistics_is_not_cached(self, hass, cache, recorder):
+        # The recorder's websocket API can rewrite past statistics without an event
+        recorder.async_add_executor_job = AsyncMock(
+            return_value={"sensor.energy": [{"start": 0.0, "end": 3600.0, "sum": 1.5}]}
+        )
+        arguments = {
+            "entity_id": "sensor.energy",
+            "start_time": "2024-01-01T00:00:00+00:00",
+            "end_time": "2024-01-02T00:00:00+00:00",
+        }
+        first = await get_statistics(hass, arguments)
+        recorder.async_add_executor_job.return_value = {"sensor.energy": []}
+        second = await get_statistics(hass, arguments)
+
+        assert first != second
+        assert recorder.async_add_executor_job.await_count == 2
+        assert cache.stats()["size"] == 0
@@ -0,0 +1,163 @@
+"""Tests for the coalescing reload scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, call
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import Service
+
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.reload_scheduler import (
+    ReloadScheduler,
+    async_request_reload,
+)
+
+
+@pytest.fixture
+async def hass():
+    loop = asyncio.get_running_loop()
+    hass = Mock()
+    hass.data = {}
+    hass.loop = loop
+    hass.async_create_task = lambda coro, name=None: loop.create_task(coro)
+    hass.services.async_call = AsyncMock()
+    return hass
+
+
+@pytest.fixture
+def scheduler(hass):
+    scheduler = ReloadScheduler(hass, delay=0.05, max_delay=0.2)
+    hass.data[DOMAIN] = {"reload_scheduler": scheduler}
+    return scheduler
+
+
+async def test_requests_in_a_row_share_one_reload(hass, scheduler):
+    # Requests return at once; the reload follows after the delay
+    assert await async_request_reload(hass, "automation") is False
+    await asyncio.sleep(0.02)
+    assert await async_request_reload(hass, "automation") is True
+    assert await async_request_reload(hass, "script") is False
+    hass.services.async_call.assert_not_awaited()
+
+    await asyncio.sleep(0.1)
+    assert hass.services.async_call.await_count == 2
+    hass.services.async_call.assert_any_await("automation", "reload", blocking=True)
+    hass.services.async_call.assert_any_await("script", "reload", blocking=True)
+
+
+async def test_flush_reloads_at_once(hass, scheduler):
+    waiting = asyncio.create_task(scheduler.async_reload("scene"))
+    await asyncio.sleep(0)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    assert await scheduler.async_reload("scene", flush=True) is True
+    assert await waiting is True
+    assert loop.time() - started < 0.05
+    hass.services.async_call.assert_awaited_once_with("scene", "reload", blocking=True)
+
+
+async def test_steady_requests_wait_no_longer_than_max_delay(hass, scheduler):
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    tasks = []
+    for _ in range(10):
+        tasks.append(asyncio.create_task(scheduler.async_reload("automation")))
+        await asyncio.sleep(0.03)
+    await asyncio.gather(*tasks)
+    # Requests every 30 ms never leave 50 ms of quiet; max_delay cuts in
+    assert 2 <= hass.services.async_call.await_count <= 3
+    assert loop.time() - started < 1
+
+
+async def test_request_during_a_reload_schedules_another(hass, scheduler):
+    release = asyncio.Event()
+
+    async def _reload(*args, **kwargs):
+        await release.wait()
+
+    hass.services.async_call = AsyncMock(side_effect=_reload)
+    first = asyncio.create_task(scheduler.async_reload("automation", flush=True))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(scheduler.async_reload("automation", flush=True))
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(first, second) == [False, False]
+    assert hass.services.async_call.await_count == 2
+
+
+async def test_reload_errors_reach_every_request(hass, scheduler):
+    hass.services.async_call = AsyncMock(side_effect=RuntimeError("invalid config"))
+    first = asyncio.create_task(scheduler.async_reload("script"))
+    second = asyncio.create_task(scheduler.async_reload("script"))
+    results = await asyncio.gather(first, second, return_exceptions=True)
+    assert [str(result) for result in results] == ["invalid config", "invalid config"]
+    hass.services.async_call.assert_awaited_once()
+
+
+async def test_scheduled_reload_errors_are_logged(hass, scheduler, caplog):
+    hass.services.async_call.side_effect = RuntimeError("invalid config")
+    scheduler.async_schedule("script")
+    await asyncio.sleep(0.1)
+    assert "Error reloading script after a config edit: invalid config" in caplog.text
+
+
+async def test_flush_waits_for_the_reload(hass, scheduler):
+    assert scheduler.async_schedule("automation") is False
+    assert await async_request_reload(hass, "automation", flush=True) is True
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+
+
+async def test_stop_starts_pending_reloads(hass, scheduler):
+    waiting = asyncio.create_task(scheduler.async_reload("automation"))
+    await asyncio.sleep(0)
+    scheduler.async_stop()
+    await asyncio.sleep(0)
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+    assert await waiting is False
+
+
+async def test_without_scheduler_reloads_directly(hass):
+    assert await async_request_reload(hass, "automation", flush=False) is False
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+
+
+def _reload_service(domain, schema):
+    return {"reload": Service(AsyncMock(), schema, domain, "reload")}
+
+
+async def test_targeted_reload_of_changed_items(hass, scheduler):
+    hass.services.async_services_for_domain = Mock(
+        return_value=_reload_service("automation", vol.Schema({vol.Optional("id"): str}))
+    )
+    first = asyncio.create_task(scheduler.async_reload("automation", targets=["b"]))
+    second = asyncio.create_task(scheduler.async_reload("automation", targets=["a", "b"]))
+    await asyncio.gather(first, second)
+    assert hass.services.async_call.await_args_list == [
+        call("automation", "reload", {"id": "a"}, blocking=True),
+        call("automation", "reload", {"id": "b"}, blocking=True),
+    ]
+
+
+async def test_full_reload_when_targets_cannot_be_reloaded_alone(hass, scheduler):
+    # Older releases register automation.reload without an id
+    hass.services.async_services_for_domain = Mock(
+        return_value=_reload_service("automation", vol.Schema({}))
+    )
+    await scheduler.async_reload("automation", targets=["a"])
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+
+
+async def test_full_reload_when_any_request_wants_one(hass, scheduler):
+    hass.services.async_services_for_domain = Mock(
+        return_value=_reload_service("automation", vol.Schema({vol.Optional("id"): str}))
+    )
+    first = asyncio.create_task(scheduler.async_reload("automation", targets=["a"]))
+    second = asyncio.create_task(scheduler.async_reload("automation"))
+    await asyncio.gather(first, second)
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
+
+    # As when more items changed than are worth reloading one by one
+    hass.services.async_call.reset_mock()
+    await scheduler.async_reload("automation", targets=[str(i) for i in range(6)])
+    hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
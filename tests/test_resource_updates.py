@@ -0,0 +1,126 @@
+"""Tests for resource update notifications."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from custom_components.mcp_server_http_transport.resource_updates import (
+    ResourceUpdateNotifier,
+    resource_updated,
+)
+from custom_components.mcp_server_http_transport.streaming import NotificationHub
+
+
+def _state_changed(entity_id):
+    return Mock(event_type="state_changed", data={"entity_id": entity_id})
+
+
+def _drain(queue):
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait()["params"]["uri"])
+    return messages
+
+
+@pytest.fixture
+async def hass():
+    hass = Mock()
+    hass.loop = asyncio.get_running_loop()
+    return hass
+
+
+@pytest.fixture
+def hub():
+    return NotificationHub()
+
+
+@pytest.fixture
+def notifier(hass, hub):
+    notifier = ResourceUpdateNotifier(hass, hub, delay=0.01)
+    notifier.async_start()
+    yield notifier
+    notifier.async_stop()
+
+
+async def test_listens_for_state_registry_and_service_events(hass, notifier):
+    event_types = {args.args[0] for args in hass.bus.async_listen.call_args_list}
+    assert {
+        "state_changed",
+        "entity_registry_updated",
+        "device_registry_updated",
+        "area_registry_updated",
+        "floor_registry_updated",
+        "label_registry_updated",
+        "service_registered",
+        "component_loaded",
+        "core_config_updated",
+    } <= event_types
+
+
+def _subscribe(hub, *uris):
+    queue = hub.subscribe("session")
+    for uri in uris:
+        hub.subscribe_resource("session", uri)
+    return queue
+
+
+async def test_burst_of_changes_sends_each_resource_once(hub, notifier):
+    queue = _subscribe(
+        hub,
+        "hass://entities",
+        "hass://changes",
+        "hass://entity/light.a",
+        "hass://entity/light.b",
+        "hass://areas",
+    )
+    notifier._async_state_changed(_state_changed("light.a"))
+    notifier._async_state_changed(_state_changed("light.b"))
+    notifier._async_state_changed(_state_changed("light.a"))
+    notifier._async_event(Mock(event_type="area_registry_updated"))
+    assert queue.empty()
+
+    await asyncio.sleep(0.03)
+    assert _drain(queue) == [
+        "hass://entities",
+        "hass://changes",
+        "hass://entity/light.a",
+        "hass://entity/light.b",
+        "hass://areas",
+    ]
+
+
+async def test_only_subscribed_resources_are_sent(hub, notifier):
+    queue = _subscribe(hub, "hass://entity/light.a")
+    unsubscribed = hub.subscribe("other")
+    notifier._async_state_changed(_state_changed("light.a"))
+    notifier._async_state_changed(_state_changed("light.b"))
+    notifier._async_event(Mock(event_type="area_registry_updated"))
+
+    await asyncio.sleep(0.03)
+    assert _drain(queue) == ["hass://entity/light.a"]
+    assert unsubscribed.empty()
+
+
+async def test_events_without_subscriptions_are_ignored(hub, notifier):
+    notifier._async_state_changed(_state_changed("light.a"))
+    assert notifier._timer is None
+    queue = _subscribe(hub, "hass://entity/light.a")
+    await asyncio.sleep(0.03)
+    assert queue.empty()
+
+
+async def test_stop_drops_pending_updates(hub, notifier):
+    queue = _subscribe(hub, "hass://devices")
+    notifier._async_event(Mock(event_type="device_registry_updated"))
+    notifier.async_stop()
+    await asyncio.sleep(0.03)
+    assert queue.empty()
+
+
+def test_resource_updated_message():
+    assert resource_updated("hass://areas") == {
+        "jsonrpc": "2.0",
+        "method": "notifications/resources/updated",
+        "params": {"uri": "hass://areas"},
+    }
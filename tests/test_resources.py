@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from custom_components.mcp_server_http_transport.http import MCPEndpointView
+from custom_components.mcp_server_http_transport.pagination import DEFAULT_PAGE_SIZE
 
 
 class TestResources:
@@ -44,7 +45,7 @@ class TestResources:
         assert response.status == 200
         body = json.loads(response.body)
         result = body["result"]
-        assert len(result["resources"]) == 8
+        assert len(result["resources"]) == 9
         resource_uris = [r["uri"] for r in result["resources"]]
         assert "hass://config" in resource_uris
         assert "hass://areas" in resource_uris
@@ -54,7 +55,8 @@ class TestResources:
         assert "hass://entities" in resource_uris
         assert "hass://labels" in resource_uris
         assert "hass://integrations" in resource_uris
-        assert len(result["resourceTemplates"]) == 3
+        assert "hass://changes" in resource_uris
+        assert len(result["resourceTemplates"]) == 6
         assert "entity_id" in result["resourceTemplates"][0]["uriTemplate"]
 
     async def test_post_resources_read_config(self, view, mock_hass):
@@ -380,6 +382,36 @@ class TestResources:
         assert len(data) == 1
         assert data[0]["entity_id"] == "light.living_room"
 
+    async def test_post_resources_read_entities_whole_without_page_params(self, view, mock_hass):
+        """Test resources/read returns every entity unless a page is asked for."""
+        states = []
+        for i in range(DEFAULT_PAGE_SIZE + 50):
+            state = Mock()
+            state.entity_id = f"sensor.s{i:03d}"
+            state.state = "1"
+            state.attributes = {}
+            states.append(state)
+        mock_hass.states.async_all.return_value = states
+
+        request = Mock()
+        request.headers = {"Authorization": "Bearer valid_token"}
+        request.json = AsyncMock(
+            return_value={
+                "jsonrpc": "2.0",
+                "method": "resources/read",
+                "params": {"uri": "hass://entities/domain/sensor"},
+                "id": 224,
+            }
+        )
+
+        with patch.object(view, "_validate_token", return_value={"sub": "user123"}):
+            response = await view.post(request)
+
+        body = json.loads(response.body)
+        assert "nextCursor" not in body["result"]
+        data = json.loads(body["result"]["contents"][0]["text"])
+        assert len(data) == DEFAULT_PAGE_SIZE + 50
+
     async def test_post_resources_read_labels(self, view, mock_hass):
         """Test POST with resources/read for hass://labels."""
         mock_label = Mock()
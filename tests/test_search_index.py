@@ -0,0 +1,90 @@
+"""Tests for the trigram search index."""
+
+from custom_components.mcp_server_http_transport.search_index import TrigramIndex, trigrams
+
+
+class TestTrigrams:
+    """Test trigram extraction."""
+
+    def test_separators_are_ignored(self):
+        assert trigrams("light.living_room") == trigrams("Light Living Room")
+
+    def test_word_starts_are_padded(self):
+        assert trigrams("Lamp") == {" la", "lam", "amp"}
+
+    def test_single_character_tokens_produce_a_trigram(self):
+        assert trigrams("A") == {" a "}
+
+    def test_empty_text(self):
+        assert trigrams(" .,_ ") == frozenset()
+
+
+def _index():
+    index = TrigramIndex()
+    index.add("light.living_room_lamp", ["light.living_room_lamp", "Living Room Lamp"])
+    index.add("light.living_room", ["light.living_room", "Living Room Light"])
+    index.add("sensor.kitchen_temp", ["sensor.kitchen_temp", "Temperature"], ["Kitchen"])
+    index.add("switch.lamp_plug", ["switch.lamp_plug", "Lamp Power Monitor"])
+    return index
+
+
+class TestTrigramIndex:
+    """Test ranked search."""
+
+    def test_typo_tolerant(self):
+        results = _index().search("livng room lamp")
+        assert results[0][0] == "light.living_room_lamp"
+
+    def test_results_ranked_best_first(self):
+        results = _index().search("living room lamp")
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+        assert [doc_id for doc_id, _ in results][:2] == [
+            "light.living_room_lamp",
+            "light.living_room",
+        ]
+
+    def test_unrelated_documents_do_not_match(self):
+        assert _index().search("garage door") == []
+
+    def test_context_names_match(self):
+        assert _index().search("kitchen temperature")[0][0] == "sensor.kitchen_temp"
+
+    def test_closer_name_ranks_higher(self):
+        index = TrigramIndex()
+        index.add("switch.a", ["Lamp Power Monitor"])
+        index.add("light.b", ["Lamp"])
+        assert [doc_id for doc_id, _ in index.search("lamp")] == ["light.b", "switch.a"]
+
+    def test_name_match_outranks_context_match(self):
+        index = TrigramIndex()
+        index.add("sensor.a", ["Sensor"], ["Kitchen"])
+        index.add("light.b", ["Kitchen"])
+        assert [doc_id for doc_id, _ in index.search("kitchen")] == ["light.b", "sensor.a"]
+
+    def test_limit_keeps_the_best_matches(self):
+        index = TrigramIndex()
+        for i in range(50):
+            index.add(f"sensor.motion_{i}", [f"Hallway Motion Sensor {i}"])
+        index.add("binary_sensor.motion", ["Motion"])
+        assert index.search("motion", limit=3)[0][0] == "binary_sensor.motion"
+        assert index.search("motion", limit=3) == index.search("motion")[:3]
+
+    def test_candidates_restrict_results(self):
+        results = _index().search("living", candidates={"light.living_room"})
+        assert [doc_id for doc_id, _ in results] == ["light.living_room"]
+
+    def test_limit(self):
+        assert len(_index().search("living room", limit=1)) == 1
+
+    def test_add_replaces_and_remove_forgets(self):
+        index = _index()
+        index.add("switch.lamp_plug", ["Garage Door"])
+        assert index.search("garage door")[0][0] == "switch.lamp_plug"
+        index.remove("switch.lamp_plug")
+        assert "switch.lamp_plug" not in index
+        assert index.search("garage door") == []
+        assert len(index) == 3
+
+    def test_empty_query(self):
+        assert _index().search("  ") == []
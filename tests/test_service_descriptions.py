@@ -0,0 +1,120 @@
+"""Tests for the service description cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from homeassistant.helpers.service import SERVICE_DESCRIPTION_CACHE
+
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.service_descriptions import (
+    ServiceDescriptionCache,
+    async_get_service_descriptions,
+)
+
+ALL_DESCRIPTIONS = (
+    "custom_components.mcp_server_http_transport.service_descriptions.async_get_all_descriptions"
+)
+
+VACUUM = {"start": {"name": "Start", "fields": {}}, "stop": {"name": "Stop", "fields": {}}}
+
+
+@pytest.fixture
+def hass():
+    hass = Mock()
+    hass.data = {}
+    services = {"vacuum": {"start": Mock(), "stop": Mock()}, "light": {"turn_on": Mock()}}
+    hass.services.async_services_for_domain = Mock(
+        side_effect=lambda domain: services.get(domain, {})
+    )
+    return hass
+
+
+@pytest.fixture
+def all_descriptions():
+    with patch(ALL_DESCRIPTIONS, AsyncMock(return_value={"vacuum": VACUUM})) as mock:
+        yield mock
+
+
+def _event(**data):
+    return Mock(data=data)
+
+
+class TestServiceDescriptionCache:
+    """Test cached lookups and invalidation."""
+
+    async def test_second_lookup_is_cached(self, hass, all_descriptions):
+        cache = ServiceDescriptionCache(hass)
+        assert await cache.async_get("vacuum") == VACUUM
+        assert await cache.async_get("vacuum") == VACUUM
+        assert all_descriptions.await_count == 1
+
+    async def test_uses_ha_per_service_cache_without_full_catalog(self, hass, all_descriptions):
+        hass.data[SERVICE_DESCRIPTION_CACHE] = {
+            ("vacuum", "start"): VACUUM["start"],
+            ("vacuum", "stop"): VACUUM["stop"],
+        }
+        assert await ServiceDescriptionCache(hass).async_get("vacuum") == VACUUM
+        all_descriptions.assert_not_awaited()
+
+    async def test_unknown_domain(self, hass, all_descriptions):
+        assert await ServiceDescriptionCache(hass).async_get("nope") == {}
+        all_descriptions.assert_not_awaited()
+
+    async def test_service_events_invalidate_their_domain(self, hass, all_descriptions):
+        cache = ServiceDescriptionCache(hass)
+        await cache.async_get("vacuum")
+
+        cache._async_service_changed(_event(domain="light", service="turn_on"))
+        await cache.async_get("vacuum")
+        assert all_descriptions.await_count == 1
+
+        cache._async_service_changed(_event(domain="vacuum", service="clean_area"))
+        await cache.async_get("vacuum")
+        assert all_descriptions.await_count == 2
+
+    async def test_platform_load_invalidates_domain(self, hass, all_descriptions):
+        cache = ServiceDescriptionCache(hass)
+        await cache.async_get("vacuum")
+        cache._async_component_loaded(_event(component="vacuum.roborock"))
+        await cache.async_get("vacuum")
+        assert all_descriptions.await_count == 2
+
+    async def test_lookup_racing_invalidation_is_not_stored(self, hass):
+        cache = ServiceDescriptionCache(hass)
+        release = asyncio.Event()
+
+        async def _slow(hass):
+            await release.wait()
+            return {"vacuum": VACUUM}
+
+        with patch(ALL_DESCRIPTIONS, side_effect=_slow) as all_descriptions:
+            task = asyncio.create_task(cache.async_get("vacuum"))
+            await asyncio.sleep(0)
+            cache._async_service_changed(_event(domain="vacuum", service="start"))
+            release.set()
+            assert await task == VACUUM
+
+            await cache.async_get("vacuum")
+            assert all_descriptions.call_count == 2
+
+    def test_start_and_stop(self, hass):
+        unsub = Mock()
+        hass.bus.async_listen.return_value = unsub
+        cache = ServiceDescriptionCache(hass)
+        cache.async_start()
+        cache.async_stop()
+        assert unsub.call_count == 3
+
+
+class TestGetServiceDescriptions:
+    """Test the accessor used by describe_service."""
+
+    async def test_uses_installed_cache(self, hass, all_descriptions):
+        hass.data[DOMAIN] = {"service_descriptions": ServiceDescriptionCache(hass)}
+        await async_get_service_descriptions(hass, "vacuum")
+        await async_get_service_descriptions(hass, "vacuum")
+        assert all_descriptions.await_count == 1
+
+    async def test_describes_directly_when_not_set_up(self, hass, all_descriptions):
+        assert await async_get_service_descriptions(hass, "vacuum") == VACUUM
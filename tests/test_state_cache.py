@@ -0,0 +1,138 @@
+"""Tests for the state fragment cache."""
+
+import json
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.mcp_server_http_transport.const import DOMAIN
+from custom_components.mcp_server_http_transport.json_utils import (
+    JSONFragment,
+    json_dumps,
+    reset_indent,
+    set_indent,
+)
+from custom_components.mcp_server_http_transport.state_cache import (
+    _MIN_SWEEP_SIZE,
+    StateFragmentCache,
+    get_state_fragments,
+    state_attributes,
+    state_timestamps,
+)
+from custom_components.mcp_server_http_transport.tools.entities import get_state
+
+
+def _hass(*states):
+    hass = Mock()
+    hass.data = {}
+    by_id = {state.entity_id: state for state in states}
+    hass.states.get = Mock(side_effect=by_id.get)
+    return hass
+
+
+@pytest.fixture
+def light():
+    return State("light.a", "on", {"brightness": 20, "color_temp": 300, "friendly_name": "A"})
+
+
+@pytest.fixture
+def cache(light):
+    return StateFragmentCache(_hass(light))
+
+
+class TestStateFragmentCache:
+    """Test reuse and replacement of cached parts."""
+
+    def test_attributes_encoded_once_per_state(self, cache, light):
+        first = cache.attributes(light)
+        assert isinstance(first, JSONFragment)
+        assert json.loads(first.contents) == dict(light.attributes)
+        assert cache.attributes(light) is first
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_new_state_object_is_encoded_again(self, cache, light):
+        cache.attributes(light)
+        changed = State("light.a", "on", {"brightness": 30})
+        assert json.loads(cache.attributes(changed).contents) == {"brightness": 30}
+        assert cache.stats()["size"] == 1
+
+    def test_projection_keyed_by_field_set(self, cache, light):
+        projected = cache.attributes(light, ["color_temp", "brightness"])
+        assert json.loads(projected.contents) == {"brightness": 20, "color_temp": 300}
+        assert cache.attributes(light, ["brightness", "color_temp"]) is projected
+
+    def test_projections_beyond_limit_are_not_stored(self, cache, light):
+        for i in range(10):
+            cache.attributes(light, [f"attr_{i}"])
+        assert len(cache._entries["light.a"][1]) == 6
+        assert cache.attributes(light, ["brightness"]) == {"brightness": 20}
+
+    def test_unencodable_attributes_fall_back_to_dict(self, cache):
+        state = State("sensor.big", "1", {"value": 2**70})
+        assert cache.attributes(state) == {"value": 2**70}
+        assert json.loads(json_dumps({"attributes": cache.attributes(state)})) == {
+            "attributes": {"value": 2**70}
+        }
+
+    def test_timestamps(self, cache, light):
+        assert cache.timestamps(light) == (
+            light.last_changed.isoformat(),
+            light.last_updated.isoformat(),
+        )
+        assert cache.timestamps(light) is cache.timestamps(light)
+
+    def test_sweep_drops_states_no_longer_current(self, light):
+        cache = StateFragmentCache(_hass(light))
+        cache.attributes(light)
+        for i in range(_MIN_SWEEP_SIZE):
+            cache.attributes(State(f"sensor.removed_{i}", "1"))
+        # Swept when the last one was added
+        assert list(cache._entries) == ["light.a", f"sensor.removed_{_MIN_SWEEP_SIZE - 1}"]
+
+
+class TestFragmentsInOutput:
+    """Test fragments serialize like the attributes they encode."""
+
+    def test_embedded_fragment(self, cache, light):
+        payload = {"attributes": cache.attributes(light), "at": datetime(2026, 1, 1)}
+        assert json.loads(json_dumps(payload)) == {
+            "attributes": dict(light.attributes),
+            "at": "2026-01-01T00:00:00",
+        }
+
+    def test_stdlib_fallback_decodes_fragment(self, cache, light):
+        payload = {"attributes": cache.attributes(light)}
+        assert json.loads(json_dumps(payload, indent=4)) == {"attributes": dict(light.attributes)}
+
+    def test_indented_output_bypasses_cache(self, light):
+        hass = _hass(light)
+        hass.data[DOMAIN] = {"state_fragments": StateFragmentCache(hass)}
+        token = set_indent(2)
+        try:
+            assert state_attributes(hass, light) == dict(light.attributes)
+        finally:
+            reset_indent(token)
+        assert isinstance(state_attributes(hass, light), JSONFragment)
+
+
+class TestAccessors:
+    """Test lookups with and without the integration's cache."""
+
+    def test_without_cache(self, light):
+        hass = _hass(light)
+        assert get_state_fragments(hass) is None
+        assert state_attributes(hass, light, ["brightness"]) == {"brightness": 20}
+        assert state_timestamps(hass, light)[0] == light.last_changed.isoformat()
+
+    async def test_get_state_reuses_fragment(self, light):
+        hass = _hass(light)
+        cache = StateFragmentCache(hass)
+        hass.data[DOMAIN] = {"state_fragments": cache}
+        with patch("custom_components.mcp_server_http_transport.tools.entities.er.async_get"):
+            first = await get_state(hass, {"entity_id": "light.a"})
+            second = await get_state(hass, {"entity_id": "light.a"})
+        assert first == second
+        assert json.loads(first["content"][0]["text"])["attributes"] == dict(light.attributes)
+        assert cache.stats()["hits"] == 1
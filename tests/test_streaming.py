@@ -0,0 +1,128 @@
+"""Tests for SSE helpers, progress reporting, and the notification hub."""
+
+import json
+from unittest.mock import AsyncMock
+
+from custom_components.mcp_server_http_transport.json_utils import reset_indent, set_indent
+from custom_components.mcp_server_http_transport.streaming import (
+    NotificationHub,
+    report_progress,
+    reset_progress_callback,
+    set_progress_callback,
+    sse_event,
+)
+
+
+class TestSseEvent:
+    """Test SSE event encoding."""
+
+    def test_encodes_message_event(self):
+        raw = sse_event({"jsonrpc": "2.0", "id": 1, "result": {}})
+        text = raw.decode()
+        assert text.startswith("event: message\ndata: ")
+        assert text.endswith("\n\n")
+        assert json.loads(text.split("data: ", 1)[1]) == {"jsonrpc": "2.0", "id": 1, "result": {}}
+
+    def test_data_stays_on_one_line_for_pretty_requests(self):
+        token = set_indent(2)
+        try:
+            raw = sse_event({"jsonrpc": "2.0", "id": 1, "result": {"a": [1, 2]}})
+        finally:
+            reset_indent(token)
+        assert raw == b'event: message\ndata: {"jsonrpc":"2.0","id":1,"result":{"a":[1,2]}}\n\n'
+
+
+class TestReportProgress:
+    """Test the context-bound progress callback."""
+
+    async def test_noop_without_callback(self):
+        await report_progress(1, 2, "ignored")
+
+    async def test_calls_bound_callback(self):
+        callback = AsyncMock()
+        token = set_progress_callback(callback)
+        try:
+            await report_progress(3, 10, "working")
+        finally:
+            reset_progress_callback(token)
+
+        callback.assert_awaited_once_with(3, 10, "working")
+
+    async def test_reset_unbinds_callback(self):
+        callback = AsyncMock()
+        token = set_progress_callback(callback)
+        reset_progress_callback(token)
+
+        await report_progress(1)
+
+        callback.assert_not_awaited()
+
+
+class TestNotificationHub:
+    """Test fan-out of server-initiated notifications."""
+
+    async def test_publish_reaches_every_subscriber(self):
+        hub = NotificationHub()
+        q1 = hub.subscribe()
+        q2 = hub.subscribe()
+
+        hub.publish({"method": "notifications/test"})
+
+        assert q1.get_nowait() == {"method": "notifications/test"}
+        assert q2.get_nowait() == {"method": "notifications/test"}
+
+    async def test_unsubscribed_queue_receives_nothing(self):
+        hub = NotificationHub()
+        queue = hub.subscribe()
+        hub.unsubscribe(queue)
+
+        hub.publish({"method": "notifications/test"})
+
+        assert queue.empty()
+
+    async def test_resource_updates_reach_subscribed_sessions_only(self):
+        hub = NotificationHub()
+        subscribed = hub.subscribe("s1")
+        other = hub.subscribe("s2")
+        anonymous = hub.subscribe()
+        hub.subscribe_resource("s1", "hass://areas")
+        assert hub.is_subscribed("hass://areas")
+        assert not hub.is_subscribed("hass://devices")
+
+        hub.publish({"n": 1}, resource="hass://areas")
+        hub.unsubscribe_resource("s1", "hass://areas")
+        hub.publish({"n": 2}, resource="hass://areas")
+
+        assert subscribed.get_nowait() == {"n": 1}
+        assert subscribed.empty()
+        assert other.empty()
+        assert anonymous.empty()
+        assert not hub.is_subscribed("hass://areas")
+
+    async def test_end_session_drops_its_subscriptions(self):
+        hub = NotificationHub()
+        hub.subscribe("s1")
+        hub.subscribe_resource("s1", "hass://areas")
+
+        hub.end_session("s1")
+
+        assert not hub.is_subscribed("hass://areas")
+
+    async def test_full_queue_drops_instead_of_blocking(self):
+        hub = NotificationHub(max_queue=1)
+        queue = hub.subscribe()
+
+        hub.publish({"n": 1})
+        hub.publish({"n": 2})
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == {"n": 1}
+
+    async def test_close_ends_streams(self):
+        hub = NotificationHub(max_queue=1)
+        queue = hub.subscribe()
+        hub.publish({"n": 1})
+
+        hub.close()
+
+        assert queue.get_nowait() is None
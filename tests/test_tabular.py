@@ -0,0 +1,63 @@
+"""Tests for the table output format."""
+
+import pytest
+
+from custom_components.mcp_server_http_transport.tabular import format_records, to_table
+
+RECORDS = [
+    {"entity_id": "light.a", "state": "on", "area_id": "kitchen"},
+    {"entity_id": "light.b", "state": "on", "area_id": None},
+    {"entity_id": "light.c", "state": "off", "area_id": "kitchen"},
+    {"entity_id": "light.d", "state": "on", "area_id": "kitchen", "score": 0.5},
+]
+
+
+class TestToTable:
+    """Test converting records to columns and rows."""
+
+    def test_columns_in_first_seen_order_with_missing_as_none(self):
+        table = to_table(RECORDS)
+        assert table["columns"] == ["entity_id", "state", "area_id", "score"]
+        assert table["rows"][0] == ["light.a", "on", "kitchen", None]
+        assert table["rows"][3] == ["light.d", "on", "kitchen", 0.5]
+        assert "dictionaries" not in table
+
+    def test_dictionary_encodes_repetitive_string_columns(self):
+        table = to_table(RECORDS, dictionary=True)
+        assert table["dictionaries"] == {"state": ["on", "off"], "area_id": ["kitchen"]}
+        assert [row[1] for row in table["rows"]] == [0, 0, 1, 0]
+        assert [row[2] for row in table["rows"]] == [0, None, 0, 0]
+        # Unique and non-string columns are kept as is
+        assert [row[0] for row in table["rows"]] == ["light.a", "light.b", "light.c", "light.d"]
+
+    def test_dictionary_round_trips(self):
+        table = to_table(RECORDS, dictionary=True)
+        decoded = []
+        for row in table["rows"]:
+            record = {}
+            for column, value in zip(table["columns"], row, strict=True):
+                values = table["dictionaries"].get(column)
+                record[column] = values[value] if values and value is not None else value
+            decoded.append(record)
+        assert decoded == [
+            {"entity_id": r["entity_id"], "state": r["state"], "area_id": r["area_id"]}
+            | {"score": r.get("score")}
+            for r in RECORDS
+        ]
+
+    def test_empty(self):
+        assert to_table([], dictionary=True) == {"columns": [], "rows": []}
+
+
+class TestFormatRecords:
+    """Test the format argument."""
+
+    def test_objects_by_default(self):
+        assert format_records(RECORDS, {}) is RECORDS
+
+    def test_table(self):
+        assert format_records(RECORDS, {"format": "table"}) == to_table(RECORDS)
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError, match="Unknown format"):
+            format_records(RECORDS, {"format": "csv"})
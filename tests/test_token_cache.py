@@ -0,0 +1,78 @@
+"""Tests for the validated bearer token cache."""
+
+import time
+from unittest.mock import patch
+
+from custom_components.mcp_server_http_transport.token_cache import TokenCache
+
+
+class TestTokenCache:
+    """Test TokenCache expiry, LRU eviction, and counters."""
+
+    def test_key_does_not_contain_raw_token(self):
+        key = TokenCache.make_key("secret-token", "https://ha", "https://ha/api/mcp")
+        assert "secret-token" not in key
+
+    def test_key_depends_on_issuer_and_audience(self):
+        a = TokenCache.make_key("t", "https://a", "https://a/api/mcp")
+        b = TokenCache.make_key("t", "https://b", "https://b/api/mcp")
+        assert a != b
+
+    def test_miss_then_hit(self):
+        cache = TokenCache(max_size=10, max_ttl=60)
+        key = cache.make_key("t", "iss", "aud")
+
+        assert cache.get(key) is None
+        cache.set(key, {"sub": "user"})
+        assert cache.get(key) == {"sub": "user"}
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "max_size": 10,
+            "max_ttl": 60,
+        }
+
+    def test_entry_expires_at_exp_claim(self):
+        cache = TokenCache(max_ttl=3600)
+        now = time.time()
+        cache.set("k", {"sub": "user", "exp": now + 10})
+
+        with patch(
+            "custom_components.mcp_server_http_transport.token_cache.time.time",
+            return_value=now + 11,
+        ):
+            assert cache.get("k") is None
+
+    def test_entry_expires_at_max_ttl(self):
+        cache = TokenCache(max_ttl=5)
+        now = time.time()
+        cache.set("k", {"sub": "user", "exp": now + 3600})
+
+        with patch(
+            "custom_components.mcp_server_http_transport.token_cache.time.time",
+            return_value=now + 6,
+        ):
+            assert cache.get("k") is None
+
+    def test_already_expired_payload_is_not_cached(self):
+        cache = TokenCache()
+        cache.set("k", {"sub": "user", "exp": time.time() - 1})
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = TokenCache(max_size=2)
+        cache.set("a", {"sub": "a"})
+        cache.set("b", {"sub": "b"})
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", {"sub": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"sub": "a"}
+        assert cache.get("c") == {"sub": "c"}
+
+    def test_clear(self):
+        cache = TokenCache()
+        cache.set("k", {"sub": "user"})
+        cache.clear()
+        assert cache.get("k") is None
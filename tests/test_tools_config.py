@@ -1,11 +1,20 @@
 """Tests for automation/scene/script config tools."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from custom_components.mcp_server_http_transport.const import DOMAIN
 from custom_components.mcp_server_http_transport.http import MCPEndpointView
+from custom_components.mcp_server_http_transport.reload_scheduler import ReloadScheduler
+from custom_components.mcp_server_http_transport.tools.config import (
+    batch_edit_automations,
+    batch_edit_scenes,
+    batch_edit_scripts,
+    update_automation,
+)
 
 
 class TestToolsConfig:
@@ -748,3 +757,94 @@ class TestToolsConfig:
         assert response.status == 200
         body = json.loads(response.body)
         assert "Error deleting script" in body["result"]["content"][0]["text"]
+
+
+class TestBatchEditTools:
+    """Test the batch_edit_* tools' validation and summary."""
+
+    async def test_summary(self):
+        results = [
+            {"index": 0, "op": "create", "id": "new", "success": True},
+            {"index": 1, "op": "delete", "id": "x", "success": False, "error": "not found"},
+        ]
+        with patch(
+            "custom_components.mcp_server_http_transport.config_manager.apply_list_operations",
+            AsyncMock(return_value=(results, True)),
+        ) as apply:
+            result = await batch_edit_automations(
+                Mock(), {"operations": [{"op": "create", "config": {}}, {"op": "delete"}]}
+            )
+        assert apply.await_args.args[1:] == (
+            "automations.yaml",
+            [{"op": "create", "config": {}}, {"op": "delete"}],
+            "automation",
+        )
+        summary = json.loads(result["content"][0]["text"])
+        assert summary == {
+            "succeeded": 1,
+            "failed": 1,
+            "reloaded": True,
+            "reload_merged": True,
+            "results": results,
+        }
+
+    async def test_limits(self):
+        result = await batch_edit_scripts(Mock(), {"operations": []})
+        assert result["content"][0]["text"] == "Error: operations must not be empty"
+        result = await batch_edit_scenes(Mock(), {"operations": [{"op": "delete"}] * 51})
+        assert result["content"][0]["text"] == "Error: maximum 50 operations per request"
+
+    async def test_write_error(self):
+        with patch(
+            "custom_components.mcp_server_http_transport.config_manager.apply_dict_operations",
+            AsyncMock(side_effect=OSError("read-only file system")),
+        ):
+            result = await batch_edit_scripts(
+                Mock(), {"operations": [{"op": "delete", "key": "a"}]}
+            )
+        assert result["content"][0]["text"] == "Error editing scripts.yaml: read-only file system"
+
+
+class TestReloadReporting:
+    """Test edit tools report merged reloads and pass reload_now on."""
+
+    async def test_merged_reload(self):
+        with patch(
+            "custom_components.mcp_server_http_transport.config_manager.update_list_entry",
+            AsyncMock(return_value=True),
+        ) as update:
+            result = await update_automation(
+                Mock(), {"automation_id": "a", "config": {}, "reload_now": True}
+            )
+        assert update.await_args.kwargs == {"reload_now": True}
+        assert result["content"][0]["text"] == (
+            "Successfully updated automation (reload merged with other edits)"
+        )
+
+    async def test_edits_in_a_row_share_one_reload(self, tmp_path):
+        hass = Mock()
+        hass.config.path = lambda name: str(tmp_path / name)
+
+        async def run_fn(fn, *args):
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        hass.async_add_executor_job = AsyncMock(side_effect=run_fn)
+        hass.loop = loop
+        hass.async_create_task = lambda coro, name=None: loop.create_task(coro)
+        hass.services.async_call = AsyncMock()
+        hass.services.async_services_for_domain = Mock(return_value={})
+        hass.data = {DOMAIN: {"reload_scheduler": ReloadScheduler(hass, 0.05, 0.2)}}
+        (tmp_path / "automations.yaml").write_text("- id: a\n  alias: A\n- id: b\n  alias: B\n")
+
+        # Each edit returns once written, without waiting for its reload
+        first = await update_automation(hass, {"automation_id": "a", "config": {"alias": "A2"}})
+        second = await update_automation(hass, {"automation_id": "b", "config": {"alias": "B2"}})
+        assert first["content"][0]["text"] == "Successfully updated automation"
+        assert second["content"][0]["text"] == (
+            "Successfully updated automation (reload merged with other edits)"
+        )
+        hass.services.async_call.assert_not_awaited()
+
+        await asyncio.sleep(0.1)
+        hass.services.async_call.assert_awaited_once_with("automation", "reload", blocking=True)
@@ -1,5 +1,6 @@
 """Tests for entity-related tools."""
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
@@ -10,36 +11,6 @@ from custom_components.mcp_server_http_transport.http import MCPEndpointView
 from custom_components.mcp_server_http_transport.tools import entities as entities_mod
 
 
-class TestGetAliasesCompat:
-    """Test _get_aliases backward compatibility helper."""
-
-    def test_uses_async_get_entity_aliases_when_available(self):
-        """Test _get_aliases uses er.async_get_entity_aliases on HA 2026.4+."""
-        mock_hass = Mock()
-        mock_entry = Mock()
-        mock_entry.aliases = ["Test Alias"]
-        with (
-            patch.object(entities_mod, "_HAS_GET_ENTITY_ALIASES", True),
-            patch(
-                "custom_components.mcp_server_http_transport.tools.entities.er.async_get_entity_aliases",
-                return_value=["Resolved Alias"],
-                create=True,
-            ) as mock_fn,
-        ):
-            result = entities_mod._get_aliases(mock_hass, mock_entry)
-        assert result == ["Resolved Alias"]
-        mock_fn.assert_called_once_with(mock_hass, mock_entry)
-
-    def test_falls_back_to_sorted_str_on_older_ha(self):
-        """Test _get_aliases falls back to sorted(str(a) ...) on older HA."""
-        mock_hass = Mock()
-        mock_entry = Mock()
-        mock_entry.aliases = ["Bravo", "Alpha"]
-        with patch.object(entities_mod, "_HAS_GET_ENTITY_ALIASES", False):
-            result = entities_mod._get_aliases(mock_hass, mock_entry)
-        assert result == ["Alpha", "Bravo"]
-
-
 class TestToolsEntities:
     """Test entity-related tools."""
 
@@ -719,6 +690,10 @@ class TestToolsEntities:
             }
         }
 
+        mock_hass.services.async_services_for_domain.return_value = {
+            "clean_area": Mock(),
+            "start": Mock(),
+        }
         request = Mock()
         request.headers = {"Authorization": "Bearer valid_token"}
         request.json = AsyncMock(
@@ -736,10 +711,15 @@ class TestToolsEntities:
         with (
             patch.object(view, "_validate_token", return_value={"sub": "user123"}),
             patch(
-                "custom_components.mcp_server_http_transport.tools.entities."
+                "custom_components.mcp_server_http_transport.service_descriptions."
                 "async_get_all_descriptions",
                 AsyncMock(return_value=descriptions),
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.service_descriptions."
+                "async_get_cached_service_description",
+                return_value=None,
+            ),
         ):
             response = await view.post(request)
 
@@ -759,6 +739,10 @@ class TestToolsEntities:
             }
         }
 
+        mock_hass.services.async_services_for_domain.return_value = {
+            "clean_area": Mock(),
+            "start": Mock(),
+        }
         request = Mock()
         request.headers = {"Authorization": "Bearer valid_token"}
         request.json = AsyncMock(
@@ -773,10 +757,15 @@ class TestToolsEntities:
         with (
             patch.object(view, "_validate_token", return_value={"sub": "user123"}),
             patch(
-                "custom_components.mcp_server_http_transport.tools.entities."
+                "custom_components.mcp_server_http_transport.service_descriptions."
                 "async_get_all_descriptions",
                 AsyncMock(return_value=descriptions),
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.service_descriptions."
+                "async_get_cached_service_description",
+                return_value=None,
+            ),
         ):
             response = await view.post(request)
 
@@ -787,6 +776,7 @@ class TestToolsEntities:
 
     async def test_post_tools_call_describe_service_unknown_domain(self, view, mock_hass):
         """Test describe_service reports when a domain has no services."""
+        mock_hass.services.async_services_for_domain.return_value = {}
         request = Mock()
         request.headers = {"Authorization": "Bearer valid_token"}
         request.json = AsyncMock(
@@ -801,7 +791,7 @@ class TestToolsEntities:
         with (
             patch.object(view, "_validate_token", return_value={"sub": "user123"}),
             patch(
-                "custom_components.mcp_server_http_transport.tools.entities."
+                "custom_components.mcp_server_http_transport.service_descriptions."
                 "async_get_all_descriptions",
                 AsyncMock(return_value={"vacuum": {"start": {}}}),
             ),
@@ -814,6 +804,7 @@ class TestToolsEntities:
 
     async def test_post_tools_call_describe_service_unknown_service(self, view, mock_hass):
         """Test describe_service reports when a service does not exist in the domain."""
+        mock_hass.services.async_services_for_domain.return_value = {"start": Mock()}
         request = Mock()
         request.headers = {"Authorization": "Bearer valid_token"}
         request.json = AsyncMock(
@@ -831,7 +822,7 @@ class TestToolsEntities:
         with (
             patch.object(view, "_validate_token", return_value={"sub": "user123"}),
             patch(
-                "custom_components.mcp_server_http_transport.tools.entities."
+                "custom_components.mcp_server_http_transport.service_descriptions."
                 "async_get_all_descriptions",
                 AsyncMock(return_value={"vacuum": {"start": {}}}),
             ),
@@ -883,6 +874,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -963,6 +958,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1024,6 +1023,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1078,6 +1081,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=mock_dr,
@@ -1130,6 +1137,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1183,6 +1194,10 @@ class TestToolsEntities:
                 "custom_components.mcp_server_http_transport.tools.entities.er.async_get",
                 return_value=mock_er,
             ),
+            patch(
+                "custom_components.mcp_server_http_transport.tools.entities.ar.async_get",
+                return_value=Mock(async_get_area=Mock(return_value=None)),
+            ),
             patch(
                 "custom_components.mcp_server_http_transport.tools.entities.dr.async_get",
                 return_value=Mock(),
@@ -1689,3 +1704,233 @@ class TestToolsEntities:
         assert "state" in data[0]
         assert "attributes" not in data[0]
         assert "last_changed" not in data[0]
+
+
+class TestWaitForState:
+    """Tests for the wait_for_state tool."""
+
+    @pytest.fixture
+    def states(self):
+        return {
+            "cover.garage": Mock(state="opening", attributes={"current_position": 40}),
+            "vacuum.robot": Mock(state="cleaning", attributes={}),
+        }
+
+    @pytest.fixture
+    def hass(self, states):
+        hass = Mock()
+        hass.states.get = Mock(side_effect=states.get)
+        return hass
+
+    @pytest.fixture
+    def track(self):
+        """Capture the state change listener instead of subscribing to the bus."""
+        listener = {"unsub": Mock()}
+
+        def _track(hass, entity_ids, action):
+            listener["action"] = action
+            return listener["unsub"]
+
+        with patch.object(entities_mod, "async_track_state_change_event", side_effect=_track):
+            yield listener
+
+    @staticmethod
+    async def _wait(hass, arguments):
+        result = await entities_mod.wait_for_state(hass, arguments)
+        return json.loads(result["content"][0]["text"])
+
+    async def test_returns_immediately_when_already_met(self, hass, track):
+        data = await self._wait(hass, {"entity_ids": ["vacuum.robot"], "state": "cleaning"})
+        assert data["condition_met"] is True
+        assert data["states"] == {"vacuum.robot": "cleaning"}
+        assert "action" not in track
+
+    async def test_returns_when_a_change_meets_the_condition(self, hass, states, track):
+
+        task = asyncio.create_task(
+            self._wait(hass, {"entity_ids": ["cover.garage"], "state": "closed", "timeout": 5})
+        )
+        while "action" not in track:
+            await asyncio.sleep(0)
+
+        track["action"](Mock())
+        await asyncio.sleep(0)
+        assert not task.done()
+
+        states["cover.garage"] = Mock(state="closed", attributes={})
+        track["action"](Mock())
+        data = await task
+
+        assert data["condition_met"] is True
+        assert data["states"] == {"cover.garage": "closed"}
+        assert data["waited_seconds"] < 5
+        track["unsub"].assert_called_once()
+
+    async def test_times_out(self, hass, track):
+        data = await self._wait(
+            hass, {"entity_ids": ["cover.garage"], "state": "closed", "timeout": 0.01}
+        )
+        assert data["condition_met"] is False
+        assert data["states"] == {"cover.garage": "opening"}
+        track["unsub"].assert_called_once()
+
+    async def test_cancellation_removes_listener(self, hass, track):
+
+        task = asyncio.create_task(
+            self._wait(hass, {"entity_ids": ["cover.garage"], "state": "closed"})
+        )
+        while "action" not in track:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        track["unsub"].assert_called_once()
+
+    async def test_attribute_threshold_and_any_match(self, hass, track):
+        data = await self._wait(
+            hass,
+            {
+                "entity_ids": ["cover.garage", "vacuum.robot"],
+                "attribute": "current_position",
+                "above": 30,
+                "match": "any",
+            },
+        )
+        assert data["condition_met"] is True
+
+    async def test_requires_a_condition(self, hass):
+        result = await entities_mod.wait_for_state(hass, {"entity_ids": ["cover.garage"]})
+        assert "Error" in result["content"][0]["text"]
+
+
+class TestStateMatches:
+    """Tests for the wait_for_state criteria."""
+
+    @pytest.mark.parametrize(
+        ("arguments", "expected"),
+        [
+            ({"state": "21.5"}, True),
+            ({"state": 21.5}, True),
+            ({"above": 20, "below": 22}, True),
+            ({"above": 21.5}, False),
+            ({"attribute": "unit", "state": "°C"}, True),
+            ({"attribute": "missing", "state": "x"}, False),
+            ({"attribute": "unit", "above": 0}, False),
+        ],
+    )
+    def test_criteria(self, arguments, expected):
+        state = Mock(state="21.5", attributes={"unit": "°C"})
+        assert entities_mod._state_matches(state, arguments) is expected
+
+    def test_missing_entity(self):
+        assert entities_mod._state_matches(None, {"state": "on"}) is False
+
+
+class TestBatchCallService:
+    """Tests for the batch_call_service tool."""
+
+    @pytest.fixture
+    def hass(self):
+        hass = Mock()
+        hass.services.async_call = AsyncMock()
+        return hass
+
+    @staticmethod
+    async def _batch(hass, arguments):
+        result = await entities_mod.batch_call_service(hass, arguments)
+        return json.loads(result["content"][0]["text"])
+
+    async def test_calls_run_concurrently(self, hass):
+        in_flight, peak = 0, 0
+
+        async def _async_call(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        hass.services.async_call.side_effect = _async_call
+        calls = [
+            {"domain": "light", "service": "turn_off", "target": {"area_id": "upstairs"}},
+            {"domain": "climate", "service": "set_temperature", "data": {"temperature": 20}},
+            {"domain": "climate", "service": "set_temperature", "data": {"temperature": 21}},
+        ]
+        data = await self._batch(hass, {"calls": calls, "max_concurrency": 2})
+
+        assert peak == 2
+        assert data["succeeded"] == 3
+        assert [r["index"] for r in data["results"]] == [0, 1, 2]
+        assert all(r["duration_seconds"] >= 0 for r in data["results"])
+        hass.services.async_call.assert_any_call(
+            "light", "turn_off", {}, blocking=True, target={"area_id": "upstairs"}
+        )
+
+    async def test_groups_run_in_order(self, hass):
+        order = []
+
+        async def _async_call(domain, service, data, **kwargs):
+            order.append(service)
+
+        hass.services.async_call.side_effect = _async_call
+        calls = [
+            {"domain": "cover", "service": "close_cover", "group": 1},
+            {"domain": "scene", "service": "turn_on", "group": 2},
+            {"domain": "light", "service": "turn_off"},
+        ]
+        await self._batch(hass, {"calls": calls})
+        assert order == ["turn_off", "close_cover", "turn_on"]
+
+    async def test_errors_and_timeouts_are_reported_per_call(self, hass):
+        async def _async_call(domain, service, data, **kwargs):
+            if service == "fail":
+                raise ValueError("Service not found")
+            if service == "slow":
+                await asyncio.sleep(1)
+
+        hass.services.async_call.side_effect = _async_call
+        calls = [
+            {"domain": "light", "service": "fail"},
+            {"domain": "light", "service": "slow"},
+            {"domain": "light", "service": "turn_on"},
+            {"domain": "light"},
+        ]
+        data = await self._batch(hass, {"calls": calls, "timeout": 0.01})
+
+        results = data["results"]
+        assert results[0] == {**results[0], "success": False, "error": "Service not found"}
+        assert results[1]["success"] is False
+        assert "Timed out" in results[1]["error"]
+        assert results[2]["success"] is True
+        assert results[3]["error"] == "domain and service are required"
+        assert (data["succeeded"], data["failed"]) == (1, 3)
+
+    async def test_stop_on_error_skips_later_groups(self, hass):
+        hass.services.async_call.side_effect = [ValueError("boom"), None]
+        calls = [
+            {"domain": "lock", "service": "unlock"},
+            {"domain": "cover", "service": "open_cover", "group": 1},
+        ]
+        data = await self._batch(hass, {"calls": calls, "stop_on_error": True})
+
+        assert data["results"][1]["skipped"] is True
+        assert (data["failed"], data["skipped"]) == (1, 1)
+        assert hass.services.async_call.call_count == 1
+
+    async def test_rejects_too_many_calls(self, hass):
+        calls = [{"domain": "light", "service": "turn_on"}] * 51
+        result = await entities_mod.batch_call_service(hass, {"calls": calls})
+        assert "maximum 50" in result["content"][0]["text"]
+        hass.services.async_call.assert_not_called()
+
+    @pytest.mark.parametrize("group", ["1", -1, 1.5, True, None])
+    async def test_rejects_invalid_group(self, hass, group):
+        calls = [
+            {"domain": "light", "service": "turn_on", "group": 1},
+            {"domain": "light", "service": "turn_off", "group": group},
+        ]
+        result = await entities_mod.batch_call_service(hass, {"calls": calls})
+        assert result["content"][0]["text"] == (
+            f"Error: group of call 1 must be a non-negative integer, got {group!r}"
+        )
+        hass.services.async_call.assert_not_called()
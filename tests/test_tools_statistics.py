@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from custom_components.mcp_server_http_transport.http import MCPEndpointView
+from custom_components.mcp_server_http_transport.tools.statistics import get_statistics
 
 
 class TestToolsStatistics:
@@ -146,3 +147,74 @@ class TestToolsStatistics:
         body = json.loads(response.body)
         text = body["result"]["content"][0]["text"]
         assert "Error getting statistics" in text
+
+
+class TestGetStatisticsDownsampling:
+    """Test get_statistics with max_points."""
+
+    @pytest.fixture
+    def hass(self):
+        hass = Mock()
+        hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+        return hass
+
+    @pytest.fixture
+    def recorder(self):
+        rows = [
+            {
+                "start": 3600.0 * i,
+                "end": 3600.0 * (i + 1),
+                "mean": float(i % 24),
+                "min": float(i % 24) - 1,
+                "max": float(i % 24) + 1,
+            }
+            for i in range(24 * 30)
+        ]
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(return_value={"sensor.temperature": rows})
+        with patch("homeassistant.components.recorder.get_instance", return_value=recorder):
+            yield
+
+    async def _statistics(self, hass, **arguments):
+        result = await get_statistics(
+            hass,
+            {"entity_id": "sensor.temperature", "start_time": "2024-01-01T00:00:00", **arguments},
+        )
+        return json.loads(result["content"][0]["text"])
+
+    async def test_lttb(self, hass, recorder):
+        result = await self._statistics(hass, max_points=60)
+        assert result["original_count"] == 720
+        assert result["count"] == 60
+        assert result["rows"][0]["start"] == 0.0
+        assert result["rows"][-1]["start"] == 3600.0 * 719
+
+    async def test_lttb_without_values_merges_rows(self, hass):
+        rows = [
+            {"start": 3600.0 * i, "end": 3600.0 * (i + 1), "mean": float("nan")} for i in range(100)
+        ]
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(return_value={"sensor.temperature": rows})
+        with patch("homeassistant.components.recorder.get_instance", return_value=recorder):
+            result = await self._statistics(hass, max_points=10)
+        assert result["count"] == 10
+        assert result["rows"][0] == {"start": 0.0, "end": 36000.0, "count": 10}
+
+    async def test_bucket_merges_days(self, hass, recorder):
+        result = await self._statistics(hass, max_points=30, downsample="bucket")
+        assert result["count"] == 30
+        assert result["rows"][0] == {
+            "start": 0.0,
+            "end": 86400.0,
+            "min": -1.0,
+            "max": 24.0,
+            "mean": 11.5,
+            "count": 24,
+        }
+
+    async def test_invalid_downsample(self, hass, recorder):
+        result = await get_statistics(
+            hass,
+            {"entity_id": "sensor.temperature", "start_time": "2024-01-01", "downsample": "x"},
+        )
+        assert "Unknown downsample" in result["content"][0]["text"]
@@ -1,12 +1,18 @@
 """Tests for system tools (get_config, render_template, get_history, fire_event, get_logbook)."""
 
 import json
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from homeassistant.core import State
 
 from custom_components.mcp_server_http_transport.http import MCPEndpointView
+from custom_components.mcp_server_http_transport.tools.system import (
+    get_history,
+    get_history_summary,
+    get_logbook,
+)
 
 
 class TestToolsSystem:
@@ -530,3 +536,472 @@ class TestToolsSystem:
         assert response.status == 200
         body = json.loads(response.body)
         assert "Error getting logbook" in body["result"]["content"][0]["text"]
+
+
+class TestGetHistoryMultiEntity:
+    """Test get_history with several entities in one recorder query."""
+
+    @pytest.fixture
+    def hass(self):
+        hass = Mock()
+        hass.data = {}
+        hass.states.async_all.return_value = [
+            State("sensor.kitchen_temperature", "21"),
+            State("sensor.bedroom_temperature", "19"),
+            State("sensor.kitchen_humidity", "40"),
+            State("light.kitchen", "on"),
+        ]
+        return hass
+
+    @pytest.fixture
+    def recorder(self):
+        def _row(state, hour, **attributes):
+            return Mock(state=state, last_changed=datetime(2024, 1, 1, hour), attributes=attributes)
+
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(
+            return_value={
+                "sensor.kitchen_temperature": [
+                    _row("20", 8, unit_of_measurement="°C", friendly_name="Kitchen"),
+                    {"state": "21", "last_changed": "2024-01-01T09:00:00"},
+                ],
+                "sensor.bedroom_temperature": [_row("19", 8, unit_of_measurement="°C")],
+            }
+        )
+        with patch("homeassistant.components.recorder.get_instance", return_value=recorder):
+            yield recorder
+
+    async def _history(self, hass, **arguments):
+        result = await get_history(hass, {"start_time": "2024-01-01T00:00:00", **arguments})
+        return json.loads(result["content"][0]["text"])
+
+    async def test_patterns_resolved_into_one_query(self, hass, recorder):
+        history = await self._history(hass, entity_ids=["sensor.*_temperature"])
+
+        recorder.async_add_executor_job.assert_awaited_once()
+        assert recorder.async_add_executor_job.await_args.args[4] == [
+            "sensor.bedroom_temperature",
+            "sensor.kitchen_temperature",
+        ]
+        assert [(row["entity_id"], row["state"]) for row in history] == [
+            ("sensor.bedroom_temperature", "19"),
+            ("sensor.kitchen_temperature", "20"),
+            ("sensor.kitchen_temperature", "21"),
+        ]
+        # minimal_response rows carry no attributes
+        assert "attributes" not in history[2]
+
+    async def test_query_options_passed_through(self, hass, recorder):
+        await self._history(
+            hass,
+            entity_ids=["sensor.kitchen_temperature"],
+            significant_changes_only=False,
+            minimal_response=True,
+            no_attributes=True,
+        )
+        assert recorder.async_add_executor_job.await_args.args[7:] == (False, True, True)
+
+    async def test_attribute_whitelist(self, hass, recorder):
+        history = await self._history(
+            hass, entity_ids=["sensor.kitchen_temperature"], attributes=["unit_of_measurement"]
+        )
+        assert history[0]["attributes"] == {"unit_of_measurement": "°C"}
+
+    async def test_empty_attribute_whitelist(self, hass, recorder):
+        history = await self._history(
+            hass, entity_ids=["sensor.kitchen_temperature"], attributes=[]
+        )
+        # Attributes are not loaded at all
+        assert recorder.async_add_executor_job.await_args.args[-1] is True
+        assert "attributes" not in history[0]
+
+    async def test_no_attributes(self, hass, recorder):
+        history = await self._history(
+            hass, entity_ids=["sensor.kitchen_temperature"], no_attributes=True
+        )
+        assert "attributes" not in history[0]
+
+    async def test_entity_id_and_entity_ids_combined(self, hass, recorder):
+        await self._history(
+            hass, entity_id="sensor.kitchen_temperature", entity_ids=["sensor.kitchen_*"]
+        )
+        assert recorder.async_add_executor_job.await_args.args[4] == [
+            "sensor.kitchen_temperature",
+            "sensor.kitchen_humidity",
+        ]
+
+    async def test_requires_entities(self, hass, recorder):
+        result = await get_history(hass, {"start_time": "2024-01-01T00:00:00"})
+        assert "entity_id or entity_ids is required" in result["content"][0]["text"]
+
+        result = await get_history(
+            hass, {"start_time": "2024-01-01T00:00:00", "entity_ids": ["switch.*"]}
+        )
+        assert "no entities match" in result["content"][0]["text"]
+        recorder.async_add_executor_job.assert_not_awaited()
+
+    async def test_too_many_entities(self, hass, recorder):
+        entity_ids = [f"sensor.s{i}" for i in range(51)]
+        result = await get_history(
+            hass, {"start_time": "2024-01-01T00:00:00", "entity_ids": entity_ids}
+        )
+        assert "maximum 50" in result["content"][0]["text"]
+        recorder.async_add_executor_job.assert_not_awaited()
+
+
+class TestGetHistoryDownsampling:
+    """Test get_history with max_points."""
+
+    @pytest.fixture
+    def hass(self):
+        hass = Mock()
+        hass.data = {}
+        hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+        return hass
+
+    def _recorder(self, states):
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(return_value=states)
+        return patch("homeassistant.components.recorder.get_instance", return_value=recorder)
+
+    def _rows(self, values):
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        return [
+            Mock(state=value, last_changed=start + timedelta(seconds=10 * i), attributes={"i": i})
+            for i, value in enumerate(values)
+        ]
+
+    async def _history(self, hass, **arguments):
+        result = await get_history(
+            hass,
+            {
+                "start_time": "2024-01-01T00:00:00+00:00",
+                "end_time": "2024-01-02T00:00:00+00:00",
+                **arguments,
+            },
+        )
+        return json.loads(result["content"][0]["text"])
+
+    async def test_lttb_keeps_original_rows(self, hass):
+        values = [str(i % 50) for i in range(1000)]
+        with self._recorder({"sensor.power": self._rows(values)}):
+            result = await self._history(hass, entity_id="sensor.power", max_points=100)
+
+        assert result["original_count"] == 1000
+        assert result["count"] == len(result["rows"]) == 100
+        assert result["rows"][0] == {
+            "state": "0",
+            "last_changed": "2024-01-01T00:00:00+00:00",
+            "attributes": {"i": 0},
+        }
+        hass.async_add_executor_job.assert_awaited_once()
+
+    async def test_bucket(self, hass):
+        values = [str(i) for i in range(1000)]
+        with self._recorder({"sensor.power": self._rows(values)}):
+            result = await self._history(
+                hass, entity_ids=["sensor.power"], max_points=10, downsample="bucket"
+            )
+
+        assert result["count"] == 10
+        first = result["rows"][0]
+        assert first["entity_id"] == "sensor.power"
+        assert (first["min"], first["max"], first["last"], first["count"]) == (0, 99, 99, 100)
+        assert first["start"] == "2024-01-01T00:00:00+00:00"
+
+    async def test_non_numeric_becomes_spans(self, hass):
+        values = ["on"] * 300 + ["off"] * 300
+        with self._recorder({"switch.pump": self._rows(values)}):
+            result = await self._history(hass, entity_id="switch.pump", max_points=10)
+
+        assert result["rows"] == [
+            {
+                "state": "on",
+                "start": "2024-01-01T00:00:00+00:00",
+                "end": "2024-01-01T00:50:00+00:00",
+                "count": 300,
+            },
+            {
+                "state": "off",
+                "start": "2024-01-01T00:50:00+00:00",
+                "end": "2024-01-02T00:00:00+00:00",
+                "count": 300,
+            },
+        ]
+
+    @pytest.mark.parametrize("downsample", ["lttb", "bucket"])
+    async def test_series_without_numbers_becomes_spans(self, hass, downsample):
+        values = ["unavailable"] * 300 + ["unknown"] * 300
+        with self._recorder({"sensor.power": self._rows(values)}):
+            result = await self._history(
+                hass, entity_id="sensor.power", max_points=10, downsample=downsample
+            )
+
+        assert [(row["state"], row["count"]) for row in result["rows"]] == [
+            ("unavailable", 300),
+            ("unknown", 300),
+        ]
+
+    async def test_short_series_unchanged(self, hass):
+        with self._recorder({"sensor.power": self._rows(["1", "2"])}):
+            result = await self._history(hass, entity_id="sensor.power", max_points=10)
+        assert result["original_count"] == result["count"] == 2
+        assert [row["state"] for row in result["rows"]] == ["1", "2"]
+
+    async def test_invalid_max_points(self, hass):
+        with self._recorder({}) as get_instance:
+            result = await get_history(
+                hass, {"entity_id": "sensor.power", "start_time": "2024-01-01", "max_points": 1}
+            )
+        assert "max_points must be an integer" in result["content"][0]["text"]
+        get_instance.assert_not_called()
+
+
+class TestGetHistorySummary:
+    """Test get_history_summary aggregates."""
+
+    @pytest.fixture
+    def hass(self):
+        hass = Mock()
+        hass.data = {}
+        hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+        return hass
+
+    def _row(self, state, minutes, **attributes):
+        changed = datetime(2024, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes)
+        return Mock(state=state, last_changed=changed, attributes=attributes)
+
+    async def test_numeric_and_state_entities(self, hass):
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(
+            return_value={
+                "sensor.temperature": [
+                    self._row("20", 0, unit_of_measurement="°C"),
+                    {"state": "unavailable", "last_changed": "2024-01-01T00:30:00+00:00"},
+                    self._row("22", 45, unit_of_measurement="°C"),
+                ],
+                "binary_sensor.door": [
+                    self._row("off", 0),
+                    {"state": "on", "last_changed": "2024-01-01T00:10:00+00:00"},
+                    {"state": "off", "last_changed": "2024-01-01T00:12:00+00:00"},
+                    self._row("on", 50),
+                ],
+            }
+        )
+        with patch("homeassistant.components.recorder.get_instance", return_value=recorder):
+            result = await get_history_summary(
+                hass,
+                {
+                    "entity_ids": ["sensor.temperature", "binary_sensor.door", "sensor.gone"],
+                    "start_time": "2024-01-01T00:00:00+00:00",
+                    "end_time": "2024-01-01T01:00:00+00:00",
+                    "percentiles": [50],
+                },
+            )
+        summaries = json.loads(result["content"][0]["text"])
+
+        args = recorder.async_add_executor_job.await_args.args
+        assert args[8:] == (True, False)  # minimal_response, attributes kept for the unit
+
+        temperature, door, gone = summaries
+        assert temperature == {
+            "entity_id": "sensor.temperature",
+            "rows": 3,
+            "type": "numeric",
+            "count": 2,
+            "min": 20.0,
+            "max": 22.0,
+            "mean": 21.0,
+            # 20 for 30 min, unavailable for 15 min, 22 for 15 min
+            "time_weighted_mean": pytest.approx(20 + 2 / 3),
+            "last": 22.0,
+            "percentiles": {"p50": 21.0},
+            "unit_of_measurement": "°C",
+        }
+        assert door["type"] == "state"
+        assert door["transitions"] == 3
+        assert door["states"]["on"] == {
+            "count": 2,
+            "total_seconds": 720.0,
+            "longest_seconds": 600.0,
+        }
+        assert door["states"]["off"]["total_seconds"] == 2880.0
+        assert gone == {"entity_id": "sensor.gone", "rows": 0}
+
+    async def test_invalid_percentiles(self, hass):
+        result = await get_history_summary(
+            hass,
+            {"entity_id": "sensor.a", "start_time": "2024-01-01", "percentiles": [150]},
+        )
+        assert "percentiles must be numbers from 0 to 100" in result["content"][0]["text"]
+
+    async def test_requires_entities(self, hass):
+        result = await get_history_summary(hass, {"start_time": "2024-01-01"})
+        assert "entity_id or entity_ids is required" in result["content"][0]["text"]
+
+
+class TestGetLogbookStreaming:
+    """Test get_logbook order, filters, slice reads and context chains."""
+
+    @pytest.fixture
+    def events(self):
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        return [
+            {
+                "when": (start + timedelta(hours=hours)).isoformat(),
+                "name": f"Entry {hours}",
+                "entity_id": "light.kitchen" if hours % 2 else "switch.fan",
+            }
+            for hours in range(1, 48, 3)
+        ]
+
+    @pytest.fixture
+    def recorder(self, events):
+        def _get_events(start_time, end_time):
+            # The recorder excludes both ends of the window
+            return [
+                event
+                for event in events
+                if start_time < datetime.fromisoformat(event["when"]) < end_time
+            ]
+
+        recorder = Mock()
+        recorder.async_add_executor_job = AsyncMock(
+            side_effect=lambda func, *args: _get_events(*args)
+        )
+        return recorder
+
+    async def _call(self, recorder, arguments, processor_cls=None):
+        arguments = {
+            "start_time": "2024-01-01T00:00:00+00:00",
+            "end_time": "2024-01-03T00:00:00+00:00",
+            **arguments,
+        }
+        with (
+            patch(
+                "homeassistant.components.logbook.processor.EventProcessor",
+                processor_cls or Mock(),
+            ),
+            patch("homeassistant.components.recorder.get_instance", return_value=recorder),
+        ):
+            hass = Mock(data={})
+            hass.states.async_all.return_value = [
+                State("light.kitchen", "on"),
+                State("switch.fan", "off"),
+            ]
+            result = await get_logbook(hass, arguments)
+        items = json.loads(result["content"][0]["text"])
+        cursor = (
+            json.loads(result["content"][1]["text"])["nextCursor"]
+            if len(result["content"]) > 1
+            else None
+        )
+        return items, cursor
+
+    async def test_descending_pages_cover_every_entry_once(self, recorder, events):
+        names, cursor, pages = [], None, 0
+        while True:
+            arguments = {"order": "desc", "page_size": 5}
+            if cursor:
+                arguments["cursor"] = cursor
+            items, cursor = await self._call(recorder, arguments)
+            names += [item["name"] for item in items]
+            pages += 1
+            if cursor is None:
+                break
+        assert names == [event["name"] for event in reversed(events)]
+        assert pages == 4
+
+    async def test_reads_only_the_slices_a_page_needs(self, recorder):
+        items, cursor = await self._call(recorder, {"page_size": 2})
+        assert [item["name"] for item in items] == ["Entry 1", "Entry 4"]
+        assert cursor is not None
+        # Slices of 1h to 8h, up to 15:00, hold the three entries needed; the rest
+        # of the two days is not read
+        assert recorder.async_add_executor_job.await_count == 4
+
+    async def test_slice_boundaries_keep_entries_once(self, recorder, events):
+        items, cursor = await self._call(recorder, {"page_size": 100})
+        assert [item["when"] for item in items] == [event["when"] for event in events]
+        assert cursor is None
+
+    async def test_domain_filter(self, recorder):
+        processor_cls = Mock()
+        items, _ = await self._call(recorder, {"domain": "light"}, processor_cls)
+        assert processor_cls.call_args.kwargs["entity_ids"] == ["light.kitchen"]
+        assert items
+        assert all(item["entity_id"] == "light.kitchen" for item in items)
+
+    async def test_domain_without_entities_matches_nothing(self, recorder):
+        items, cursor = await self._call(recorder, {"domain": "climate"})
+        assert (items, cursor) == ([], None)
+        recorder.async_add_executor_job.assert_not_awaited()
+
+    async def test_context_user_filter(self, recorder, events):
+        events[2]["context_user_id"] = "user-1"
+        events[5]["context_user_id"] = "user-2"
+        items, _ = await self._call(recorder, {"context_user_id": "user-1"})
+        assert [item["name"] for item in items] == [events[2]["name"]]
+
+    async def test_device_filter(self, recorder):
+        processor_cls = Mock()
+        device_entries = [Mock(entity_id="light.kitchen"), Mock(entity_id="sensor.power")]
+        with (
+            patch("homeassistant.helpers.entity_registry.async_get"),
+            patch(
+                "homeassistant.helpers.entity_registry.async_entries_for_device",
+                return_value=device_entries,
+            ),
+        ):
+            await self._call(recorder, {"device_id": "device-1"}, processor_cls)
+            assert processor_cls.call_args.kwargs["entity_ids"] == [
+                "light.kitchen",
+                "sensor.power",
+            ]
+            assert processor_cls.call_args.kwargs["device_ids"] == ["device-1"]
+
+            # Entities outside the device match nothing
+            recorder.async_add_executor_job.reset_mock()
+            items, cursor = await self._call(
+                recorder, {"device_id": "device-1", "entity_id": "switch.fan"}
+            )
+        assert (items, cursor) == ([], None)
+        recorder.async_add_executor_job.assert_not_awaited()
+
+    async def test_group_by_context(self, recorder, events):
+        events[:] = [
+            {
+                "when": "2024-01-01T06:00:00+00:00",
+                "name": "Motion",
+                "entity_id": "automation.lights_on_motion",
+                "message": "triggered by state of binary_sensor.motion",
+            },
+            *(
+                {
+                    "when": f"2024-01-01T06:00:0{second}+00:00",
+                    "name": name,
+                    "entity_id": entity_id,
+                    "state": "on",
+                    "context_entity_id": "automation.lights_on_motion",
+                    "context_event_type": "automation_triggered",
+                }
+                for second, (name, entity_id) in enumerate(
+                    [("Hall", "light.hall"), ("Stairs", "light.stairs")], start=1
+                )
+            ),
+            {"when": "2024-01-01T09:00:00+00:00", "name": "Fan", "entity_id": "switch.fan"},
+        ]
+        items, _ = await self._call(recorder, {"group_by_context": True})
+        chain, fan = items
+        assert chain["when"] == "2024-01-01T06:00:00+00:00"
+        assert chain["context"] == {
+            "context_entity_id": "automation.lights_on_motion",
+            "context_event_type": "automation_triggered",
+        }
+        assert [entry["name"] for entry in chain["entries"]] == ["Motion", "Hall", "Stairs"]
+        assert "context_entity_id" not in chain["entries"][1]
+        assert fan["name"] == "Fan"
+
+        items, _ = await self._call(recorder, {"group_by_context": True, "order": "desc"})
+        assert [item.get("name", "chain") for item in items] == ["Fan", "chain"]
+        assert [entry["name"] for entry in items[1]["entries"]] == ["Motion", "Hall", "Stairs"]